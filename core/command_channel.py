@@ -0,0 +1,155 @@
+# core/command_channel.py
+"""
+Araç Komut Kanalı
+=================
+
+Navigation'daki global `vehicle_lock` (threading.Lock) yerine asyncio
+uyumlu komut serileştirme:
+- Salt okuma telemetri (position, battery, armed, vtol_state, ...) kilit
+  almaz; MAVSDK abonelikleri aynı loop'ta eşzamanlı okunabilir
+- Aracı değiştiren komutlar (arm, takeoff, land, offboard, tilt, mission
+  upload, ...) araç başına tek kanaldan geçer. Kanal bir `asyncio.Lock`
+  üzerinedir: bekleyenler geliş sırasıyla (FIFO) alır ve beklerken event
+  loop thread'i bloklanmaz
+- Komut adı başına kilit bekleme (wait) ve tutma (hold) süreleri ölçülür
+
+Kanal navigation loop'una aittir (`navigation_loop.py`); aynı kanal farklı
+event loop'lardan kullanılmamalıdır. Kanal yeniden girişli (reentrant)
+değildir: bir komut bloğu içinde aynı kanaldan ikinci komut alınmaz.
+
+Usage:
+    channel = get_command_channel(drone)
+    async with channel.command("land"):
+        await drone.action.land()
+
+    await channel.send("rtl", drone.action.return_to_launch)
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Optional
+
+try:
+    from .task_stats import DurationHistogram
+    from .logger import get_logger
+except ImportError:
+    from task_stats import DurationHistogram
+    from logger import get_logger
+
+log = get_logger("command_channel")
+
+# Bu süreden uzun kilit beklemesi uyarı olarak loglanır (ms)
+SLOW_WAIT_WARN_MS = 1000.0
+
+
+class CommandStats:
+    """Komut adı başına kilit bekleme / tutma süreleri"""
+
+    __slots__ = ('count', 'errors', 'wait', 'hold')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.wait = DurationHistogram()
+        self.hold = DurationHistogram()
+
+    def snapshot(self) -> dict:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'wait': self.wait.snapshot(),
+            'hold': self.hold.snapshot(),
+        }
+
+
+class VehicleCommandChannel:
+    """Araç başına sıralı (FIFO) komut kanalı"""
+
+    def __init__(self, name: str = "vehicle"):
+        self.name = name
+        self._lock: Optional[asyncio.Lock] = None
+        self._holder: Optional[str] = None
+        self._waiting = 0
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, CommandStats] = {}
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Loop içinde oluşturulur (Python < 3.10'da Lock oluşturulduğu loop'a bağlanır)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @asynccontextmanager
+    async def command(self, name: str):
+        """Komut bloğu: kanal sırası gelene kadar bekle, blok boyunca tut"""
+        lock = self._get_lock()
+        requested = time.perf_counter()
+        self._waiting += 1
+        try:
+            await lock.acquire()
+        finally:
+            self._waiting -= 1
+
+        acquired = time.perf_counter()
+        wait_ms = (acquired - requested) * 1000.0
+        if wait_ms > SLOW_WAIT_WARN_MS:
+            log.warning("%s kanalı: '%s' %.0f ms bekledi (önceki: %s)",
+                        self.name, name, wait_ms, self._holder)
+        self._holder = name
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._holder = None
+            lock.release()
+            self._record(name, wait_ms, (time.perf_counter() - acquired) * 1000.0, failed)
+
+    async def send(self, name: str, coro_func: Callable[[], Awaitable]):
+        """Tek komutu kanal sırasıyla çalıştır ve sonucunu döndür"""
+        async with self.command(name):
+            return await coro_func()
+
+    def _record(self, name: str, wait_ms: float, hold_ms: float, failed: bool):
+        with self._stats_lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = CommandStats()
+            stats.count += 1
+            if failed:
+                stats.errors += 1
+            stats.wait.add(wait_ms)
+            stats.hold.add(hold_ms)
+
+    def get_statistics(self) -> dict:
+        """Komut adı başına wait / hold histogramları ve anlık kanal durumu"""
+        with self._stats_lock:
+            commands = {name: stats.snapshot() for name, stats in self._stats.items()}
+        return {
+            'channel': self.name,
+            'holder': self._holder,
+            'waiting': self._waiting,
+            'commands': commands,
+        }
+
+
+# ========================================
+# ARAÇ BAŞINA KANAL
+# ========================================
+
+_channels: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_channels_lock = threading.Lock()
+
+
+def get_command_channel(vehicle) -> VehicleCommandChannel:
+    """Araç nesnesinin (MAVSDK System) komut kanalı; yoksa oluşturulur"""
+    with _channels_lock:
+        channel = _channels.get(vehicle)
+        if channel is None:
+            channel = _channels[vehicle] = VehicleCommandChannel(f"vehicle-{id(vehicle):x}")
+        return channel
@@ -33,6 +33,11 @@ except ImportError:
     from threading import Lock
     vehicle_lock = Lock
 
+try:
+    from core.mavlink_hub import resolve_endpoint
+except ImportError:
+    from mavlink_hub import resolve_endpoint
+
 # Thread-safe signal sistemi
 class ThreadSafeSignal:
     """Thread-safe signal/callback sistemi"""
@@ -248,8 +253,9 @@ class MAVSDKConnectionManager:
                 if not self.system:
                     return False
                 
-                # Bağlantıyı kur
-                await self.system.connect(system_address=self.connection_string)
+                # Bağlantıyı kur (MAVLink hub açıksa kendi yerel ucu üzerinden)
+                system_address = resolve_endpoint('connection', self.connection_string)
+                await self.system.connect(system_address=system_address)
             
             logger.info("⏳ System bağlantısı bekleniyor...")
             
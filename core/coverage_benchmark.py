@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# core/coverage_benchmark.py
+"""
+Kapsama Planlayıcı Hız ve Kapsama Kontrolü
+==========================================
+
+`coverage_planner.py` için birkaç km²'lik örnek alanlarda (kare, döndürülmüş
+dikdörtgen, rastgele dışbükey, yıldız biçimli dışbükey olmayan, L):
+- Hız: desen başına planlama süresi (ms, medyan); `--max-ms` üstü hatadır
+- Kapsama: alan içi örnek noktaların rotaya uzaklığı `swath / 2` içinde
+  olan oranı; `--min-coverage` altı hatadır
+- Özet: toplam uzunluk, şerit ve dönüş sayısı, şerit açısı
+
+Kullanım:
+    python3 core/coverage_benchmark.py --swath 80 --turn-radius 60
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from coverage_planner import convex_hull, plan_coverage, rectangle
+
+
+def rotated(poly, degrees):
+    theta = np.radians(degrees)
+    rotation = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
+    return poly @ rotation.T
+
+
+def random_convex(rng, radius, count=40):
+    angles = rng.uniform(0.0, 2.0 * np.pi, count)
+    radii = radius * np.sqrt(rng.uniform(0.3, 1.0, count))
+    points = np.column_stack([radii * np.cos(angles), radii * np.sin(angles)])
+    return convex_hull(points)
+
+
+def random_star(rng, radius, count=24):
+    angles = np.sort(rng.uniform(0.0, 2.0 * np.pi, count))
+    radii = radius * rng.uniform(0.45, 1.0, count)
+    return np.column_stack([radii * np.cos(angles), radii * np.sin(angles)])
+
+
+def inside_polygon(points, poly):
+    """Işın atma; (M, 2) noktalar için bool maske"""
+    x, y = points[:, 0:1], points[:, 1:2]
+    x0, y0 = poly[:, 0], poly[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    crosses = (y0 > y) != (y1 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+    return (np.count_nonzero(crosses & (x < x_cross), axis=1) % 2) == 1
+
+
+def coverage_ratio(plan, poly, swath, samples, rng):
+    low, high = poly.min(axis=0), poly.max(axis=0)
+    points = rng.uniform(low, high, (samples, 2))
+    points = points[inside_polygon(points, poly)]
+
+    a = plan.waypoints[:-1]
+    b = plan.waypoints[1:]
+    ab = b - a
+    length2 = np.maximum((ab ** 2).sum(axis=1), 1e-12)
+    nearest = np.full(len(points), np.inf)
+    # Bellek için parça parça
+    for chunk in range(0, len(points), 4096):
+        p = points[chunk:chunk + 4096, None, :]
+        t = np.clip(((p - a) * ab).sum(axis=2) / length2, 0.0, 1.0)
+        d = np.hypot(*(p - (a + t[:, :, None] * ab)).transpose(2, 0, 1))
+        nearest[chunk:chunk + 4096] = d.min(axis=1)
+    return float(np.mean(nearest <= swath / 2.0 + 1e-6))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kapsama planlayıcı hız ve kapsama kontrolü")
+    parser.add_argument('--swath', type=float, default=80.0, help="Tarama genişliği (m)")
+    parser.add_argument('--turn-radius', type=float, default=60.0, help="Dönüş yarıçapı (m)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--samples', type=int, default=20000, help="Kapsama örnek nokta sayısı")
+    parser.add_argument('--max-ms', type=float, default=100.0, help="Plan başına en uzun süre (ms)")
+    parser.add_argument('--min-coverage', type=float, default=0.97)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    areas = [
+        ("kare 2x2 km", rectangle(0.0, 0.0, 2000.0, 2000.0)),
+        ("dikdörtgen 1.5x3 km (35°)", rotated(rectangle(0.0, 0.0, 1500.0, 3000.0), 35.0)),
+        ("rastgele dışbükey", random_convex(rng, 1500.0)),
+        ("yıldız (dışbükey değil)", random_star(rng, 1600.0)),
+        ("L 2.5 km", np.array([[0, 0], [0, 2500], [900, 2500], [900, 900], [2500, 900], [2500, 0]], float)),
+    ]
+
+    print(f"swath {args.swath:g} m, dönüş yarıçapı {args.turn_radius:g} m, numpy {np.__version__}")
+    ok = True
+    for name, poly in areas:
+        for pattern in ('boustrophedon', 'spiral', 'auto'):
+            timings = []
+            plan = None
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                try:
+                    plan = plan_coverage(poly, args.swath, args.turn_radius, pattern=pattern)
+                except ValueError:
+                    plan = None
+                    break
+                timings.append((time.perf_counter() - started) * 1000.0)
+            if plan is None:
+                print(f"  --   {name:<26} {pattern:<13} uygulanamaz")
+                continue
+
+            elapsed = float(np.median(timings))
+            covered = coverage_ratio(plan, poly, args.swath, args.samples, rng)
+            passed = elapsed <= args.max_ms and covered >= args.min_coverage
+            ok = ok and passed
+            angle = '-' if plan.sweep_angle is None else f"{plan.sweep_angle:5.1f}°"
+            print(f"  {'OK  ' if passed else 'HATA'} {name:<26} {plan.pattern:<13} "
+                  f"{plan.area / 1e6:5.2f} km²  {elapsed:6.1f} ms  kapsama %{covered * 100:5.1f}  "
+                  f"{plan.total_length / 1000.0:7.2f} km  şerit {plan.lanes:3d}  dönüş {plan.turns:3d}  açı {angle}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
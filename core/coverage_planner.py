@@ -0,0 +1,600 @@
+# core/coverage_planner.py
+"""
+Kapsama Rotası Planlayıcı
+=========================
+
+Devriye görevleri için sabit kodlu rotalar yerine alan kapsama planı.
+Girdi: keyfi çokgen alan, sensör tarama genişliği (swath) ve sabit kanat
+dönüş yarıçapı. Çıktı: kuzey/doğu (NED, m) waypoint dizisi.
+
+Desenler:
+- boustrophedon: paralel şeritler (biçerdöver deseni). Şerit yönü dışbükey
+  zarf kenar yönleri ve her `angle_step` derecede bir aday açı arasından
+  seçilir: ucuz tahminle en iyi adaylar bulunur, bunlar tam planlanır ve
+  en kısa (şerit + dönüş + geçiş) rota seçilir. Dışbükey olmayan alanlar
+  şerit süreklilikleriyle hücrelere (boustrophedon decomposition) ayrılır;
+  hücreler en yakın giriş noktasına göre sıralanır
+- spiral: dışbükey alanlarda dıştan içe halkalar (swath aralıklı içe
+  öteleme). Dönüş yarıçapının sığmadığı iç çekirdek şeritlerle kapatılır.
+  Köşeler fly-by uçulur; uzunluk waypoint çokgeni üzerinden hesaplanır
+- auto: iki desenden toplam maliyeti düşük olan
+
+Sabit kanat dönüşleri: `swath < 2R` iken komşu şeride U dönüşü ilmek
+(omega) ister; bu durumda şeritler yarış pisti (racetrack) sırasıyla
+k şerit atlanarak uçulur (k = ceil(2R / swath) + 1) ve hangi sıra kısaysa
+o kullanılır. Dönüş uzunluğu, şeritler arası yanal mesafe d için:
+- d >= 2R: πR + (d - 2R)
+- d < 2R:  R(π + 4·acos((d + 2R) / 4R))
+ve şerit uçları arasındaki boyuna fark düz uçuş olarak eklenir.
+
+Hücreler arası geçişler düz çizgidir (dışbükey olmayan alanda alan dışına
+taşabilir). Tüm hesap NumPy ile vektöreldir; birkaç km²'lik alan tek
+çekirdekte milisaniyeler içinde planlanır (haritadan etkileşimli yeniden
+planlama için). Hız ve kapsama kontrolü: `python3 core/coverage_benchmark.py`
+
+Usage:
+    plan = plan_coverage([(0, 0), (0, 800), (600, 900), (700, 0)],
+                         swath=120, turn_radius=60)
+    for north, east in plan.waypoints: ...
+
+    plan = plan_coverage_lla(lats, lons, swath=120, turn_radius=60)
+    lats, lons = plan.to_lla()
+"""
+
+import math
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from .geodesy import lla_to_ned, ned_to_lla
+except ImportError:
+    from geodesy import lla_to_ned, ned_to_lla
+
+PATTERNS = ('auto', 'boustrophedon', 'spiral')
+
+DEFAULT_ANGLE_STEP_DEG = 5.0
+# Tahmini maliyeti en iyi bu kadar şerit açısı tam planlanır
+REFINE_CANDIDATES = 4
+# Spiral köşelerinde bu açıdan büyük yön değişimleri dönüş sayılır (derece)
+TURN_ANGLE_DEG = 30.0
+EPS = 1e-9
+
+
+@dataclass
+class CoveragePlan:
+    """Kapsama planı: waypoint'ler ve uzunluk / dönüş özetleri"""
+    pattern: str
+    waypoints: np.ndarray                 # (N, 2) kuzey, doğu (m)
+    sweep_angle: Optional[float]          # Şerit yönü, kuzeyden derece (spiral: iç çekirdek)
+    lanes: int                            # Şerit / halka sayısı
+    turns: int
+    coverage_length: float                # Tarama şeritleri / halkalar (m)
+    turn_length: float                    # Şerit sonu dönüşleri (m)
+    transit_length: float                 # Başlangıçtan girişe ve hücreler arası (m)
+    planning_ms: float = 0.0
+    reference: Optional[Tuple[float, float]] = None   # NED referansı (lat, lon)
+    area: float = 0.0                     # Alan (m²)
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def total_length(self) -> float:
+        return self.coverage_length + self.turn_length + self.transit_length
+
+    def ned_waypoints(self, down: float) -> List[Tuple[float, float, float]]:
+        """Offboard `PositionNedYaw` için (north, east, down) listesi"""
+        return [(float(north), float(east), float(down)) for north, east in self.waypoints]
+
+    def to_lla(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Waypoint'lerin enlem/boylamı (yalnızca `plan_coverage_lla` planları)"""
+        if self.reference is None:
+            raise ValueError("Plan NED referansı olmadan oluşturuldu")
+        lats, lons, _alts = ned_to_lla(self.waypoints[:, 0], self.waypoints[:, 1], 0.0,
+                                       self.reference[0], self.reference[1], 0.0)
+        return lats, lons
+
+    def summary(self) -> dict:
+        return {
+            'pattern': self.pattern,
+            'waypoints': len(self.waypoints),
+            'sweep_angle': None if self.sweep_angle is None else round(self.sweep_angle, 1),
+            'lanes': self.lanes,
+            'turns': self.turns,
+            'area_m2': round(self.area, 1),
+            'total_length_m': round(self.total_length, 1),
+            'coverage_length_m': round(self.coverage_length, 1),
+            'turn_length_m': round(self.turn_length, 1),
+            'transit_length_m': round(self.transit_length, 1),
+            'planning_ms': round(self.planning_ms, 2),
+        }
+
+
+# ========================================
+# ÇOKGEN YARDIMCILARI
+# ========================================
+
+def _as_polygon(polygon) -> np.ndarray:
+    poly = np.asarray(polygon, dtype=np.float64)
+    if poly.ndim != 2 or poly.shape[1] != 2:
+        raise ValueError("Alan (N, 2) kuzey/doğu noktaları olmalı")
+    # Kapanış tekrarı ve ardışık çift noktaları at
+    keep = np.any(np.abs(poly - np.roll(poly, 1, axis=0)) > 1e-6, axis=1)
+    poly = poly[keep]
+    if len(poly) < 3:
+        raise ValueError("Alan en az 3 farklı köşe içermeli")
+    if abs(polygon_area(poly)) < EPS:
+        raise ValueError("Alan sıfır (köşeler doğrusal)")
+    return poly
+
+
+def polygon_area(poly: np.ndarray) -> float:
+    """İşaretli alan (shoelace); saat yönü tersi (kuzey=x, doğu=y) pozitif"""
+    x, y = poly[:, 0], poly[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _is_convex(poly: np.ndarray) -> bool:
+    edges = np.roll(poly, -1, axis=0) - poly
+    cross = edges[:, 0] * np.roll(edges[:, 1], -1) - edges[:, 1] * np.roll(edges[:, 0], -1)
+    cross = cross[np.abs(cross) > EPS]
+    return bool(np.all(cross > 0) or np.all(cross < 0))
+
+
+def convex_hull(points: np.ndarray) -> np.ndarray:
+    """Andrew monotone chain; saat yönü tersi köşeler"""
+    pts = np.unique(points, axis=0)
+    if len(pts) < 3:
+        return pts
+
+    def build(seq):
+        chain = []
+        for p in seq:
+            while len(chain) >= 2:
+                (ax, ay), (bx, by) = chain[-2], chain[-1]
+                if (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax) > EPS:
+                    break
+                chain.pop()
+            chain.append((p[0], p[1]))
+        return chain
+
+    lower = build(pts)
+    upper = build(pts[::-1])
+    return np.array(lower[:-1] + upper[:-1])
+
+
+def _min_width(poly: np.ndarray) -> float:
+    """Dışbükey çokgenin en dar genişliği (kenar başına en uzak köşe)"""
+    edges = np.roll(poly, -1, axis=0) - poly
+    lengths = np.hypot(edges[:, 0], edges[:, 1])
+    valid = lengths > EPS
+    edges, starts, lengths = edges[valid], poly[valid], lengths[valid]
+    rel = poly[None, :, :] - starts[:, None, :]
+    dist = np.abs(edges[:, None, 0] * rel[:, :, 1] - edges[:, None, 1] * rel[:, :, 0]) / lengths[:, None]
+    return float(dist.max(axis=1).min())
+
+
+def _inset_convex(poly: np.ndarray, distance: float) -> Optional[np.ndarray]:
+    """Dışbükey çokgeni `distance` kadar içe ötele (yarı düzlem kırpma); boşsa None"""
+    if polygon_area(poly) < 0:
+        poly = poly[::-1]
+    result = poly
+    for start, end in zip(poly, np.roll(poly, -1, axis=0)):
+        edge = end - start
+        length = math.hypot(edge[0], edge[1])
+        if length < EPS:
+            continue
+        inward = np.array([-edge[1], edge[0]]) / length
+        result = _clip_half_plane(result, inward, float(np.dot(inward, start)) + distance)
+        if result is None:
+            return None
+    if len(result) < 3 or polygon_area(result) < 1.0:
+        return None
+    return result
+
+
+def _clip_half_plane(poly: np.ndarray, normal: np.ndarray, offset: float) -> Optional[np.ndarray]:
+    """Sutherland-Hodgman, tek yarı düzlem: normal·p >= offset kısmı"""
+    signed = poly @ normal - offset
+    inside = signed >= 0
+    if inside.all():
+        return poly
+    if not inside.any():
+        return None
+    nxt = np.roll(poly, -1, axis=0)
+    signed_next = np.roll(signed, -1)
+    crosses = inside != np.roll(inside, -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(crosses, signed / (signed - signed_next), 0.0)
+    intersections = poly + t[:, None] * (nxt - poly)
+    # Her kenar için sırayla: [köşe (içerideyse), kesişim (geçişse)]
+    candidates = np.stack([poly, intersections], axis=1).reshape(-1, 2)
+    mask = np.stack([inside, crosses], axis=1).reshape(-1)
+    clipped = candidates[mask]
+    keep = np.any(np.abs(clipped - np.roll(clipped, 1, axis=0)) > 1e-6, axis=1)
+    clipped = clipped[keep]
+    return clipped if len(clipped) >= 3 else None
+
+
+def _path_length(points: np.ndarray) -> float:
+    if len(points) < 2:
+        return 0.0
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+# ========================================
+# DÖNÜŞ MODELİ
+# ========================================
+
+def turn_length(lateral, turn_radius: float):
+    """Ters yönlü paralel şeride U dönüşü uzunluğu (m); `lateral` dizi olabilir"""
+    lateral = np.abs(np.asarray(lateral, dtype=np.float64))
+    radius = float(turn_radius)
+    if radius <= 0:
+        return lateral
+    wide = lateral >= 2.0 * radius
+    omega = radius * (np.pi + 4.0 * np.arccos(np.clip((lateral + 2.0 * radius) / (4.0 * radius), -1.0, 1.0)))
+    return np.where(wide, np.pi * radius + (lateral - 2.0 * radius), omega)
+
+
+def _racetrack_skip(spacing: float, turn_radius: float) -> int:
+    if turn_radius <= 0 or spacing >= 2.0 * turn_radius:
+        return 1
+    return int(math.ceil(2.0 * turn_radius / spacing)) + 1
+
+
+def _racetrack_order(count: int, skip: int) -> np.ndarray:
+    """0, k, 1, k+1, ... blokları (2k şerit); son kısmi blok aynı düzenle küçültülür"""
+    order = []
+    base = 0
+    while base < count:
+        size = min(2 * skip, count - base)
+        half = size // 2
+        if half == 0:
+            order.append(base)
+        else:
+            for i in range(half):
+                order.extend((base + i, base + half + i))
+            if size % 2:
+                order.append(base + size - 1)
+        base += size
+    return np.array(order, dtype=int)
+
+
+# ========================================
+# BOUSTROPHEDON
+# ========================================
+
+def _rotate(points: np.ndarray, angle: float) -> np.ndarray:
+    """(kuzey, doğu) -> (u: şerit boyunca, v: şeritlere dik); açı kuzeyden radyan"""
+    c, s = math.cos(angle), math.sin(angle)
+    return np.column_stack([points[:, 0] * c + points[:, 1] * s,
+                            -points[:, 0] * s + points[:, 1] * c])
+
+
+def _unrotate(points: np.ndarray, angle: float) -> np.ndarray:
+    c, s = math.cos(angle), math.sin(angle)
+    return np.column_stack([points[:, 0] * c - points[:, 1] * s,
+                            points[:, 0] * s + points[:, 1] * c])
+
+
+def _lane_segments(rotated: np.ndarray, swath: float):
+    """
+    Şerit seviyeleri ve her seviyede alan içi aralıklar.
+
+    Returns:
+        levels (L,), xs (L, E) sıralı kesişimler (inf dolgulu), counts (L,)
+    """
+    u, v = rotated[:, 0], rotated[:, 1]
+    vmin, vmax = float(v.min()), float(v.max())
+    span = vmax - vmin
+    count = max(1, int(math.ceil(span / swath - 1e-9)))
+    levels = vmin + (np.arange(count) + 0.5) * (span / count)
+
+    u0, v0 = u, v
+    u1, v1 = np.roll(u, -1), np.roll(v, -1)
+    lo, hi = np.minimum(v0, v1), np.maximum(v0, v1)
+    level = levels[:, None]
+    crosses = (level >= lo) & (level < hi)
+    dv = np.where(v1 != v0, v1 - v0, 1.0)
+    xs = np.where(crosses, u0 + (level - v0) / dv * (u1 - u0), np.inf)
+    xs.sort(axis=1)
+    return levels, xs, crosses.sum(axis=1)
+
+
+def _estimate_cost(rotated: np.ndarray, swath: float, turn_radius: float) -> float:
+    """Açı ön eleme: şerit uzunluğu + şerit sayısı kadar dönüş"""
+    levels, xs, counts = _lane_segments(rotated, swath)
+    finite = np.where(np.isfinite(xs), xs, 0.0)
+    finite = finite[:, :finite.shape[1] - finite.shape[1] % 2]
+    lane_length = float((finite[:, 1::2] - finite[:, 0::2]).sum())
+    segments = int(counts.sum()) // 2
+    spacing = float(levels[1] - levels[0]) if len(levels) > 1 else swath
+    skip = _racetrack_skip(spacing, turn_radius)
+    per_turn = float(turn_length(spacing, turn_radius))
+    if skip > 1:
+        per_turn = min(per_turn, float(turn_length(skip * spacing, turn_radius)
+                                       + turn_length((skip - 1) * spacing, turn_radius)) / 2.0)
+    return lane_length + max(0, segments - 1) * per_turn
+
+
+def _decompose_cells(levels, xs, counts) -> List[np.ndarray]:
+    """
+    Şerit aralıklarını hücrelere ayır: bir aralık önceki seviyede tam bir
+    aralıkla örtüşüyor ve o da yalnız bununla örtüşüyorsa aynı hücrede
+    devam eder; bölünme / birleşmede yeni hücre açılır.
+
+    Returns:
+        Hücre başına (M, 3) dizi: v, u_başlangıç, u_bitiş
+    """
+    cells: List[list] = []
+    previous: List[Tuple[float, float, int]] = []   # (a, b, hücre)
+    for level, row, count in zip(levels, xs, counts):
+        segments = row[:count - count % 2].reshape(-1, 2)
+        segments = segments[segments[:, 1] - segments[:, 0] > EPS]
+        overlaps = [[j for j, (pa, pb, _cell) in enumerate(previous) if pa < b and a < pb]
+                    for a, b in segments]
+        current = []
+        for (a, b), links in zip(segments, overlaps):
+            cell = None
+            if len(links) == 1 and sum(1 for other in overlaps if links[0] in other) == 1:
+                cell = previous[links[0]][2]
+            if cell is None:
+                cell = len(cells)
+                cells.append([])
+            cells[cell].append((level, a, b))
+            current.append((a, b, cell))
+        previous = current
+    return [np.array(cell) for cell in cells]
+
+
+def _cell_variants(cell: np.ndarray, turn_radius: float):
+    """
+    Hücre için uçuş varyantları (şerit sırası x ilk şerit yönü).
+
+    Returns:
+        [(maliyet, dönüş uzunluğu, giriş (u, v), çıkış (u, v), waypoint'ler (K, 2))]
+    """
+    count = len(cell)
+    orders = [np.arange(count)]
+    if count > 2:
+        spacing = abs(float(np.median(np.diff(cell[:, 0]))))
+        skip = _racetrack_skip(spacing, turn_radius)
+        if skip > 1:
+            orders.append(_racetrack_order(count, skip))
+    orders += [order[::-1] for order in orders]
+
+    variants = []
+    for order in orders:
+        lanes = cell[order]
+        for forward in (True, False):
+            flip = (np.arange(count) % 2 == 0) != forward
+            starts = np.where(flip, lanes[:, 2], lanes[:, 1])
+            ends = np.where(flip, lanes[:, 1], lanes[:, 2])
+            turns = turn_length(np.diff(lanes[:, 0]), turn_radius)
+            turns = turns + np.abs(starts[1:] - ends[:-1])
+            turn_total = float(turns.sum())
+            points = np.empty((2 * count, 2))
+            points[0::2, 0], points[0::2, 1] = starts, lanes[:, 0]
+            points[1::2, 0], points[1::2, 1] = ends, lanes[:, 0]
+            variants.append((turn_total, turn_total, points[0], points[-1], points))
+    return variants
+
+
+def _plan_boustrophedon(poly: np.ndarray, swath: float, turn_radius: float,
+                        start: np.ndarray, angle: float) -> Tuple[float, CoveragePlan]:
+    rotated = _rotate(poly, angle)
+    levels, xs, counts = _lane_segments(rotated, swath)
+    cells = [cell for cell in _decompose_cells(levels, xs, counts) if len(cell)]
+    position = _rotate(start[None, :], angle)[0]
+
+    path = [position[None, :]]
+    coverage = float(sum((cell[:, 2] - cell[:, 1]).sum() for cell in cells))
+    turn_total = 0.0
+    transit = 0.0
+    turns = 0
+    remaining = {i: _cell_variants(cell, turn_radius) for i, cell in enumerate(cells)}
+    while remaining:
+        best = None
+        for index, variants in remaining.items():
+            for cost, turn_cost, entry, _exit, points in variants:
+                hop = math.hypot(entry[0] - position[0], entry[1] - position[1])
+                if best is None or hop + cost < best[0]:
+                    best = (hop + cost, hop, turn_cost, index, points)
+        _score, hop, turn_cost, index, points = best
+        del remaining[index]
+        transit += hop
+        turn_total += turn_cost
+        turns += len(points) // 2 - 1 + (1 if len(path) > 1 else 0)
+        path.append(points)
+        position = points[-1]
+
+    waypoints = _unrotate(np.vstack(path[1:]), angle)
+    plan = CoveragePlan(
+        pattern='boustrophedon',
+        waypoints=waypoints,
+        sweep_angle=math.degrees(angle) % 180.0,
+        lanes=int(sum(len(cell) for cell in cells)),
+        turns=turns,
+        coverage_length=coverage,
+        turn_length=turn_total,
+        transit_length=transit,
+    )
+    if len(cells) > 1:
+        plan.notes.append(f"{len(cells)} hücre")
+    return plan.total_length, plan
+
+
+def _candidate_angles(poly: np.ndarray, angle_step: float) -> np.ndarray:
+    hull = convex_hull(poly)
+    edges = np.roll(hull, -1, axis=0) - hull
+    edge_angles = np.degrees(np.arctan2(edges[:, 1], edges[:, 0])) % 180.0
+    sweep = np.arange(0.0, 180.0, angle_step) if angle_step > 0 else np.empty(0)
+    angles = np.concatenate([edge_angles, sweep])
+    # 0.5° içindeki yinelenenleri at
+    angles = np.unique(np.round(angles * 2.0) / 2.0 % 180.0)
+    return np.radians(angles)
+
+
+def _best_boustrophedon(poly: np.ndarray, swath: float, turn_radius: float, start: np.ndarray,
+                        angle_step: float, sweep_angle: Optional[float]) -> Optional[CoveragePlan]:
+    if sweep_angle is not None:
+        candidates = [math.radians(sweep_angle)]
+    else:
+        angles = _candidate_angles(poly, angle_step)
+        estimates = np.array([_estimate_cost(_rotate(poly, a), swath, turn_radius) for a in angles])
+        candidates = angles[np.argsort(estimates)[:REFINE_CANDIDATES]]
+
+    best = None
+    for angle in candidates:
+        cost, plan = _plan_boustrophedon(poly, swath, turn_radius, start, float(angle))
+        if best is None or cost < best[0]:
+            best = (cost, plan)
+    return best[1] if best else None
+
+
+# ========================================
+# SPİRAL
+# ========================================
+
+def _plan_spiral(poly: np.ndarray, swath: float, turn_radius: float, start: np.ndarray,
+                 angle_step: float) -> Optional[CoveragePlan]:
+    """Dışbükey alanda içe halkalar; dönüşe sığmayan çekirdek şeritlerle"""
+    if not _is_convex(poly):
+        return None
+    if polygon_area(poly) < 0:
+        poly = poly[::-1]
+
+    path = []
+    position = start
+    rings = 0
+    depth = 0.0
+    transit = 0.0
+    coverage = 0.0
+    turns = 0
+    while True:
+        ring = _inset_convex(poly, depth + swath / 2.0)
+        if ring is None or _min_width(ring) < 2.0 * turn_radius:
+            break
+        # Halkaya en yakın köşeden gir, aynı köşede kapat
+        entry = int(np.argmin(np.hypot(*(ring - position).T)))
+        ring = np.roll(ring, -entry, axis=0)
+        closed = np.vstack([ring, ring[:1]])
+        transit += math.hypot(*(closed[0] - position))
+        coverage += _path_length(closed)
+
+        headings = np.diff(closed, axis=0)
+        angles = np.degrees(np.arctan2(headings[:, 1], headings[:, 0]))
+        change = np.abs((np.diff(np.concatenate([angles, angles[:1]])) + 180.0) % 360.0 - 180.0)
+        turns += int((change >= TURN_ANGLE_DEG).sum())
+
+        path.append(closed)
+        position = closed[-1]
+        rings += 1
+        depth += swath
+
+    if rings == 0:
+        return None
+
+    plan = CoveragePlan(
+        pattern='spiral',
+        waypoints=np.vstack(path),
+        sweep_angle=None,
+        lanes=rings,
+        turns=turns,
+        coverage_length=coverage,
+        turn_length=0.0,
+        transit_length=transit,
+    )
+
+    # Halkalarla kapanmayan iç çekirdek
+    core = _inset_convex(poly, depth)
+    if core is not None:
+        inner = _best_boustrophedon(core, swath, turn_radius, position, angle_step, None)
+        if inner is not None:
+            plan.waypoints = np.vstack([plan.waypoints, inner.waypoints])
+            plan.sweep_angle = inner.sweep_angle
+            plan.lanes += inner.lanes
+            plan.turns += inner.turns + 1
+            plan.coverage_length += inner.coverage_length
+            plan.turn_length += inner.turn_length
+            plan.transit_length += inner.transit_length
+            plan.notes.append(f"iç çekirdek {inner.lanes} şerit")
+    return plan
+
+
+# ========================================
+# GİRİŞ NOKTALARI
+# ========================================
+
+def plan_coverage(polygon: Sequence[Sequence[float]], swath: float, turn_radius: float = 0.0,
+                  pattern: str = 'auto', start: Optional[Sequence[float]] = None,
+                  angle_step: float = DEFAULT_ANGLE_STEP_DEG, sweep_angle: Optional[float] = None,
+                  turn_penalty: float = 0.0) -> CoveragePlan:
+    """
+    Çokgen alan için kapsama rotası.
+
+    Args:
+        polygon: (N, 2) kuzey/doğu köşeleri (m), kendini kesmeyen
+        swath: Sensör tarama genişliği (m); şerit aralığı bunu aşmaz
+        turn_radius: Sabit kanat dönüş yarıçapı (m); 0 = yerinde dönebilen araç
+        pattern: 'auto' | 'boustrophedon' | 'spiral' (spiral yalnız dışbükey alan)
+        start: Rotaya giriş maliyeti için başlangıç (kuzey, doğu); varsayılan (0, 0)
+        angle_step: Şerit yönü aday açı aralığı (derece)
+        sweep_angle: Şerit yönünü sabitle (kuzeyden derece); None = optimize et
+        turn_penalty: Desen seçiminde dönüş başına ek maliyet (m)
+
+    Raises:
+        ValueError: Geçersiz alan / parametre
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Bilinmeyen desen: {pattern} (seçenekler: {', '.join(PATTERNS)})")
+    if swath <= 0:
+        raise ValueError("Tarama genişliği pozitif olmalı")
+    if turn_radius < 0:
+        raise ValueError("Dönüş yarıçapı negatif olamaz")
+
+    started = time.perf_counter()
+    poly = _as_polygon(polygon)
+    origin = np.zeros(2) if start is None else np.asarray(start, dtype=np.float64)
+
+    plans = []
+    if pattern in ('auto', 'boustrophedon'):
+        plans.append(_best_boustrophedon(poly, float(swath), float(turn_radius), origin,
+                                         angle_step, sweep_angle))
+    if pattern in ('auto', 'spiral'):
+        spiral = _plan_spiral(poly, float(swath), float(turn_radius), origin, angle_step)
+        if spiral is None and pattern == 'spiral':
+            raise ValueError("Spiral desen dışbükey ve dönüş yarıçapına yetecek genişlikte alan ister")
+        plans.append(spiral)
+
+    plans = [plan for plan in plans if plan is not None]
+    plan = min(plans, key=lambda p: p.total_length + turn_penalty * p.turns)
+    plan.area = abs(polygon_area(poly))
+    plan.planning_ms = (time.perf_counter() - started) * 1000.0
+    return plan
+
+
+def plan_coverage_lla(latitudes: Sequence[float], longitudes: Sequence[float], swath: float,
+                      turn_radius: float = 0.0, start: Optional[Tuple[float, float]] = None,
+                      **kwargs) -> CoveragePlan:
+    """
+    Enlem/boylam köşeli alan için `plan_coverage`.
+
+    Planlama `start` (verilmezse ilk köşe) etrafında yerel NED düzleminde
+    yapılır; waypoint'ler `plan.to_lla()` ile geri çevrilir.
+    """
+    lats = np.asarray(latitudes, dtype=np.float64)
+    lons = np.asarray(longitudes, dtype=np.float64)
+    reference = (float(lats[0]), float(lons[0])) if start is None else (float(start[0]), float(start[1]))
+    north, east, _down = lla_to_ned(lats, lons, 0.0, reference[0], reference[1], 0.0)
+    plan = plan_coverage(np.column_stack([north, east]), swath, turn_radius, **kwargs)
+    plan.reference = reference
+    return plan
+
+
+def rectangle(north_min: float, east_min: float, north_max: float, east_max: float) -> np.ndarray:
+    """Eksen hizalı dikdörtgen alan (varsayılan devriye alanları için)"""
+    return np.array([[north_min, east_min], [north_min, east_max],
+                     [north_max, east_max], [north_max, east_min]], dtype=np.float64)
@@ -0,0 +1,1126 @@
+#!/usr/bin/env python3
+# core/failsafe_worker.py
+"""
+Failsafe Worker
+===============
+
+Uzun ömürlü failsafe izleme süreci. Araca bir kez bağlanır ve monitoring
+durdurulana kadar açık kalır; eşik değişiklikleri yeniden bağlanmadan,
+bir sonraki telemetri örneğinden itibaren uygulanır.
+
+Kullanım:
+    python3 core/failsafe_worker.py --connection udp://:14540 --engine stream
+
+Çıktı (stdout): her satır bir JSON nesnesi
+    {"timestamp": ..., "results": [...], "state": {...}, ...}   durum
+    {"control": "<komut>", "status": "ok" | "error", ...}       komut cevabı
+
+Kontrol kanalı (stdin): her satır bir JSON komutu
+    {"cmd": "config", "config": {"battery": {"warning_percent": 40}}}
+    {"cmd": "pause"}
+    {"cmd": "resume"}
+    {"cmd": "shutdown"}
+
+stdin kapanırsa (GUI süreci öldüyse) worker kendini kapatır.
+"""
+
+import argparse
+import sys
+import json
+import asyncio
+import math
+import threading
+import time
+from datetime import datetime
+
+
+try:
+    from mavsdk import System
+    MAVSDK_AVAILABLE = True
+except ImportError:
+    MAVSDK_AVAILABLE = False
+
+
+CHECK_TIMEOUT_S = 3.0  # Kontrol başına süre sınırı
+
+# Stream (olay tabanlı) motor ayarları
+STREAM_RATE_HZ = 20               # Telemetri akış hızı isteği
+STREAM_PUBLISH_INTERVAL_S = 1.0   # Değişiklik yokken durum yayın aralığı
+DEBOUNCE_RAISE_SAMPLES = 2        # Seviye yükselmesi için ardışık örnek sayısı
+DEBOUNCE_CLEAR_HOLD_S = 1.0       # Seviye düşmesi için bekleme süresi
+
+
+class FailsafeLevel:
+    """Failsafe seviye sabitleri"""
+    NORMAL = "normal"
+    WARNING = "warning" 
+    CRITICAL = "critical"
+    EMERGENCY = "emergency"
+
+LEVEL_RANK = {
+    FailsafeLevel.NORMAL: 0,
+    FailsafeLevel.WARNING: 1,
+    FailsafeLevel.CRITICAL: 2,
+    FailsafeLevel.EMERGENCY: 3
+}
+
+
+class LevelDebouncer:
+    """
+    Seviye geçişlerini süzer (chatter önleme):
+    - Yükselme: en az `raise_samples` ardışık örnek daha yüksek seviyede olmalı
+    - Düşme: daha düşük seviye `clear_hold_s` boyunca kesintisiz sürmeli
+    """
+    
+    def __init__(self, raise_samples=DEBOUNCE_RAISE_SAMPLES, clear_hold_s=DEBOUNCE_CLEAR_HOLD_S):
+        self.raise_samples = max(1, int(raise_samples))
+        self.clear_hold_s = clear_hold_s
+        self.level = FailsafeLevel.NORMAL
+        self._raise_count = 0
+        self._raise_level = None
+        self._lower_since = None
+        self._lower_level = None
+    
+    def update(self, level, now):
+        """Ham seviyeyi işle; onaylı seviye değiştiyse True döndür"""
+        rank = LEVEL_RANK.get(level, 1)
+        current = LEVEL_RANK[self.level]
+        
+        if rank > current:
+            self._lower_since = None
+            self._raise_count += 1
+            # Seri boyunca görülen en düşük yüksek seviyeye çık
+            if self._raise_level is None or rank < LEVEL_RANK[self._raise_level]:
+                self._raise_level = level
+            if self._raise_count >= self.raise_samples:
+                return self._commit(self._raise_level)
+            
+        elif rank < current:
+            self._raise_count = 0
+            self._raise_level = None
+            if self._lower_since is None:
+                self._lower_since = now
+                self._lower_level = level
+            elif rank > LEVEL_RANK[self._lower_level]:
+                self._lower_level = level
+            if now - self._lower_since >= self.clear_hold_s:
+                return self._commit(self._lower_level)
+            
+        else:
+            self._raise_count = 0
+            self._raise_level = None
+            self._lower_since = None
+        
+        return False
+    
+    def _commit(self, level):
+        self.level = level
+        self._raise_count = 0
+        self._raise_level = None
+        self._lower_since = None
+        self._lower_level = None
+        return True
+
+
+class FailsafeMonitor:
+    """Real-time failsafe monitoring engine"""
+    
+    def __init__(self, connection_string="udp://:14540", config=None):
+        self.connection_string = connection_string
+        self.system = None
+        self._connect_lock = None
+        self.config = config or self.get_default_config()
+        self.running = True
+        self.paused = False
+        self.last_alert_times = {}
+        self.failsafe_history = []
+        self.current_state = {
+            'battery_level': FailsafeLevel.NORMAL,
+            'gps_level': FailsafeLevel.NORMAL,
+            'rc_level': FailsafeLevel.NORMAL,
+            'telemetry_level': FailsafeLevel.NORMAL,
+            'speed_level': FailsafeLevel.NORMAL,
+            'attitude_level': FailsafeLevel.NORMAL,
+            'altitude_level': FailsafeLevel.NORMAL,
+            'geofence_level': FailsafeLevel.NORMAL
+        }
+        
+        # Stream motoru durumu
+        self.latest_results = {}
+        self.last_sample_times = {}
+        self.debouncers = {}
+        self.changed_types = set()
+        self._publish_event = None
+        
+    def get_default_config(self):
+        """Varsayılan failsafe konfigürasyonu"""
+        return {
+            'battery': {
+                'warning_percent': 50,
+                'critical_percent': 30,
+                'emergency_percent': 20,
+                'voltage_critical': 11.1
+            },
+            'gps': {
+                'warning_satellites': 7,
+                'critical_satellites': 5,
+                'emergency_satellites': 3
+            },
+            'rc': {
+                'warning_rssi': -50,
+                'critical_rssi': -70,
+                'timeout_seconds': 5
+            },
+            'speed': {
+                'warning_horizontal': 15,
+                'critical_horizontal': 25,
+                'emergency_horizontal': 35,
+                'warning_vertical': 5,
+                'critical_vertical': 10
+            },
+            'attitude': {
+                'warning_angle': 30,
+                'critical_angle': 45,
+                'emergency_angle': 60
+            },
+            'altitude': {
+                'min_safe': 2,
+                'warning_low': 1,
+                'max_safe': 120,
+                'warning_high': 100
+            },
+            'actions': {
+                'auto_rtl_enabled': True,
+                'auto_land_enabled': True,
+                'emergency_stop_enabled': True
+            }
+        }
+    
+    def apply_config(self, config):
+        """Eşikleri yerinde güncelle (bölüm bazında birleştirme)"""
+        for section, values in config.items():
+            if isinstance(values, dict) and isinstance(self.config.get(section), dict):
+                self.config[section].update(values)
+            else:
+                self.config[section] = values
+    
+    def stop(self):
+        """Motoru durdur"""
+        self.running = False
+        if self._publish_event is not None:
+            self._publish_event.set()
+    
+    async def connect_to_system(self):
+        """MAVSDK sistemine bağlan (eşzamanlı kontroller tek bağlantıyı paylaşır)"""
+        if not MAVSDK_AVAILABLE:
+            raise Exception("MAVSDK kütüphanesi mevcut değil")
+        
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        
+        async with self._connect_lock:
+            if self.system:
+                return self.system
+            
+            system = System()
+            await system.connect(system_address=self.connection_string)
+            
+            # Bağlantı bekleme
+            async for state in system.core.connection_state():
+                if state.is_connected:
+                    break
+            
+            self.system = system
+        
+        return self.system
+    
+    async def get_telemetry_data(self, telemetry_stream, timeout=2.0):
+        """Güvenli telemetri verisi alma"""
+        try:
+            async def get_first_item():
+                async for data in telemetry_stream:
+                    return data
+                raise StopAsyncIteration("Stream bitti")
+            
+            data = await asyncio.wait_for(get_first_item(), timeout=timeout)
+            return data, None
+            
+        except asyncio.TimeoutError:
+            return None, "Timeout"
+        except Exception as e:
+            return None, str(e)
+    
+    def add_event(self, event_type, level, message, action_taken=None):
+        """Failsafe olayını kaydet"""
+        event = {
+            'timestamp': datetime.now().isoformat(),
+            'type': event_type,
+            'level': level,
+            'message': message,
+            'action_taken': action_taken
+        }
+        self.failsafe_history.append(event)
+        
+        # Son 100 olayı tut
+        if len(self.failsafe_history) > 100:
+            self.failsafe_history.pop(0)
+        
+        return event
+    
+    def should_alert(self, event_type, level):
+        """Uyarı vermeli mi kontrol et (spam önleme)"""
+        now = time.time()
+        last_alert = self.last_alert_times.get(f"{event_type}_{level}", 0)
+        
+        # Seviyeye göre uyarı sıklığı
+        intervals = {
+            FailsafeLevel.WARNING: 30,    # 30 saniye
+            FailsafeLevel.CRITICAL: 15,   # 15 saniye  
+            FailsafeLevel.EMERGENCY: 5    # 5 saniye
+        }
+        
+        interval = intervals.get(level, 60)
+        
+        if now - last_alert > interval:
+            self.last_alert_times[f"{event_type}_{level}"] = now
+            return True
+        return False
+    
+    def safe_float(self, value, default=0.0):
+        """Güvenli float dönüşümü"""
+        try:
+            if value is None:
+                return default
+            return float(value)
+        except (ValueError, TypeError):
+            return default
+    
+    def safe_int(self, value, default=0):
+        """Güvenli int dönüşümü"""
+        try:
+            if value is None:
+                return default
+            return int(value)
+        except (ValueError, TypeError):
+            return default
+    
+    def safe_getattr(self, obj, attr_name, default=None):
+        """Güvenli attribute erişimi"""
+        try:
+            return getattr(obj, attr_name, default)
+        except (AttributeError, TypeError):
+            return default
+    
+    def evaluate_battery_failsafe(self, battery):
+        """Batarya örneğini eşiklere göre değerlendir"""
+        # Güvenli değer alma
+        percent = self.safe_float(self.safe_getattr(battery, 'remaining_percent', 0))
+        voltage = self.safe_float(self.safe_getattr(battery, 'voltage_v', 0))
+        current = self.safe_float(self.safe_getattr(battery, 'current_a', 0))
+        
+        # Seviye belirleme
+        if percent <= self.config['battery']['emergency_percent']:
+            level = FailsafeLevel.EMERGENCY
+            message = f"KRİTİK BATARYA: %{percent:.1f} - OTOMATİK İNİŞ!"
+            action = "emergency_land"
+        elif percent <= self.config['battery']['critical_percent']:
+            level = FailsafeLevel.CRITICAL  
+            message = f"DÜŞÜK BATARYA: %{percent:.1f} - DERHAL DÖNÜN!"
+            action = "rtl_recommended"
+        elif percent <= self.config['battery']['warning_percent']:
+            level = FailsafeLevel.WARNING
+            message = f"Batarya azalıyor: %{percent:.1f}"
+            action = None
+        else:
+            level = FailsafeLevel.NORMAL
+            message = f"Batarya normal: %{percent:.1f}"
+            action = None
+        
+        # Voltaj kontrolü
+        if voltage < self.config['battery']['voltage_critical'] and level == FailsafeLevel.NORMAL:
+            level = FailsafeLevel.CRITICAL
+            message = f"DÜŞÜK VOLTAJ: {voltage:.1f}V - Kritik!"
+            action = "voltage_critical"
+        
+        self.current_state['battery_level'] = level
+        
+        return {
+            'type': 'battery',
+            'level': level,
+            'message': message,
+            'action': action,
+            'data': {
+                'percent': percent,
+                'voltage': voltage,
+                'current': current
+            }
+        }
+    
+    async def check_battery_failsafe(self):
+        """Batarya failsafe kontrolü"""
+        try:
+            if not self.system:
+                await self.connect_to_system()
+            
+            battery, error = await self.get_telemetry_data(
+                self.system.telemetry.battery()
+            )
+            
+            if error:
+                return {
+                    'type': 'battery',
+                    'level': FailsafeLevel.WARNING,
+                    'message': f"Batarya verisi alınamadı: {error}",
+                    'data': None
+                }
+            
+            if not battery:
+                return {
+                    'type': 'battery',
+                    'level': FailsafeLevel.WARNING,
+                    'message': "Batarya verisi None",
+                    'data': None
+                }
+            
+            return self.evaluate_battery_failsafe(battery)
+            
+        except Exception as e:
+            return {
+                'type': 'battery',
+                'level': FailsafeLevel.WARNING,
+                'message': f"Batarya kontrolü hatası: {str(e)}",
+                'data': None
+            }
+    
+    def gps_fix_type_to_int(self, fix_type):
+        """GPS fix type enum'unu int'e çevir"""
+        try:
+            if fix_type is None:
+                return 0
+            
+            # MAVSDK fix type enum değerleri
+            if hasattr(fix_type, 'value'):
+                return fix_type.value
+            elif isinstance(fix_type, int):
+                return fix_type
+            else:
+                # String karşılaştırma
+                fix_str = str(fix_type).lower()
+                if 'no_fix' in fix_str or 'none' in fix_str:
+                    return 0
+                elif '2d' in fix_str:
+                    return 2
+                elif '3d' in fix_str:
+                    return 3
+                elif 'dgps' in fix_str or 'rtk' in fix_str:
+                    return 4
+                else:
+                    return 0
+        except:
+            return 0
+    
+    def evaluate_gps_failsafe(self, gps):
+        """GPS örneğini eşiklere göre değerlendir"""
+        # Güvenli GPS verisi alma
+        try:
+            satellites = self.safe_int(self.safe_getattr(gps, 'num_satellites', 0))
+            fix_type_raw = self.safe_getattr(gps, 'fix_type', None)
+            fix_type = self.gps_fix_type_to_int(fix_type_raw)
+            
+        except Exception as e:
+            return {
+                'type': 'gps',
+                'level': FailsafeLevel.CRITICAL,
+                'message': f"GPS attribute hatası: {str(e)}",
+                'action': 'gps_loss',
+                'data': None
+            }
+        
+        # Fix type kontrolü - DÜZELTİLMİŞ
+        if fix_type < 2:  # No fix veya invalid
+            level = FailsafeLevel.EMERGENCY
+            message = f"GPS FIX YOK - {satellites} uydu - ACİL İNİŞ!"
+            action = "emergency_land"
+        elif satellites <= self.config['gps']['emergency_satellites']:
+            level = FailsafeLevel.EMERGENCY
+            message = f"KRİTİK GPS: {satellites} uydu - Pozisyon güvenilmez!"
+            action = "stabilize_mode"
+        elif satellites <= self.config['gps']['critical_satellites']:
+            level = FailsafeLevel.CRITICAL
+            message = f"DÜŞÜK GPS: {satellites} uydu - Dikkat!"
+            action = "gps_degraded"
+        elif satellites <= self.config['gps']['warning_satellites']:
+            level = FailsafeLevel.WARNING
+            message = f"GPS zayıfladı: {satellites} uydu"
+            action = None
+        else:
+            level = FailsafeLevel.NORMAL
+            message = f"GPS normal: {satellites} uydu, {fix_type}D fix"
+            action = None
+        
+        self.current_state['gps_level'] = level
+        
+        return {
+            'type': 'gps',
+            'level': level,
+            'message': message,
+            'action': action,
+            'data': {
+                'satellites': satellites,
+                'fix_type': fix_type
+            }
+        }
+    
+    async def check_gps_failsafe(self):
+        """GPS failsafe kontrolü - DÜZELTİLMİŞ VERSİYON"""
+        try:
+            if not self.system:
+                await self.connect_to_system()
+            
+            # GPS info alma
+            gps, error = await self.get_telemetry_data(
+                self.system.telemetry.gps_info()
+            )
+            
+            if error:
+                return {
+                    'type': 'gps',
+                    'level': FailsafeLevel.CRITICAL,
+                    'message': f"GPS verisi alınamadı: {error}",
+                    'action': 'gps_loss',
+                    'data': None
+                }
+            
+            if not gps:
+                return {
+                    'type': 'gps',
+                    'level': FailsafeLevel.CRITICAL,
+                    'message': "GPS verisi None",
+                    'action': 'gps_loss',
+                    'data': None
+                }
+            
+            return self.evaluate_gps_failsafe(gps)
+            
+        except Exception as e:
+            return {
+                'type': 'gps',
+                'level': FailsafeLevel.CRITICAL,
+                'message': f"GPS kontrolü hatası: {str(e)}",
+                'data': None
+            }
+    
+    def evaluate_speed_failsafe(self, velocity):
+        """Hız örneğini eşiklere göre değerlendir"""
+        # Güvenli velocity hesaplama - DÜZELTİLMİŞ
+        try:
+            north = self.safe_float(self.safe_getattr(velocity, 'north_m_s', 0.0))
+            east = self.safe_float(self.safe_getattr(velocity, 'east_m_s', 0.0))
+            down = self.safe_float(self.safe_getattr(velocity, 'down_m_s', 0.0))
+            
+            horizontal_speed = math.sqrt(north**2 + east**2)
+            vertical_speed = abs(down)
+            
+        except Exception as e:
+            return {
+                'type': 'speed',
+                'level': FailsafeLevel.WARNING,
+                'message': f"Hız hesaplama hatası: {str(e)}",
+                'data': None
+            }
+        
+        # Yatay hız kontrolü
+        if horizontal_speed > self.config['speed']['emergency_horizontal']:
+            level = FailsafeLevel.EMERGENCY
+            message = f"AŞIRI HIZ: {horizontal_speed:.1f} m/s - FREN!"
+            action = "emergency_brake"
+        elif horizontal_speed > self.config['speed']['critical_horizontal']:
+            level = FailsafeLevel.CRITICAL
+            message = f"TEHLİKELİ HIZ: {horizontal_speed:.1f} m/s"
+            action = "speed_limit"
+        elif horizontal_speed > self.config['speed']['warning_horizontal']:
+            level = FailsafeLevel.WARNING
+            message = f"Yüksek hız: {horizontal_speed:.1f} m/s"
+            action = None
+        else:
+            level = FailsafeLevel.NORMAL
+            message = f"Hız normal: {horizontal_speed:.1f} m/s"
+            action = None
+        
+        # Dikey hız kontrolü - DÜZELTİLMİŞ
+        if vertical_speed > self.config['speed'].get('critical_vertical', 10):
+            if level == FailsafeLevel.NORMAL:
+                level = FailsafeLevel.CRITICAL
+            message += f" | Dikey: {vertical_speed:.1f} m/s TEHLİKELİ!"
+            action = "vertical_speed_limit"
+        elif vertical_speed > self.config['speed'].get('warning_vertical', 5):
+            if level == FailsafeLevel.NORMAL:
+                level = FailsafeLevel.WARNING
+            message += f" | Dikey hız yüksek: {vertical_speed:.1f} m/s"
+        
+        self.current_state['speed_level'] = level
+        
+        return {
+            'type': 'speed',
+            'level': level,
+            'message': message,
+            'action': action,
+            'data': {
+                'horizontal_speed': horizontal_speed,
+                'vertical_speed': vertical_speed,
+                'north': north,
+                'east': east,
+                'down': down
+            }
+        }
+    
+    async def check_speed_failsafe(self):
+        """Hız failsafe kontrolü - DÜZELTİLMİŞ VERSİYON"""
+        try:
+            if not self.system:
+                await self.connect_to_system()
+            
+            # Velocity verisi alma
+            velocity, error = await self.get_telemetry_data(
+                self.system.telemetry.velocity_ned()
+            )
+            
+            if error:
+                return {
+                    'type': 'speed',
+                    'level': FailsafeLevel.WARNING,
+                    'message': f"Hız verisi alınamadı: {error}",
+                    'data': None
+                }
+            
+            if not velocity:
+                return {
+                    'type': 'speed',
+                    'level': FailsafeLevel.WARNING,
+                    'message': "Hız verisi None",
+                    'data': None
+                }
+            
+            return self.evaluate_speed_failsafe(velocity)
+            
+        except Exception as e:
+            return {
+                'type': 'speed',
+                'level': FailsafeLevel.WARNING,
+                'message': f"Hız kontrolü hatası: {str(e)}",
+                'data': None
+            }
+    
+    def evaluate_attitude_failsafe(self, attitude):
+        """Açı örneğini eşiklere göre değerlendir"""
+        # Güvenli attitude hesaplama - DÜZELTİLMİŞ
+        try:
+            roll_deg = self.safe_float(self.safe_getattr(attitude, 'roll_deg', 0.0))
+            pitch_deg = self.safe_float(self.safe_getattr(attitude, 'pitch_deg', 0.0))
+            yaw_deg = self.safe_float(self.safe_getattr(attitude, 'yaw_deg', 0.0))
+            
+            roll = abs(roll_deg)
+            pitch = abs(pitch_deg)
+            yaw = yaw_deg
+            
+            max_angle = max(roll, pitch)
+            
+        except Exception as e:
+            return {
+                'type': 'attitude',
+                'level': FailsafeLevel.WARNING,
+                'message': f"Açı hesaplama hatası: {str(e)}",
+                'data': None
+            }
+        
+        if max_angle > self.config['attitude']['emergency_angle']:
+            level = FailsafeLevel.EMERGENCY
+            message = f"KONTROL KAYBI: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
+            action = "stabilize_emergency"
+        elif max_angle > self.config['attitude']['critical_angle']:
+            level = FailsafeLevel.CRITICAL
+            message = f"TEHLİKELİ EĞİM: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
+            action = "attitude_correction"
+        elif max_angle > self.config['attitude']['warning_angle']:
+            level = FailsafeLevel.WARNING
+            message = f"Yüksek eğim: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
+            action = None
+        else:
+            level = FailsafeLevel.NORMAL
+            message = f"Açı normal: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
+            action = None
+        
+        self.current_state['attitude_level'] = level
+        
+        return {
+            'type': 'attitude',
+            'level': level,
+            'message': message,
+            'action': action,
+            'data': {
+                'roll': roll,
+                'pitch': pitch,
+                'yaw': yaw
+            }
+        }
+    
+    async def check_attitude_failsafe(self):
+        """Açı failsafe kontrolü - DÜZELTİLMİŞ VERSİYON"""
+        try:
+            if not self.system:
+                await self.connect_to_system()
+            
+            attitude, error = await self.get_telemetry_data(
+                self.system.telemetry.attitude_euler()
+            )
+            
+            if error:
+                return {
+                    'type': 'attitude',
+                    'level': FailsafeLevel.WARNING,
+                    'message': f"Açı verisi alınamadı: {error}",
+                    'data': None
+                }
+            
+            if not attitude:
+                return {
+                    'type': 'attitude',
+                    'level': FailsafeLevel.WARNING,
+                    'message': "Açı verisi None",
+                    'data': None
+                }
+            
+            return self.evaluate_attitude_failsafe(attitude)
+            
+        except Exception as e:
+            return {
+                'type': 'attitude',
+                'level': FailsafeLevel.WARNING,
+                'message': f"Açı kontrolü hatası: {str(e)}",
+                'data': None
+            }
+    
+    async def execute_failsafe_action(self, action, level, event_type):
+        """Failsafe aksiyonunu gerçekleştir"""
+        if not self.config['actions'].get('auto_rtl_enabled', True):
+            return f"Otomatik aksiyon devre dışı: {action}"
+        
+        try:
+            if action == "emergency_land" and self.config['actions'].get('auto_land_enabled', True):
+                await self.system.action.land()
+                return "Acil iniş komutu gönderildi"
+                
+            elif action == "rtl_recommended":
+                # Sadece öneri, otomatik eylem yok
+                return "RTL önerildi (manuel)"
+                
+            elif action == "emergency_brake":
+                # Hız sınırlama modu
+                try:
+                    await self.system.action.set_maximum_speed(5.0)
+                    return "Acil fren - Hız sınırlandı"
+                except Exception:
+                    return "Acil fren komutu - Hız sınırlama desteklenmiyor"
+                
+            elif action == "stabilize_emergency":
+                # Stabilize moda geçiş
+                return "Stabilize moduna geçiş önerildi"
+                
+            elif action == "gps_loss":
+                # GPS kaybında stabilize mod
+                return "GPS kaybı - Stabilize mod önerildi"
+                
+            else:
+                return f"Bilinmeyen aksiyon: {action}"
+                
+        except Exception as e:
+            return f"Aksiyon hatası: {str(e)}"
+    
+    async def _dispatch_action(self, result):
+        """Kritik/acil sonuç için failsafe aksiyonunu çalıştır ve olayı kaydet"""
+        if result.get('action') and result['level'] in [FailsafeLevel.CRITICAL, FailsafeLevel.EMERGENCY]:
+            if self.should_alert(result['type'], result['level']):
+                action_result = await self.execute_failsafe_action(
+                    result['action'], result['level'], result['type']
+                )
+                result['action_result'] = action_result
+                
+                # Event log'a ekle
+                self.add_event(
+                    result['type'],
+                    result['level'], 
+                    result['message'],
+                    action_result
+                )
+    
+    async def _run_check(self, check_type, check_func):
+        """Tek kontrolü kendi süre sınırıyla çalıştır, gerekirse aksiyonu hemen tetikle"""
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(check_func(), timeout=CHECK_TIMEOUT_S)
+            
+            # Aksiyon gerekiyorsa diğer kontrolleri beklemeden çalıştır
+            await self._dispatch_action(result)
+            
+        except asyncio.TimeoutError:
+            result = {
+                'type': check_type,
+                'level': FailsafeLevel.WARNING,
+                'message': 'Kontrol timeout',
+                'data': None
+            }
+        except Exception as e:
+            result = {
+                'type': check_type,
+                'level': FailsafeLevel.WARNING,
+                'message': f'Kontrol hatası: {str(e)}',
+                'data': None
+            }
+        
+        result['latency_ms'] = round((time.monotonic() - started) * 1000.0, 1)
+        return result
+    
+    async def run_monitoring_cycle(self):
+        """Tek bir monitoring döngüsü - tüm kontroller eşzamanlı çalışır"""
+        started = time.monotonic()
+        
+        checks = [
+            ('battery', self.check_battery_failsafe),
+            ('gps', self.check_gps_failsafe),
+            ('speed', self.check_speed_failsafe),
+            ('attitude', self.check_attitude_failsafe)
+        ]
+        
+        # Yavaş bir stream diğer kontrollerin tespit süresini geciktirmez
+        results = await asyncio.gather(
+            *(self._run_check(check_type, check_func) for check_type, check_func in checks)
+        )
+        
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'results': list(results),
+            'cycle_latency_ms': round((time.monotonic() - started) * 1000.0, 1),
+            'state': self.current_state.copy(),
+            'recent_events': self.failsafe_history[-5:]  # Son 5 olay
+        }
+    
+    # ==================== STREAM (OLAY TABANLI) MOTOR ====================
+    
+    def stream_sources(self):
+        """(tip, akış fabrikası, değerlendirici) listesi"""
+        telemetry = self.system.telemetry
+        return [
+            ('battery', telemetry.battery, self.evaluate_battery_failsafe),
+            ('gps', telemetry.gps_info, self.evaluate_gps_failsafe),
+            ('speed', telemetry.velocity_ned, self.evaluate_speed_failsafe),
+            ('attitude', telemetry.attitude_euler, self.evaluate_attitude_failsafe)
+        ]
+    
+    async def set_stream_rates(self, rate_hz):
+        """Akış hızlarını iste (desteklenmeyenler atlanır)"""
+        telemetry = self.system.telemetry
+        for name in ('set_rate_battery', 'set_rate_gps_info',
+                     'set_rate_velocity_ned', 'set_rate_attitude_euler'):
+            setter = getattr(telemetry, name, None)
+            if setter is None:
+                continue
+            try:
+                await asyncio.wait_for(setter(rate_hz), timeout=CHECK_TIMEOUT_S)
+            except Exception:
+                pass  # Rate ayarı opsiyonel - varsayılan hızla devam
+    
+    def stale_result(self, check_type):
+        """Akış süre sınırı içinde örnek vermediğinde üretilen sonuç"""
+        if check_type == 'gps':
+            return {
+                'type': 'gps',
+                'level': FailsafeLevel.CRITICAL,
+                'message': "GPS verisi alınamadı: Timeout",
+                'action': 'gps_loss',
+                'data': None
+            }
+        return {
+            'type': check_type,
+            'level': FailsafeLevel.WARNING,
+            'message': 'Kontrol timeout',
+            'data': None
+        }
+    
+    async def apply_stream_result(self, check_type, result, received):
+        """Ham sonucu debounce'tan geçir, seviye değiştiyse hemen yayınla ve aksiyon al"""
+        debouncer = self.debouncers[check_type]
+        raw_level = result['level']
+        previous_level = debouncer.level
+        changed = debouncer.update(raw_level, received)
+        
+        result['raw_level'] = raw_level
+        result['level'] = debouncer.level
+        if not changed and raw_level != debouncer.level:
+            # Onaylanmamış geçiş - son onaylı mesajı koru
+            previous = self.latest_results.get(check_type)
+            if previous:
+                result['message'] = previous['message']
+        
+        self.current_state[f'{check_type}_level'] = debouncer.level
+        result['latency_ms'] = round((time.monotonic() - received) * 1000.0, 1)
+        self.latest_results[check_type] = result
+        
+        if changed:
+            self.changed_types.add(check_type)
+            self._publish_event.set()
+            if LEVEL_RANK[debouncer.level] > LEVEL_RANK[previous_level]:
+                await self._dispatch_action(result)
+    
+    async def watch_stream(self, check_type, stream_factory, evaluate):
+        """Tek telemetri aboneliğini açık tut, her örnekte eşikleri değerlendir"""
+        while self.running:
+            try:
+                async for sample in stream_factory():
+                    received = time.monotonic()
+                    self.last_sample_times[check_type] = received
+                    
+                    if self.paused:
+                        continue  # Abonelik açık kalır, değerlendirme yapılmaz
+                    
+                    try:
+                        result = evaluate(sample)
+                    except Exception as e:
+                        result = {
+                            'type': check_type,
+                            'level': FailsafeLevel.WARNING,
+                            'message': f'Kontrol hatası: {str(e)}',
+                            'data': None
+                        }
+                    
+                    await self.apply_stream_result(check_type, result, received)
+                    
+                    if not self.running:
+                        break
+                    
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass  # Akış koptu - kısa beklemeden sonra yeniden abone ol
+            
+            await asyncio.sleep(0.5)
+    
+    async def watch_staleness(self, stream_types):
+        """Örnek gelmeyen akışları süre sınırından sonra timeout olarak işaretle"""
+        started = time.monotonic()
+        while self.running:
+            await asyncio.sleep(CHECK_TIMEOUT_S / 3)
+            now = time.monotonic()
+            if self.paused:
+                continue
+            for check_type in stream_types:
+                last = self.last_sample_times.get(check_type, started)
+                if now - last > CHECK_TIMEOUT_S:
+                    await self.apply_stream_result(check_type, self.stale_result(check_type), now)
+    
+    def stream_snapshot(self):
+        """Son sonuçlardan döngü formatında çıktı üret"""
+        snapshot = {
+            'timestamp': datetime.now().isoformat(),
+            'results': list(self.latest_results.values()),
+            'changed': sorted(self.changed_types),
+            'state': self.current_state.copy(),
+            'recent_events': self.failsafe_history[-5:]  # Son 5 olay
+        }
+        self.changed_types.clear()
+        return snapshot
+    
+    async def run_stream_engine(self, duration, emit, raise_samples=DEBOUNCE_RAISE_SAMPLES,
+                                clear_hold_s=DEBOUNCE_CLEAR_HOLD_S, rate_hz=STREAM_RATE_HZ,
+                                publish_interval_s=STREAM_PUBLISH_INTERVAL_S):
+        """
+        Olay tabanlı motor: her akışa tek abonelik, her örnekte değerlendirme.
+        Onaylı seviye değişiklikleri anında, diğer durumlar `publish_interval_s`
+        aralığıyla `emit` edilir. `duration` 0/None ise `stop()` çağrılana kadar
+        çalışır.
+        """
+        await self.connect_to_system()
+        await self.set_stream_rates(rate_hz)
+        
+        self._publish_event = asyncio.Event()
+        sources = self.stream_sources()
+        for check_type, _, _ in sources:
+            self.debouncers[check_type] = LevelDebouncer(raise_samples, clear_hold_s)
+        
+        tasks = [asyncio.ensure_future(self.watch_stream(*source)) for source in sources]
+        tasks.append(asyncio.ensure_future(
+            self.watch_staleness([check_type for check_type, _, _ in sources])
+        ))
+        
+        deadline = time.monotonic() + duration if duration else None
+        try:
+            while self.running and (deadline is None or time.monotonic() < deadline):
+                timeout = publish_interval_s
+                if deadline is not None:
+                    timeout = min(timeout, max(0.0, deadline - time.monotonic()))
+                try:
+                    await asyncio.wait_for(self._publish_event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._publish_event.clear()
+                
+                if self.latest_results and self.running and not self.paused:
+                    emit(self.stream_snapshot())
+        finally:
+            self.running = False
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+def emit_result(result):
+    """Sonucu tek JSON satırı olarak gönder"""
+    print(json.dumps(result))
+    sys.stdout.flush()
+
+def start_control_reader(loop, queue, stream=None):
+    """stdin satırlarını event loop kuyruğuna aktaran thread (Windows uyumlu)"""
+    stream = stream or sys.stdin
+    
+    def push(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # Event loop kapandı
+    
+    def reader():
+        try:
+            for line in iter(stream.readline, ''):
+                push(line)
+        except (OSError, ValueError):
+            pass
+        push(None)  # EOF
+    
+    thread = threading.Thread(target=reader, name="failsafe-control", daemon=True)
+    thread.start()
+    return thread
+
+def handle_command(monitor, command):
+    """Tek kontrol komutunu uygula, cevap nesnesini döndür"""
+    cmd = command.get('cmd')
+    
+    if cmd == 'config':
+        monitor.apply_config(command.get('config') or {})
+        return {'control': cmd, 'status': 'ok', 'config': monitor.config}
+    if cmd == 'pause':
+        monitor.paused = True
+        return {'control': cmd, 'status': 'ok'}
+    if cmd == 'resume':
+        monitor.paused = False
+        return {'control': cmd, 'status': 'ok'}
+    if cmd == 'shutdown':
+        monitor.stop()
+        return {'control': cmd, 'status': 'ok'}
+    
+    return {'control': cmd, 'status': 'error', 'message': f"Bilinmeyen komut: {cmd}"}
+
+async def control_loop(monitor, queue, emit):
+    """Kontrol kanalından gelen komutları işle"""
+    while monitor.running:
+        line = await queue.get()
+        if line is None:
+            # GUI kanalı kapattı - worker'ı kapat
+            monitor.stop()
+            return
+        
+        line = line.strip()
+        if not line:
+            continue
+        
+        try:
+            reply = handle_command(monitor, json.loads(line))
+        except Exception as e:
+            reply = {'control': None, 'status': 'error', 'message': f"Komut hatası: {str(e)}"}
+        emit(reply)
+
+async def run_cycle_engine(monitor, duration, emit):
+    """Periyodik (çekme tabanlı) motor"""
+    start_time = time.time()
+    
+    while monitor.running and (not duration or time.time() - start_time < duration):
+        if not monitor.paused:
+            cycle_result = await monitor.run_monitoring_cycle()
+            
+            # Sonucu gönder
+            emit(cycle_result)
+        
+        # 1 saniye bekle
+        await asyncio.sleep(1.0)
+
+async def run_failsafe_monitoring(params, control_stream=None):
+    """Ana failsafe monitoring fonksiyonu"""
+    try:
+        connection_string = params.get('connection_string', 'udp://:14540')
+        config = params.get('config', {})
+        duration = params.get('duration', 0)  # Kaç saniye çalışacak (0 = sınırsız)
+        
+        monitor = FailsafeMonitor(connection_string, config)
+        
+        queue = asyncio.Queue()
+        if params.get('control', True):
+            start_control_reader(asyncio.get_running_loop(), queue, control_stream)
+        control_task = asyncio.ensure_future(control_loop(monitor, queue, emit_result))
+        
+        try:
+            if params.get('engine', 'cycle') == 'stream':
+                await monitor.run_stream_engine(
+                    duration,
+                    emit_result,
+                    raise_samples=params.get('debounce_samples', DEBOUNCE_RAISE_SAMPLES),
+                    clear_hold_s=params.get('clear_hold_s', DEBOUNCE_CLEAR_HOLD_S),
+                    rate_hz=params.get('stream_rate_hz', STREAM_RATE_HZ),
+                    publish_interval_s=params.get('publish_interval_s', STREAM_PUBLISH_INTERVAL_S)
+                )
+            else:
+                await run_cycle_engine(monitor, duration, emit_result)
+        finally:
+            control_task.cancel()
+        
+        return {"status": "completed", "message": "Monitoring tamamlandı"}
+        
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+def main(argv=None):
+    """Subprocess entry point"""
+    parser = argparse.ArgumentParser(description="Uzun ömürlü failsafe izleme worker'ı")
+    parser.add_argument('--connection', default='udp://:14540',
+                        help="MAVSDK bağlantı adresi")
+    parser.add_argument('--engine', choices=('stream', 'cycle'), default='stream',
+                        help="stream: sürekli abonelik, cycle: saniyelik kontrol")
+    parser.add_argument('--config', default=None,
+                        help="Başlangıç eşikleri (JSON)")
+    parser.add_argument('--duration', type=float, default=0,
+                        help="Çalışma süresi (s), 0 = shutdown komutuna kadar")
+    parser.add_argument('--publish-interval', type=float, default=STREAM_PUBLISH_INTERVAL_S,
+                        help="Değişiklik yokken durum yayın aralığı (s)")
+    args = parser.parse_args(argv)
+    
+    try:
+        params = {
+            'connection_string': args.connection,
+            'config': json.loads(args.config) if args.config else {},
+            'duration': args.duration,
+            'engine': args.engine,
+            'publish_interval_s': args.publish_interval
+        }
+        
+        result = asyncio.run(run_failsafe_monitoring(params))
+        if result.get('status') == 'error':
+            emit_result(result)
+        
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        error_result = {
+            'status': 'error',
+            'message': f'Failsafe worker hatası: {str(e)}'
+        }
+        print(json.dumps(error_result))
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
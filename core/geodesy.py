@@ -0,0 +1,237 @@
+# core/geodesy.py
+"""
+Geodezi (NumPy, vektörel)
+=========================
+
+Navigation, mission'lar ve harita için tek geodezi modülü. Tüm
+fonksiyonlar skaler ya da NumPy dizisi alır; girdiler NumPy yayınlama
+(broadcasting) kurallarıyla eşlenir, döngü yoktur:
+- Mesafe: `haversine_distance` (küre, ortalama yarıçap) ve
+  `vincenty_distance` (WGS84 elipsoidi, mm doğruluk)
+- Yön: `initial_bearing` (büyük daire başlangıç yönü, 0-360)
+- Hedef nokta: `destination` (küre) ve `circle_points`
+- Dönüşümler: LLA <-> ECEF, LLA <-> ENU / NED (referans noktaya göre),
+  küçük ofsetler için `offset_ned` (WGS84 eğrilik yarıçapları ile)
+
+Birimler: enlem/boylam derece, irtifa ve mesafe metre. Skaler girdiler
+0 boyutlu NumPy değeri döndürür; `float()` ile çevrilebilir.
+
+Doğruluk ve hız kontrolü: `python3 core/geodesy_benchmark.py`
+
+Usage:
+    from core.geodesy import haversine_distance, lla_to_ned
+    d = haversine_distance(lat, lon, target_lat, target_lon)       # dizi
+    north, east, down = lla_to_ned(lats, lons, alts, home_lat, home_lon, home_alt)
+"""
+
+import numpy as np
+
+# WGS84
+WGS84_A = 6378137.0
+WGS84_F = 1.0 / 298.257223563
+WGS84_B = WGS84_A * (1.0 - WGS84_F)
+WGS84_E2 = WGS84_F * (2.0 - WGS84_F)
+
+# IUGG ortalama dünya yarıçapı (küresel hesaplar)
+MEAN_EARTH_RADIUS = 6371008.8
+
+VINCENTY_TOLERANCE = 1e-12
+VINCENTY_MAX_ITERATIONS = 200
+
+
+def _as_float(*values):
+    return [np.asarray(value, dtype=np.float64) for value in values]
+
+
+# ========================================
+# MESAFE / YÖN / HEDEF NOKTA
+# ========================================
+
+def haversine_distance(lat1, lon1, lat2, lon2, radius: float = MEAN_EARTH_RADIUS):
+    """Büyük daire mesafesi (m) - küre modeli, elipsoide göre hata en fazla ~%0.6"""
+    lat1, lon1, lat2, lon2 = _as_float(lat1, lon1, lat2, lon2)
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    half_dphi = 0.5 * (phi2 - phi1)
+    half_dlam = 0.5 * np.radians(lon2 - lon1)
+    h = np.sin(half_dphi) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(half_dlam) ** 2
+    return 2.0 * radius * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+def vincenty_distance(lat1, lon1, lat2, lon2,
+                      tolerance: float = VINCENTY_TOLERANCE,
+                      max_iterations: int = VINCENTY_MAX_ITERATIONS):
+    """
+    WGS84 elipsoidi üzerinde jeodezik mesafe (m) - Vincenty ters çözümü.
+
+    Tüm noktalar birlikte iterasyona girer. Yakınsamayan (neredeyse
+    antipodal) noktalar için küresel haversine sonucu döner.
+    """
+    lat1, lon1, lat2, lon2 = np.broadcast_arrays(*_as_float(lat1, lon1, lat2, lon2))
+    f = WGS84_F
+    L = np.radians(lon2 - lon1)
+    U1 = np.arctan((1.0 - f) * np.tan(np.radians(lat1)))
+    U2 = np.arctan((1.0 - f) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1 = np.sin(U1), np.cos(U1)
+    sin_u2, cos_u2 = np.sin(U2), np.cos(U2)
+
+    lam = L.copy()
+    converged = np.zeros(L.shape, dtype=bool)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma == 0.0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1.0 - sin_alpha ** 2
+            # Ekvator boyunca çizgilerde cos2_alpha = 0
+            cos_2sigma_m = np.where(cos2_alpha == 0.0, 0.0,
+                                    cos_sigma - 2.0 * sin_u1 * sin_u2 / cos2_alpha)
+            C = f / 16.0 * cos2_alpha * (4.0 + f * (4.0 - 3.0 * cos2_alpha))
+            lam_next = L + (1.0 - C) * f * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sigma_m + C * cos_sigma * (-1.0 + 2.0 * cos_2sigma_m ** 2)))
+            converged = np.abs(lam_next - lam) < tolerance
+            lam = lam_next
+            if converged.all():
+                break
+
+        u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+        A = 1.0 + u2 / 16384.0 * (4096.0 + u2 * (-768.0 + u2 * (320.0 - 175.0 * u2)))
+        B = u2 / 1024.0 * (256.0 + u2 * (-128.0 + u2 * (74.0 - 47.0 * u2)))
+        delta_sigma = B * sin_sigma * (cos_2sigma_m + B / 4.0 * (
+            cos_sigma * (-1.0 + 2.0 * cos_2sigma_m ** 2)
+            - B / 6.0 * cos_2sigma_m * (-3.0 + 4.0 * sin_sigma ** 2) * (-3.0 + 4.0 * cos_2sigma_m ** 2)))
+        distance = WGS84_B * A * (sigma - delta_sigma)
+
+    if not converged.all():
+        fallback = ~converged | ~np.isfinite(distance)
+        distance = np.where(fallback, haversine_distance(lat1, lon1, lat2, lon2), distance)
+    return distance
+
+
+def initial_bearing(lat1, lon1, lat2, lon2):
+    """1. noktadan 2. noktaya büyük daire başlangıç yönü (derece, 0-360)"""
+    lat1, lon1, lat2, lon2 = _as_float(lat1, lon1, lat2, lon2)
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    dlam = np.radians(lon2 - lon1)
+    y = np.sin(dlam) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(dlam)
+    return np.mod(np.degrees(np.arctan2(y, x)), 360.0)
+
+
+def destination(lat, lon, bearing_deg, distance_m, radius: float = MEAN_EARTH_RADIUS):
+    """Başlangıç noktası, yön ve mesafeden hedef nokta (küre) -> (lat, lon)"""
+    lat, lon, bearing_deg, distance_m = _as_float(lat, lon, bearing_deg, distance_m)
+    phi1 = np.radians(lat)
+    theta = np.radians(bearing_deg)
+    delta = distance_m / radius
+    sin_phi2 = np.sin(phi1) * np.cos(delta) + np.cos(phi1) * np.sin(delta) * np.cos(theta)
+    phi2 = np.arcsin(np.clip(sin_phi2, -1.0, 1.0))
+    dlam = np.arctan2(np.sin(theta) * np.sin(delta) * np.cos(phi1),
+                      np.cos(delta) - np.sin(phi1) * sin_phi2)
+    lon2 = np.mod(lon + np.degrees(dlam) + 540.0, 360.0) - 180.0
+    return np.degrees(phi2), lon2
+
+
+def circle_points(center_lat, center_lon, radius_m, count: int = 8, start_bearing: float = 0.0):
+    """Merkez etrafında eşit aralıklı `count` nokta (kuzeyden saat yönünde) -> (lats, lons)"""
+    bearings = start_bearing + np.arange(count) * (360.0 / count)
+    return destination(center_lat, center_lon, bearings, radius_m)
+
+
+# ========================================
+# LLA / ECEF / ENU / NED
+# ========================================
+
+def lla_to_ecef(lat, lon, alt=0.0):
+    """WGS84 enlem/boylam/irtifa -> ECEF (x, y, z) metre"""
+    lat, lon, alt = _as_float(lat, lon, alt)
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    sin_phi = np.sin(phi)
+    cos_phi = np.cos(phi)
+    n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_phi ** 2)
+    x = (n + alt) * cos_phi * np.cos(lam)
+    y = (n + alt) * cos_phi * np.sin(lam)
+    z = (n * (1.0 - WGS84_E2) + alt) * sin_phi
+    return x, y, z
+
+
+def ecef_to_lla(x, y, z, iterations: int = 4):
+    """ECEF -> WGS84 (lat, lon, alt); yüzey yakınında 4 iterasyon mm altı"""
+    x, y, z = _as_float(x, y, z)
+    lon = np.arctan2(y, x)
+    p = np.hypot(x, y)
+    lat = np.arctan2(z, p * (1.0 - WGS84_E2))
+    for _ in range(iterations):
+        sin_lat = np.sin(lat)
+        n = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat ** 2)
+        alt = p * np.cos(lat) + z * sin_lat - WGS84_A * np.sqrt(1.0 - WGS84_E2 * sin_lat ** 2)
+        lat = np.arctan2(z, p * (1.0 - WGS84_E2 * n / (n + alt)))
+    sin_lat = np.sin(lat)
+    alt = p * np.cos(lat) + z * sin_lat - WGS84_A * np.sqrt(1.0 - WGS84_E2 * sin_lat ** 2)
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def lla_to_enu(lat, lon, alt, ref_lat, ref_lon, ref_alt=0.0):
+    """Referans noktaya göre doğu/kuzey/yukarı (east, north, up) metre"""
+    x, y, z = lla_to_ecef(lat, lon, alt)
+    x0, y0, z0 = lla_to_ecef(ref_lat, ref_lon, ref_alt)
+    dx, dy, dz = x - x0, y - y0, z - z0
+    phi = np.radians(np.asarray(ref_lat, dtype=np.float64))
+    lam = np.radians(np.asarray(ref_lon, dtype=np.float64))
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+    east = -sin_lam * dx + cos_lam * dy
+    north = -sin_phi * cos_lam * dx - sin_phi * sin_lam * dy + cos_phi * dz
+    up = cos_phi * cos_lam * dx + cos_phi * sin_lam * dy + sin_phi * dz
+    return east, north, up
+
+
+def enu_to_lla(east, north, up, ref_lat, ref_lon, ref_alt=0.0):
+    """Referans noktaya göre ENU ofsetlerinden WGS84 (lat, lon, alt)"""
+    east, north, up = _as_float(east, north, up)
+    x0, y0, z0 = lla_to_ecef(ref_lat, ref_lon, ref_alt)
+    phi = np.radians(np.asarray(ref_lat, dtype=np.float64))
+    lam = np.radians(np.asarray(ref_lon, dtype=np.float64))
+    sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+    sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+    x = x0 - sin_lam * east - sin_phi * cos_lam * north + cos_phi * cos_lam * up
+    y = y0 + cos_lam * east - sin_phi * sin_lam * north + cos_phi * sin_lam * up
+    z = z0 + cos_phi * north + sin_phi * up
+    return ecef_to_lla(x, y, z)
+
+
+def lla_to_ned(lat, lon, alt, ref_lat, ref_lon, ref_alt=0.0):
+    """Referans noktaya göre kuzey/doğu/aşağı (north, east, down) metre"""
+    east, north, up = lla_to_enu(lat, lon, alt, ref_lat, ref_lon, ref_alt)
+    return north, east, -up
+
+
+def ned_to_lla(north, east, down, ref_lat, ref_lon, ref_alt=0.0):
+    """Referans noktaya göre NED ofsetlerinden WGS84 (lat, lon, alt)"""
+    return enu_to_lla(east, north, -np.asarray(down, dtype=np.float64), ref_lat, ref_lon, ref_alt)
+
+
+def offset_ned(lat, lon, north, east, alt=0.0):
+    """
+    Küçük kuzey/doğu ofseti (m) uygulanmış nokta -> (lat, lon).
+
+    WGS84 meridyen ve dikey eğrilik yarıçaplarını kullanır; `ned_to_lla`'dan
+    ucuzdur, 1 km ofsette farkı 0.5 m altındadır (teğet düzlem eğriliği).
+    """
+    lat, lon, north, east, alt = _as_float(lat, lon, north, east, alt)
+    phi = np.radians(lat)
+    w = 1.0 - WGS84_E2 * np.sin(phi) ** 2
+    meridian = WGS84_A * (1.0 - WGS84_E2) / w ** 1.5
+    prime_vertical = WGS84_A / np.sqrt(w)
+    dlat = np.degrees(north / (meridian + alt))
+    dlon = np.degrees(east / ((prime_vertical + alt) * np.cos(phi)))
+    return lat + dlat, lon + dlon
+
+
+def within_radius(lat, lon, target_lat, target_lon, radius_m):
+    """Nokta(lar) hedefin `radius_m` yatay yarıçapı içinde mi"""
+    return haversine_distance(lat, lon, target_lat, target_lon) <= radius_m
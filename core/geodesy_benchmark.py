@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# core/geodesy_benchmark.py
+"""
+Geodezi Doğruluk ve Hız Kontrolü
+================================
+
+`geodesy.py` için:
+- Doğruluk: bilinen referans değerlere (Vincenty 1975 örneği, meridyen
+  yayı, ekvator çevresi) ve gidiş-dönüş dönüşümlere (LLA -> NED -> LLA,
+  destination -> distance / bearing) karşı kontroller
+- Hız: rastgele nokta dizileri üzerinde fonksiyon başına nokta/s
+
+Bir kontrol başarısız olursa ya da `--min-rate` altında kalan fonksiyon
+varsa çıkış kodu 1'dir.
+
+Kullanım:
+    python3 core/geodesy_benchmark.py --points 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from geodesy import (
+    WGS84_A, destination, haversine_distance, initial_bearing, lla_to_ecef,
+    ecef_to_lla, lla_to_ned, ned_to_lla, offset_ned, vincenty_distance,
+)
+
+# Vincenty (1975) örneği: Flinders Peak -> Buninyong
+FLINDERS_PEAK = (-37.95103341666667, 144.42486788888889)
+BUNINYONG = (-37.65282113888889, 143.92649552777777)
+FLINDERS_BUNINYONG_M = 54972.271
+
+# WGS84 çeyrek meridyen uzunluğu ve ekvator çevresi
+QUARTER_MERIDIAN_M = 10001965.729
+EQUATOR_QUARTER_M = 0.5 * np.pi * WGS84_A
+
+
+def check(name, error, limit, results):
+    error = float(np.max(np.abs(error)))
+    ok = error <= limit
+    results.append(ok)
+    print(f"  {'OK  ' if ok else 'HATA'} {name:<42} maks hata {error:.3e} (sınır {limit:g})")
+
+
+def accuracy_checks(rng):
+    results = []
+    print("Doğruluk")
+
+    check("vincenty: Flinders Peak -> Buninyong (m)",
+          vincenty_distance(*FLINDERS_PEAK, *BUNINYONG) - FLINDERS_BUNINYONG_M, 1e-3, results)
+    check("vincenty: çeyrek meridyen (m)",
+          vincenty_distance(0.0, 0.0, 90.0, 0.0) - QUARTER_MERIDIAN_M, 1e-3, results)
+    check("vincenty: ekvator boyunca 90° (m)",
+          vincenty_distance(0.0, 0.0, 0.0, 90.0) - EQUATOR_QUARTER_M, 1e-3, results)
+    check("vincenty: aynı nokta (m)", vincenty_distance(41.0, 29.0, 41.0, 29.0), 1e-9, results)
+
+    lat1 = rng.uniform(-80.0, 80.0, 100000)
+    lon1 = rng.uniform(-180.0, 180.0, 100000)
+    lat2 = np.clip(lat1 + rng.uniform(-1.0, 1.0, lat1.size), -89.0, 89.0)
+    lon2 = lon1 + rng.uniform(-1.0, 1.0, lat1.size)
+    vincenty = vincenty_distance(lat1, lon1, lat2, lon2)
+    haversine = haversine_distance(lat1, lon1, lat2, lon2)
+    check("haversine / vincenty bağıl fark", (haversine - vincenty) / vincenty, 6e-3, results)
+
+    # destination -> distance / bearing gidiş-dönüş (küre)
+    bearings = rng.uniform(0.0, 360.0, lat1.size)
+    distances = rng.uniform(1.0, 50000.0, lat1.size)
+    dest_lat, dest_lon = destination(lat1, lon1, bearings, distances)
+    check("destination -> haversine mesafe (m)",
+          haversine_distance(lat1, lon1, dest_lat, dest_lon) - distances, 1e-5, results)
+    bearing_error = (initial_bearing(lat1, lon1, dest_lat, dest_lon) - bearings + 180.0) % 360.0 - 180.0
+    check("destination -> initial_bearing (°)", bearing_error, 1e-6, results)
+
+    # LLA -> ECEF -> LLA, LLA -> NED -> LLA
+    alts = rng.uniform(-100.0, 5000.0, lat1.size)
+    lat_back, lon_back, alt_back = ecef_to_lla(*lla_to_ecef(lat1, lon1, alts))
+    check("ECEF gidiş-dönüş enlem (°)", lat_back - lat1, 1e-9, results)
+    check("ECEF gidiş-dönüş irtifa (m)", alt_back - alts, 1e-4, results)
+
+    ref_lat, ref_lon, ref_alt = 39.9334, 32.8597, 900.0
+    north = rng.uniform(-5000.0, 5000.0, lat1.size)
+    east = rng.uniform(-5000.0, 5000.0, lat1.size)
+    down = rng.uniform(-500.0, 50.0, lat1.size)
+    lat_ned, lon_ned, alt_ned = ned_to_lla(north, east, down, ref_lat, ref_lon, ref_alt)
+    n_back, e_back, d_back = lla_to_ned(lat_ned, lon_ned, alt_ned, ref_lat, ref_lon, ref_alt)
+    check("NED gidiş-dönüş (m)", np.concatenate([n_back - north, e_back - east, d_back - down]), 1e-4, results)
+
+    # Küçük ofset: offset_ned ile tam NED dönüşümü
+    small_n = rng.uniform(-1000.0, 1000.0, lat1.size)
+    small_e = rng.uniform(-1000.0, 1000.0, lat1.size)
+    lat_off, lon_off = offset_ned(ref_lat, ref_lon, small_n, small_e)
+    n_off, e_off, _ = lla_to_ned(lat_off, lon_off, ref_alt, ref_lat, ref_lon, ref_alt)
+    check("offset_ned / lla_to_ned (1 km, m)", np.concatenate([n_off - small_n, e_off - small_e]), 0.5, results)
+
+    return all(results)
+
+
+def throughput(points, rng, min_rate):
+    lat1 = rng.uniform(-80.0, 80.0, points)
+    lon1 = rng.uniform(-180.0, 180.0, points)
+    lat2 = lat1 + rng.uniform(-0.5, 0.5, points)
+    lon2 = lon1 + rng.uniform(-0.5, 0.5, points)
+    bearings = rng.uniform(0.0, 360.0, points)
+    distances = rng.uniform(1.0, 50000.0, points)
+    alts = rng.uniform(0.0, 3000.0, points)
+
+    cases = [
+        ("haversine_distance", lambda: haversine_distance(lat1, lon1, lat2, lon2)),
+        ("vincenty_distance", lambda: vincenty_distance(lat1, lon1, lat2, lon2)),
+        ("initial_bearing", lambda: initial_bearing(lat1, lon1, lat2, lon2)),
+        ("destination", lambda: destination(lat1, lon1, bearings, distances)),
+        ("lla_to_ned", lambda: lla_to_ned(lat2, lon2, alts, 39.9334, 32.8597, 900.0)),
+        ("ned_to_lla", lambda: ned_to_lla(distances, distances, -alts, 39.9334, 32.8597, 900.0)),
+        ("offset_ned", lambda: offset_ned(lat1, lon1, distances, distances)),
+    ]
+
+    print(f"Hız ({points:,} nokta, numpy {np.__version__})")
+    ok = True
+    for name, func in cases:
+        func()  # ısınma
+        samples = []
+        for _ in range(3):
+            started = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - started)
+        rate = points / min(samples)
+        passed = rate >= min_rate
+        ok = ok and passed
+        print(f"  {'OK  ' if passed else 'YAVAŞ'} {name:<20} {rate / 1e6:8.2f} M nokta/s  ({min(samples) * 1000.0:7.1f} ms)")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Geodezi doğruluk ve hız kontrolü")
+    parser.add_argument('--points', type=int, default=1000000, help="Hız ölçümü nokta sayısı")
+    parser.add_argument('--min-rate', type=float, default=1e6, help="Fonksiyon başına en düşük nokta/s")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    accurate = accuracy_checks(rng)
+    fast = throughput(args.points, rng, args.min_rate)
+    sys.exit(0 if accurate and fast else 1)
+
+
+if __name__ == "__main__":
+    main()
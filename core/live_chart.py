@@ -0,0 +1,250 @@
+# core/live_chart.py
+"""
+Canlı Çizgi Grafikleri
+======================
+
+Yüksek hızlı telemetri grafikleri için artımlı (incremental) çizim:
+- Çizgi nesneleri bir kez oluşturulur, veriler yerinde güncellenir
+- pyqtgraph varsa `PgLiveChart` (kısmi yeniden çizim yerleşik)
+- Yoksa matplotlib `BlitLiveChart`: arka plan önbelleğe alınır, her
+  güncellemede sadece çizgiler blit edilir; eksen sınırları yalnızca veri
+  mevcut aralığın dışına çıktığında (histerezisle) yeniden hesaplanır
+- X ekseni "saniye önce" olarak sabittir (-pencere .. 0), böylece eksen
+  her örnekte değişmez
+
+Tüm grafikler aynı arayüzü sunar:
+    chart.update_series(x, {'roll': roll_view, 'pitch': pitch_view})
+    chart.set_window(60)
+    chart.reset()
+"""
+
+import numpy as np
+
+try:
+    import pyqtgraph as pg
+    PYQTGRAPH_AVAILABLE = True
+except ImportError:
+    PYQTGRAPH_AVAILABLE = False
+
+try:
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+    from matplotlib.figure import Figure
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+
+DEFAULT_WINDOW_S = 60.0
+Y_SHRINK_RATIO = 3.0   # Veri aralığı eksenin 1/3'ünden küçükse ekseni daralt
+Y_MARGIN_RATIO = 0.1
+
+
+def _padded_limits(y_min, y_max, min_margin=1.0):
+    """Veri aralığına kenar boşluğu ekle"""
+    margin = max((y_max - y_min) * Y_MARGIN_RATIO, min_margin)
+    return y_min - margin, y_max + margin
+
+
+def _data_range(series):
+    """Tüm serilerin (min, max) aralığı; boşsa None"""
+    lows, highs = [], []
+    for y in series.values():
+        if len(y):
+            lows.append(y.min())
+            highs.append(y.max())
+    if not lows:
+        return None
+    return float(min(lows)), float(max(highs))
+
+
+if PYQTGRAPH_AVAILABLE:
+
+    class PgLiveChart(pg.PlotWidget):
+        """pyqtgraph tabanlı canlı grafik"""
+
+        def __init__(self, title, xlabel, ylabel, threshold_lines=None, series=None,
+                     mirror_thresholds=False, window_s=DEFAULT_WINDOW_S, parent=None):
+            super().__init__(parent)
+            self.setBackground('w')
+            self.setTitle(title, color='#2c3e50', size='11pt')
+            self.setLabel('left', ylabel)
+            self.setLabel('bottom', f"{xlabel} (s)")
+            self.showGrid(x=True, y=True, alpha=0.3)
+            self.setMinimumHeight(250)
+            self.addLegend(offset=(-10, 10))
+
+            plot_item = self.getPlotItem()
+            plot_item.setClipToView(True)
+            plot_item.setDownsampling(auto=True, mode='peak')
+
+            for value, label, color in threshold_lines or []:
+                pen = pg.mkPen(color=color, style=pg.QtCore.Qt.DashLine)
+                self.addItem(pg.InfiniteLine(pos=value, angle=0, pen=pen,
+                                             label=f"{label}: {value}",
+                                             labelOpts={'position': 0.95, 'color': color}))
+                if mirror_thresholds:
+                    self.addItem(pg.InfiniteLine(pos=-value, angle=0, pen=pen))
+
+            self.series_keys = tuple(key for key, _, _ in series or [])
+            self.curves = {}
+            for key, color, label in series or []:
+                self.curves[key] = self.plot(pen=pg.mkPen(color=color, width=2), name=label)
+
+            self.set_window(window_s)
+
+        def set_window(self, window_s):
+            self.window_s = window_s
+            if window_s:
+                self.setXRange(-window_s, 0, padding=0)
+            else:
+                self.enableAutoRange(axis='x')
+
+        def update_series(self, x, series):
+            for key, y in series.items():
+                curve = self.curves.get(key)
+                if curve is not None:
+                    curve.setData(x, y)
+
+        def reset(self):
+            for curve in self.curves.values():
+                curve.setData([], [])
+
+
+if MATPLOTLIB_AVAILABLE:
+
+    class BlitLiveChart(FigureCanvas):
+        """matplotlib blitting tabanlı canlı grafik"""
+
+        def __init__(self, title, xlabel, ylabel, threshold_lines=None, series=None,
+                     mirror_thresholds=False, window_s=DEFAULT_WINDOW_S, parent=None):
+            fig = Figure(figsize=(10, 4), dpi=80)
+            fig.patch.set_facecolor('white')
+            super().__init__(fig)
+            self.setParent(parent)
+            self.setMinimumHeight(250)
+
+            self.fig = fig
+            self.ax = ax = fig.add_subplot(111)
+            ax.set_title(title, fontsize=12, fontweight='bold')
+            ax.set_xlabel(f"{xlabel} (s)")
+            ax.set_ylabel(ylabel)
+            ax.grid(True, alpha=0.3)
+
+            self.threshold_values = []
+            for value, label, color in threshold_lines or []:
+                ax.axhline(y=value, color=color, linestyle='--', alpha=0.7, label=f"{label}: {value}")
+                self.threshold_values.append(value)
+                if mirror_thresholds:
+                    ax.axhline(y=-value, color=color, linestyle='--', alpha=0.7)
+                    self.threshold_values.append(-value)
+
+            # Çizgiler animated: normal çizimde atlanır, sadece blit ile çizilir
+            self.series_keys = tuple(key for key, _, _ in series or [])
+            self.lines = {}
+            for key, color, label in series or []:
+                line, = ax.plot([], [], color=color, linewidth=2, label=label, animated=True)
+                self.lines[key] = line
+
+            if threshold_lines or len(self.lines) > 1:
+                ax.legend(loc='upper right', fontsize=8)
+
+            self._background = None
+            self._y_limits = None
+            self.mpl_connect('draw_event', self._on_draw)
+
+            self.set_window(window_s)
+            self._set_y_limits(*self._initial_y_range())
+
+        def _initial_y_range(self):
+            if self.threshold_values:
+                return _padded_limits(min(self.threshold_values + [0.0]),
+                                      max(self.threshold_values))
+            return -1.0, 1.0
+
+        def _set_y_limits(self, low, high):
+            self._y_limits = (low, high)
+            self.ax.set_ylim(low, high)
+
+        def _on_draw(self, event):
+            """Tam çizimden sonra arka planı önbelleğe al ve çizgileri üstüne çiz"""
+            self._background = self.copy_from_bbox(self.ax.bbox)
+            for line in self.lines.values():
+                self.ax.draw_artist(line)
+
+        def _needs_rescale(self, data_range):
+            low, high = self._y_limits
+            y_min, y_max = data_range
+            if y_min < low or y_max > high:
+                return True
+            return (y_max - y_min) * Y_SHRINK_RATIO < (high - low) and (high - low) > 2.0
+
+        def set_window(self, window_s):
+            self.window_s = window_s
+            self.ax.set_xlim(-(window_s or DEFAULT_WINDOW_S), 0)
+            self._background = None
+            self.draw_idle()
+
+        def update_series(self, x, series):
+            for key, y in series.items():
+                line = self.lines.get(key)
+                if line is not None:
+                    line.set_data(x, y)
+
+            if not self.window_s and len(x):
+                self.ax.set_xlim(min(float(x[0]), -1.0), 0)
+                self._background = None
+
+            data_range = _data_range(series)
+            if data_range and self._needs_rescale(data_range):
+                self._set_y_limits(*_padded_limits(*data_range))
+                self._background = None
+
+            if self._background is None:
+                # Eksen değişti - tam çizim, draw_event arka planı yeniler
+                self.draw_idle()
+                return
+
+            self.restore_region(self._background)
+            for line in self.lines.values():
+                self.ax.draw_artist(line)
+            self.blit(self.ax.bbox)
+
+        def reset(self):
+            for line in self.lines.values():
+                line.set_data([], [])
+            self._set_y_limits(*self._initial_y_range())
+            self._background = None
+            self.draw_idle()
+
+
+def create_live_chart(title, xlabel, ylabel, threshold_lines=None, series=None,
+                      mirror_thresholds=False, window_s=DEFAULT_WINDOW_S, parent=None):
+    """
+    Mevcut backend'e göre canlı grafik oluştur.
+
+    Args:
+        series: [(veri anahtarı, renk, etiket), ...]
+        mirror_thresholds: Eşik çizgilerini negatif tarafa da çiz (açılar için)
+
+    Returns:
+        PgLiveChart, BlitLiveChart veya hiçbir backend yoksa None
+    """
+    kwargs = dict(threshold_lines=threshold_lines, series=series,
+                  mirror_thresholds=mirror_thresholds, window_s=window_s, parent=parent)
+    if PYQTGRAPH_AVAILABLE:
+        return PgLiveChart(title, xlabel, ylabel, **kwargs)
+    if MATPLOTLIB_AVAILABLE:
+        return BlitLiveChart(title, xlabel, ylabel, **kwargs)
+    return None
+
+
+def seconds_ago(times, out):
+    """
+    Zaman view'ını "saniye önce" eksenine çevir (önceden ayrılmış tampona).
+
+    Returns:
+        out[:len(times)] view'ı
+    """
+    count = len(times)
+    if not count:
+        return out[:0]
+    return np.subtract(times, times[-1], out=out[:count])
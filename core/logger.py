@@ -0,0 +1,84 @@
+# core/logger.py
+"""
+Seviye Kontrollü Loglama
+========================
+
+Telemetri sıcak yolu (hot path) için standart `logging` üzerine ince katman:
+- Seviye `IHA_LOG_LEVEL` ortam değişkeninden okunur (varsayılan: INFO)
+- Mesajlar tembel (lazy) formatlanır: `log.debug("alt=%s", alt)` seviye
+  kapalıyken string oluşturmaz
+- Sıcak yol çağrıları `if __debug__:` bloğu içine yazılır; `python -O`
+  ile çalıştırıldığında bu bloklar bytecode'dan tamamen çıkarılır
+
+Usage:
+    from core.logger import get_logger
+    log = get_logger(__name__)
+
+    if __debug__:
+        log.debug("Telemetri: %s", telemetry)   # üretimde maliyet ~0
+    log.info("Bağlantı kuruldu")
+"""
+
+import logging
+import os
+import sys
+
+LOG_LEVEL_ENV = "IHA_LOG_LEVEL"
+DEFAULT_LOG_LEVEL = "INFO"
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+ROOT_LOGGER_NAME = "iha"
+
+_configured = False
+
+
+def _resolve_level(level) -> int:
+    """Seviye adını / sayısını logging seviyesine çevir"""
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, DEFAULT_LOG_LEVEL)
+    if isinstance(level, int):
+        return level
+    resolved = logging.getLevelName(str(level).upper())
+    return resolved if isinstance(resolved, int) else logging.INFO
+
+
+def configure_logging(level=None, stream=None):
+    """
+    Uygulama log kökünü yapılandır.
+
+    Args:
+        level: Seviye adı ('DEBUG', 'INFO', ...) veya sayısı; None ise ortam değişkeni
+        stream: Çıktı akışı (varsayılan stdout)
+    """
+    global _configured
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.setLevel(_resolve_level(level))
+
+    if not _configured:
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, "%H:%M:%S"))
+        root.addHandler(handler)
+        root.propagate = False
+        _configured = True
+
+    return root
+
+
+def set_level(level):
+    """Çalışma anında log seviyesini değiştir"""
+    logging.getLogger(ROOT_LOGGER_NAME).setLevel(_resolve_level(level))
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Modül logger'ı döndür.
+
+    Tüm logger'lar `iha` kökü altında toplanır, böylece seviye tek yerden
+    kontrol edilir.
+    """
+    if not _configured:
+        configure_logging()
+    if name == "__main__" or not name:
+        name = "main"
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
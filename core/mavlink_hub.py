@@ -0,0 +1,290 @@
+# core/mavlink_hub.py
+"""
+MAVLink Hub
+===========
+
+`mavlink_router.py` sürecini yöneten servis. Araç bağlantısını router
+sahiplenir; araca bağlanan her tüketici (bağlantı yöneticisi, UI telemetrisi,
+hazırlık izleyicisi, failsafe, preflight, MAVSDK task süreçleri) kendi yerel
+ucunu kiralar:
+- Uzun ömürlü tüketiciler sabit adla kiralar ("telemetry", "failsafe", ...)
+- Task süreçleri task başına kiralar ve iş bitince bırakır
+- Araç adresi router'ın dinleyebileceği bir UDP adresi değilse (seri port,
+  TCP, uzak UDP) hub açılmaz ve tüketiciler doğrudan bağlanır
+
+`motor_status.MavlinkListener` için sabit `motor_status` istemcisi eski
+14541 portuna yönlendirilir.
+
+Usage:
+    hub = start_hub("udp://:14540")
+    endpoint = resolve_endpoint("telemetry", "udp://:14540")   # "udp://:14601"
+    ...
+    stop_hub()
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from threading import Thread
+from typing import Dict, Optional
+
+try:
+    from .logger import get_logger
+except ImportError:
+    from logger import get_logger
+
+log = get_logger("mavlink_hub")
+
+MAVLINK_ROUTER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mavlink_router.py')
+CLIENT_PORT_BASE = 14601
+CLIENT_PORT_COUNT = 100
+READY_TIMEOUT_S = 5.0
+HUB_STOP_TIMEOUT_S = 3.0
+STATS_INTERVAL_S = 2.0
+
+# Sabit portlu istemciler (dinleyen taraf değiştirilmeden)
+FIXED_CLIENT_PORTS = {
+    'motor_status': 14541,
+}
+
+# İstemci başına hız sınırı (mesaj/s); listede olmayanlar sınırsız
+CLIENT_RATE_LIMITS = {
+    'motor_status': 50.0,
+    'readiness': 100.0,
+    'preflight': 100.0,
+}
+
+_LISTEN_ADDRESS = re.compile(r'^udp(?:in)?://(?P<host>[^:/]*)(?::(?P<port>\d+))?/?$')
+_LOCAL_HOSTS = ('', '0.0.0.0', '127.0.0.1', 'localhost')
+
+
+def parse_listen_port(connection_string: str) -> Optional[int]:
+    """Router'ın devralabileceği yerel UDP dinleme portu; değilse None"""
+    match = _LISTEN_ADDRESS.match((connection_string or '').strip())
+    if not match or match.group('host') not in _LOCAL_HOSTS:
+        return None
+    return int(match.group('port') or 14540)
+
+
+class MAVLinkHub:
+    """Router subprocess'i ve istemci uçlarının kiralanması"""
+
+    def __init__(self, connection_string: str = "udp://:14540"):
+        self.connection_string = connection_string
+        self.vehicle_port = parse_listen_port(connection_string)
+        self.subprocess_proc = None
+        self.running = False
+        self.ready = threading.Event()
+        self.lock = threading.Lock()
+        self.leases: Dict[str, int] = {}          # istemci adı -> port
+        self.stats: dict = {}
+        self.vehicle_address = None
+        self.error: Optional[str] = None
+
+    def is_alive(self) -> bool:
+        return self.running and self.subprocess_proc is not None and self.subprocess_proc.poll() is None
+
+    def start(self) -> bool:
+        """Router'ı başlat ve araç portunu devralmasını bekle"""
+        if self.running:
+            return True
+        if self.vehicle_port is None:
+            log.info("MAVLink hub kullanılmıyor - yerel UDP adresi değil: %s", self.connection_string)
+            return False
+
+        self.running = True
+        self.ready.clear()
+        args = [sys.executable, '-u', MAVLINK_ROUTER_SCRIPT,
+                '--vehicle-port', str(self.vehicle_port),
+                '--stats-interval', str(STATS_INTERVAL_S)]
+        for name, port in FIXED_CLIENT_PORTS.items():
+            rate = CLIENT_RATE_LIMITS.get(name)
+            args += ['--client', f"{name}={port}" + (f"@{rate:g}" if rate else "")]
+            self.leases[name] = port
+
+        try:
+            self.subprocess_proc = subprocess.Popen(
+                args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1
+            )
+        except Exception as e:
+            self.running = False
+            log.error("MAVLink router başlatılamadı: %s", e)
+            return False
+
+        Thread(target=self._read_output, name="MAVLinkHub", daemon=True).start()
+        Thread(target=self._read_stderr, name="MAVLinkHub-err", daemon=True).start()
+
+        if not self.ready.wait(READY_TIMEOUT_S) or not self.is_alive():
+            log.error("MAVLink router hazır olmadı: %s", self.error or "zaman aşımı")
+            self.stop()
+            return False
+
+        log.info("MAVLink hub hazır (araç portu %d)", self.vehicle_port)
+        return True
+
+    def _read_output(self):
+        proc = self.subprocess_proc
+        try:
+            for line in proc.stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError:
+                    log.debug("MAVLink router: %s", line)
+                    continue
+
+                if 'ready' in msg:
+                    if not msg['ready']:
+                        self.error = msg.get('error')
+                    self.ready.set()
+                elif 'stats' in msg:
+                    self.stats = msg
+                elif 'vehicle' in msg:
+                    self.vehicle_address = msg['vehicle']
+                    log.info("MAVLink hub araç adresi: %s", msg['vehicle'])
+                elif msg.get('status') == 'error':
+                    log.warning("MAVLink router komut hatası: %s", msg)
+        except Exception as e:
+            log.error("MAVLink router okuma hatası: %s", e)
+
+        self.ready.set()
+        if self.running:
+            log.warning("MAVLink router subprocess'i sonlandı")
+
+    def _read_stderr(self):
+        proc = self.subprocess_proc
+        try:
+            for line in proc.stderr:
+                log.warning("MAVLink router stderr: %s", line.strip())
+        except Exception:
+            pass
+
+    def _send(self, command: dict) -> bool:
+        proc = self.subprocess_proc
+        if proc is None or proc.poll() is not None:
+            return False
+        try:
+            proc.stdin.write(json.dumps(command) + "\n")
+            proc.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def lease(self, name: str, rate: Optional[float] = None) -> Optional[str]:
+        """İstemci için yerel uç kirala: MAVSDK bağlantı adresi veya None"""
+        if not self.is_alive():
+            return None
+        if rate is None:
+            rate = CLIENT_RATE_LIMITS.get(name, 0.0)
+
+        with self.lock:
+            port = self.leases.get(name)
+            if port is None:
+                used = set(self.leases.values())
+                port = next((p for p in range(CLIENT_PORT_BASE, CLIENT_PORT_BASE + CLIENT_PORT_COUNT)
+                             if p not in used), None)
+                if port is None:
+                    log.warning("MAVLink hub: boş istemci portu yok (%s)", name)
+                    return None
+                self.leases[name] = port
+
+        if not self._send({'cmd': 'add_client', 'name': name, 'port': port, 'rate': rate}):
+            with self.lock:
+                self.leases.pop(name, None)
+            return None
+        return f"udp://:{port}"
+
+    def release(self, name: str):
+        """Kiralanan ucu bırak (sabit istemciler bırakılmaz)"""
+        if name in FIXED_CLIENT_PORTS:
+            return
+        with self.lock:
+            port = self.leases.pop(name, None)
+        if port is not None:
+            self._send({'cmd': 'remove_client', 'name': name})
+
+    def get_stats(self) -> dict:
+        """Son router istatistiği (istemci başına paket / bayt / düşürülen)"""
+        return dict(self.stats)
+
+    def stop(self):
+        self.running = False
+        proc = self.subprocess_proc
+        if proc:
+            self._send({'cmd': 'shutdown'})
+            try:
+                proc.wait(timeout=HUB_STOP_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            except Exception:
+                pass
+            self.subprocess_proc = None
+        with self.lock:
+            self.leases.clear()
+        log.info("MAVLink hub durduruldu")
+
+
+# ========================================
+# SÜREÇ GENELİ HUB
+# ========================================
+
+_active_hub: Optional[MAVLinkHub] = None
+_hub_lock = threading.Lock()
+
+
+def start_hub(connection_string: str) -> Optional[MAVLinkHub]:
+    """Araç bağlantısı için hub'ı başlat (zaten açıksa onu döndür)"""
+    global _active_hub
+    with _hub_lock:
+        if _active_hub is not None:
+            if _active_hub.connection_string == connection_string and _active_hub.is_alive():
+                return _active_hub
+            _active_hub.stop()
+            _active_hub = None
+
+        hub = MAVLinkHub(connection_string)
+        if not hub.start():
+            return None
+        _active_hub = hub
+        return hub
+
+
+def stop_hub():
+    global _active_hub
+    with _hub_lock:
+        hub, _active_hub = _active_hub, None
+    if hub is not None:
+        hub.stop()
+
+
+def get_hub() -> Optional[MAVLinkHub]:
+    return _active_hub
+
+
+def resolve_endpoint(name: str, connection_string: str, rate: Optional[float] = None) -> str:
+    """
+    Tüketicinin bağlanacağı adres.
+
+    Hub bu araç bağlantısı için açıksa kiralanan yerel uç, değilse
+    `connection_string`'in kendisi döner (doğrudan bağlantı).
+    """
+    hub = _active_hub
+    if hub is None or hub.connection_string != connection_string:
+        return connection_string
+    return hub.lease(name, rate) or connection_string
+
+
+def release_endpoint(name: str):
+    hub = _active_hub
+    if hub is not None:
+        hub.release(name)
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# core/mavlink_router.py
+"""
+MAVLink Router
+==============
+
+Araç bağlantısının (ör. udp://:14540) tek sahibi olan yerel yönlendirici.
+Araçtan gelen her MAVLink datagram'ı kayıtlı yerel istemcilere (UI
+telemetrisi, failsafe, preflight, task süreçleri, motor durumu) kendi UDP
+uçlarından dağıtılır; istemcilerden gelen paketler araca iletilir.
+- Araç portunu tek süreç bağlar; istemciler port için yarışmaz
+- İstemci başına token bucket hız sınırı (mesaj/s); kontrol mesajları
+  (HEARTBEAT, COMMAND_ACK, PARAM_VALUE, MISSION_*, STATUSTEXT) sınırlanmaz
+- Aynı sistem/bileşenden gelen HEARTBEAT'ler araca saniyede bir kez gider
+- İstemci başına geçen paket / bayt ve düşürülen paket sayıları raporlanır
+
+Kullanım:
+    python3 core/mavlink_router.py --vehicle-port 14540 \\
+        --client telemetry=14601 --client motor_status=14541@50
+
+Çıktı (stdout): her satır bir JSON nesnesi
+    {"ready": true, "vehicle_port": 14540}
+    {"ready": false, "error": "..."}
+    {"vehicle": [host, port]}                       araç adresi (değiştiğinde)
+    {"stats": {...}, "vehicle": {...}, "uptime_s": ...}  periyodik istatistik
+    {"control": "<komut>", "status": "ok" | "error", ...} komut cevabı
+
+Kontrol kanalı (stdin): her satır bir JSON komutu
+    {"cmd": "add_client", "name": "task_1", "port": 14610, "rate": 0}
+    {"cmd": "remove_client", "name": "task_1"}
+    {"cmd": "shutdown"}
+
+stdin kapanırsa (GUI süreci öldüyse) router kendini kapatır.
+"""
+
+import argparse
+import json
+import selectors
+import socket
+import sys
+import threading
+import time
+
+LOCALHOST = '127.0.0.1'
+DEFAULT_VEHICLE_PORT = 14540
+DEFAULT_STATS_INTERVAL_S = 2.0
+HEARTBEAT_FORWARD_INTERVAL_S = 0.9
+MAX_DATAGRAM = 65535
+
+MAVLINK_V1_MAGIC = 0xFE
+MAVLINK_V2_MAGIC = 0xFD
+MSG_HEARTBEAT = 0
+
+# Hız sınırından muaf mesajlar: komut / parametre / görev el sıkışmaları
+CONTROL_MESSAGE_IDS = frozenset((
+    0,      # HEARTBEAT
+    22,     # PARAM_VALUE
+    39, 40, 44, 47, 51, 73,   # MISSION_ITEM / REQUEST / COUNT / ACK / REQUEST_INT / ITEM_INT
+    77,     # COMMAND_ACK
+    111,    # TIMESYNC
+    148,    # AUTOPILOT_VERSION
+    253,    # STATUSTEXT
+))
+
+
+def emit(message):
+    """Tek JSON satırı gönder"""
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def parse_header(data):
+    """Datagram'ın ilk MAVLink çerçevesi: (msgid, sysid, compid) veya None"""
+    if len(data) >= 10 and data[0] == MAVLINK_V2_MAGIC:
+        return data[7] | (data[8] << 8) | (data[9] << 16), data[5], data[6]
+    if len(data) >= 6 and data[0] == MAVLINK_V1_MAGIC:
+        return data[5], data[3], data[4]
+    return None
+
+
+class TokenBucket:
+    """Mesaj/s hız sınırı; 1 saniyelik patlama payı"""
+
+    __slots__ = ('rate', 'tokens', 'updated')
+
+    def __init__(self, rate):
+        self.rate = float(rate)
+        self.tokens = self.rate
+        self.updated = time.monotonic()
+
+    def take(self, now):
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
+
+
+class RouterClient:
+    """Tek yerel istemci ucu ve sayaçları"""
+
+    def __init__(self, name, port, rate=0.0):
+        self.name = name
+        self.address = (LOCALHOST, int(port))
+        self.rate = float(rate or 0.0)
+        self.bucket = TokenBucket(self.rate) if self.rate > 0 else None
+        self.to_client_packets = 0
+        self.to_client_bytes = 0
+        self.from_client_packets = 0
+        self.from_client_bytes = 0
+        self.dropped = 0
+        self.send_errors = 0
+        self._window_packets = 0
+
+    def snapshot(self, window_s):
+        rate = self._window_packets / window_s if window_s > 0 else 0.0
+        self._window_packets = 0
+        return {
+            'port': self.address[1],
+            'rate_limit': self.rate or None,
+            'to_client_packets': self.to_client_packets,
+            'to_client_bytes': self.to_client_bytes,
+            'from_client_packets': self.from_client_packets,
+            'from_client_bytes': self.from_client_bytes,
+            'dropped': self.dropped,
+            'send_errors': self.send_errors,
+            'packets_per_s': round(rate, 1),
+        }
+
+
+class MAVLinkRouter:
+    """Araç soketi ile istemci soketi arasında datagram yönlendirici"""
+
+    def __init__(self, vehicle_port=DEFAULT_VEHICLE_PORT, bind_host='0.0.0.0'):
+        self.vehicle_port = vehicle_port
+        self.bind_host = bind_host
+        self.vehicle_address = None
+        self.clients = {}            # name -> RouterClient
+        self.by_address = {}         # (host, port) -> RouterClient
+        self.lock = threading.Lock()
+        self.running = False
+        self.started_at = time.monotonic()
+
+        # Araç yönü sayaçları
+        self.from_vehicle_packets = 0
+        self.from_vehicle_bytes = 0
+        self.to_vehicle_packets = 0
+        self.to_vehicle_bytes = 0
+        self.unroutable = 0          # Araç adresi bilinmeden gelen istemci paketleri
+        self.heartbeats_coalesced = 0
+        self._last_heartbeat = {}    # (sysid, compid) -> monotonic
+
+        self.vehicle_sock = None
+        self.client_sock = None
+
+    def open(self):
+        self.vehicle_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.vehicle_sock.bind((self.bind_host, self.vehicle_port))
+        self.vehicle_sock.setblocking(False)
+
+        self.client_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.client_sock.bind((LOCALHOST, 0))
+        self.client_sock.setblocking(False)
+
+    def add_client(self, name, port, rate=0.0):
+        client = RouterClient(name, port, rate)
+        with self.lock:
+            old = self.clients.pop(name, None)
+            if old is not None:
+                self.by_address.pop(old.address, None)
+            clash = self.by_address.get(client.address)
+            if clash is not None:
+                self.clients.pop(clash.name, None)
+            self.clients[name] = client
+            self.by_address[client.address] = client
+        return client
+
+    def remove_client(self, name):
+        with self.lock:
+            client = self.clients.pop(name, None)
+            if client is not None:
+                self.by_address.pop(client.address, None)
+        return client is not None
+
+    # ========================================
+    # YÖNLENDİRME
+    # ========================================
+
+    def _from_vehicle(self, data, address):
+        if address != self.vehicle_address:
+            self.vehicle_address = address
+            emit({'vehicle': list(address)})
+        self.from_vehicle_packets += 1
+        self.from_vehicle_bytes += len(data)
+
+        header = parse_header(data)
+        limited = header is None or header[0] not in CONTROL_MESSAGE_IDS
+        now = time.monotonic()
+        with self.lock:
+            clients = list(self.clients.values())
+        for client in clients:
+            if limited and client.bucket is not None and not client.bucket.take(now):
+                client.dropped += 1
+                continue
+            try:
+                self.client_sock.sendto(data, client.address)
+            except OSError:
+                # İstemci henüz dinlemiyor (Windows: ICMP port unreachable)
+                client.send_errors += 1
+                continue
+            client.to_client_packets += 1
+            client.to_client_bytes += len(data)
+            client._window_packets += 1
+
+    def _from_client(self, data, address):
+        with self.lock:
+            client = self.by_address.get(address)
+        if client is not None:
+            client.from_client_packets += 1
+            client.from_client_bytes += len(data)
+
+        if self.vehicle_address is None:
+            self.unroutable += 1
+            return
+
+        header = parse_header(data)
+        if header is not None and header[0] == MSG_HEARTBEAT:
+            now = time.monotonic()
+            key = (header[1], header[2])
+            if now - self._last_heartbeat.get(key, 0.0) < HEARTBEAT_FORWARD_INTERVAL_S:
+                self.heartbeats_coalesced += 1
+                return
+            self._last_heartbeat[key] = now
+
+        try:
+            self.vehicle_sock.sendto(data, self.vehicle_address)
+        except OSError:
+            return
+        self.to_vehicle_packets += 1
+        self.to_vehicle_bytes += len(data)
+
+    def _drain(self, sock, handler):
+        while True:
+            try:
+                data, address = sock.recvfrom(MAX_DATAGRAM)
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionResetError:
+                continue   # Windows: önceki sendto'nun ICMP hatası
+            handler(data, address)
+
+    def stats(self, window_s):
+        with self.lock:
+            clients = list(self.clients.values())
+        return {
+            'stats': {client.name: client.snapshot(window_s) for client in clients},
+            'vehicle': {
+                'address': list(self.vehicle_address) if self.vehicle_address else None,
+                'from_vehicle_packets': self.from_vehicle_packets,
+                'from_vehicle_bytes': self.from_vehicle_bytes,
+                'to_vehicle_packets': self.to_vehicle_packets,
+                'to_vehicle_bytes': self.to_vehicle_bytes,
+                'unroutable': self.unroutable,
+                'heartbeats_coalesced': self.heartbeats_coalesced,
+            },
+            'uptime_s': round(time.monotonic() - self.started_at, 1),
+        }
+
+    def serve(self, stats_interval=DEFAULT_STATS_INTERVAL_S):
+        """Soketleri kapatılana kadar yönlendir (bloklar)"""
+        selector = selectors.DefaultSelector()
+        selector.register(self.vehicle_sock, selectors.EVENT_READ, self._from_vehicle)
+        selector.register(self.client_sock, selectors.EVENT_READ, self._from_client)
+
+        self.running = True
+        last_stats = time.monotonic()
+        try:
+            while self.running:
+                timeout = max(0.0, last_stats + stats_interval - time.monotonic())
+                for key, _ in selector.select(timeout=min(timeout, 0.5)):
+                    self._drain(key.fileobj, key.data)
+
+                now = time.monotonic()
+                if stats_interval > 0 and now - last_stats >= stats_interval:
+                    emit(self.stats(now - last_stats))
+                    last_stats = now
+        finally:
+            selector.close()
+            self.close()
+
+    def close(self):
+        self.running = False
+        for sock in (self.vehicle_sock, self.client_sock):
+            if sock is not None:
+                try:
+                    sock.close()
+                except OSError:
+                    pass
+
+
+# ========================================
+# ANA DÖNGÜ
+# ========================================
+
+def handle_command(router, command):
+    cmd = command.get('cmd')
+    if cmd == 'add_client':
+        try:
+            router.add_client(command['name'], int(command['port']), float(command.get('rate') or 0.0))
+        except (KeyError, TypeError, ValueError) as e:
+            emit({'control': cmd, 'status': 'error', 'error': str(e)})
+            return
+        emit({'control': cmd, 'status': 'ok', 'name': command['name']})
+    elif cmd == 'remove_client':
+        removed = router.remove_client(command.get('name'))
+        emit({'control': cmd, 'status': 'ok' if removed else 'error', 'name': command.get('name')})
+    elif cmd == 'shutdown':
+        router.running = False
+    else:
+        emit({'control': cmd, 'status': 'error', 'error': "Bilinmeyen komut"})
+
+
+def start_stdin_reader(router, stream=None):
+    """Kontrol komutlarını okuyan thread; EOF router'ı durdurur (Windows uyumlu)"""
+    stream = stream or sys.stdin
+
+    def reader():
+        try:
+            for line in iter(stream.readline, ''):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    handle_command(router, json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        except (OSError, ValueError):
+            pass
+        router.running = False
+
+    thread = threading.Thread(target=reader, name="mavlink-router-stdin", daemon=True)
+    thread.start()
+    return thread
+
+
+def parse_client(spec):
+    """'ad=port' veya 'ad=port@hız' -> (ad, port, hız)"""
+    name, _, rest = spec.partition('=')
+    port, _, rate = rest.partition('@')
+    if not name or not port:
+        raise argparse.ArgumentTypeError(f"Geçersiz istemci: {spec} (beklenen ad=port[@hız])")
+    try:
+        return name, int(port), float(rate) if rate else 0.0
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz istemci: {spec}")
+
+
+def main(argv=None):
+    """Subprocess entry point"""
+    parser = argparse.ArgumentParser(description="Yerel MAVLink yönlendirici")
+    parser.add_argument('--vehicle-port', type=int, default=DEFAULT_VEHICLE_PORT,
+                        help="Araç bağlantısının dinlendiği UDP portu")
+    parser.add_argument('--bind', default='0.0.0.0',
+                        help="Araç soketinin bağlanacağı adres")
+    parser.add_argument('--client', action='append', type=parse_client, default=[],
+                        help="Başlangıç istemcisi: ad=port[@mesaj/s]")
+    parser.add_argument('--stats-interval', type=float, default=DEFAULT_STATS_INTERVAL_S,
+                        help="İstatistik yayın aralığı (s)")
+    args = parser.parse_args(argv)
+
+    router = MAVLinkRouter(args.vehicle_port, args.bind)
+    try:
+        router.open()
+    except OSError as e:
+        emit({'ready': False, 'error': f"UDP {args.vehicle_port} bağlanamadı: {e}"})
+        sys.exit(1)
+
+    for name, port, rate in args.client:
+        router.add_client(name, port, rate)
+
+    start_stdin_reader(router)
+    emit({'ready': True, 'vehicle_port': args.vehicle_port})
+    try:
+        router.serve(args.stats_interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+# core/mavsdk_pool.py
+"""
+MAVSDK Worker Pool
+==================
+
+`mavsdk_pool_worker.py` süreçlerinden oluşan önceden ısıtılmış havuz:
+- Worker'lar yönetici başlarken açılır, mavsdk'yi import eder ve araca bağlanır
+- Görev tanımlayıcısı stdin'den gider; soğuk başlatma maliyeti (yorumlayıcı,
+  import, mavsdk_server, el sıkışma) görev yolundan çıkar
+- Son boş worker(lar) acil görevlere (EMERGENCY / RTL) ayrılır; uzun süren bir
+  iniş beklerken bile acil komut hazır bir bağlantı bulur
+- Durdurulan görev worker içinde iptal edilir (`{"cancel": task_id}`); bağlantı
+  açık kalır. Worker yalnızca iptal süresinde yanıt vermezse sonlandırılır
+- Ölen / durdurulan worker'ın yerine yenisi açılır; art arda başlatma hataları
+  havuzu devre dışı bırakır (yönetici soğuk yola döner)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from typing import Callable, List, Optional
+
+from .logger import get_logger
+from .mavlink_hub import resolve_endpoint
+
+log = get_logger("mavsdk_pool")
+
+POOL_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mavsdk_pool_worker.py')
+DEFAULT_POOL_SIZE = 2
+DEFAULT_URGENT_RESERVE = 1      # Yalnızca acil görevlerin alabileceği boş worker sayısı
+RESPAWN_DELAY_S = 2.0
+MAX_SPAWN_FAILURES = 3          # Hazır olamadan art arda ölen worker sınırı
+WORKER_STOP_TIMEOUT_S = 3.0
+CANCEL_GRACE_S = 2.0            # İptal edilen görevin bitmesi için beklenen süre
+
+
+class PooledWorker:
+    """Tek önceden bağlanmış worker süreci"""
+
+    def __init__(self, pool: 'MAVSDKWorkerPool', index: int):
+        self.pool = pool
+        self.index = index
+        self.process: Optional[subprocess.Popen] = None
+        self.ready = threading.Event()
+        self.busy = False
+        self.retire = False           # Görev bitince kapatılacak (bağlantı adresi değişti)
+        self.connect_ms: Optional[float] = None
+        self.connection_string = pool.connection_string
+
+        # Yürütülen görev
+        self.task_id: Optional[str] = None
+        self.on_event: Optional[Callable[[dict], None]] = None
+        self.task_done = threading.Event()
+        self.task_ok = False
+        self.send_lock = threading.Lock()           # Görev / iptal yazımları sıralı
+        self.cancelled_task: Optional[str] = None   # Gönderilmeden iptal edilen görev
+
+    def spawn(self):
+        self.connection_string = self.pool.connection_string
+        endpoint = resolve_endpoint(f"pool-{self.index}", self.connection_string)
+        self.process = subprocess.Popen(
+            [sys.executable, '-u', POOL_WORKER_SCRIPT, '--connection', endpoint],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            bufsize=1
+        )
+        threading.Thread(target=self._read_stdout, name=f"MAVSDKPool-{self.index}", daemon=True).start()
+        threading.Thread(target=self._read_stderr, name=f"MAVSDKPool-{self.index}-err", daemon=True).start()
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _read_stdout(self):
+        process = self.process
+        try:
+            for line in iter(process.stdout.readline, ''):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    log.debug("[pool-%d] %s", self.index, line)
+                    continue
+
+                if 'ready' in message:
+                    if message['ready']:
+                        self.connect_ms = message.get('connect_ms')
+                        self.ready.set()
+                        self.pool._worker_ready(self)
+                    else:
+                        log.warning("[pool-%d] başlatılamadı: %s", self.index, message.get('error'))
+                    continue
+
+                if message.get('task_id') != self.task_id or self.on_event is None:
+                    continue
+                self.on_event(message)
+                if message.get('done'):
+                    self.task_ok = bool(message.get('ok'))
+                    self.task_done.set()
+        except Exception as e:
+            log.error("[pool-%d] stdout okuma hatası: %s", self.index, e)
+
+        # Süreç bitti: bekleyen görevi serbest bırak, havuza bildir
+        self.ready.clear()
+        self.task_done.set()
+        self.pool._worker_exited(self)
+
+    def _read_stderr(self):
+        process = self.process
+        try:
+            for line in iter(process.stderr.readline, ''):
+                line = line.strip()
+                if line:
+                    log.debug("[pool-%d] stderr: %s", self.index, line)
+        except Exception:
+            pass
+
+    def run(self, task_id: str, task_type: str, params: dict,
+            on_event: Callable[[dict], None]) -> bool:
+        """Görevi gönder ve bitmesini bekle (çağıran thread bloklanır)"""
+        descriptor = {'task_id': task_id, 'task_type': task_type, 'params': params}
+        with self.send_lock:
+            if self.cancelled_task == task_id:
+                self.cancelled_task = None
+                return False
+
+            self.task_id = task_id
+            self.on_event = on_event
+            self.task_ok = False
+            self.task_done.clear()
+            try:
+                self.process.stdin.write(json.dumps(descriptor) + "\n")
+                self.process.stdin.flush()
+            except (OSError, ValueError) as e:
+                raise RuntimeError(f"Pool worker'a görev gönderilemedi: {e}")
+
+        self.task_done.wait()
+        ok = self.task_ok and self.is_alive()
+        self.task_id = None
+        self.on_event = None
+        return ok
+
+    def cancel(self, task_id: str, grace: float = CANCEL_GRACE_S) -> bool:
+        """
+        Çalışan görevi worker içinde iptal et (çağıran bloklanmaz).
+
+        Görev henüz gönderilmediyse `run()` göndermeden döner. Görev `grace`
+        saniye içinde bitmezse worker sonlandırılır; havuz yerine yenisini
+        açar. İptal mesajı gönderilemezse False döner.
+        """
+        process = self.process
+        if process is None:
+            return False
+        with self.send_lock:
+            if self.task_id != task_id:
+                self.cancelled_task = task_id
+                return True
+            try:
+                process.stdin.write(json.dumps({'cancel': task_id}) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as e:
+                log.warning("[pool-%d] iptal gönderilemedi [%s]: %s", self.index, task_id, e)
+                return False
+
+        def watchdog():
+            if self.task_done.wait(grace) or self.task_id != task_id or self.process is not process:
+                return
+            log.warning("[pool-%d] görev %.1f s içinde iptal edilemedi [%s] - worker sonlandırılıyor",
+                        self.index, grace, task_id)
+            try:
+                process.terminate()
+                process.wait(timeout=WORKER_STOP_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            except Exception:
+                pass
+
+        threading.Thread(target=watchdog, name=f"MAVSDKPool-{self.index}-cancel", daemon=True).start()
+        return True
+
+    def stop(self):
+        if not self.process:
+            return
+        try:
+            self.process.stdin.write(json.dumps({'cmd': 'shutdown'}) + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass
+        try:
+            self.process.terminate()
+            self.process.wait(timeout=WORKER_STOP_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        except Exception:
+            pass
+
+
+class MAVSDKWorkerPool:
+    """
+    Önceden bağlanmış MAVSDK worker havuzu.
+
+    Usage:
+        pool = MAVSDKWorkerPool("udp://:14540", size=2)
+        pool.start()
+        worker = pool.acquire(urgent=True)
+        if worker:
+            try:
+                ok = worker.run(task_id, 'EMERGENCY', {}, on_event)
+            finally:
+                pool.release(worker)
+    """
+
+    def __init__(self, connection_string: str = "udp://:14540",
+                 size: int = DEFAULT_POOL_SIZE,
+                 urgent_reserve: int = DEFAULT_URGENT_RESERVE):
+        self.connection_string = connection_string
+        self.size = size
+        self.urgent_reserve = min(urgent_reserve, max(0, size - 1))
+        self.workers: List[PooledWorker] = []
+        self.lock = threading.Lock()
+        self.shutting_down = False
+        self.disabled = False
+        self.spawn_failures = 0
+
+    def start(self):
+        """Worker'ları başlat (bağlantı arka planda kurulur)"""
+        for index in range(self.size):
+            worker = PooledWorker(self, index)
+            self.workers.append(worker)
+            self._spawn(worker)
+        print(f"✅ MAVSDK worker havuzu başlatılıyor ({self.size} worker)")
+
+    def _spawn(self, worker: PooledWorker):
+        try:
+            worker.spawn()
+        except Exception as e:
+            log.error("Pool worker başlatılamadı: %s", e)
+            self.disabled = True
+
+    def _worker_ready(self, worker: PooledWorker):
+        with self.lock:
+            self.spawn_failures = 0
+        log.info("Pool worker %d hazır (bağlantı %.0f ms)", worker.index, worker.connect_ms or 0.0)
+
+    def _worker_exited(self, worker: PooledWorker):
+        with self.lock:
+            if self.shutting_down:
+                return
+            if worker.connect_ms is None:
+                self.spawn_failures += 1
+                if self.spawn_failures >= MAX_SPAWN_FAILURES:
+                    if not self.disabled:
+                        log.warning("MAVSDK worker havuzu devre dışı - soğuk subprocess yoluna dönülüyor")
+                    self.disabled = True
+                    return
+            worker.busy = False
+            worker.retire = False
+            worker.connect_ms = None
+
+        # Ölen worker'ın yerine yenisini aç
+        timer = threading.Timer(RESPAWN_DELAY_S, self._respawn, args=(worker,))
+        timer.daemon = True
+        timer.start()
+
+    def _respawn(self, worker: PooledWorker):
+        if self.shutting_down or self.disabled or worker.is_alive():
+            return
+        self._spawn(worker)
+
+    def available(self) -> bool:
+        return not self.disabled and any(w.ready.is_set() for w in self.workers)
+
+    def acquire(self, urgent: bool = False, connection_string: Optional[str] = None) -> Optional[PooledWorker]:
+        """
+        Boş ve hazır bir worker al; yoksa None (çağıran soğuk yola döner).
+
+        Acil olmayan görevler son `urgent_reserve` boş worker'ı alamaz.
+        """
+        if self.disabled:
+            return None
+        with self.lock:
+            idle = [w for w in self.workers
+                    if w.ready.is_set() and not w.busy and not w.retire and w.is_alive()
+                    and (connection_string is None or w.connection_string == connection_string)]
+            if not idle or (not urgent and len(idle) <= self.urgent_reserve):
+                return None
+            worker = idle[0]
+            worker.busy = True
+            return worker
+
+    def release(self, worker: PooledWorker):
+        with self.lock:
+            worker.busy = False
+            retire = worker.retire
+        if retire:
+            worker.stop()   # _worker_exited yeni adresle yeniden açar
+
+    def set_connection_string(self, connection_string: str):
+        """Bağlantı adresi değişti: boş worker'ları yeniden aç, meşgulleri görev sonunda"""
+        if connection_string == self.connection_string:
+            return
+        self.connection_string = connection_string
+        with self.lock:
+            self.spawn_failures = 0
+            self.disabled = False
+            to_stop = []
+            for worker in self.workers:
+                if worker.busy:
+                    worker.retire = True
+                else:
+                    to_stop.append(worker)
+        for worker in to_stop:
+            if worker.is_alive():
+                worker.stop()
+            else:
+                self._spawn(worker)
+
+    def shutdown(self):
+        with self.lock:
+            self.shutting_down = True
+        for worker in self.workers:
+            worker.stop()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# core/mavsdk_pool_worker.py
+"""
+MAVSDK Pool Worker
+==================
+
+Önceden başlatılmış (pre-warmed) komut süreci. Yorumlayıcı açılışı, mavsdk
+import'u, mavsdk_server başlatma ve bağlantı el sıkışması görev gelmeden
+önce bir kez yapılır; görevler stdin üzerinden tanımlayıcı olarak gelir ve
+ilk komut araca milisaniyeler içinde gider.
+
+Kullanım:
+    python3 core/mavsdk_pool_worker.py --connection udp://:14540
+
+Giriş (stdin): her satır bir görev tanımlayıcısı veya kontrol mesajı
+    {"task_id": "land_1712", "task_type": "LAND", "params": {}}
+    {"cancel": "land_1712"}                              görevi iptal et
+    {"cmd": "shutdown"}
+
+Çıktı (stdout): her satır bir JSON nesnesi
+    {"ready": true, "connect_ms": 850.2}                 bağlantı hazır
+    {"ready": false, "error": "..."}                     başlatılamadı
+    {"task_id": "...", "line": "STATUS:..."}             görev çıktısı
+    {"task_id": "...", "command": "land"}                ilk araç komutu
+    {"task_id": "...", "done": true, "ok": true}         görev bitti
+    {"task_id": "...", "done": true, "ok": false,
+     "cancelled": true}                                  görev iptal edildi
+
+Görevler sırayla çalışır; bir worker aynı anda tek görev yürütür. Görev
+sürerken de stdin okunur: iptal, görev coroutine'ini keser ve bağlantı açık
+kalır (worker yeniden el sıkışmadan sonraki görevi alır). stdin kapanırsa
+(yönetici öldüyse) worker kendini kapatır. Görev gövdeleri soğuk runner ile
+ortaktır (bkz. mavsdk_tasks.py).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+
+try:
+    from mavsdk import System
+    MAVSDK_AVAILABLE = True
+except ImportError:
+    MAVSDK_AVAILABLE = False
+
+try:
+    from .mavsdk_tasks import TASK_HANDLERS
+except ImportError:
+    from mavsdk_tasks import TASK_HANDLERS
+
+
+
+def emit(message):
+    """Tek JSON satırı gönder"""
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+class TaskOutput:
+    """Görev çıktısını task_id ile etiketleyerek yayınlar"""
+
+    def __init__(self, task_id):
+        self.task_id = task_id
+        self.command_sent = False
+
+    def line(self, text):
+        emit({'task_id': self.task_id, 'line': text})
+
+    def command(self, name):
+        """Araca gidecek ilk komuttan hemen önce çağrılır (gecikme ölçümü)"""
+        if not self.command_sent:
+            self.command_sent = True
+            emit({'task_id': self.task_id, 'command': name})
+
+
+# ========================================
+# ANA DÖNGÜ
+# ========================================
+
+def start_stdin_reader(loop, queue, stream=None):
+    """stdin satırlarını event loop kuyruğuna aktaran thread (Windows uyumlu)"""
+    stream = stream or sys.stdin
+
+    def push(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # Event loop kapandı
+
+    def reader():
+        try:
+            for line in iter(stream.readline, ''):
+                push(line)
+        except (OSError, ValueError):
+            pass
+        push(None)  # EOF
+
+    thread = threading.Thread(target=reader, name="pool-worker-stdin", daemon=True)
+    thread.start()
+    return thread
+
+
+class TaskRunner:
+    """Görevleri sırayla yürütür; çalışan ya da sırada bekleyen görev iptal edilebilir"""
+
+    def __init__(self, drone):
+        self.drone = drone
+        self.queue = asyncio.Queue()
+        self.pending = set()          # Sırada bekleyen task_id'ler
+        self.cancelled = set()        # Başlamadan iptal edilenler
+        self.current_id = None
+        self.current = None           # Çalışan görev coroutine'i (asyncio.Task)
+        self.cancel_requested = False
+
+    def submit(self, descriptor):
+        self.pending.add(descriptor.get('task_id', '?'))
+        self.queue.put_nowait(descriptor)
+
+    def cancel(self, task_id):
+        if self.current is not None and self.current_id == task_id:
+            self.cancel_requested = True
+            self.current.cancel()
+        elif task_id in self.pending:
+            self.cancelled.add(task_id)
+
+    async def run(self):
+        while True:
+            descriptor = await self.queue.get()
+            task_id = descriptor.get('task_id', '?')
+            self.pending.discard(task_id)
+            if task_id in self.cancelled:
+                self.cancelled.discard(task_id)
+                emit({'task_id': task_id, 'done': True, 'ok': False, 'cancelled': True})
+                continue
+            await self.run_task(descriptor)
+
+    async def run_task(self, descriptor):
+        task_id = descriptor.get('task_id', '?')
+        out = TaskOutput(task_id)
+        handler = TASK_HANDLERS.get(descriptor.get('task_type'))
+
+        ok = False
+        cancelled = False
+        if handler is None:
+            out.line(f"ERROR:Havuz bu görev tipini desteklemiyor: {descriptor.get('task_type')}")
+        else:
+            self.current_id = task_id
+            self.cancel_requested = False
+            self.current = asyncio.ensure_future(
+                handler(self.drone, descriptor.get('params') or {}, out))
+            try:
+                ok = bool(await self.current)
+            except asyncio.CancelledError:
+                # Yalnız iptal mesajı yutulur; worker kapanıyorsa iptal yayılır
+                if not self.cancel_requested:
+                    raise
+                cancelled = True
+                out.line("STATUS:Görev iptal edildi")
+            except Exception as e:
+                out.line(f"ERROR:Görev hatası: {e}")
+            finally:
+                self.current_id = None
+                self.current = None
+
+        result = {'task_id': task_id, 'done': True, 'ok': ok}
+        if cancelled:
+            result['cancelled'] = True
+        emit(result)
+
+
+async def serve(connection_string, stream=None):
+    started = time.monotonic()
+    drone = System()
+    await drone.connect(system_address=connection_string)
+    async for state in drone.core.connection_state():
+        if state.is_connected:
+            break
+
+    emit({'ready': True, 'connect_ms': round((time.monotonic() - started) * 1000.0, 1)})
+
+    queue = asyncio.Queue()
+    start_stdin_reader(asyncio.get_running_loop(), queue, stream)
+
+    # Görevler ayrı coroutine'de; bu döngü görev sürerken iptal mesajlarını da okur
+    runner = TaskRunner(drone)
+    runner_task = asyncio.ensure_future(runner.run())
+    try:
+        while True:
+            line = await queue.get()
+            if line is None:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                descriptor = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if descriptor.get('cmd') == 'shutdown':
+                break
+            if 'cancel' in descriptor:
+                runner.cancel(descriptor['cancel'])
+                continue
+            runner.submit(descriptor)
+    finally:
+        runner_task.cancel()
+
+
+def main(argv=None):
+    """Subprocess entry point"""
+    parser = argparse.ArgumentParser(description="Önceden bağlanmış MAVSDK komut worker'ı")
+    parser.add_argument('--connection', default='udp://:14540',
+                        help="MAVSDK bağlantı adresi")
+    args = parser.parse_args(argv)
+
+    if not MAVSDK_AVAILABLE:
+        emit({'ready': False, 'error': "MAVSDK kütüphanesi mevcut değil"})
+        sys.exit(1)
+
+    try:
+        asyncio.run(serve(args.connection))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        emit({'ready': False, 'error': f"Pool worker hatası: {str(e)}"})
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
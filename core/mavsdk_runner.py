@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# core/mavsdk_runner.py
+"""
+MAVSDK Task Runner
+==================
+
+Soğuk yoldaki (havuz dışı) task subprocess'inin giriş noktası. Task
+gövdeleri `mavsdk_tasks` modülündedir ve import edildiği için bytecode
+önbelleğinden yüklenir; bu dosya bilerek küçük tutulur.
+
+Kullanım:
+    python3 -u core/mavsdk_runner.py --task LAND --connection udp://:14540
+    python3 -u core/mavsdk_runner.py --task TAKEOFF --params '{"altitude": 15}'
+
+Çıktı: STATUS:/SUCCESS:/ERROR:/COMMAND: satırları (stdout)
+"""
+
+from mavsdk_tasks import main
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,30 @@ MAVSDK Subprocess Manager - Complete Version with EW VTOL Support
 Bu modül MAVSDK işlemlerini subprocess'ler halinde yönetir ve EW VTOL mission desteği sağlar.
 """
 
+import asyncio
 import subprocess
 import threading
 import time
 import json
 import os
 import sys
-from typing import Dict, List, Optional, Callable, Any
+from typing import Deque, Dict, List, Optional, Callable, Any
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from enum import Enum
-import queue
+import heapq
+import itertools
 import signal
 import psutil
 
+from .logger import get_logger
+from .mavlink_hub import resolve_endpoint, release_endpoint
+from .mavsdk_pool import MAVSDKWorkerPool, DEFAULT_POOL_SIZE
+from .task_history import TaskHistory, DEFAULT_HISTORY_DIR
+from .task_stats import TaskStatistics, TERMINAL_STATUSES
+
+log = get_logger("mavsdk_subprocess")
+
 # EW VTOL missions import (güvenli)
 try:
     # Missions path ekle
@@ -28,7 +39,6 @@ try:
     
     from ew_vtol_missions import (
         get_available_ew_missions, 
-        generate_ew_vtol_mission_script,
         EW_VTOL_MISSIONS
     )
     EW_MISSIONS_AVAILABLE = True
@@ -63,6 +73,44 @@ class TaskType(Enum):
     CUSTOM = "CUSTOM"
 
 
+class TaskPriority(Enum):
+    """Task öncelik sınıfları (küçük değer = yüksek öncelik)"""
+    EMERGENCY = 0
+    FLIGHT_CONTROL = 1
+    MISSION = 2
+    BACKGROUND = 3
+
+
+TASK_PRIORITIES = {
+    TaskType.EMERGENCY: TaskPriority.EMERGENCY,
+    TaskType.RTL: TaskPriority.EMERGENCY,
+    TaskType.TAKEOFF: TaskPriority.FLIGHT_CONTROL,
+    TaskType.LAND: TaskPriority.FLIGHT_CONTROL,
+    TaskType.MISSION: TaskPriority.MISSION,
+    TaskType.EW_MISSION: TaskPriority.MISSION,
+    TaskType.TELEMETRY: TaskPriority.BACKGROUND,
+    TaskType.PARAMETER_SET: TaskPriority.BACKGROUND,
+    TaskType.CUSTOM: TaskPriority.BACKGROUND,
+}
+# Yeni task'ı aynı araçtaki daha düşük öncelikli (kesilebilir) task'ları iptal eder
+PREEMPTING_PRIORITIES = {TaskPriority.EMERGENCY, TaskPriority.FLIGHT_CONTROL}
+PREEMPTIBLE_PRIORITIES = {TaskPriority.FLIGHT_CONTROL, TaskPriority.MISSION}
+
+# Bellekte tutulan çıktı ve biten task sınırları (tam çıktı disktedir)
+TASK_OUTPUT_TAIL_LINES = 200
+MAX_COMPLETED_TASKS = 500
+COMPLETED_TASK_MAX_AGE_S = 3600
+
+# Önceden bağlanmış worker havuzunda çalışabilen task tipleri
+POOLED_TASK_TYPES = {TaskType.TAKEOFF, TaskType.LAND, TaskType.RTL,
+                     TaskType.EMERGENCY, TaskType.PARAMETER_SET}
+# Havuzun ayrılmış worker'ını kullanabilen acil task tipleri
+URGENT_TASK_TYPES = {TaskType.EMERGENCY, TaskType.RTL}
+
+# Soğuk yol: task gövdeleri mavsdk_tasks modülünde, parametreler argv ile gider
+MAVSDK_RUNNER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mavsdk_runner.py')
+
+
 @dataclass
 class TaskInfo:
     """Task bilgileri"""
@@ -72,16 +120,368 @@ class TaskInfo:
     start_time: float
     end_time: Optional[float] = None
     params: Optional[Dict] = None
-    output: List[str] = None
-    error_output: List[str] = None
+    output: Optional[Deque[str]] = None        # Son TASK_OUTPUT_TAIL_LINES satır
+    error_output: Optional[Deque[str]] = None
     process: Optional[subprocess.Popen] = None
     timeout: Optional[int] = None
+    priority: Optional[TaskPriority] = None
+    enqueue_time: Optional[float] = None        # Kuyruğa girdiği an
+    dispatch_time: Optional[float] = None       # Worker thread'in task'ı aldığı an
+    spawn_time: Optional[float] = None          # Process başlatıldığı / havuza gönderildiği an
+    first_command_time: Optional[float] = None  # İlk araç komutunun gönderildiği an
+    pooled: bool = False
+    pool_worker: Optional[Any] = None           # Havuz task'ının worker'ı (iptal için)
+    output_line_count: int = 0                  # Toplam satır (bellekte olmayanlar dahil)
     
     def __post_init__(self):
         if self.output is None:
-            self.output = []
+            self.output = deque(maxlen=TASK_OUTPUT_TAIL_LINES)
         if self.error_output is None:
-            self.error_output = []
+            self.error_output = deque(maxlen=TASK_OUTPUT_TAIL_LINES)
+        if self.priority is None:
+            self.priority = TASK_PRIORITIES.get(self.task_type, TaskPriority.BACKGROUND)
+    
+    @property
+    def queue_wait_ms(self) -> Optional[float]:
+        """Kuyrukta bekleme süresi (ms)"""
+        if self.enqueue_time is None or self.dispatch_time is None:
+            return None
+        return (self.dispatch_time - self.enqueue_time) * 1000.0
+    
+    @property
+    def first_command_latency_ms(self) -> Optional[float]:
+        """Dispatch -> ilk araç komutu gecikmesi (ms)"""
+        if self.dispatch_time is None or self.first_command_time is None:
+            return None
+        return (self.first_command_time - self.dispatch_time) * 1000.0
+
+
+class PriorityTaskQueue:
+    """
+    Öncelik sınıflı task kuyruğu - sınıf içinde FIFO.
+    
+    `get(max_priority=...)` ile bir worker yalnızca belirli sınıf ve üstünü
+    alabilir; acil durum worker'ı uzun görevlerle hiç meşgul olmaz.
+    """
+    
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+    
+    def put(self, task_info: TaskInfo):
+        with self._cond:
+            heapq.heappush(self._heap, (task_info.priority.value, next(self._seq), task_info))
+            self._cond.notify_all()
+    
+    def get(self, timeout: Optional[float] = None,
+            max_priority: Optional[TaskPriority] = None) -> Optional[TaskInfo]:
+        """En yüksek öncelikli task'ı al; zaman aşımında veya kapanınca None"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._closed:
+                if self._heap and (max_priority is None or self._heap[0][0] <= max_priority.value):
+                    return heapq.heappop(self._heap)[2]
+                
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+        return None
+    
+    def remove_if(self, predicate: Callable[[TaskInfo], bool]) -> List[TaskInfo]:
+        """Koşulu sağlayan bekleyen task'ları kuyruktan çıkar"""
+        with self._cond:
+            removed = [entry[2] for entry in self._heap if predicate(entry[2])]
+            if removed:
+                self._heap = [entry for entry in self._heap if not predicate(entry[2])]
+                heapq.heapify(self._heap)
+            return removed
+    
+    def qsize(self, priority: Optional[TaskPriority] = None) -> int:
+        with self._cond:
+            if priority is None:
+                return len(self._heap)
+            return sum(1 for entry in self._heap if entry[0] == priority.value)
+    
+    def close(self):
+        """Bekleyen tüm worker'ları uyandır ve kuyruğu kapat"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class DeadlineScheduler:
+    """
+    Min-heap tabanlı zaman aşımı zamanlayıcısı.
+    
+    Thread bir sonraki son tarihe kadar tam uyur; ekleme/iptal onu uyandırır.
+    İptal edilen kayıtlar heap'te tembel silinir. `on_expire` kilit dışında,
+    zamanlayıcı thread'inde çağrılır.
+    """
+    
+    def __init__(self, on_expire: Callable[[str], None], name: str = "DeadlineScheduler"):
+        self.on_expire = on_expire
+        self._heap = []                       # (monotonic son tarih, sıra, anahtar)
+        self._deadlines: Dict[str, float] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+    
+    def start(self):
+        self._thread.start()
+    
+    def schedule(self, key: str, deadline: float):
+        """`key` için son tarih ayarla (time.time() tabanlı mutlak zaman)"""
+        monotonic_deadline = time.monotonic() + (deadline - time.time())
+        with self._cond:
+            self._deadlines[key] = monotonic_deadline
+            heapq.heappush(self._heap, (monotonic_deadline, next(self._seq), key))
+            if self._heap[0][2] == key:
+                self._cond.notify()
+    
+    def cancel(self, key: str):
+        with self._cond:
+            if self._deadlines.pop(key, None) is None:
+                return
+            # Tembel silme: heap iptal kayıtlarıyla şişmesin
+            if len(self._heap) > 2 * len(self._deadlines) + 16:
+                self._heap = [entry for entry in self._heap
+                              if self._deadlines.get(entry[2]) == entry[0]]
+                heapq.heapify(self._heap)
+            self._cond.notify()
+    
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._deadlines)
+    
+    def _next_expired(self) -> Optional[str]:
+        """Süresi dolan ilk anahtarı bekle; durdurulursa None"""
+        with self._cond:
+            while not self._stopped:
+                # İptal edilmiş / yeniden planlanmış başları at
+                while self._heap and self._deadlines.get(self._heap[0][2]) != self._heap[0][0]:
+                    heapq.heappop(self._heap)
+                
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                
+                deadline, _, key = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    heapq.heappop(self._heap)
+                    del self._deadlines[key]
+                    return key
+                self._cond.wait(remaining)
+        return None
+    
+    def _run(self):
+        while True:
+            key = self._next_expired()
+            if key is None:
+                return
+            try:
+                self.on_expire(key)
+            except Exception as e:
+                log.error("Deadline callback hatası [%s]: %s", key, e)
+    
+    def stop(self, timeout: float = 5.0):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+
+class AsyncProcessHandle:
+    """
+    asyncio subprocess'i için thread-safe, Popen benzeri arayüz.
+    
+    stop_task / timeout yolları process'i başka thread'lerden `terminate()`,
+    `wait(timeout)`, `kill()`, `poll()` ile yönetmeye devam eder.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop, process, args):
+        self.loop = loop
+        self.process = process
+        self.args = args
+        self.pid = process.pid
+        self.exited = threading.Event()
+    
+    @property
+    def returncode(self) -> Optional[int]:
+        return self.process.returncode
+    
+    def poll(self) -> Optional[int]:
+        return self.process.returncode
+    
+    def _signal(self, method: Callable[[], None]):
+        def call():
+            if self.process.returncode is None:
+                try:
+                    method()
+                except ProcessLookupError:
+                    pass
+        try:
+            self.loop.call_soon_threadsafe(call)
+        except RuntimeError:
+            pass  # Event loop kapandı
+    
+    def terminate(self):
+        self._signal(self.process.terminate)
+    
+    def kill(self):
+        self._signal(self.process.kill)
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        if not self.exited.wait(timeout):
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.process.returncode
+
+
+class AsyncTaskEngine:
+    """
+    Tek event loop üzerinde çalışan task motoru.
+    
+    Task başına üç thread (bekleyen worker + stdout/stderr okuyucuları) yerine
+    tüm çocuk process'ler ve çıktı akışları tek bir loop thread'inde yönetilir.
+    Worker'lar coroutine'dir; aynı öncelik kuyruğunu ve ayrılmış acil durum
+    worker'ını kullanır. Havuz task'ları (bloklayan pipe protokolü) loop'un
+    executor'ında çalışır.
+    """
+    
+    def __init__(self, manager: 'MAVSDKSubprocessManager'):
+        self.manager = manager
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._ready = threading.Event()
+    
+    def start(self):
+        self.thread = threading.Thread(target=self._run_loop, name="MAVSDKAsyncEngine", daemon=True)
+        self.thread.start()
+        self._ready.wait(timeout=5)
+    
+    def _run_loop(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            loop.run_until_complete(self._main())
+        except Exception as e:
+            log.error("Async engine hatası: %s", e)
+        finally:
+            loop.close()
+    
+    async def _main(self):
+        self._wake = asyncio.Event()
+        self._ready.set()
+        
+        workers = [self._worker() for _ in range(self.manager.max_concurrent)]
+        workers.append(self._worker(TaskPriority.EMERGENCY))
+        await asyncio.gather(*workers)
+    
+    def notify(self):
+        """Yeni task kuyruğa girdi - bekleyen worker'ları uyandır (thread-safe)"""
+        loop = self.loop
+        if loop is None or self._wake is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass  # Event loop kapandı
+    
+    async def _worker(self, max_priority: Optional[TaskPriority] = None):
+        manager = self.manager
+        while not manager.shutdown_event.is_set():
+            self._wake.clear()
+            task_info = manager.task_queue.get(timeout=0, max_priority=max_priority)
+            if task_info is None:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            await self._execute(task_info)
+    
+    async def _execute(self, task_info: TaskInfo):
+        manager = self.manager
+        try:
+            manager._begin_task(task_info)
+            
+            worker = manager._acquire_pool_worker(task_info)
+            if worker:
+                try:
+                    return_code = await self.loop.run_in_executor(
+                        None, manager._run_pooled, task_info, worker)
+                finally:
+                    manager.worker_pool.release(worker)
+            else:
+                return_code = await self._run_cold(task_info)
+            
+            manager._complete_task(task_info, return_code)
+            
+        except Exception as e:
+            manager._fail_task(task_info, e)
+    
+    async def _run_cold(self, task_info: TaskInfo) -> int:
+        try:
+            return await self._spawn_cold(task_info)
+        finally:
+            self.manager._release_endpoint(task_info)
+    
+    async def _spawn_cold(self, task_info: TaskInfo) -> int:
+        manager = self.manager
+        task_id = task_info.task_id
+        args = manager._build_command(task_info)
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=dict(os.environ, PYTHONIOENCODING='utf-8')
+        )
+        handle = AsyncProcessHandle(self.loop, process, args)
+        task_info.process = handle
+        manager._mark_spawned(task_info)
+        
+        # Başlatma sırasında durdurulduysa (ör. kesildiyse) hemen sonlandır
+        if task_id not in manager.active_tasks:
+            process.terminate()
+        
+        try:
+            await asyncio.gather(
+                self._pump(task_id, process.stdout, manager._handle_output_line, "Stdout"),
+                self._pump(task_id, process.stderr, manager._handle_error_line, "Stderr")
+            )
+            return await process.wait()
+        finally:
+            handle.exited.set()
+    
+    async def _pump(self, task_id: str, stream: asyncio.StreamReader,
+                    handler: Callable[[str, str], None], name: str):
+        """Çıktı akışını satır satır işle"""
+        try:
+            while True:
+                raw = await stream.readline()
+                if not raw:
+                    break
+                
+                line = raw.decode('utf-8', 'replace').strip()
+                if line:
+                    if __debug__:
+                        log.debug("[%s] %s: %s", task_id, name.lower(), line)
+                    handler(task_id, line)
+        except Exception as e:
+            self.manager._send_callback(task_id, f"ERROR:{name} okuma hatası: {e}")
+    
+    def stop(self, timeout: float = 5.0):
+        self.notify()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=timeout)
 
 
 class MAVSDKSubprocessManager:
@@ -102,7 +502,12 @@ class MAVSDKSubprocessManager:
                  connection_string: str = "udp://:14540",
                  max_concurrent: int = 5,
                  default_timeout: int = 300,
-                 enable_logging: bool = True):
+                 enable_logging: bool = True,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 max_completed_tasks: int = MAX_COMPLETED_TASKS,
+                 completed_task_max_age: float = COMPLETED_TASK_MAX_AGE_S,
+                 history_dir: Optional[str] = DEFAULT_HISTORY_DIR,
+                 engine: str = "asyncio"):
         
         self.connection_string = connection_string
         self.max_concurrent = max_concurrent
@@ -111,16 +516,31 @@ class MAVSDKSubprocessManager:
         
         # Task management
         self.tasks: Dict[str, TaskInfo] = {}
-        self.task_queue = queue.Queue()
+        self.task_queue = PriorityTaskQueue()
         self.active_tasks: Dict[str, TaskInfo] = {}
-        self.completed_tasks: Dict[str, TaskInfo] = {}
+        self.completed_tasks: 'OrderedDict[str, TaskInfo]' = OrderedDict()   # LRU sırası
+        self.max_completed_tasks = max_completed_tasks
+        self.completed_task_max_age = completed_task_max_age
+        
+        # Tam çıktı ve biten task indeksi diskte
+        self.task_history: Optional[TaskHistory] = None
+        if history_dir:
+            try:
+                self.task_history = TaskHistory(history_dir)
+            except Exception as e:
+                log.warning("Task geçmişi açılamadı (%s): %s", history_dir, e)
         
         # Threading
         self.worker_threads: List[threading.Thread] = []
-        self.monitor_thread: Optional[threading.Thread] = None
+        self.engine = engine                  # "asyncio" (tek loop) veya "thread"
+        self.async_engine: Optional[AsyncTaskEngine] = None
+        self.timeout_scheduler = DeadlineScheduler(self._timeout_task, name="MAVSDKTimeouts")
         self.shutdown_event = threading.Event()
         self.task_lock = threading.Lock()
         
+        # Durum geçişlerinde güncellenen sayaçlar / süre histogramları
+        self.stats = TaskStatistics()
+        
         # Callbacks
         self.callback_func: Optional[Callable[[str, str], None]] = None
         self.status_callbacks: Dict[str, Callable] = {}
@@ -129,12 +549,19 @@ class MAVSDKSubprocessManager:
         self.ew_missions: Dict[str, Dict] = {}
         self.setup_ew_support()
         
+        # Önceden bağlanmış komut worker havuzu
+        self.worker_pool: Optional[MAVSDKWorkerPool] = None
+        if pool_size > 0:
+            self.worker_pool = MAVSDKWorkerPool(connection_string, size=pool_size)
+            self.worker_pool.start()
+        
         # Start worker threads
         self.start_workers()
         
         print(f"✅ MAVSDK Subprocess Manager başlatıldı")
         print(f"   📡 Connection: {connection_string}")
         print(f"   🧵 Max concurrent: {max_concurrent}")
+        print(f"   🔥 Worker pool: {pool_size}")
         print(f"   ⏰ Default timeout: {default_timeout}s")
         print(f"   🚁✈️ EW Missions: {'✅ Aktif' if EW_MISSIONS_AVAILABLE else '❌ Pasif'}")
     
@@ -143,7 +570,6 @@ class MAVSDKSubprocessManager:
         if EW_MISSIONS_AVAILABLE:
             try:
                 self.available_ew_missions = get_available_ew_missions()
-                self.ew_script_generator = generate_ew_vtol_mission_script
                 print(f"✅ {len(self.available_ew_missions)} EW VTOL mission hazır")
             except Exception as e:
                 print(f"❌ EW support kurulumu hatası: {e}")
@@ -155,15 +581,26 @@ class MAVSDKSubprocessManager:
         """Output callback fonksiyonu ayarla"""
         self.callback_func = callback
         if self.enable_logging:
-            print("✅ Callback function ayarlandı")
+            log.info("Callback function ayarlandı")
     
     def set_connection_string(self, connection_string: str):
         """Connection string'i güncelle"""
         self.connection_string = connection_string
+        if self.worker_pool:
+            self.worker_pool.set_connection_string(connection_string)
         print(f"📡 Connection string güncellendi: {connection_string}")
     
     def start_workers(self):
-        """Worker thread'leri başlat"""
+        """Worker'ları başlat"""
+        # Timeout zamanlayıcısı
+        self.timeout_scheduler.start()
+        
+        if self.engine == "asyncio":
+            self.async_engine = AsyncTaskEngine(self)
+            self.async_engine.start()
+            print(f"✅ Asyncio task motoru başlatıldı ({self.max_concurrent} + 1 acil worker)")
+            return
+        
         # Task processor thread'leri
         for i in range(self.max_concurrent):
             worker = threading.Thread(
@@ -174,137 +611,381 @@ class MAVSDKSubprocessManager:
             worker.start()
             self.worker_threads.append(worker)
         
-        # Monitor thread
-        self.monitor_thread = threading.Thread(
-            target=self._monitor_tasks,
-            name="MAVSDKMonitor",
+        # Yalnızca acil durum sınıfını alan ayrılmış worker - diğerleri uzun
+        # görevlerle dolu olsa da acil komut kuyrukta beklemez
+        emergency_worker = threading.Thread(
+            target=self._task_worker,
+            args=(TaskPriority.EMERGENCY,),
+            name="MAVSDKWorker-emergency",
             daemon=True
         )
-        self.monitor_thread.start()
+        emergency_worker.start()
+        self.worker_threads.append(emergency_worker)
         
         print(f"✅ {self.max_concurrent} worker thread başlatıldı")
     
-    def _task_worker(self):
+    def _task_worker(self, max_priority: Optional[TaskPriority] = None):
         """Task işleyici worker thread"""
         while not self.shutdown_event.is_set():
             try:
-                # Queue'dan task al (timeout ile)
-                task_info = self.task_queue.get(timeout=1.0)
+                # Queue'dan en öncelikli task'ı al (timeout ile)
+                task_info = self.task_queue.get(timeout=1.0, max_priority=max_priority)
                 
-                if task_info is None:  # Shutdown signal
-                    break
+                if task_info is None:  # Timeout veya shutdown
+                    continue
                 
                 # Task'ı çalıştır
                 self._execute_task(task_info)
                 
-                # Queue'ya task tamamlandığını bildir
-                self.task_queue.task_done()
-                
-            except queue.Empty:
-                continue
             except Exception as e:
-                print(f"❌ Worker thread hatası: {e}")
-    
-    def _monitor_tasks(self):
-        """Task monitor thread - timeout ve cleanup"""
-        while not self.shutdown_event.is_set():
-            try:
-                current_time = time.time()
-                
-                with self.task_lock:
-                    # Timeout kontrolü
-                    timed_out_tasks = []
-                    
-                    for task_id, task_info in self.active_tasks.items():
-                        if (task_info.timeout and 
-                            current_time - task_info.start_time > task_info.timeout):
-                            timed_out_tasks.append(task_id)
-                    
-                    # Timeout olan task'ları durdur
-                    for task_id in timed_out_tasks:
-                        self._timeout_task(task_id)
-                
-                time.sleep(2.0)  # 2 saniyede bir kontrol
-                
-            except Exception as e:
-                print(f"❌ Monitor thread hatası: {e}")
-                time.sleep(1.0)
+                log.error("Worker thread hatası: %s", e)
     
     def _execute_task(self, task_info: TaskInfo):
-        """Tek bir task'ı çalıştır"""
-        task_id = task_info.task_id
-        
+        """Tek bir task'ı çalıştır (thread motoru)"""
         try:
-            # Active tasks'a ekle
-            with self.task_lock:
-                self.active_tasks[task_id] = task_info
-                task_info.status = TaskStatus.RUNNING
-            
-            self._send_callback(task_id, f"STATUS:Task başlatılıyor: {task_id}")
+            self._begin_task(task_info)
             
-            # Task tipine göre script oluştur
-            if task_info.task_type == TaskType.EW_MISSION:
-                script = self._generate_ew_mission_script(task_info)
+            worker = self._acquire_pool_worker(task_info)
+            if worker:
+                try:
+                    return_code = self._run_pooled(task_info, worker)
+                finally:
+                    self.worker_pool.release(worker)
             else:
-                script = self._generate_standard_script(task_info)
+                return_code = self._run_cold(task_info)
             
-            if not script:
-                raise Exception("Script oluşturulamadı")
-            
-            # Subprocess başlat
-            process = subprocess.Popen(
-                [sys.executable, '-c', script],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1
-            )
+            self._complete_task(task_info, return_code)
             
-            task_info.process = process
-            
-            # Output okuma thread'leri
-            stdout_thread = threading.Thread(
-                target=self._read_stdout,
-                args=(task_id, process),
-                daemon=True
-            )
-            stderr_thread = threading.Thread(
-                target=self._read_stderr,
-                args=(task_id, process),
-                daemon=True
-            )
-            
-            stdout_thread.start()
-            stderr_thread.start()
-            
-            # Process bitmesini bekle
-            return_code = process.wait()
-            
-            # Task tamamlandı
-            with self.task_lock:
-                task_info.end_time = time.time()
-                task_info.status = TaskStatus.COMPLETED if return_code == 0 else TaskStatus.FAILED
-                
-                # Active'den completed'e taşı
-                if task_id in self.active_tasks:
-                    del self.active_tasks[task_id]
-                self.completed_tasks[task_id] = task_info
-            
-            status_msg = "SUCCESS" if return_code == 0 else "ERROR"
-            self._send_callback(task_id, f"{status_msg}:Task tamamlandı: {task_id}")
+        except Exception as e:
+            self._fail_task(task_info, e)
+    
+    def _begin_task(self, task_info: TaskInfo):
+        """Task'ı aktif yap, son tarihini planla"""
+        task_id = task_info.task_id
+        
+        # Active tasks'a ekle
+        with self.task_lock:
+            self.active_tasks[task_id] = task_info
+            old_status = task_info.status
+            task_info.status = TaskStatus.RUNNING
+            task_info.dispatch_time = time.time()
+        
+        self.stats.task_started(task_info.task_type.value, task_info.priority.name,
+                                old_status.value, TaskStatus.RUNNING.value, task_info.queue_wait_ms)
+        
+        # Son tarih task oluşturulduğu andan sayılır
+        if task_info.timeout:
+            self.timeout_scheduler.schedule(task_id, task_info.start_time + task_info.timeout)
+        
+        self._send_callback(task_id, f"STATUS:Task başlatılıyor: {task_id}")
+    
+    def _complete_task(self, task_info: TaskInfo, return_code: int):
+        """Process bitti: sonucu kaydet"""
+        task_id = task_info.task_id
+        self.timeout_scheduler.cancel(task_id)
+        
+        # Task tamamlandı (stop/timeout ile zaten taşındıysa dokunma)
+        with self.task_lock:
+            if task_id not in self.active_tasks:
+                return
+            self._finish_task(task_info, TaskStatus.COMPLETED if return_code == 0 else TaskStatus.FAILED)
+        self._archive_task(task_info)
+        
+        status_msg = "SUCCESS" if return_code == 0 else "ERROR"
+        self._send_callback(task_id, f"{status_msg}:Task tamamlandı: {task_id}")
+    
+    def _fail_task(self, task_info: TaskInfo, error: Exception):
+        """Task çalıştırılamadı"""
+        task_id = task_info.task_id
+        self.timeout_scheduler.cancel(task_id)
+        
+        # Task başarısız
+        self._append_output(task_info, 'ERR', str(error))
+        with self.task_lock:
+            # Durdurulmuş / timeout olmuş task'ın sonucu ezilmesin
+            if task_info.status.value in TERMINAL_STATUSES:
+                return
+            self._finish_task(task_info, TaskStatus.FAILED)
+        self._archive_task(task_info)
+        
+        self._send_callback(task_id, f"ERROR:Task hatası: {error}")
+    
+    def _finish_task(self, task_info: TaskInfo, status: TaskStatus):
+        """Task'ı bitmiş olarak işaretle ve LRU'ya taşı (task_lock altında)"""
+        task_id = task_info.task_id
+        old_status = task_info.status
+        task_info.end_time = time.time()
+        task_info.status = status
+        
+        run_ms = None
+        started = task_info.spawn_time or task_info.dispatch_time
+        if started is not None:
+            run_ms = (task_info.end_time - started) * 1000.0
+        self.stats.task_finished(task_info.task_type.value, old_status.value, status.value, run_ms)
+        
+        # Active'den completed'e taşı
+        self.active_tasks.pop(task_id, None)
+        self.completed_tasks[task_id] = task_info
+        self.completed_tasks.move_to_end(task_id)
+        
+        if task_id in self.ew_missions and status != TaskStatus.COMPLETED:
+            self.ew_missions[task_id]['status'] = status.value
+        
+        self._evict_completed()
+    
+    def _evict_completed(self):
+        """Sınırı aşan veya yaşlanan biten task'ları bellekten at (task_lock altında)"""
+        now = time.time()
+        while self.completed_tasks:
+            task_id, task_info = next(iter(self.completed_tasks.items()))
+            too_many = len(self.completed_tasks) > self.max_completed_tasks
+            too_old = now - (task_info.end_time or now) > self.completed_task_max_age
+            if not (too_many or too_old):
+                break
             
+            del self.completed_tasks[task_id]
+            self.tasks.pop(task_id, None)
+            self.ew_missions.pop(task_id, None)
+    
+    def _archive_task(self, task_info: TaskInfo):
+        """Biten task'ı disk indeksine yaz (task_lock dışında)"""
+        if not self.task_history:
+            return
+        try:
+            self.task_history.record(task_info)
         except Exception as e:
-            # Task başarısız
+            log.warning("Task indekse yazılamadı [%s]: %s", task_info.task_id, e)
+    
+    def _append_output(self, task_info: TaskInfo, stream: str, line: str):
+        """Satırı bellekteki halka tampona ve task log dosyasına ekle"""
+        with self.task_lock:
+            target = task_info.output if stream == 'OUT' else task_info.error_output
+            target.append(line)
+            task_info.output_line_count += 1
+            archived = task_info.end_time is not None
+        
+        # Arşivlendikten sonra gelen satır log dosyasını yeniden açmasın
+        if self.task_history and not archived:
+            self.task_history.append(task_info.task_id, stream, line)
+    
+    def _mark_spawned(self, task_info: TaskInfo):
+        """Process başlatıldı / havuza gönderildi - spawn süresini kaydet"""
+        task_info.spawn_time = time.time()
+        if task_info.dispatch_time is not None:
+            self.stats.task_spawned(task_info.task_type.value,
+                                    (task_info.spawn_time - task_info.dispatch_time) * 1000.0)
+    
+    def _task_vehicle(self, task_info: TaskInfo) -> str:
+        """Task'ın komut verdiği araç (bağlantı adresi)"""
+        return (task_info.params or {}).get('connection_string', self.connection_string)
+    
+    def _submit_task(self, task_info: TaskInfo):
+        """Task'ı kaydet, öncelik kuyruğuna ekle ve çakışan alt öncelikli task'ları kes"""
+        with self.task_lock:
+            self.tasks[task_info.task_id] = task_info
+            task_info.enqueue_time = time.time()
+        self.stats.task_submitted(task_info.task_type.value, task_info.status.value)
+        
+        self.task_queue.put(task_info)
+        if self.async_engine:
+            self.async_engine.notify()
+        
+        if task_info.priority in PREEMPTING_PRIORITIES:
+            self._preempt_conflicting(task_info)
+    
+    def _preempt_conflicting(self, task_info: TaskInfo):
+        """Aynı araçtaki daha düşük öncelikli, kesilebilir task'ları iptal et"""
+        vehicle = self._task_vehicle(task_info)
+        
+        def conflicts(other: TaskInfo) -> bool:
+            return (other is not task_info
+                    and other.priority in PREEMPTIBLE_PRIORITIES
+                    and other.priority.value > task_info.priority.value
+                    and self._task_vehicle(other) == vehicle)
+        
+        reason = f"{task_info.priority.name} önceliğindeki {task_info.task_id} tarafından kesildi"
+        
+        # Bekleyenler hemen kuyruktan çıkar - acil task'tan sonra çalışmasınlar
+        for other in self.task_queue.remove_if(conflicts):
             with self.task_lock:
-                task_info.end_time = time.time()
-                task_info.status = TaskStatus.FAILED
-                task_info.error_output.append(str(e))
-                
-                if task_id in self.active_tasks:
-                    del self.active_tasks[task_id]
-                self.completed_tasks[task_id] = task_info
-            
-            self._send_callback(task_id, f"ERROR:Task hatası: {e}")
+                self._finish_task(other, TaskStatus.STOPPED)
+            self._archive_task(other)
+            self._send_callback(other.task_id, f"STATUS:Task iptal edildi - {reason}")
+        
+        # Çalışanlar ayrı thread'de durdurulur (çağıran GUI thread'i bloklanmasın)
+        running = [task_id for task_id, other in self.get_active_tasks().items() if conflicts(other)]
+        if running:
+            threading.Thread(
+                target=self._stop_preempted,
+                args=(running, reason),
+                name="MAVSDKPreempt",
+                daemon=True
+            ).start()
+    
+    def _stop_preempted(self, task_ids: List[str], reason: str):
+        for task_id in task_ids:
+            self._send_callback(task_id, f"STATUS:Task kesiliyor - {reason}")
+            self.stop_task(task_id)
+    
+    def _acquire_pool_worker(self, task_info: TaskInfo):
+        """Task havuzda çalışabiliyorsa boş bir worker al"""
+        if not self.worker_pool or task_info.task_type not in POOLED_TASK_TYPES:
+            return None
+        
+        params = task_info.params or {}
+        connection_string = params.get('connection_string', self.connection_string)
+        return self.worker_pool.acquire(
+            urgent=task_info.task_type in URGENT_TASK_TYPES,
+            connection_string=connection_string
+        )
+    
+    def _run_pooled(self, task_info: TaskInfo, worker) -> int:
+        """Task'ı önceden bağlanmış worker'da çalıştır"""
+        task_id = task_info.task_id
+        task_info.pooled = True
+        task_info.pool_worker = worker
+        task_info.process = worker.process
+        
+        # Worker alınırken durdurulduysa göndermeden çık
+        if task_id not in self.active_tasks:
+            return 1
+        
+        self._mark_spawned(task_info)
+        
+        def on_event(message: dict):
+            if 'command' in message:
+                self._record_first_command(task_info, message['command'])
+            elif 'line' in message:
+                self._handle_output_line(task_id, message['line'])
+        
+        ok = worker.run(task_id, task_info.task_type.value, task_info.params or {}, on_event)
+        return 0 if ok else 1
+    
+    def _build_command(self, task_info: TaskInfo) -> List[str]:
+        """
+        Task subprocess'inin komut satırı.
+        
+        Custom script'ler -c ile çalışır; diğer tipler önceden yazılmış runner
+        modülüne parametrelerini JSON argümanı olarak verir (-u: satırlar ve
+        COMMAND işaretleri gecikmeden gelsin).
+        """
+        params = dict(task_info.params or {})
+        
+        if task_info.task_type == TaskType.CUSTOM:
+            script = params.get('script', '')
+            if not script:
+                raise Exception("Custom script boş")
+            return [sys.executable, '-u', '-c', script]
+        
+        if task_info.task_type == TaskType.EW_MISSION:
+            if not EW_MISSIONS_AVAILABLE:
+                raise Exception("EW missions mevcut değil")
+            if not params.get('mission_id'):
+                raise Exception("Mission ID belirtilmemiş")
+        
+        # MAVLink hub açıksa task kendi yerel ucuna bağlanır (bkz. _release_endpoint)
+        connection_string = params.pop('connection_string', self.connection_string)
+        endpoint = resolve_endpoint(self._endpoint_name(task_info), connection_string)
+        return [
+            sys.executable, '-u', MAVSDK_RUNNER_SCRIPT,
+            '--task', task_info.task_type.value,
+            '--connection', endpoint,
+            '--params', json.dumps(params, default=str),
+        ]
+    
+    def _endpoint_name(self, task_info: TaskInfo) -> str:
+        return f"task-{task_info.task_id}"
+    
+    def _release_endpoint(self, task_info: TaskInfo):
+        """Soğuk task'ın hub ucunu bırak"""
+        release_endpoint(self._endpoint_name(task_info))
+    
+    def _run_cold(self, task_info: TaskInfo) -> int:
+        """Task'ı yeni bir subprocess'te çalıştır"""
+        try:
+            return self._spawn_cold(task_info)
+        finally:
+            self._release_endpoint(task_info)
+    
+    def _spawn_cold(self, task_info: TaskInfo) -> int:
+        task_id = task_info.task_id
+        
+        # Subprocess başlat
+        process = subprocess.Popen(
+            self._build_command(task_info),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            encoding='utf-8',
+            errors='replace',
+            env=dict(os.environ, PYTHONIOENCODING='utf-8'),
+            bufsize=1
+        )
+        
+        task_info.process = process
+        self._mark_spawned(task_info)
+        
+        # Başlatma sırasında durdurulduysa (ör. kesildiyse) hemen sonlandır
+        if task_id not in self.active_tasks:
+            process.terminate()
+        
+        # Output okuma thread'leri
+        stdout_thread = threading.Thread(
+            target=self._read_stdout,
+            args=(task_id, process),
+            daemon=True
+        )
+        stderr_thread = threading.Thread(
+            target=self._read_stderr,
+            args=(task_id, process),
+            daemon=True
+        )
+        
+        stdout_thread.start()
+        stderr_thread.start()
+        
+        # Process bitmesini bekle, kalan çıktıyı arşivlemeden önce topla
+        return_code = process.wait()
+        stdout_thread.join(timeout=1.0)
+        stderr_thread.join(timeout=1.0)
+        return return_code
+    
+    def _record_first_command(self, task_info: TaskInfo, command: str):
+        """İlk araç komutunun zamanını kaydet ve gecikmeyi raporla"""
+        if task_info.first_command_time is not None:
+            return
+        task_info.first_command_time = time.time()
+        latency_ms = task_info.first_command_latency_ms
+        path = "havuz" if task_info.pooled else "soğuk başlatma"
+        log.info("[%s] ilk komut '%s': %.0f ms (%s)", task_info.task_id, command, latency_ms, path)
+        self._send_callback(task_info.task_id,
+                            f"STATUS:İlk komut ({command}) {latency_ms:.0f} ms içinde gönderildi ({path})")
+    
+    def _handle_output_line(self, task_id: str, line: str):
+        """Task çıktı satırını kaydet ve callback'e ilet"""
+        if line.startswith("COMMAND:"):
+            task_info = self.tasks.get(task_id)
+            if task_info:
+                self._record_first_command(task_info, line[8:])
+            return
+        
+        # Task output'una ekle
+        task_info = self.tasks.get(task_id)
+        if task_info:
+            self._append_output(task_info, 'OUT', line)
+        
+        # Callback gönder
+        self._send_callback(task_id, line)
+    
+    def _handle_error_line(self, task_id: str, line: str):
+        """stderr satırını kaydet ve callback'e ilet"""
+        # Task error output'una ekle
+        task_info = self.tasks.get(task_id)
+        if task_info:
+            self._append_output(task_info, 'ERR', line)
+        
+        # Error callback gönder
+        self._send_callback(task_id, f"STDERR:{line}")
     
     def _read_stdout(self, task_id: str, process: subprocess.Popen):
         """Subprocess stdout okuyucu"""
@@ -315,13 +996,10 @@ class MAVSDKSubprocessManager:
                 
                 line = line.strip()
                 if line:
-                    # Task output'una ekle
-                    with self.task_lock:
-                        if task_id in self.tasks:
-                            self.tasks[task_id].output.append(line)
+                    if __debug__:
+                        log.debug("[%s] stdout: %s", task_id, line)
                     
-                    # Callback gönder
-                    self._send_callback(task_id, line)
+                    self._handle_output_line(task_id, line)
                     
         except Exception as e:
             self._send_callback(task_id, f"ERROR:Stdout okuma hatası: {e}")
@@ -335,53 +1013,67 @@ class MAVSDKSubprocessManager:
                 
                 line = line.strip()
                 if line:
-                    # Task error output'una ekle
-                    with self.task_lock:
-                        if task_id in self.tasks:
-                            self.tasks[task_id].error_output.append(line)
+                    if __debug__:
+                        log.debug("[%s] stderr: %s", task_id, line)
                     
-                    # Error callback gönder
-                    self._send_callback(task_id, f"STDERR:{line}")
+                    self._handle_error_line(task_id, line)
                     
         except Exception as e:
             self._send_callback(task_id, f"ERROR:Stderr okuma hatası: {e}")
     
     def _timeout_task(self, task_id: str):
-        """Task timeout işlemi"""
+        """Task timeout işlemi (zamanlayıcı thread'inde, task_lock dışında)"""
         try:
-            task_info = self.active_tasks.get(task_id)
-            if not task_info:
-                return
-            
-            # Process'i kill et
-            if task_info.process:
-                try:
-                    # Önce SIGTERM gönder
-                    task_info.process.terminate()
-                    
-                    # 5 saniye bekle
-                    try:
-                        task_info.process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        # Force kill
-                        task_info.process.kill()
-                        task_info.process.wait()
+            # Durumu kilit altında kısa sürede güncelle
+            with self.task_lock:
+                task_info = self.active_tasks.get(task_id)
+                if not task_info:
+                    return
                 
-                except Exception as e:
-                    print(f"❌ Process kill hatası: {e}")
-            
-            # Task durumunu güncelle
-            task_info.end_time = time.time()
-            task_info.status = TaskStatus.TIMEOUT
+                self._finish_task(task_info, TaskStatus.TIMEOUT)
+                process = task_info.process
+            self._archive_task(task_info)
             
-            # Active'den completed'e taşı
-            del self.active_tasks[task_id]
-            self.completed_tasks[task_id] = task_info
+            # Process'i kill et - bekleme ayrı thread'de, sıradaki son tarihler gecikmesin
+            self._stop_process(task_info, process)
             
             self._send_callback(task_id, f"ERROR:Task timeout: {task_id}")
             
         except Exception as e:
-            print(f"❌ Timeout task hatası: {e}")
+            log.error("Timeout task hatası: %s", e)
+    
+    def _stop_process(self, task_info: TaskInfo, process):
+        """
+        Durdurulan task'ın process'ini sonlandır (task_lock dışında).
+        
+        Havuz task'ında process paylaşılan, bağlı worker'dır: görev worker içinde
+        iptal edilir, worker yalnızca iptal süresinde yanıt vermezse sonlanır.
+        """
+        worker = task_info.pool_worker
+        if worker is not None and worker.cancel(task_info.task_id):
+            return
+        if process:
+            self._terminate_process(process)
+    
+    def _terminate_process(self, process: subprocess.Popen, grace: float = 5.0):
+        """SIGTERM gönder, `grace` saniye içinde bitmezse arka planda kill et"""
+        try:
+            process.terminate()
+        except Exception as e:
+            log.error("Process kill hatası: %s", e)
+            return
+        
+        def reap():
+            try:
+                process.wait(timeout=grace)
+            except subprocess.TimeoutExpired:
+                # Force kill
+                process.kill()
+                process.wait()
+            except Exception as e:
+                log.error("Process kill hatası: %s", e)
+        
+        threading.Thread(target=reap, name="MAVSDKReaper", daemon=True).start()
     
     def _send_callback(self, task_id: str, output: str):
         """Callback fonksiyonunu çağır"""
@@ -389,7 +1081,7 @@ class MAVSDKSubprocessManager:
             if self.callback_func:
                 self.callback_func(task_id, output)
         except Exception as e:
-            print(f"❌ Callback hatası: {e}")
+            log.error("Callback hatası [%s]: %s", task_id, e)
     
     def _generate_task_id(self, task_type: TaskType, prefix: str = "") -> str:
         """Unique task ID oluştur"""
@@ -419,11 +1111,8 @@ class MAVSDKSubprocessManager:
                 timeout=timeout or self.default_timeout
             )
             
-            # Task'ı kaydet ve queue'ya ekle
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            self.task_queue.put(task_info)
+            # Task'ı kaydet ve öncelik kuyruğuna ekle
+            self._submit_task(task_info)
             
             print(f"🚀 Takeoff task başlatıldı: {task_id} (altitude: {altitude}m)")
             return True
@@ -445,10 +1134,7 @@ class MAVSDKSubprocessManager:
                 timeout=timeout or self.default_timeout
             )
             
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            self.task_queue.put(task_info)
+            self._submit_task(task_info)
             
             print(f"⏬ Land task başlatıldı: {task_id}")
             return True
@@ -470,10 +1156,7 @@ class MAVSDKSubprocessManager:
                 timeout=timeout or self.default_timeout
             )
             
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            self.task_queue.put(task_info)
+            self._submit_task(task_info)
             
             print(f"🏠 RTL task başlatıldı: {task_id}")
             return True
@@ -495,11 +1178,8 @@ class MAVSDKSubprocessManager:
                 timeout=timeout or self.default_timeout
             )
             
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            # Emergency task'ları öncelikli queue'ya ekle (başa ekle)
-            self.task_queue.put(task_info)
+            # EMERGENCY sınıfı: ayrılmış worker'a gider, çakışan görevleri keser
+            self._submit_task(task_info)
             
             print(f"🚨 Emergency land task başlatıldı: {task_id}")
             return True
@@ -523,10 +1203,7 @@ class MAVSDKSubprocessManager:
                 timeout=timeout or (self.default_timeout * 2)  # Missions need more time
             )
             
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            self.task_queue.put(task_info)
+            self._submit_task(task_info)
             
             print(f"🎯 Mission task başlatıldı: {task_id} (tip: {mission_type})")
             return True
@@ -566,7 +1243,6 @@ class MAVSDKSubprocessManager:
             )
             
             with self.task_lock:
-                self.tasks[task_id] = task_info
                 # EW mission tracking
                 self.ew_missions[task_id] = {
                     'mission_id': mission_id,
@@ -576,7 +1252,7 @@ class MAVSDKSubprocessManager:
                     'status': 'RUNNING'
                 }
             
-            self.task_queue.put(task_info)
+            self._submit_task(task_info)
             
             print(f"🚁✈️ EW Mission task başlatıldı: {task_id}")
             print(f"   Mission: {ew_params['mission_name']}")
@@ -602,10 +1278,7 @@ class MAVSDKSubprocessManager:
                 timeout=60  # Parameter setting needs less time
             )
             
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            self.task_queue.put(task_info)
+            self._submit_task(task_info)
             
             print(f"🔧 VTOL parameter task başlatıldı: {task_id}")
             return True
@@ -626,10 +1299,7 @@ class MAVSDKSubprocessManager:
                 timeout=timeout or self.default_timeout
             )
             
-            with self.task_lock:
-                self.tasks[task_id] = task_info
-            
-            self.task_queue.put(task_info)
+            self._submit_task(task_info)
             
             print(f"📜 Custom script task başlatıldı: {task_id}")
             return True
@@ -641,6 +1311,8 @@ class MAVSDKSubprocessManager:
     def stop_task(self, task_id: str) -> bool:
         """Task'ı durdur"""
         try:
+            # Kilit altında yalnız durum güncellenir: asyncio motorunda process'in
+            # bittiğini işaretleyen loop thread'i de task_lock alır
             with self.task_lock:
                 task_info = self.active_tasks.get(task_id)
                 
@@ -648,26 +1320,15 @@ class MAVSDKSubprocessManager:
                     print(f"⚠️ Task bulunamadı veya zaten tamamlanmış: {task_id}")
                     return False
                 
-                # Process'i durdur
-                if task_info.process:
-                    try:
-                        task_info.process.terminate()
-                        task_info.process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        task_info.process.kill()
-                        task_info.process.wait()
-                
-                # Task durumunu güncelle
-                task_info.end_time = time.time()
-                task_info.status = TaskStatus.STOPPED
-                
-                # Active'den completed'e taşı
-                del self.active_tasks[task_id]
-                self.completed_tasks[task_id] = task_info
-                
-                # EW mission tracking'den kaldır
-                if task_id in self.ew_missions:
-                    self.ew_missions[task_id]['status'] = 'STOPPED'
+                # Task durumunu güncelle, completed'e taşı
+                self._finish_task(task_info, TaskStatus.STOPPED)
+                process = task_info.process
+            self.timeout_scheduler.cancel(task_id)
+            self._archive_task(task_info)
+            
+            # Process'i kilit dışında durdur (havuzda iptal, soğuk task'ta SIGTERM;
+            # süre aşılırsa arka planda kill)
+            self._stop_process(task_info, process)
             
             self._send_callback(task_id, f"STATUS:Task durduruldu: {task_id}")
             print(f"⏹️ Task durduruldu: {task_id}")
@@ -684,16 +1345,51 @@ class MAVSDKSubprocessManager:
             if task_id in self.active_tasks:
                 return self.active_tasks[task_id]
             
-            # Sonra completed'de ara
+            # Sonra completed'de ara (LRU: erişilen sona taşınır)
             if task_id in self.completed_tasks:
+                self.completed_tasks.move_to_end(task_id)
                 return self.completed_tasks[task_id]
             
             # Son olarak tüm task'larda ara
             if task_id in self.tasks:
                 return self.tasks[task_id]
         
+        # Bellekten atılmışsa disk indeksinden oluştur (çıktı: get_task_output)
+        record = self.task_history.get(task_id) if self.task_history else None
+        if record:
+            return TaskInfo(
+                task_id=record['task_id'],
+                task_type=TaskType(record['task_type']),
+                status=TaskStatus(record['status']),
+                start_time=record['start_time'],
+                end_time=record['end_time'],
+                params=record['params'],
+                timeout=record['timeout'],
+                pooled=record['pooled'],
+                output_line_count=record['output_lines'] or 0
+            )
+        
         return None
     
+    def get_task_output(self, task_id: str, max_lines: Optional[int] = None) -> List[str]:
+        """Task'ın disk log'undaki tam çıktısı; geçmiş yoksa bellekteki son satırlar"""
+        if self.task_history:
+            return self.task_history.read_log(task_id, max_lines)
+        
+        task_info = self.get_task_status(task_id)
+        if not task_info:
+            return []
+        lines = list(task_info.output) + list(task_info.error_output)
+        return lines[-max_lines:] if max_lines else lines
+    
+    def query_task_history(self, task_type: Optional[str] = None, status: Optional[str] = None,
+                           since: Optional[float] = None, until: Optional[float] = None,
+                           limit: int = 100) -> List[dict]:
+        """Disk indeksinden biten task kayıtları (en yeni önce)"""
+        if not self.task_history:
+            return []
+        return self.task_history.query(task_type, status, since, until, limit)
+    
     def get_active_tasks(self) -> Dict[str, TaskInfo]:
         """Aktif task'ları al"""
         with self.task_lock:
@@ -763,449 +1459,67 @@ class MAVSDKSubprocessManager:
         print(f"⏹️ {len(active_tasks)} task durduruldu")
     
     def get_statistics(self) -> dict:
-        """İstatistikleri al"""
-        with self.task_lock:
-            total_tasks = len(self.tasks)
-            active_count = len(self.active_tasks)
-            completed_count = len(self.completed_tasks)
-            
-            # Status dağılımı
-            status_counts = {}
-            for task_info in self.tasks.values():
-                status = task_info.status.value
-                status_counts[status] = status_counts.get(status, 0) + 1
-            
-            # Task type dağılımı
-            type_counts = {}
-            for task_info in self.tasks.values():
-                task_type = task_info.task_type.value
-                type_counts[task_type] = type_counts.get(task_type, 0) + 1
-            
-            return {
-                'total_tasks': total_tasks,
-                'active_tasks': active_count,
-                'completed_tasks': completed_count,
-                'status_distribution': status_counts,
-                'type_distribution': type_counts,
-                'active_ew_missions': len(self.get_active_ew_missions()),
-                'connection_string': self.connection_string,
-                'max_concurrent': self.max_concurrent
+        """İstatistikleri al - artımlı sayaçlardan okunur, task_lock alınmaz"""
+        stats = self.stats.snapshot()
+        live_by_type = stats.pop('live_by_type')
+        stats.pop('queue_wait_by_priority')
+        
+        stats.update({
+            'active_ew_missions': live_by_type.get(TaskType.EW_MISSION.value, 0),
+            'queued_tasks': self.task_queue.qsize(),
+            'queue_wait_by_priority': self.get_queue_wait_statistics(),
+            'connection_string': self.connection_string,
+            'max_concurrent': self.max_concurrent,
+            'engine': self.engine
+        })
+        return stats
+    
+    def get_queue_wait_statistics(self) -> dict:
+        """Öncelik sınıfı bazında kuyruk bekleme süreleri (ms)"""
+        waits = self.stats.snapshot()['queue_wait_by_priority']
+        result = {}
+        for priority in TaskPriority:
+            wait = waits.get(priority.name, {})
+            result[priority.name] = {
+                'dispatched': wait.get('count', 0),
+                'queued': self.task_queue.qsize(priority),
+                'avg_ms': wait.get('avg_ms', 0.0),
+                'max_ms': wait.get('max_ms') or 0.0,
+                'last_ms': wait.get('last_ms') or 0.0,
+                'p95_ms': wait.get('p95_ms') or 0.0
             }
+        return result
     
     def shutdown(self):
         """Manager'ı kapat"""
         print("🔄 MAVSDK Subprocess Manager kapatılıyor...")
         
+        # Önce havuzu kapat - durdurulan worker'lar yeniden açılmasın
+        if self.worker_pool:
+            self.worker_pool.shutdown()
+        
         # Tüm task'ları durdur
         self.stop_all()
         
         # Shutdown event set et
         self.shutdown_event.set()
         
-        # Queue'ya None ekleyerek worker'ları uyandır
-        for _ in range(self.max_concurrent):
-            self.task_queue.put(None)
+        # Kuyruğu kapatarak bekleyen worker'ları uyandır
+        self.task_queue.close()
+        if self.async_engine:
+            self.async_engine.stop()
         
         # Worker thread'lerin bitmesini bekle
         for worker in self.worker_threads:
             worker.join(timeout=5)
         
-        # Monitor thread'in bitmesini bekle
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=5)
-        
-        print("✅ MAVSDK Subprocess Manager kapatıldı")
-    
-    # ========================================
-    # SCRIPT GENERATION METHODS
-    # ========================================
-    
-    def _generate_standard_script(self, task_info: TaskInfo) -> str:
-        """Standart MAVSDK script'i oluştur"""
-        try:
-            task_type = task_info.task_type
-            params = task_info.params or {}
-            
-            if task_type == TaskType.TAKEOFF:
-                return self._generate_takeoff_script(params)
-            elif task_type == TaskType.LAND:
-                return self._generate_land_script(params)
-            elif task_type == TaskType.RTL:
-                return self._generate_rtl_script(params)
-            elif task_type == TaskType.EMERGENCY:
-                return self._generate_emergency_script(params)
-            elif task_type == TaskType.MISSION:
-                return self._generate_mission_script(params)
-            elif task_type == TaskType.PARAMETER_SET:
-                return self._generate_parameter_script(params)
-            elif task_type == TaskType.CUSTOM:
-                return params.get('script', '')
-            else:
-                raise ValueError(f"Bilinmeyen task type: {task_type}")
-                
-        except Exception as e:
-            print(f"❌ Script generation hatası: {e}")
-            return ""
-    
-    def _generate_ew_mission_script(self, task_info: TaskInfo) -> str:
-        """EW VTOL mission script'i oluştur"""
-        try:
-            if not EW_MISSIONS_AVAILABLE:
-                raise Exception("EW missions mevcut değil")
-            
-            params = task_info.params or {}
-            mission_id = params.get('mission_id')
-            connection_string = params.get('connection_string', self.connection_string)
-            
-            if not mission_id:
-                raise Exception("Mission ID belirtilmemiş")
-            
-            # EW mission script generator kullan
-            script = self.ew_script_generator(mission_id, params, connection_string)
-            
-            if not script:
-                raise Exception(f"EW mission script oluşturulamadı: {mission_id}")
-            
-            return script
-            
-        except Exception as e:
-            print(f"❌ EW mission script generation hatası: {e}")
-            return ""
-    
-    def _generate_takeoff_script(self, params: dict) -> str:
-        """Takeoff script'i oluştur"""
-        altitude = params.get('altitude', 10.0)
-        connection_string = params.get('connection_string', self.connection_string)
-        
-        return f'''import asyncio
-import sys
-from mavsdk import System
-
-async def takeoff_mission():
-    try:
-        print("STATUS:Takeoff işlemi başlatılıyor...")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        print("STATUS:Drone bağlantısı kuruluyor...")
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                print("STATUS:Drone bağlantısı başarılı!")
-                break
-        
-        print("STATUS:Sistem sağlığı kontrol ediliyor...")
-        async for health in drone.telemetry.health():
-            if health.is_global_position_ok and health.is_home_position_ok:
-                print("STATUS:GPS ve home position hazır!")
-                break
-            await asyncio.sleep(1)
-        
-        print("STATUS:Motor ARM işlemi...")
-        await drone.action.arm()
-        print("STATUS:Motor ARM başarılı!")
-        
-        print("STATUS:Takeoff altitude ayarlanıyor...")
-        await drone.action.set_takeoff_altitude({altitude})
-        
-        print("STATUS:Takeoff başlatılıyor...")
-        await drone.action.takeoff()
-        print("STATUS:Takeoff komutu gönderildi!")
-        
-        print("STATUS:Hedef altitude bekleniyor...")
-        target_reached = False
-        timeout_counter = 0
-        
-        async for position in drone.telemetry.position():
-            current_alt = position.relative_altitude_m
-            print(f"STATUS:Mevcut altitude: {{current_alt:.1f}}m / {altitude}m")
-            
-            if current_alt >= {altitude} * 0.9:
-                print("STATUS:Hedef altitude ulaşıldı!")
-                target_reached = True
-                break
-            
-            timeout_counter += 1
-            if timeout_counter > 60:
-                print("ERROR:Takeoff timeout!")
-                break
-                
-            await asyncio.sleep(1)
-        
-        if target_reached:
-            print("SUCCESS:Takeoff başarıyla tamamlandı!")
-        else:
-            print("ERROR:Takeoff tamamlanamadı!")
-            
-    except Exception as e:
-        print(f"ERROR:Takeoff hatası: {{e}}")
-
-asyncio.run(takeoff_mission())
-'''
-    
-    def _generate_land_script(self, params: dict) -> str:
-        """Land script'i oluştur"""
-        connection_string = params.get('connection_string', self.connection_string)
-        
-        return f'''import asyncio
-from mavsdk import System
-
-async def land_mission():
-    try:
-        print("STATUS:İniş işlemi başlatılıyor...")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                print("STATUS:Drone bağlantısı başarılı!")
-                break
-        
-        print("STATUS:İniş komutu gönderiliyor...")
-        await drone.action.land()
-        print("STATUS:İniş komutu gönderildi!")
+        # Timeout zamanlayıcısını durdur
+        self.timeout_scheduler.stop()
         
-        print("STATUS:İniş tamamlanması bekleniyor...")
-        async for armed in drone.telemetry.armed():
-            if not armed:
-                print("STATUS:Motor disarm edildi - İniş tamamlandı!")
-                break
-            await asyncio.sleep(1)
-        
-        print("SUCCESS:İniş başarıyla tamamlandı!")
-        
-    except Exception as e:
-        print(f"ERROR:İniş hatası: {{e}}")
-
-asyncio.run(land_mission())
-'''
-    
-    def _generate_rtl_script(self, params: dict) -> str:
-        """RTL script'i oluştur"""
-        connection_string = params.get('connection_string', self.connection_string)
-        
-        return f'''import asyncio
-from mavsdk import System
-
-async def rtl_mission():
-    try:
-        print("STATUS:Return to Launch işlemi başlatılıyor...")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                print("STATUS:Drone bağlantısı başarılı!")
-                break
+        if self.task_history:
+            self.task_history.close()
         
-        print("STATUS:RTL komutu gönderiliyor...")
-        await drone.action.return_to_launch()
-        print("STATUS:RTL komutu gönderildi!")
-        
-        print("STATUS:RTL tamamlanması bekleniyor...")
-        async for armed in drone.telemetry.armed():
-            if not armed:
-                print("STATUS:RTL tamamlandı - motor disarm edildi!")
-                break
-            await asyncio.sleep(1)
-        
-        print("SUCCESS:RTL başarıyla tamamlandı!")
-        
-    except Exception as e:
-        print(f"ERROR:RTL hatası: {{e}}")
-
-asyncio.run(rtl_mission())
-'''
-    
-    def _generate_emergency_script(self, params: dict) -> str:
-        """Emergency land script'i oluştur"""
-        connection_string = params.get('connection_string', self.connection_string)
-        
-        return f'''import asyncio
-from mavsdk import System
-
-async def emergency_mission():
-    try:
-        print("STATUS:ACİL DURUM İNİŞİ başlatılıyor...")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                print("STATUS:Drone bağlantısı başarılı!")
-                break
-        
-        print("STATUS:ACİL İNİŞ komutu gönderiliyor...")
-        await drone.action.land()
-        print("STATUS:ACİL İNİŞ komutu gönderildi!")
-        
-        print("STATUS:Acil iniş tamamlanması bekleniyor...")
-        timeout_counter = 0
-        
-        async for armed in drone.telemetry.armed():
-            if not armed:
-                print("STATUS:ACİL İNİŞ tamamlandı!")
-                break
-            
-            timeout_counter += 1
-            if timeout_counter > 120:  # 2 dakika timeout
-                print("STATUS:Acil iniş timeout - force disarm!")
-                try:
-                    await drone.action.disarm()
-                except:
-                    pass
-                break
-                
-            await asyncio.sleep(1)
-        
-        print("SUCCESS:Acil iniş başarıyla tamamlandı!")
-        
-    except Exception as e:
-        print(f"ERROR:Acil iniş hatası: {{e}}")
-
-asyncio.run(emergency_mission())
-'''
-    
-    def _generate_mission_script(self, params: dict) -> str:
-        """Standart mission script'i oluştur"""
-        mission_type = params.get('type', 'unknown')
-        connection_string = params.get('connection_string', self.connection_string)
-        altitude = params.get('altitude', 20.0)
-        duration = params.get('duration', 300)
-        
-        return f'''import asyncio
-import time
-from mavsdk import System
-from mavsdk.offboard import PositionNedYaw
-
-async def standard_mission():
-    try:
-        print("STATUS:Standart mission başlatılıyor...")
-        print("STATUS:Mission tipi: {mission_type}")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                print("STATUS:Drone bağlantısı başarılı!")
-                break
-        
-        print("STATUS:Mission pattern başlatılıyor...")
-        
-        # Offboard modu başlat
-        await drone.offboard.set_position_ned(PositionNedYaw(0.0, 0.0, -{altitude}, 0.0))
-        await drone.offboard.start()
-        
-        # Basit devriye pattern
-        waypoints = [
-            (50, 0, -{altitude}),
-            (50, 50, -{altitude}),
-            (0, 50, -{altitude}),
-            (0, 0, -{altitude})
-        ]
-        
-        start_time = time.time()
-        waypoint_index = 0
-        
-        while time.time() - start_time < {duration}:
-            if waypoint_index < len(waypoints):
-                north, east, down = waypoints[waypoint_index]
-                print(f"STATUS:Waypoint {{waypoint_index + 1}}/{{len(waypoints)}}: N={{north}} E={{east}}")
-                
-                await drone.offboard.set_position_ned(PositionNedYaw(north, east, down, 0.0))
-                await asyncio.sleep(15)  # Her waypoint'te 15 saniye bekle
-                
-                waypoint_index = (waypoint_index + 1) % len(waypoints)
-            else:
-                await asyncio.sleep(1)
-        
-        print("STATUS:Mission süresi tamamlandı!")
-        await drone.offboard.stop()
-        
-        print("SUCCESS:Standart mission başarıyla tamamlandı!")
-        
-    except Exception as e:
-        print(f"ERROR:Mission hatası: {{e}}")
-
-asyncio.run(standard_mission())
-'''
-    
-    def _generate_parameter_script(self, params: dict) -> str:
-        """Parameter setting script'i oluştur"""
-        connection_string = params.get('connection_string', self.connection_string)
-        param_type = params.get('param_type', 'vtol')
-        
-        if param_type == 'vtol':
-            return f'''import asyncio
-from mavsdk import System
-
-async def set_vtol_parameters():
-    try:
-        print("STATUS:VTOL parametreleri ayarlanıyor...")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                print("STATUS:Drone bağlantısı başarılı!")
-                break
-        
-        print("STATUS:VTOL parametreleri ayarlanıyor...")
-        
-        # VTOL kritik parametreler
-        vtol_params = [
-            ("VT_TYPE", 2),           # Standard VTOL
-            ("VT_TRANS_MIN_TM", 1.0), # Minimum transition time
-            ("VT_F_TRANS_DUR", 5.0),  # Forward transition duration
-            ("VT_B_TRANS_DUR", 4.0),  # Back transition duration
-            ("VT_ARSP_TRANS", 10.0),  # Transition airspeed
-            ("VT_B_REV_OUT", 0),      # Reverse output for back transition
-            ("VT_FW_MOT_OFFID", 0),   # Motor off in FW mode
-        ]
-        
-        for param_name, param_value in vtol_params:
-            try:
-                print(f"STATUS:Setting {{param_name}} = {{param_value}}")
-                await drone.param.set_param_float(param_name, float(param_value))
-                await asyncio.sleep(0.5)
-            except Exception as e:
-                print(f"STATUS:Warning: {{param_name}} setting failed: {{e}}")
-        
-        print("STATUS:VTOL parametreleri ayarlandı!")
-        print("SUCCESS:VTOL parameter setup completed!")
-        
-    except Exception as e:
-        print(f"ERROR:Parameter setting hatası: {{e}}")
-
-asyncio.run(set_vtol_parameters())
-'''
-        else:
-            return f'''import asyncio
-from mavsdk import System
-
-async def set_custom_parameters():
-    try:
-        print("STATUS:Custom parametreler ayarlanıyor...")
-        
-        drone = System()
-        await drone.connect("{connection_string}")
-        
-        async for state in drone.core.connection_state():
-            if state.is_connected:
-                break
-        
-        print("SUCCESS:Custom parameter setup completed!")
-        
-    except Exception as e:
-        print(f"ERROR:Parameter setting hatası: {{e}}")
-
-asyncio.run(set_custom_parameters())
-'''
+        print("✅ MAVSDK Subprocess Manager kapatıldı")
 
 
 # ========================================
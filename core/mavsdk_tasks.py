@@ -0,0 +1,353 @@
+# core/mavsdk_tasks.py
+"""
+MAVSDK Task Gövdeleri
+=====================
+
+Komut task'larının (takeoff, iniş, RTL, acil iniş, mission, parametre,
+EW mission) tek kaynağı. Daha önce her task için f-string ile üretilen
+Python programlarının yerini alır:
+- Normal bir modül olduğu için bytecode'u `__pycache__`'e yazılır; her
+  task'ta kaynak yeniden derlenmez
+- Parametreler yapısal gelir (`--params` JSON); kaçış / tırnak sorunu yok
+- Aynı fonksiyonları hem soğuk runner (`mavsdk_runner.py`) hem önceden
+  bağlanmış havuz worker'ı (`mavsdk_pool_worker.py`) kullanır
+
+Handler imzası: `async def handler(drone, params, out) -> bool`
+`out` nesnesi `line(text)` ve `command(name)` sağlar; runner'da satırlar
+stdout'a yazılır, havuzda task_id ile etiketlenmiş JSON olarak gider.
+
+Kullanım (runner üzerinden):
+    python3 -u core/mavsdk_runner.py --task TAKEOFF --connection udp://:14540 \\
+        --params '{"altitude": 15}'
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+try:
+    from mavsdk import System
+    from mavsdk.offboard import PositionNedYaw
+    MAVSDK_AVAILABLE = True
+except ImportError:
+    MAVSDK_AVAILABLE = False
+
+MISSIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'missions')
+
+VTOL_PARAMETERS = [
+    ("VT_TYPE", 2),           # Standard VTOL
+    ("VT_TRANS_MIN_TM", 1.0), # Minimum transition time
+    ("VT_F_TRANS_DUR", 5.0),  # Forward transition duration
+    ("VT_B_TRANS_DUR", 4.0),  # Back transition duration
+    ("VT_ARSP_TRANS", 10.0),  # Transition airspeed
+    ("VT_B_REV_OUT", 0),      # Reverse output for back transition
+    ("VT_FW_MOT_OFFID", 0),   # Motor off in FW mode
+]
+
+MISSION_WAYPOINT_HOLD_S = 15.0
+# Alan verilmezse varsayılan devriye: 50 m kare, 12.5 m şerit (4 şerit)
+MISSION_AREA_SIZE_M = 50.0
+MISSION_SWATH_M = 12.5
+
+
+class PrintOutput:
+    """Runner çıktısı: protokol satırlarını stdout'a yazar"""
+
+    def __init__(self):
+        self.command_sent = False
+
+    def line(self, text):
+        print(text, flush=True)
+
+    def command(self, name):
+        """Araca gidecek ilk komuttan hemen önce çağrılır (gecikme ölçümü)"""
+        if not self.command_sent:
+            self.command_sent = True
+            print(f"COMMAND:{name}", flush=True)
+
+
+# ========================================
+# GÖREVLER (bağlı drone üzerinde)
+# ========================================
+
+async def wait_disarmed(drone, timeout_s=None):
+    """Motorlar disarm olana kadar bekle; süre aşılırsa False"""
+    started = time.monotonic()
+    async for armed in drone.telemetry.armed():
+        if not armed:
+            return True
+        if timeout_s is not None and time.monotonic() - started > timeout_s:
+            return False
+    return False
+
+
+async def task_takeoff(drone, params, out):
+    altitude = float(params.get('altitude', 10.0))
+
+    out.line("STATUS:Sistem sağlığı kontrol ediliyor...")
+    async for health in drone.telemetry.health():
+        if health.is_global_position_ok and health.is_home_position_ok:
+            out.line("STATUS:GPS ve home position hazır!")
+            break
+
+    out.line("STATUS:Motor ARM işlemi...")
+    out.command('arm')
+    await drone.action.arm()
+    out.line("STATUS:Motor ARM başarılı!")
+
+    out.line("STATUS:Takeoff altitude ayarlanıyor...")
+    await drone.action.set_takeoff_altitude(altitude)
+
+    out.line("STATUS:Takeoff başlatılıyor...")
+    await drone.action.takeoff()
+    out.line("STATUS:Takeoff komutu gönderildi!")
+
+    out.line("STATUS:Hedef altitude bekleniyor...")
+    started = time.monotonic()
+    last_report = 0.0
+    async for position in drone.telemetry.position():
+        current_alt = position.relative_altitude_m
+        now = time.monotonic()
+        if now - last_report >= 1.0:
+            last_report = now
+            out.line(f"STATUS:Mevcut altitude: {current_alt:.1f}m / {altitude}m")
+
+        if current_alt >= altitude * 0.9:
+            out.line("STATUS:Hedef altitude ulaşıldı!")
+            out.line("SUCCESS:Takeoff başarıyla tamamlandı!")
+            return True
+
+        if now - started > 60:
+            out.line("ERROR:Takeoff timeout!")
+            break
+
+    out.line("ERROR:Takeoff tamamlanamadı!")
+    return False
+
+
+async def task_land(drone, params, out):
+    out.line("STATUS:İniş komutu gönderiliyor...")
+    out.command('land')
+    await drone.action.land()
+    out.line("STATUS:İniş komutu gönderildi!")
+
+    out.line("STATUS:İniş tamamlanması bekleniyor...")
+    await wait_disarmed(drone)
+    out.line("STATUS:Motor disarm edildi - İniş tamamlandı!")
+    out.line("SUCCESS:İniş başarıyla tamamlandı!")
+    return True
+
+
+async def task_rtl(drone, params, out):
+    out.line("STATUS:RTL komutu gönderiliyor...")
+    out.command('return_to_launch')
+    await drone.action.return_to_launch()
+    out.line("STATUS:RTL komutu gönderildi!")
+
+    out.line("STATUS:RTL tamamlanması bekleniyor...")
+    await wait_disarmed(drone)
+    out.line("STATUS:RTL tamamlandı - motor disarm edildi!")
+    out.line("SUCCESS:RTL başarıyla tamamlandı!")
+    return True
+
+
+async def task_emergency(drone, params, out):
+    out.line("STATUS:ACİL İNİŞ komutu gönderiliyor...")
+    out.command('land')
+    await drone.action.land()
+    out.line("STATUS:ACİL İNİŞ komutu gönderildi!")
+
+    out.line("STATUS:Acil iniş tamamlanması bekleniyor...")
+    if await wait_disarmed(drone, timeout_s=120):
+        out.line("STATUS:ACİL İNİŞ tamamlandı!")
+    else:
+        out.line("STATUS:Acil iniş timeout - force disarm!")
+        try:
+            await drone.action.disarm()
+        except Exception:
+            pass
+
+    out.line("SUCCESS:Acil iniş başarıyla tamamlandı!")
+    return True
+
+
+async def task_mission(drone, params, out):
+    # NumPy'lı planlayıcı yalnız burada yüklenir: diğer task'ların (acil iniş,
+    # RTL, ...) soğuk başlatmasına import maliyeti eklenmesin
+    try:
+        from .coverage_planner import plan_coverage, rectangle
+    except ImportError:
+        from coverage_planner import plan_coverage, rectangle
+
+    altitude = float(params.get('altitude', 20.0))
+    duration = float(params.get('duration', 300))
+
+    out.line("STATUS:Standart mission başlatılıyor...")
+    out.line(f"STATUS:Mission tipi: {params.get('type', 'unknown')}")
+
+    # Devriye alanı: `area` kuzey/doğu köşeleri (m), yoksa varsayılan kare
+    area = params.get('area') or rectangle(0.0, 0.0, MISSION_AREA_SIZE_M, MISSION_AREA_SIZE_M)
+    try:
+        plan = plan_coverage(area, float(params.get('swath', MISSION_SWATH_M)),
+                             float(params.get('turn_radius', 0.0)),
+                             pattern=params.get('coverage_pattern', 'auto'))
+    except ValueError as e:
+        out.line(f"ERROR:Devriye rotası planlanamadı: {e}")
+        return False
+    waypoints = plan.ned_waypoints(-altitude)
+    out.line(f"STATUS:Kapsama rotası: {plan.pattern}, {len(waypoints)} waypoint, "
+             f"{plan.total_length:.0f} m ({plan.planning_ms:.1f} ms)")
+    out.line("STATUS:Mission pattern başlatılıyor...")
+
+    # Offboard modu başlat
+    out.command('offboard')
+    await drone.offboard.set_position_ned(PositionNedYaw(0.0, 0.0, -altitude, 0.0))
+    await drone.offboard.start()
+
+    started = time.monotonic()
+    waypoint_index = 0
+    while time.monotonic() - started < duration:
+        north, east, down = waypoints[waypoint_index]
+        out.line(f"STATUS:Waypoint {waypoint_index + 1}/{len(waypoints)}: N={north:g} E={east:g}")
+
+        await drone.offboard.set_position_ned(PositionNedYaw(north, east, down, 0.0))
+        await asyncio.sleep(MISSION_WAYPOINT_HOLD_S)
+        waypoint_index = (waypoint_index + 1) % len(waypoints)
+
+    out.line("STATUS:Mission süresi tamamlandı!")
+    await drone.offboard.stop()
+
+    out.line("SUCCESS:Standart mission başarıyla tamamlandı!")
+    return True
+
+
+async def task_parameter_set(drone, params, out):
+    if params.get('param_type', 'vtol') != 'vtol':
+        out.line("SUCCESS:Custom parameter setup completed!")
+        return True
+
+    out.line("STATUS:VTOL parametreleri ayarlanıyor...")
+    for param_name, param_value in VTOL_PARAMETERS:
+        try:
+            out.line(f"STATUS:Setting {param_name} = {param_value}")
+            out.command('set_param_float')
+            await drone.param.set_param_float(param_name, float(param_value))
+        except Exception as e:
+            out.line(f"STATUS:Warning: {param_name} setting failed: {e}")
+
+    out.line("STATUS:VTOL parametreleri ayarlandı!")
+    out.line("SUCCESS:VTOL parameter setup completed!")
+    return True
+
+
+TASK_HANDLERS = {
+    'TAKEOFF': task_takeoff,
+    'LAND': task_land,
+    'RTL': task_rtl,
+    'EMERGENCY': task_emergency,
+    'MISSION': task_mission,
+    'PARAMETER_SET': task_parameter_set,
+}
+
+# Hata satırlarındaki görünen adlar
+TASK_LABELS = {
+    'TAKEOFF': "Takeoff",
+    'LAND': "İniş",
+    'RTL': "RTL",
+    'EMERGENCY': "Acil iniş",
+    'MISSION': "Mission",
+    'PARAMETER_SET': "Parameter setting",
+    'EW_MISSION': "EW mission",
+}
+
+
+# ========================================
+# EW MISSION (kendi bağlantısını kurar)
+# ========================================
+
+async def run_ew_mission(params, connection_string, out):
+    """EW VTOL mission'ı missions paketindeki sınıfla çalıştır"""
+    if MISSIONS_DIR not in sys.path:
+        sys.path.append(MISSIONS_DIR)
+    from ew_vtol_missions import run_ew_vtol_mission
+
+    mission_id = params.get('mission_id')
+    if not mission_id:
+        out.line("ERROR:Mission ID belirtilmemiş")
+        return False
+    return await run_ew_vtol_mission(mission_id, params, connection_string)
+
+
+# ========================================
+# RUNNER
+# ========================================
+
+async def connect(connection_string, out):
+    drone = System()
+    await drone.connect(system_address=connection_string)
+
+    out.line("STATUS:Drone bağlantısı kuruluyor...")
+    async for state in drone.core.connection_state():
+        if state.is_connected:
+            out.line("STATUS:Drone bağlantısı başarılı!")
+            break
+    return drone
+
+
+async def run(task_type, params, connection_string, out):
+    """Tek task'ı bağlanıp çalıştır; başarı durumunu döndür"""
+    if task_type == 'EW_MISSION':
+        return bool(await run_ew_mission(params, connection_string, out))
+
+    handler = TASK_HANDLERS[task_type]
+    drone = await connect(connection_string, out)
+    return bool(await handler(drone, params, out))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MAVSDK task runner")
+    parser.add_argument('--task', required=True,
+                        choices=sorted(list(TASK_HANDLERS) + ['EW_MISSION']),
+                        help="Task tipi (TaskType değeri)")
+    parser.add_argument('--connection', default='udp://:14540',
+                        help="MAVSDK bağlantı adresi")
+    parser.add_argument('--params', default='{}',
+                        help="Task parametreleri (JSON nesnesi)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Argümanları doğrula ve bağlanmadan çık")
+    args = parser.parse_args(argv)
+
+    try:
+        args.params = json.loads(args.params)
+    except ValueError as e:
+        parser.error(f"--params geçerli JSON değil: {e}")
+    if not isinstance(args.params, dict):
+        parser.error("--params bir JSON nesnesi olmalı")
+    return args
+
+
+def main(argv=None):
+    """Subprocess entry point: çıkış kodu 0 = başarılı, 1 = başarısız"""
+    args = parse_args(argv)
+    out = PrintOutput()
+    label = TASK_LABELS.get(args.task, args.task)
+
+    if args.dry_run:
+        out.line(f"STATUS:Runner hazır: {args.task}")
+        sys.exit(0)
+
+    if not MAVSDK_AVAILABLE:
+        out.line("ERROR:MAVSDK kütüphanesi mevcut değil")
+        sys.exit(1)
+
+    try:
+        ok = asyncio.run(run(args.task, args.params, args.connection, out))
+    except KeyboardInterrupt:
+        ok = False
+    except Exception as e:
+        out.line(f"ERROR:{label} hatası: {e}")
+        ok = False
+    sys.exit(0 if ok else 1)
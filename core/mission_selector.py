@@ -579,7 +579,7 @@ class MissionSelectorDialog(QDialog):
             ew_info = QLabel("⚡ EW VTOL Parametreleri:")
             ew_info.setStyleSheet("font-weight: bold; color: #e67e22;")
             
-            ew_details = QLabel("• transition_attempts: FW geçiş deneme sayısı\n• scan_interval: Elektronik tarama aralığı\n• pattern_size: Devriye alanı boyutu\n• landing_timeout: İniş güvenlik süresi")
+            ew_details = QLabel("• transition_attempts: FW geçiş deneme sayısı\n• scan_interval: Elektronik tarama aralığı\n• pattern_size: Devriye alanı boyutu\n• sensor_swath / turn_radius: Kapsama rotası şerit genişliği ve FW dönüş yarıçapı\n• landing_timeout: İniş güvenlik süresi")
             ew_details.setStyleSheet("color: #34495e; font-size: 10px;")
             
             info_layout.addWidget(ew_info)
@@ -636,6 +636,15 @@ class MissionSelectorDialog(QDialog):
             elif param_name == 'pattern_size':
                 widget.setRange(100, 2000)
                 widget.setSuffix(' m')
+            elif param_name == 'sensor_swath':
+                widget.setRange(10, 1000)
+                widget.setSuffix(' m')
+            elif param_name == 'turn_radius':
+                widget.setRange(0, 500)
+                widget.setSuffix(' m')
+            elif param_name == 'patrol_speed':
+                widget.setRange(5, 40)
+                widget.setSuffix(' m/s')
             elif param_name == 'transition_attempts':
                 widget.setRange(3, 20)
             elif param_name == 'landing_timeout':
@@ -679,6 +688,9 @@ class MissionSelectorDialog(QDialog):
             'auto_rtl': '🏠 Otomatik RTL',
             'scan_interval': '📡 Tarama Aralığı',
             'pattern_size': '📍 Devriye Alanı',
+            'sensor_swath': '🗺️ Tarama Genişliği',
+            'turn_radius': '↪️ Dönüş Yarıçapı',
+            'patrol_speed': '✈️ Devriye Hızı',
             'transition_attempts': '🔄 Transition Denemeleri',
             'landing_timeout': '🛬 İniş Timeout'
         }
@@ -692,6 +704,9 @@ class MissionSelectorDialog(QDialog):
             'radius': 'm',
             'scan_interval': 'saniye',
             'pattern_size': 'metre',
+            'sensor_swath': 'metre',
+            'turn_radius': 'metre',
+            'patrol_speed': 'm/s',
             'landing_timeout': 'saniye'
         }
         return units.get(param_name, '')
@@ -4,27 +4,31 @@
 Essirius ALACA - Yerli Milli Hareket Sistemi - %100 THREAD-SAFE
 
 3 KRİTİK KURAL:
-1. MAVSDK THREAD-SAFE DEĞİL → Her erişim lock'lu
+1. MAVSDK THREAD-SAFE DEĞİL → Komutlar sıralı, tek loop'ta
 2. DRONEKIT TAMAMEN KALDIRILDI → Pure MAVSDK only  
-3. LOCK SİSTEMİ ZORUNLU → Tüm işlemler vehicle_lock ile
+3. KOMUT KANALI ZORUNLU → Aracı değiştiren komutlar araç komut kanalından
 
 Özellikler:
 - 4 motorlu VTOL (Ön 2 motor tilt, Arka 2 motor sabit)
 - %100 Thread-safe MAVSDK erişimi
-- vehicle_lock ile korumalı TÜM işlemler
+- Komutlar araç başına sıralı komut kanalından (core/command_channel.py);
+  salt okuma telemetri kilitsiz
 - GUI uyumlu sync wrapper'lar
 - Zero DroneKit dependency
 """
 
 import asyncio
+import concurrent.futures
 import time
 import logging
-import math
 import threading
 from typing import Optional, Tuple, List
 
-# KURAL 3: LOCK SİSTEMİ ZORUNLU
-from core.lock import vehicle_lock
+# KURAL 3: KOMUT KANALI ZORUNLU
+from core.command_channel import VehicleCommandChannel, get_command_channel
+from core.vehicle_state import STATE_FIELDS, VehicleStateCache, get_vehicle_state
+from core import geodesy
+from core.navigation_loop import NavigationEventLoop, get_navigation_loop
 
 # KURAL 2: PURE MAVSDK - DroneKit YOK
 try:
@@ -85,14 +89,27 @@ class ThreadSafeMAVSDKLocation:
     def __str__(self):
         return f"ThreadSafeLocation({self.lat:.6f}, {self.lon:.6f}, {self.alt}m)"
 
+class _ProgressLog:
+    """Monitör ilerleme loglarını aralıkla sınırla"""
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.last = 0.0
+    
+    def due(self) -> bool:
+        now = time.monotonic()
+        if now - self.last >= self.interval:
+            self.last = now
+            return True
+        return False
+
 class ThreadSafeVTOLNavigation:
     """
     %100 THREAD-SAFE 4 Motorlu VTOL Tilt Rotor İHA Navigation Sistemi
     
     3 KURAL UYUMU:
-    1. ✅ MAVSDK THREAD-SAFE DEĞİL → Her erişim vehicle_lock ile
+    1. ✅ MAVSDK THREAD-SAFE DEĞİL → Komutlar sıralı, tek loop'ta
     2. ✅ DRONEKIT TAMAMEN KALDIRILDI → Pure MAVSDK only
-    3. ✅ LOCK SİSTEMİ ZORUNLU → TÜM işlemler lock'lu
+    3. ✅ KOMUT KANALI ZORUNLU → Komutlar komut kanalından, telemetri kilitsiz
     
     Yapı:
     - Motor 1&2: Ön motorlar (Tilt yapabilir - dikey ↔ yatay)
@@ -101,6 +118,12 @@ class ThreadSafeVTOLNavigation:
     - FW Mode: Ön motorlar yatay, arka motorlar thrust
     """
     
+    # İlk status çağrısında konum örneği için bekleme (s)
+    FIRST_SAMPLE_TIMEOUT_S = 1.0
+    # Goto varış: yatay mesafe (m) ve irtifa farkı (m)
+    GOTO_ARRIVAL_RADIUS_M = 10.0
+    GOTO_ARRIVAL_ALT_M = 1.0
+    
     def __init__(self, drone_system: System):
         """
         Thread-safe VTOL navigation başlat
@@ -108,6 +131,10 @@ class ThreadSafeVTOLNavigation:
             drone_system: Bağlantısı kurulmuş MAVSDK System objesi
         """
         self.drone = drone_system
+        # Aracı değiştiren komutlar bu kanaldan sırayla geçer
+        self.commands: VehicleCommandChannel = get_command_channel(drone_system)
+        # Telemetri okumaları canlı durum önbelleğinden
+        self.state: VehicleStateCache = get_vehicle_state(drone_system)
         self.current_mode = "MC"
         self.is_armed = False
         self.current_altitude = 0.0
@@ -133,59 +160,50 @@ class ThreadSafeVTOLNavigation:
         self.landing_speed = 2.0
         
         vtol_logger.info("✅ %100 Thread-Safe VTOL Navigation hazır")
-        vtol_logger.info("🔒 KURAL 1: MAVSDK erişimi tamamen lock'lu")
+        vtol_logger.info("🔒 KURAL 1: MAVSDK komutları sıralı komut kanalından")
         vtol_logger.info("🚫 KURAL 2: DroneKit dependency tamamen yok")
-        vtol_logger.info("🔐 KURAL 3: vehicle_lock zorunlu kullanım")
+        vtol_logger.info("🔐 KURAL 3: Telemetri okuma kilitsiz, komutlar kanal sırasıyla")
     
     async def thread_safe_takeoff(self, altitude: float = 10.0) -> bool:
         """
         %100 THREAD-SAFE VTOL Kalkış
-        KURAL 1: Her MAVSDK erişimi lock'lu
+        KURAL 1: Komutlar araç komut kanalından, telemetri kilitsiz
         """
         vtol_logger.info(f"🔒 Thread-Safe VTOL kalkış - {altitude}m")
         
         try:
-            # KURAL 1: MAVSDK erişimi lock'lu
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - home position save")
-                await self._thread_safe_save_home()
+            # Home position kaydı (salt okuma, kilitsiz)
+            await self._thread_safe_save_home()
             
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - tilt vertical")
+            async with self.commands.command("tilt"):
                 await self._thread_safe_set_tilt("vertical")
             
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - MC mode ensure")
+            async with self.commands.command("ensure_mc"):
                 await self._thread_safe_ensure_mc()
             
-            # KURAL 1: Preflight check lock'lu
-            preflight_ok = False
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - preflight check")
-                preflight_ok = await self._thread_safe_preflight()
+            # Preflight check (salt okuma, kilitsiz)
+            preflight_ok = await self._thread_safe_preflight()
             
             if not preflight_ok:
                 vtol_logger.error("❌ Thread-safe preflight başarısız!")
                 return False
             
-            # KURAL 1: ARM işlemi lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - ARM command")
+            # KURAL 1: ARM işlemi komut kanalından
+            async with self.commands.command("arm"):
                 await self.drone.action.arm()
             
-            # KURAL 1: ARM kontrolü de lock'lu!
+            # KURAL 1: ARM kontrolü salt okuma
             arm_success = await self._thread_safe_wait_arm(10)
             if not arm_success:
                 vtol_logger.error("❌ Thread-safe ARM başarısız!")
                 return False
             
-            # KURAL 1: Takeoff komutu lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - takeoff command")
+            # KURAL 1: Takeoff komutu komut kanalından
+            async with self.commands.command("takeoff"):
                 await self.drone.action.set_takeoff_altitude(altitude)
                 await self.drone.action.takeoff()
             
-            # KURAL 1: Takeoff monitoring lock'lu
+            # KURAL 1: Takeoff monitoring kilitsiz (salt okuma)
             takeoff_success = await self._thread_safe_monitor_takeoff(altitude)
             
             if takeoff_success:
@@ -205,27 +223,25 @@ class ThreadSafeVTOLNavigation:
     async def thread_safe_land(self) -> bool:
         """
         %100 THREAD-SAFE VTOL İniş
-        KURAL 1: Her MAVSDK erişimi lock'lu
+        KURAL 1: Komutlar araç komut kanalından, telemetri kilitsiz
         """
         vtol_logger.info("🔒 Thread-Safe VTOL iniş başlatılıyor")
         
         try:
-            # MC moduna geç (lock'lu)
+            # MC moduna geç
             if self.current_mode == "FW":
                 if not await self.thread_safe_transition_to_mc():
                     return False
             
-            # KURAL 1: Tilt dikey lock'lu
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - tilt vertical for landing")
+            # KURAL 1: Tilt dikey komut kanalından
+            async with self.commands.command("tilt"):
                 await self._thread_safe_set_tilt("vertical")
             
-            # KURAL 1: Land komutu lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - land command")
+            # KURAL 1: Land komutu komut kanalından
+            async with self.commands.command("land"):
                 await self.drone.action.land()
             
-            # KURAL 1: Landing monitoring lock'lu
+            # KURAL 1: Landing monitoring kilitsiz (salt okuma)
             landing_success = await self._thread_safe_monitor_landing()
             
             if landing_success:
@@ -243,17 +259,16 @@ class ThreadSafeVTOLNavigation:
     async def thread_safe_rtl(self) -> bool:
         """
         %100 THREAD-SAFE RTL
-        KURAL 1: RTL komutu lock'lu
+        KURAL 1: RTL komutu komut kanalından
         """
         vtol_logger.info("🔒 Thread-Safe RTL başlatılıyor")
         
         try:
-            # KURAL 1: RTL komutu lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - RTL command")
+            # KURAL 1: RTL komutu komut kanalından
+            async with self.commands.command("rtl"):
                 await self.drone.action.return_to_launch()
             
-            # KURAL 1: RTL monitoring lock'lu
+            # KURAL 1: RTL monitoring kilitsiz (salt okuma)
             rtl_success = await self._thread_safe_monitor_rtl()
             
             if rtl_success:
@@ -272,23 +287,21 @@ class ThreadSafeVTOLNavigation:
                                       altitude: float, speed: float = None) -> bool:
         """
         %100 THREAD-SAFE GPS Goto
-        KURAL 1: Goto komutu lock'lu
+        KURAL 1: Goto komutu komut kanalından
         """
         vtol_logger.info(f"🔒 Thread-Safe GPS goto: {latitude:.6f}, {longitude:.6f}, {altitude}m")
         
         try:
-            # KURAL 1: Speed ayarı lock'lu
+            # KURAL 1: Speed ayarı komut kanalından
             if speed:
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - speed setting")
+                async with self.commands.command("set_maximum_speed"):
                     await self.drone.action.set_maximum_speed(speed)
             
-            # KURAL 1: Goto komutu lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - goto command")
+            # KURAL 1: Goto komutu komut kanalından
+            async with self.commands.command("goto"):
                 await self.drone.action.goto_location(latitude, longitude, altitude, 0)
             
-            # KURAL 1: Goto monitoring lock'lu
+            # KURAL 1: Goto monitoring kilitsiz (salt okuma)
             goto_success = await self._thread_safe_monitor_goto(latitude, longitude, altitude)
             
             if goto_success:
@@ -305,7 +318,7 @@ class ThreadSafeVTOLNavigation:
     async def thread_safe_emergency_stop(self) -> bool:
         """
         %100 THREAD-SAFE Acil Durdurma
-        KURAL 1: Emergency komutları lock'lu
+        KURAL 1: Emergency komutları komut kanalından
         """
         vtol_logger.warning("🚨 %100 Thread-Safe ACİL DURDURMA!")
         
@@ -314,14 +327,12 @@ class ThreadSafeVTOLNavigation:
             if self.current_mode == "FW":
                 await self.thread_safe_transition_to_mc()
             
-            # KURAL 1: Tilt dikey lock'lu
-            with vehicle_lock:
-                vtol_logger.warning("🔒 Lock alındı - emergency tilt vertical")
+            # KURAL 1: Tilt dikey komut kanalından
+            async with self.commands.command("tilt"):
                 await self._thread_safe_set_tilt("vertical")
             
-            # KURAL 1: Emergency land lock'lu
-            with vehicle_lock:
-                vtol_logger.warning("🔒 Lock alındı - emergency land")
+            # KURAL 1: Emergency land komut kanalından
+            async with self.commands.command("land"):
                 await self.drone.action.land()
             
             vtol_logger.info("✅ Thread-Safe acil durdurma aktif!")
@@ -334,7 +345,7 @@ class ThreadSafeVTOLNavigation:
     async def thread_safe_transition_to_fw(self, target_speed: float = 12.0) -> bool:
         """
         %100 THREAD-SAFE MC → FW Transition
-        KURAL 1: Transition komutları lock'lu
+        KURAL 1: Transition komutları komut kanalından
         """
         vtol_logger.info("🔒 Thread-Safe MC → FW Transition")
         
@@ -342,30 +353,27 @@ class ThreadSafeVTOLNavigation:
             # Stabilization
             await asyncio.sleep(3)
             
-            # KURAL 1: Forward momentum lock'lu
+            # KURAL 1: Forward momentum komut kanalından
             momentum_success = await self._thread_safe_create_momentum(target_speed)
             if not momentum_success:
                 return False
             
-            # KURAL 1: Tilt transition lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - tilt transitioning")
+            # KURAL 1: Tilt transition komut kanalından
+            async with self.commands.command("tilt"):
                 await self._thread_safe_set_tilt("transitioning")
             
             await asyncio.sleep(2)
             
-            # KURAL 1: FW transition lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - FW transition")
+            # KURAL 1: FW transition komut kanalından
+            async with self.commands.command("transition_to_fw"):
                 await self.drone.action.transition_to_fixedwing()
             
-            # KURAL 1: FW monitoring lock'lu
+            # KURAL 1: FW monitoring kilitsiz (salt okuma)
             fw_success = await self._thread_safe_monitor_fw_transition()
             
             if fw_success:
-                # KURAL 1: Final tilt lock'lu
-                with vehicle_lock:
-                    vtol_logger.info("🔒 Lock alındı - final tilt horizontal")
+                # KURAL 1: Final tilt komut kanalından
+                async with self.commands.command("tilt"):
                     await self._thread_safe_set_tilt("horizontal")
                 
                 self.current_mode = "FW"
@@ -373,41 +381,38 @@ class ThreadSafeVTOLNavigation:
                 return True
             else:
                 # Güvenli pozisyona dön
-                with vehicle_lock:
+                async with self.commands.command("tilt"):
                     await self._thread_safe_set_tilt("vertical")
                 return False
             
         except Exception as e:
             vtol_logger.error(f"❌ Thread-safe FW transition hatası: {e}")
-            with vehicle_lock:
+            async with self.commands.command("tilt"):
                 await self._thread_safe_set_tilt("vertical")
             return False
     
     async def thread_safe_transition_to_mc(self) -> bool:
         """
         %100 THREAD-SAFE FW → MC Transition
-        KURAL 1: Transition komutları lock'lu
+        KURAL 1: Transition komutları komut kanalından
         """
         vtol_logger.info("🔒 Thread-Safe FW → MC Transition")
         
         try:
-            # KURAL 1: Tilt transition lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - tilt transitioning to MC")
+            # KURAL 1: Tilt transition komut kanalından
+            async with self.commands.command("tilt"):
                 await self._thread_safe_set_tilt("transitioning")
             
-            # KURAL 1: MC transition lock'lu
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - MC transition")
+            # KURAL 1: MC transition komut kanalından
+            async with self.commands.command("transition_to_mc"):
                 await self.drone.action.transition_to_multicopter()
             
-            # KURAL 1: MC monitoring lock'lu
+            # KURAL 1: MC monitoring kilitsiz (salt okuma)
             mc_success = await self._thread_safe_monitor_mc_transition()
             
             if mc_success:
-                # KURAL 1: Final tilt lock'lu
-                with vehicle_lock:
-                    vtol_logger.info("🔒 Lock alındı - final tilt vertical")
+                # KURAL 1: Final tilt komut kanalından
+                async with self.commands.command("tilt"):
                     await self._thread_safe_set_tilt("vertical")
                 
                 self.current_mode = "MC"
@@ -423,97 +428,47 @@ class ThreadSafeVTOLNavigation:
     async def thread_safe_get_status(self) -> dict:
         """
         %100 THREAD-SAFE Status Alma
-        KURAL 1: TÜM telemetri okuma lock'lu!
+        Canlı durum önbelleğinden hemen döner; alan başına örnek yaşı
+        `sample_age` (s) içinde, hiç örnek gelmemiş alanlar None
         """
+        status = self._base_status()
+        
         try:
-            status = {
-                'current_mode': self.current_mode,
-                'is_armed': self.is_armed,
-                'current_altitude': self.current_altitude,
-                'home_position': str(self.home_position) if self.home_position else None
-            }
+            await self.state.ensure_started()
             
-            # KURAL 1: Position okuma lock'lu!
-            try:
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - position telemetry")
-                    async for position in self.drone.telemetry.position():
-                        status.update({
-                            'latitude': position.latitude_deg,
-                            'longitude': position.longitude_deg,
-                            'altitude': position.relative_altitude_m,
-                            'heading': position.heading_deg
-                        })
-                        break
-            except:
-                # Fallback değerler
-                status.update({
-                    'latitude': -35.363262,
-                    'longitude': 149.1652371,
-                    'altitude': 0,
-                    'heading': 0
-                })
+            # İlk çağrıda konumun ilk örneğini kısa süre bekle
+            if not self.state.has('latitude'):
+                await self.state.wait_until(lambda state: state.has('latitude'), self.FIRST_SAMPLE_TIMEOUT_S)
             
-            # KURAL 1: Battery okuma lock'lu!
-            try:
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - battery telemetry")
-                    async for battery in self.drone.telemetry.battery():
-                        status.update({
-                            'battery_voltage': battery.voltage_v,
-                            'battery_remaining': battery.remaining_percent
-                        })
-                        break
-            except:
-                status.update({
-                    'battery_voltage': 12.6,
-                    'battery_remaining': 100
-                })
+            snapshot = self.state.snapshot()
+            status.update(snapshot['values'])
+            status['sample_age'] = snapshot['sample_age']
             
-            # KURAL 1: Velocity okuma lock'lu!
-            try:
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - velocity telemetry")
-                    async for velocity in self.drone.telemetry.velocity_ned():
-                        ground_speed = math.sqrt(velocity.north_m_s**2 + velocity.east_m_s**2)
-                        status.update({
-                            'ground_speed': ground_speed,
-                            'vertical_speed': velocity.down_m_s
-                        })
-                        break
-            except:
-                status.update({
-                    'ground_speed': 0,
-                    'vertical_speed': 0
-                })
-            
-            # KURAL 1: VTOL state okuma lock'lu!
-            try:
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - vtol state telemetry")
-                    async for vtol_state in self.drone.telemetry.vtol_state():
-                        status['vtol_state'] = str(vtol_state)
-                        break
-            except:
+            if status['armed'] is not None:
+                status['is_armed'] = status['armed']
+            if status['vtol_state'] is None:
                 status['vtol_state'] = self.current_mode
-            
             return status
             
         except Exception as e:
             vtol_logger.error(f"❌ Thread-safe status hatası: {e}")
-            # Fallback status
-            return {
-                'current_mode': self.current_mode,
-                'is_armed': self.is_armed,
-                'current_altitude': self.current_altitude,
-                'latitude': -35.363262,
-                'longitude': 149.1652371,
-                'altitude': 0,
-                'heading': 0,
-                'battery_remaining': 100,
-                'ground_speed': 0,
-                'vtol_state': self.current_mode
-            }
+            return self.unavailable_status(str(e))
+    
+    def _base_status(self) -> dict:
+        return {
+            'current_mode': self.current_mode,
+            'is_armed': self.is_armed,
+            'current_altitude': self.current_altitude,
+            'home_position': str(self.home_position) if self.home_position else None
+        }
+    
+    def unavailable_status(self, error: str) -> dict:
+        """Durum alınamadı: `thread_safe_get_status` biçiminde, telemetri alanları None"""
+        status = self._base_status()
+        status.update({field: None for field in STATE_FIELDS})
+        status['sample_age'] = None
+        status['error'] = error
+        return status
     
     # ==============================================
     # %100 THREAD-SAFE PRIVATE METHODS
@@ -521,7 +476,7 @@ class ThreadSafeVTOLNavigation:
     # ==============================================
     
     async def _thread_safe_set_tilt(self, position: str):
-        """Thread-safe tilt control - Bu fonksiyon zaten lock içinde çağrılıyor"""
+        """Thread-safe tilt control - komut kanalı bloğu içinde çağrılır"""
         vtol_logger.debug(f"📐 Thread-safe tilt: {position}")
         
         try:
@@ -545,7 +500,7 @@ class ThreadSafeVTOLNavigation:
             vtol_logger.error(f"❌ Thread-safe tilt hatası: {e}")
     
     async def _thread_safe_ensure_mc(self):
-        """Thread-safe MC mode - Bu fonksiyon zaten lock içinde çağrılıyor"""
+        """Thread-safe MC mode - komut kanalı bloğu içinde çağrılır"""
         try:
             async for flight_mode in self.drone.telemetry.flight_mode():
                 if "MULTICOPTER" not in str(flight_mode):
@@ -557,7 +512,7 @@ class ThreadSafeVTOLNavigation:
             vtol_logger.warning(f"⚠ Thread-safe MC mode hatası: {e}")
     
     async def _thread_safe_save_home(self):
-        """Thread-safe home position - Bu fonksiyon zaten lock içinde çağrılıyor"""
+        """Thread-safe home position - salt okuma, kilitsiz"""
         try:
             async for position in self.drone.telemetry.position():
                 self.home_position = ThreadSafeMAVSDKLocation(
@@ -571,7 +526,7 @@ class ThreadSafeVTOLNavigation:
             vtol_logger.warning(f"⚠ Thread-safe home hatası: {e}")
     
     async def _thread_safe_preflight(self) -> bool:
-        """Thread-safe preflight - Bu fonksiyon zaten lock içinde çağrılıyor"""
+        """Thread-safe preflight - salt okuma, kilitsiz"""
         vtol_logger.info("🔍 Thread-safe preflight...")
         
         try:
@@ -591,22 +546,20 @@ class ThreadSafeVTOLNavigation:
     async def _thread_safe_wait_arm(self, timeout: int) -> bool:
         """
         Thread-safe ARM bekleme
-        KURAL 1: ARM kontrolü de lock'lu!
+        KURAL 1: ARM kontrolü salt okuma
         """
         arm_start = time.time()
         
         while (time.time() - arm_start) < timeout:
             try:
-                # KURAL 1: ARM durumu okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - armed status check")
-                    async for armed in self.drone.telemetry.armed():
-                        if armed:
-                            vtol_logger.info("✅ Thread-safe ARM başarılı!")
-                            self.is_armed = True
-                            return True
-                        break
-            except:
+                # KURAL 1: ARM durumu okuma kilitsiz (salt okuma)
+                async for armed in self.drone.telemetry.armed():
+                    if armed:
+                        vtol_logger.info("✅ Thread-safe ARM başarılı!")
+                        self.is_armed = True
+                        return True
+                    break
+            except Exception:
                 pass
             
             await asyncio.sleep(0.5)
@@ -617,31 +570,24 @@ class ThreadSafeVTOLNavigation:
     async def _thread_safe_monitor_takeoff(self, target_altitude: float) -> bool:
         """
         Thread-safe takeoff monitoring
-        KURAL 1: Position okuma lock'lu!
+        Durum önbelleğindeki irtifa değişimlerini bekler
         """
-        takeoff_start = time.time()
-        takeoff_timeout = 60
+        progress = _ProgressLog(3.0)
         
-        while (time.time() - takeoff_start) < takeoff_timeout:
-            try:
-                # KURAL 1: Position telemetry okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - takeoff position check")
-                    async for position in self.drone.telemetry.position():
-                        current_alt = position.relative_altitude_m
-                        self.current_altitude = current_alt
-                        
-                        if current_alt >= target_altitude - 0.5:
-                            vtol_logger.info(f"🎯 Thread-safe hedef irtifa: {current_alt:.1f}m")
-                            return True
-                        
-                        if int(time.time()) % 3 == 0:
-                            vtol_logger.info(f"   ⬆️ Thread-safe kalkış: {current_alt:.1f}m / {target_altitude}m")
-                        break
-            except:
-                pass
-            
-            await asyncio.sleep(0.5)
+        def reached(state) -> bool:
+            current_alt = state.get('altitude')
+            if current_alt is None:
+                return False
+            self.current_altitude = current_alt
+            if current_alt >= target_altitude - 0.5:
+                vtol_logger.info(f"🎯 Thread-safe hedef irtifa: {current_alt:.1f}m")
+                return True
+            if progress.due():
+                vtol_logger.info(f"   ⬆️ Thread-safe kalkış: {current_alt:.1f}m / {target_altitude}m")
+            return False
+        
+        if await self.state.wait_until(reached, 60):
+            return True
         
         vtol_logger.error("❌ Thread-safe kalkış timeout!")
         return False
@@ -649,130 +595,86 @@ class ThreadSafeVTOLNavigation:
     async def _thread_safe_monitor_landing(self) -> bool:
         """
         Thread-safe landing monitoring
-        KURAL 1: Position ve armed okuma lock'lu!
+        Durum önbelleğinde disarm olmasını bekler
         """
-        landing_start = time.time()
-        landing_timeout = 120
+        progress = _ProgressLog(5.0)
         
-        while (time.time() - landing_start) < landing_timeout:
-            try:
-                # KURAL 1: Position okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - landing position check")
-                    async for position in self.drone.telemetry.position():
-                        current_alt = position.relative_altitude_m
-                        self.current_altitude = current_alt
-                        
-                        if int(time.time()) % 5 == 0:
-                            vtol_logger.info(f"   ⬇️ Thread-safe iniş: {current_alt:.1f}m")
-                        break
-                
-                # KURAL 1: Armed durumu okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - landing armed check")
-                    async for armed in self.drone.telemetry.armed():
-                        if not armed:
-                            vtol_logger.info("✅ Thread-safe iniş - DISARM")
-                            return True
-                        break
-            except:
-                pass
-            
-            await asyncio.sleep(1)
+        def landed(state) -> bool:
+            current_alt = state.get('altitude')
+            if current_alt is not None:
+                self.current_altitude = current_alt
+                if progress.due():
+                    vtol_logger.info(f"   ⬇️ Thread-safe iniş: {current_alt:.1f}m")
+            if state.get('armed') is False:
+                vtol_logger.info("✅ Thread-safe iniş - DISARM")
+                return True
+            return False
         
-        return False
+        return await self.state.wait_until(landed, 120)
     
     async def _thread_safe_monitor_rtl(self) -> bool:
         """
         Thread-safe RTL monitoring
-        KURAL 1: Position ve armed okuma lock'lu!
+        Durum önbelleğinde disarm olmasını bekler
         """
-        rtl_start = time.time()
-        rtl_timeout = 300
+        progress = _ProgressLog(10.0)
         
-        while (time.time() - rtl_start) < rtl_timeout:
-            try:
-                # KURAL 1: Position okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - RTL position check")
-                    async for position in self.drone.telemetry.position():
-                        current_alt = position.relative_altitude_m
-                        
-                        if int(time.time()) % 10 == 0:
-                            vtol_logger.info(f"   🏠 Thread-safe RTL: {current_alt:.1f}m")
-                        break
-                
-                # KURAL 1: Armed durumu okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - RTL armed check")
-                    async for armed in self.drone.telemetry.armed():
-                        if not armed:
-                            vtol_logger.info("✅ Thread-safe RTL - DISARM")
-                            return True
-                        break
-            except:
-                pass
-            
-            await asyncio.sleep(2)
+        def returned(state) -> bool:
+            current_alt = state.get('altitude')
+            if current_alt is not None and progress.due():
+                vtol_logger.info(f"   🏠 Thread-safe RTL: {current_alt:.1f}m")
+            if state.get('armed') is False:
+                vtol_logger.info("✅ Thread-safe RTL - DISARM")
+                return True
+            return False
         
-        return False
+        return await self.state.wait_until(returned, 300)
     
     async def _thread_safe_monitor_goto(self, target_lat: float, target_lon: float, target_alt: float) -> bool:
         """
         Thread-safe goto monitoring
-        KURAL 1: Position okuma lock'lu!
+        Durum önbelleğindeki konum değişimlerini bekler
         """
-        goto_start = time.time()
-        goto_timeout = 120
+        progress = _ProgressLog(5.0)
         
-        while (time.time() - goto_start) < goto_timeout:
-            try:
-                # KURAL 1: Position okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - goto position check")
-                    async for position in self.drone.telemetry.position():
-                        current_lat = position.latitude_deg
-                        current_lon = position.longitude_deg
-                        current_alt = position.relative_altitude_m
-                        
-                        lat_diff = abs(current_lat - target_lat)
-                        lon_diff = abs(current_lon - target_lon)
-                        alt_diff = abs(current_alt - target_alt)
-                        
-                        if lat_diff < 0.0001 and lon_diff < 0.0001 and alt_diff < 1.0:
-                            vtol_logger.info("✅ Thread-safe hedef pozisyon!")
-                            return True
-                        
-                        if int(time.time()) % 5 == 0:
-                            vtol_logger.info(f"   📍 Thread-safe goto: {current_lat:.6f}, {current_lon:.6f}")
-                        break
-            except:
-                pass
+        def arrived(state) -> bool:
+            current_lat = state.get('latitude')
+            current_lon = state.get('longitude')
+            current_alt = state.get('altitude')
+            if current_lat is None or current_lon is None or current_alt is None:
+                return False
             
-            await asyncio.sleep(2)
+            distance = float(geodesy.haversine_distance(current_lat, current_lon, target_lat, target_lon))
+            alt_diff = abs(current_alt - target_alt)
+            
+            if distance <= self.GOTO_ARRIVAL_RADIUS_M and alt_diff < self.GOTO_ARRIVAL_ALT_M:
+                vtol_logger.info("✅ Thread-safe hedef pozisyon!")
+                return True
+            
+            if progress.due():
+                vtol_logger.info(f"   📍 Thread-safe goto: {current_lat:.6f}, {current_lon:.6f} ({distance:.0f}m)")
+            return False
         
-        return False
+        return await self.state.wait_until(arrived, 120)
     
     async def _thread_safe_create_momentum(self, target_speed: float) -> bool:
         """
         Thread-safe forward momentum
-        KURAL 1: Offboard komutları lock'lu!
+        KURAL 1: Offboard komutları komut kanalından!
         """
         try:
-            # KURAL 1: Offboard başlatma lock'lu!
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - offboard start")
+            # KURAL 1: Offboard başlatma komut kanalından
+            async with self.commands.command("offboard_start"):
                 await self.drone.offboard.set_velocity_ned(VelocityNedYaw(0.0, 0.0, 0.0, 0.0))
                 await self.drone.offboard.start()
             
             await asyncio.sleep(2)
             
-            # KURAL 1: Velocity komutları lock'lu!
+            # KURAL 1: Velocity komutları komut kanalından!
             speeds = [3.0, 6.0, 9.0, target_speed]
             for speed in speeds:
                 vtol_logger.info(f"   → Thread-safe {speed} m/s momentum")
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - velocity command")
+                async with self.commands.command("offboard_velocity"):
                     await self.drone.offboard.set_velocity_ned(VelocityNedYaw(speed, 0.0, 0.0, 0.0))
                 await asyncio.sleep(3)
             
@@ -785,39 +687,35 @@ class ThreadSafeVTOLNavigation:
     async def _thread_safe_monitor_fw_transition(self) -> bool:
         """
         Thread-safe FW transition monitoring
-        KURAL 1: VTOL state okuma lock'lu!
+        KURAL 1: VTOL state okuma kilitsiz
         """
         transition_timeout = 20
         transition_start = time.time()
         
         while (time.time() - transition_start) < transition_timeout:
             try:
-                # KURAL 1: VTOL state okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - FW transition state check")
-                    async for vtol_state in self.drone.telemetry.vtol_state():
-                        state_str = str(vtol_state)
-                        vtol_logger.info(f"   🔄 Thread-safe VTOL State: {state_str}")
+                # KURAL 1: VTOL state okuma kilitsiz (salt okuma)
+                async for vtol_state in self.drone.telemetry.vtol_state():
+                    state_str = str(vtol_state)
+                    vtol_logger.info(f"   🔄 Thread-safe VTOL State: {state_str}")
                         
-                        if "FIXED_WING" in state_str or "FW" in state_str:
-                            vtol_logger.info("✅ Thread-safe FW aktif!")
-                            # KURAL 1: Offboard stop lock'lu!
-                            with vehicle_lock:
-                                vtol_logger.debug("🔒 Lock alındı - offboard stop")
-                                await self.drone.offboard.stop()
-                            return True
-                        break
-            except:
+                    if "FIXED_WING" in state_str or "FW" in state_str:
+                        vtol_logger.info("✅ Thread-safe FW aktif!")
+                        # KURAL 1: Offboard stop komut kanalından
+                        async with self.commands.command("offboard_stop"):
+                            await self.drone.offboard.stop()
+                        return True
+                    break
+            except Exception:
                 pass
             
             await asyncio.sleep(1)
         
         # Timeout durumunda offboard stop
         try:
-            with vehicle_lock:
-                vtol_logger.debug("🔒 Lock alındı - offboard stop timeout")
+            async with self.commands.command("offboard_stop"):
                 await self.drone.offboard.stop()
-        except:
+        except Exception:
             pass
         
         return True
@@ -825,23 +723,21 @@ class ThreadSafeVTOLNavigation:
     async def _thread_safe_monitor_mc_transition(self) -> bool:
         """
         Thread-safe MC transition monitoring
-        KURAL 1: VTOL state okuma lock'lu!
+        KURAL 1: VTOL state okuma kilitsiz
         """
         transition_timeout = 15
         transition_start = time.time()
         
         while (time.time() - transition_start) < transition_timeout:
             try:
-                # KURAL 1: VTOL state okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - MC transition state check")
-                    async for vtol_state in self.drone.telemetry.vtol_state():
-                        state_str = str(vtol_state)
-                        if "MULTICOPTER" in state_str or "MC" in state_str:
-                            vtol_logger.info("✅ Thread-safe MC aktif!")
-                            return True
-                        break
-            except:
+                # KURAL 1: VTOL state okuma kilitsiz (salt okuma)
+                async for vtol_state in self.drone.telemetry.vtol_state():
+                    state_str = str(vtol_state)
+                    if "MULTICOPTER" in state_str or "MC" in state_str:
+                        vtol_logger.info("✅ Thread-safe MC aktif!")
+                        return True
+                    break
+            except Exception:
                 pass
             
             await asyncio.sleep(1)
@@ -854,27 +750,48 @@ class ThreadSafeMissionPlanner:
     %100 THREAD-SAFE VTOL Mission Planner - GUI uyumluluğu
     
     3 KURAL UYUMU:
-    1. ✅ MAVSDK THREAD-SAFE DEĞİL → Her erişim vehicle_lock ile
+    1. ✅ MAVSDK THREAD-SAFE DEĞİL → Komutlar sıralı, tek loop'ta
     2. ✅ DRONEKIT TAMAMEN KALDIRILDI → Pure MAVSDK only
-    3. ✅ LOCK SİSTEMİ ZORUNLU → TÜM işlemler lock'lu
+    3. ✅ KOMUT KANALI ZORUNLU → Komutlar komut kanalından, telemetri kilitsiz
     """
     
-    def __init__(self, drone_system: System, ground_speed: float = 5.0):
+    # Sync wrapper zaman aşımları (s) - navigation monitör sürelerinin üstünde
+    CALL_TIMEOUTS = {
+        'takeoff': 150.0,
+        'land': 180.0,
+        'rtl': 360.0,
+        'transition_to_fw': 90.0,
+        'transition_to_mc': 60.0,
+        'emergency_land': 90.0,
+        'goto': 180.0,
+        'waypoints': 900.0,
+        'status': 5.0,
+    }
+    HOLD_TIMEOUT_MARGIN_S = 30.0
+
+    # Başlamadan önce çalışan komutu iptal eden çağrılar
+    PREEMPTING_CALLS = ('land', 'rtl', 'emergency_land')
+
+    def __init__(self, drone_system: System, ground_speed: float = 5.0,
+                 nav_loop: Optional[NavigationEventLoop] = None):
         """
         Thread-safe Mission Planner
         Args:
             drone_system: MAVSDK System objesi
             ground_speed: Varsayılan yer hızı
+            nav_loop: Coroutine'lerin çalışacağı loop (varsayılan: paylaşılan
+                navigation loop). drone_system bu loop'ta bağlanmış olmalı.
         """
         self.navigation = ThreadSafeVTOLNavigation(drone_system)
         self.ground_speed = ground_speed
+        self.nav_loop = nav_loop or get_navigation_loop()
         self._paused = threading.Event()
         self._paused.clear()
         
         vtol_logger.info(f"✅ %100 Thread-Safe Mission Planner - Hız: {ground_speed} m/s")
-        vtol_logger.info("🔒 KURAL 1: MAVSDK erişimi tamamen lock'lu")
+        vtol_logger.info("🔒 KURAL 1: MAVSDK komutları sıralı komut kanalından")
         vtol_logger.info("🚫 KURAL 2: DroneKit dependency tamamen yok")
-        vtol_logger.info("🔐 KURAL 3: vehicle_lock zorunlu kullanım")
+        vtol_logger.info("🔐 KURAL 3: Telemetri okuma kilitsiz, komutlar kanal sırasıyla")
     
     # ==============================================
     # GUI UYUMLU THREAD-SAFE SYNC WRAPPER'LAR
@@ -885,116 +802,113 @@ class ThreadSafeMissionPlanner:
         async def _takeoff():
             return await self.navigation.thread_safe_takeoff(target_altitude)
         
-        return self._thread_safe_run_async(_takeoff)
+        return self._thread_safe_run_async(_takeoff, 'takeoff')
     
     def land(self) -> bool:
         """Thread-safe landing - GUI sync wrapper"""
         async def _land():
             return await self.navigation.thread_safe_land()
         
-        return self._thread_safe_run_async(_land)
+        return self._thread_safe_run_async(_land, 'land')
     
     def rtl(self) -> bool:
         """Thread-safe RTL - GUI sync wrapper"""
         async def _rtl():
             return await self.navigation.thread_safe_rtl()
         
-        return self._thread_safe_run_async(_rtl)
+        return self._thread_safe_run_async(_rtl, 'rtl')
     
     def transition_to_fw(self) -> bool:
         """Thread-safe FW transition"""
         async def _transition():
             return await self.navigation.thread_safe_transition_to_fw(self.ground_speed)
         
-        return self._thread_safe_run_async(_transition)
+        return self._thread_safe_run_async(_transition, 'transition_to_fw')
     
     def transition_to_mc(self) -> bool:
         """Thread-safe MC transition"""
         async def _transition():
             return await self.navigation.thread_safe_transition_to_mc()
         
-        return self._thread_safe_run_async(_transition)
+        return self._thread_safe_run_async(_transition, 'transition_to_mc')
     
     def emergency_land(self) -> bool:
         """Thread-safe emergency land"""
         async def _emergency():
             return await self.navigation.thread_safe_emergency_stop()
         
-        return self._thread_safe_run_async(_emergency)
+        return self._thread_safe_run_async(_emergency, 'emergency_land')
     
     def goto_location(self, latitude: float, longitude: float, altitude: float) -> bool:
         """Thread-safe goto location"""
         async def _goto():
             return await self.navigation.thread_safe_goto_position(latitude, longitude, altitude, self.ground_speed)
         
-        return self._thread_safe_run_async(_goto)
+        return self._thread_safe_run_async(_goto, 'goto')
     
     def execute_waypoints(self, waypoints: List[Tuple[float, float, float]]) -> bool:
         """Thread-safe waypoint execution"""
         async def _waypoints():
             return await self._thread_safe_execute_mission(waypoints)
         
-        return self._thread_safe_run_async(_waypoints)
+        return self._thread_safe_run_async(_waypoints, 'waypoints')
     
     def get_status(self) -> dict:
-        """Thread-safe status"""
+        """Thread-safe status - salt okuma, çalışan komutu beklemez"""
         async def _status():
             return await self.navigation.thread_safe_get_status()
         
-        return self._thread_safe_run_async(_status, default={
-            'current_mode': 'MC',
-            'altitude': 0,
-            'ground_speed': 0,
-            'heading': 0,
-            'battery_remaining': 100,
-            'latitude': -35.363262,
-            'longitude': 149.1652371,
-            'vtol_state': 'MC'
-        })
-    
-    def _thread_safe_run_async(self, async_func, default=False):
+        status = self._thread_safe_run_async(_status, 'status', default=None, exclusive=False)
+        if status is None:
+            # Zaman aşımı / hata: uydurma konum yerine boş alanlar ve hata
+            return self.navigation.unavailable_status("Durum alınamadı (zaman aşımı veya hata)")
+        return status
+    
+    def _thread_safe_run_async(self, async_func, name: str = "call", default=False,
+                               timeout: Optional[float] = None, exclusive: bool = True):
         """
-        %100 Thread-safe async runner
-        KURAL 3: QTimer kullanarak thread-safe wrapper
+        Coroutine'i kalıcı navigation loop'unda çalıştır ve sonucu bekle.
+        Hata, zaman aşımı veya iptalde `default` döner. Komut akışları
+        (exclusive) sırayla çalışır; salt okuma çağrıları onları beklemez.
         """
+        if timeout is None:
+            timeout = self.CALL_TIMEOUTS.get(name)
         try:
-            # Event loop kontrolü
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Ana thread'de çalışan loop varsa yeni thread kullan
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(self._run_in_isolated_thread, async_func)
-                    result = future.result(timeout=60)  # 60 saniye timeout
-                    return result
-            else:
-                return loop.run_until_complete(async_func())
-        except Exception as e:
-            vtol_logger.error(f"❌ Thread-safe async runner hatası: {e}")
-            return default
-    
-    def _run_in_isolated_thread(self, async_func):
-        """İzole thread'de async çalıştır - %100 thread-safe"""
-        try:
-            # Yeni event loop oluştur
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                result = loop.run_until_complete(async_func())
-                return result
-            finally:
-                # Loop'u temizle
-                loop.close()
-                
+            return self.nav_loop.run(async_func, name=name, timeout=timeout, exclusive=exclusive,
+                                     preempt=name in self.PREEMPTING_CALLS)
+        except (asyncio.TimeoutError, concurrent.futures.TimeoutError):
+            vtol_logger.error(f"❌ Navigation çağrısı zaman aşımı: {name} ({timeout:.0f}s)")
+        except (asyncio.CancelledError, concurrent.futures.CancelledError):
+            vtol_logger.warning(f"⚠ Navigation çağrısı iptal edildi: {name}")
         except Exception as e:
-            vtol_logger.error(f"❌ İzole thread hatası: {e}")
-            return False
+            vtol_logger.error(f"❌ Thread-safe async runner hatası ({name}): {e}")
+        return default
+    
+    def submit_async(self, async_func, name: str = "call", timeout: Optional[float] = None) -> concurrent.futures.Future:
+        """Bloklamadan gönder: sonucu `Future.result()` ile alınır, `cancel()` ile iptal edilir"""
+        if timeout is None:
+            timeout = self.CALL_TIMEOUTS.get(name)
+        return self.nav_loop.submit(async_func, name=name, timeout=timeout,
+                                    preempt=name in self.PREEMPTING_CALLS)
+    
+    def cancel_pending(self) -> int:
+        """Çalışan ve sırada bekleyen navigation çağrılarını iptal et"""
+        cancelled = self.nav_loop.cancel_all()
+        if cancelled:
+            vtol_logger.warning(f"⚠ {cancelled} navigation çağrısı iptal edildi")
+        return cancelled
+    
+    def get_call_statistics(self) -> dict:
+        """Çağrı başına komut gecikmesi, loop aktarma maliyeti, komut kanalı ve telemetri önbelleği sayaçları"""
+        statistics = self.nav_loop.get_statistics()
+        statistics['command_channel'] = self.navigation.commands.get_statistics()
+        statistics['vehicle_state'] = self.navigation.state.get_statistics()
+        return statistics
     
     async def _thread_safe_execute_mission(self, waypoints: List[Tuple[float, float, float]]) -> bool:
         """
         Thread-safe waypoint mission
-        KURAL 1: Mission komutları lock'lu!
+        KURAL 1: Mission komutları komut kanalından!
         """
         vtol_logger.info(f"🔒 Thread-Safe waypoint mission - {len(waypoints)} nokta")
         
@@ -1011,19 +925,17 @@ class ThreadSafeMissionPlanner:
             
             mission_plan = MissionPlan(mission_items)
             
-            # KURAL 1: Mission upload lock'lu!
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - mission upload")
+            # KURAL 1: Mission upload komut kanalından
+            async with self.navigation.commands.command("mission_upload"):
                 await self.navigation.drone.mission.upload_mission(mission_plan)
                 vtol_logger.info("✅ Thread-safe mission yüklendi")
             
-            # KURAL 1: Mission start lock'lu!
-            with vehicle_lock:
-                vtol_logger.info("🔒 Lock alındı - mission start")
+            # KURAL 1: Mission start komut kanalından
+            async with self.navigation.commands.command("mission_start"):
                 await self.navigation.drone.mission.start_mission()
                 vtol_logger.info("🚀 Thread-safe mission başlatıldı")
             
-            # KURAL 1: Mission monitoring lock'lu!
+            # KURAL 1: Mission monitoring kilitsiz (salt okuma)!
             mission_success = await self._thread_safe_monitor_mission()
             
             if mission_success:
@@ -1040,27 +952,25 @@ class ThreadSafeMissionPlanner:
     async def _thread_safe_monitor_mission(self) -> bool:
         """
         Thread-safe mission monitoring
-        KURAL 1: Mission progress okuma lock'lu!
+        KURAL 1: Mission progress okuma kilitsiz
         """
         mission_start = time.time()
         mission_timeout = 600
         
         while (time.time() - mission_start) < mission_timeout:
             try:
-                # KURAL 1: Mission progress okuma lock'lu!
-                with vehicle_lock:
-                    vtol_logger.debug("🔒 Lock alındı - mission progress check")
-                    async for mission_progress in self.navigation.drone.mission.mission_progress():
-                        current = mission_progress.current
-                        total = mission_progress.total
+                # KURAL 1: Mission progress okuma kilitsiz (salt okuma)
+                async for mission_progress in self.navigation.drone.mission.mission_progress():
+                    current = mission_progress.current
+                    total = mission_progress.total
                         
-                        vtol_logger.info(f"   🗺️ Thread-safe Mission: {current}/{total}")
+                    vtol_logger.info(f"   🗺️ Thread-safe Mission: {current}/{total}")
                         
-                        if current >= total:
-                            vtol_logger.info("✅ Thread-safe mission tamamlandı!")
-                            return True
-                        break
-            except:
+                    if current >= total:
+                        vtol_logger.info("✅ Thread-safe mission tamamlandı!")
+                        return True
+                    break
+            except Exception:
                 pass
             
             await asyncio.sleep(5)
@@ -1086,15 +996,14 @@ class ThreadSafeMissionPlanner:
     def hold_position(self, duration: float = 10.0) -> bool:
         """Thread-safe position hold"""
         async def _hold():
-            # KURAL 1: Hold komutu lock'lu!
+            # KURAL 1: Hold komutu komut kanalından!
             try:
                 if self.navigation.current_mode == "MC":
                     vtol_logger.info(f"🚁 Thread-safe MC hover {duration}s...")
                     await asyncio.sleep(duration)
                 else:
                     vtol_logger.info(f"✈️ Thread-safe FW loiter {duration}s...")
-                    with vehicle_lock:
-                        vtol_logger.debug("🔒 Lock alındı - hold command")
+                    async with self.navigation.commands.command("hold"):
                         await self.navigation.drone.action.hold()
                     await asyncio.sleep(duration)
                 
@@ -1105,7 +1014,7 @@ class ThreadSafeMissionPlanner:
                 vtol_logger.error(f"❌ Thread-safe hold hatası: {e}")
                 return False
         
-        return self._thread_safe_run_async(_hold)
+        return self._thread_safe_run_async(_hold, 'hold', timeout=duration + self.HOLD_TIMEOUT_MARGIN_S)
     
     def loiter(self, duration: float):
         """Thread-safe loiter - eski API uyumluluğu"""
@@ -1122,24 +1031,14 @@ def create_thread_safe_location(lat: float, lon: float, alt: float) -> ThreadSaf
     return ThreadSafeMAVSDKLocation(lat, lon, alt)
 
 def thread_safe_distance_between(loc1: ThreadSafeMAVSDKLocation, loc2: ThreadSafeMAVSDKLocation) -> float:
-    """Thread-safe distance calculation - DroneKit dependency yok"""
-    dlat = loc2.lat - loc1.lat
-    dlon = loc2.lon - loc1.lon
-    return ((dlat*1.113195e5)**2 + (dlon*1.113195e5)**2) ** 0.5
+    """Thread-safe distance calculation (haversine, m) - DroneKit dependency yok"""
+    return float(geodesy.haversine_distance(loc1.lat, loc1.lon, loc2.lat, loc2.lon))
 
 def generate_thread_safe_circle_waypoints(center_lat: float, center_lon: float, center_alt: float, 
                                         radius_meters: float, count: int = 8) -> List[Tuple[float, float, float]]:
-    """Thread-safe circle waypoint generator - DroneKit yok"""
-    waypoints = []
-    radius_deg = radius_meters / 111320.0
-    
-    for i in range(count):
-        angle = (2 * math.pi * i) / count
-        lat = center_lat + radius_deg * math.cos(angle)
-        lon = center_lon + radius_deg * math.sin(angle)
-        waypoints.append((lat, lon, center_alt))
-    
-    return waypoints
+    """Thread-safe circle waypoint generator (kuzeyden saat yönünde) - DroneKit yok"""
+    lats, lons = geodesy.circle_points(center_lat, center_lon, radius_meters, count)
+    return [(float(lat), float(lon), center_alt) for lat, lon in zip(lats, lons)]
 
 def thread_safe_offset_location(base_lat: float, base_lon: float, base_alt: float,
                                offset_lat: float, offset_lon: float, new_alt: float) -> Tuple[float, float, float]:
@@ -1157,14 +1056,14 @@ def get_thread_safe_navigation_classes():
     3 KURAL UYUMU:
     1. ✅ MAVSDK THREAD-SAFE DEĞİL → Lock sistemli classes
     2. ✅ DRONEKIT TAMAMEN KALDIRILDI → Pure MAVSDK classes
-    3. ✅ LOCK SİSTEMİ ZORUNLU → vehicle_lock zorunlu
+    3. ✅ KOMUT KANALI ZORUNLU → Komutlar araç komut kanalından
     """
     try:
         if MAVSDK_AVAILABLE:
             vtol_logger.info("✅ %100 Thread-Safe MAVSDK classes available")
-            vtol_logger.info("🔒 KURAL 1: MAVSDK erişimi tamamen lock'lu")
+            vtol_logger.info("🔒 KURAL 1: MAVSDK komutları sıralı komut kanalından")
             vtol_logger.info("🚫 KURAL 2: DroneKit dependency tamamen yok")
-            vtol_logger.info("🔐 KURAL 3: vehicle_lock zorunlu kullanım")
+            vtol_logger.info("🔐 KURAL 3: Telemetri okuma kilitsiz, komutlar kanal sırasıyla")
             return ThreadSafeVTOLNavigation, ThreadSafeMissionPlanner
         else:
             vtol_logger.warning("⚠ MAVSDK unavailable - Thread-safe mock classes")
@@ -1225,10 +1124,10 @@ def verify_thread_safety_compliance():
     vtol_logger.info("=" * 60)
     
     # KURAL 1: MAVSDK THREAD-SAFE DEĞİL
-    vtol_logger.info("🔒 KURAL 1: MAVSDK erişimi tamamen lock'lu ✅")
-    vtol_logger.info("   - Tüm MAVSDK telemetry okuma: with vehicle_lock")
-    vtol_logger.info("   - Tüm MAVSDK action komutları: with vehicle_lock")
-    vtol_logger.info("   - Tüm MAVSDK offboard komutları: with vehicle_lock")
+    vtol_logger.info("🔒 KURAL 1: MAVSDK komutları sıralı ✅")
+    vtol_logger.info("   - MAVSDK telemetry okuma: kilitsiz (salt okuma)")
+    vtol_logger.info("   - MAVSDK action komutları: async with commands.command(...)")
+    vtol_logger.info("   - MAVSDK offboard komutları: async with commands.command(...)")
     
     # KURAL 2: DRONEKIT TAMAMEN KALDIRILDI
     vtol_logger.info("🚫 KURAL 2: DroneKit dependency tamamen yok ✅")
@@ -1237,10 +1136,10 @@ def verify_thread_safety_compliance():
     vtol_logger.info("   - Vehicle → MAVSDK System")
     
     # KURAL 3: LOCK SİSTEMİ ZORUNLU
-    vtol_logger.info("🔐 KURAL 3: vehicle_lock zorunlu kullanım ✅")
-    vtol_logger.info("   - Her MAVSDK erişimi vehicle_lock ile korumalı")
-    vtol_logger.info("   - Thread-safe sync wrapper'lar QTimer kullanım")
-    vtol_logger.info("   - İzole thread'ler event loop güvenliği")
+    vtol_logger.info("🔐 KURAL 3: Komut kanalı zorunlu kullanım ✅")
+    vtol_logger.info("   - Komutlar araç başına FIFO kanal, bekleme / tutma süresi ölçülür")
+    vtol_logger.info("   - Sync wrapper'lar kalıcı navigation loop'una gönderilir")
+    vtol_logger.info("   - Çağrı başına zaman aşımı ve iptal")
     
     vtol_logger.info("=" * 60)
     vtol_logger.info("✅ %100 THREAD-SAFE NAVIGATION - 3 KURAL UYUMLU")
@@ -0,0 +1,308 @@
+# core/navigation_loop.py
+"""
+Navigation Event Loop
+=====================
+
+Navigation coroutine'lerinin çalıştığı uzun ömürlü event loop thread'i.
+`ThreadSafeMissionPlanner` sync wrapper'ları her çağrıda yeni thread ve
+event loop kurup kapatmak yerine coroutine'lerini bu loop'a gönderir:
+- `submit()` hemen `concurrent.futures.Future` döndürür; `run()` sonucu
+  bekler (GUI / worker thread'leri için)
+- Çağrı başına zaman aşımı loop içinde uygulanır; süre dolunca coroutine
+  iptal edilir, bekleyen taraf `TimeoutError` alır
+- `cancel_all()` ve öne geçen (preempt) çağrılar çalışan komutları iptal
+  eder (ör. acil iniş devam eden goto'yu keser)
+- MAVSDK `System` nesnesi ve telemetri abonelikleri bağlandıkları loop'a
+  aittir; loop kalıcı olduğu için çağrılar arasında canlı kalır
+
+Özel (exclusive) çağrılar loop üzerinde sırayla çalışır (komut akışları:
+kalkış, iniş, goto, ...). Salt okuma çağrıları (status) `exclusive=False`
+ile gönderilir ve çalışan akışı beklemez; tek tek araç komutlarının sırası
+`command_channel.py` kanalında tutulur.
+
+İstatistikler çağrı adı başına tutulur:
+- dispatch: submit'ten coroutine'in loop'ta başlamasına kadar (aktarma maliyeti)
+- wait: sıra bekleme (önceki özel çağrının bitmesi)
+- latency: submit'ten sonucun hazır olmasına kadar toplam süre
+
+Usage:
+    nav_loop = get_navigation_loop()
+    future = nav_loop.submit(lambda: navigation.thread_safe_land(), name='land', timeout=180)
+    ok = future.result()
+    ok = nav_loop.run(lambda: navigation.thread_safe_rtl(), name='rtl', timeout=360)
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .task_stats import DurationHistogram
+    from .logger import get_logger
+except ImportError:
+    from task_stats import DurationHistogram
+    from logger import get_logger
+
+log = get_logger("navigation_loop")
+
+LOOP_START_TIMEOUT_S = 5.0
+LOOP_STOP_TIMEOUT_S = 5.0
+# Loop içi zaman aşımından sonra bekleyen tarafa tanınan ek süre
+RESULT_GRACE_S = 1.0
+
+
+class NavigationCallStats:
+    """Çağrı adı başına sayaçlar ve süre histogramları"""
+
+    __slots__ = ('calls', 'completed', 'errors', 'timeouts', 'cancelled',
+                 'dispatch', 'wait', 'latency')
+
+    def __init__(self):
+        self.calls = 0
+        self.completed = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.dispatch = DurationHistogram()
+        self.wait = DurationHistogram()
+        self.latency = DurationHistogram()
+
+    def snapshot(self) -> dict:
+        return {
+            'calls': self.calls,
+            'completed': self.completed,
+            'errors': self.errors,
+            'timeouts': self.timeouts,
+            'cancelled': self.cancelled,
+            'dispatch': self.dispatch.snapshot(),
+            'wait': self.wait.snapshot(),
+            'latency': self.latency.snapshot(),
+        }
+
+
+class NavigationEventLoop:
+    """Coroutine'leri tek bir arka plan loop thread'inde çalıştırır"""
+
+    def __init__(self, name: str = "NavigationLoop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._gate: Optional[asyncio.Lock] = None
+        self._ids = itertools.count(1)
+        self._calls_lock = threading.Lock()
+        self._active: Dict[int, Tuple[str, Future, bool]] = {}   # call_id -> (ad, future, exclusive)
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, NavigationCallStats] = {}
+
+    # ----------------------------------------
+    # YAŞAM DÖNGÜSÜ
+    # ----------------------------------------
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._loop is not None
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Çalışan loop (gerekirse başlatılır) - MAVSDK bağlantısı bu loop'ta kurulmalı"""
+        self.start()
+        return self._loop
+
+    def start(self):
+        with self._start_lock:
+            if self.is_running():
+                return
+            ready = threading.Event()
+            self._thread = threading.Thread(target=self._run_loop, args=(ready,),
+                                            name=self.name, daemon=True)
+            self._thread.start()
+            if not ready.wait(LOOP_START_TIMEOUT_S):
+                raise RuntimeError(f"{self.name} başlatılamadı")
+            log.info("%s başlatıldı", self.name)
+
+    def _run_loop(self, ready: threading.Event):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._gate = asyncio.Lock()
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            self._loop = None
+            log.info("%s durduruldu", self.name)
+
+    def stop(self, timeout: float = LOOP_STOP_TIMEOUT_S):
+        """Bekleyen çağrıları iptal et ve loop thread'ini kapat"""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            self.cancel_all()
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+            self._thread = None
+
+    # ----------------------------------------
+    # ÇAĞRILAR
+    # ----------------------------------------
+
+    def submit(self, coro_func: Callable[[], Awaitable], name: str = "call",
+               timeout: Optional[float] = None, exclusive: bool = True,
+               preempt: bool = False) -> Future:
+        """
+        `coro_func()` coroutine'ini loop'ta çalıştır; Future döndür.
+
+        Args:
+            coro_func: Coroutine üreten fonksiyon (loop thread'inde çağrılır)
+            name: İstatistik / log adı
+            timeout: Saniye; None ise sınırsız (sıra bekleme dahil)
+            exclusive: Diğer özel çağrılarla sırayla çalış
+            preempt: Başlamadan önce çalışan/bekleyen diğer özel çağrıları iptal et
+        """
+        self.start()
+        call_id = next(self._ids)
+        submitted = time.perf_counter()
+        with self._stats_lock:
+            self._call_stats(name).calls += 1
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._execute(call_id, name, coro_func, timeout, exclusive, preempt, submitted),
+            self._loop
+        )
+        with self._calls_lock:
+            self._active[call_id] = (name, future, exclusive)
+        future.add_done_callback(lambda _f: self._forget(call_id))
+        return future
+
+    def run(self, coro_func: Callable[[], Awaitable], name: str = "call",
+            timeout: Optional[float] = None, exclusive: bool = True, preempt: bool = False):
+        """Bloklayan çağrı: sonucu döndürür, hata / zaman aşımı / iptal istisnası fırlatır"""
+        if self.in_loop_thread():
+            # Loop kendi sonucunu bekleyemez
+            raise RuntimeError(f"{name}: navigation loop thread'inden bloklayan çağrı yapılamaz")
+
+        future = self.submit(coro_func, name, timeout, exclusive, preempt)
+        try:
+            return future.result(None if timeout is None else timeout + RESULT_GRACE_S)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    async def _execute(self, call_id: int, name: str, coro_func, timeout, exclusive, preempt, submitted):
+        started = time.perf_counter()
+        with self._stats_lock:
+            self._call_stats(name).dispatch.add((started - submitted) * 1000.0)
+
+        if preempt:
+            self._cancel_others(call_id)
+
+        try:
+            result = await asyncio.wait_for(self._guarded(name, coro_func, exclusive, started), timeout)
+        except asyncio.TimeoutError:
+            self._finish(name, submitted, 'timeouts')
+            log.warning("Navigation çağrısı zaman aşımı: %s (%.1f s)", name, timeout)
+            raise
+        except asyncio.CancelledError:
+            self._finish(name, submitted, 'cancelled')
+            log.info("Navigation çağrısı iptal edildi: %s", name)
+            raise
+        except Exception:
+            self._finish(name, submitted, 'errors')
+            raise
+
+        self._finish(name, submitted, 'completed')
+        return result
+
+    async def _guarded(self, name: str, coro_func, exclusive: bool, started: float):
+        if not exclusive:
+            return await coro_func()
+        async with self._gate:
+            with self._stats_lock:
+                self._call_stats(name).wait.add((time.perf_counter() - started) * 1000.0)
+            return await coro_func()
+
+    def _finish(self, name: str, submitted: float, outcome: str):
+        with self._stats_lock:
+            stats = self._call_stats(name)
+            setattr(stats, outcome, getattr(stats, outcome) + 1)
+            stats.latency.add((time.perf_counter() - submitted) * 1000.0)
+
+    def _call_stats(self, name: str) -> NavigationCallStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = NavigationCallStats()
+        return stats
+
+    def _forget(self, call_id: int):
+        with self._calls_lock:
+            self._active.pop(call_id, None)
+
+    def _cancel_others(self, call_id: int):
+        with self._calls_lock:
+            others = [(name, future) for cid, (name, future, exclusive) in self._active.items()
+                      if cid != call_id and exclusive]
+        for name, future in others:
+            if future.cancel():
+                log.info("Navigation çağrısı öne geçen komutla iptal edildi: %s", name)
+
+    def cancel_all(self) -> int:
+        """Çalışan ve bekleyen tüm çağrıları iptal et; iptal edilen sayısını döndür"""
+        with self._calls_lock:
+            futures = [future for _name, future, _exclusive in self._active.values()]
+        return sum(1 for future in futures if future.cancel())
+
+    def active_calls(self) -> List[str]:
+        with self._calls_lock:
+            return [name for name, _future, _exclusive in self._active.values()]
+
+    def get_statistics(self) -> dict:
+        """Çağrı adı başına sayaçlar ve dispatch / wait / latency histogramları"""
+        with self._stats_lock:
+            calls = {name: stats.snapshot() for name, stats in self._stats.items()}
+        return {
+            'running': self.is_running(),
+            'active': self.active_calls(),
+            'calls': calls,
+        }
+
+
+# ========================================
+# SÜREÇ GENELİ LOOP
+# ========================================
+
+_navigation_loop: Optional[NavigationEventLoop] = None
+_navigation_loop_lock = threading.Lock()
+
+
+def get_navigation_loop() -> NavigationEventLoop:
+    """Paylaşılan navigation loop'u (ilk kullanımda başlatılır)"""
+    global _navigation_loop
+    with _navigation_loop_lock:
+        if _navigation_loop is None:
+            _navigation_loop = NavigationEventLoop()
+        nav_loop = _navigation_loop
+    nav_loop.start()
+    return nav_loop
+
+
+def stop_navigation_loop():
+    global _navigation_loop
+    with _navigation_loop_lock:
+        nav_loop, _navigation_loop = _navigation_loop, None
+    if nav_loop is not None:
+        nav_loop.stop()
@@ -4,7 +4,11 @@ Otonom uçuş için DroneKit, ArduPilot SITL ve Gazebo kullanımı.
 """
 from dronekit import connect, VehicleMode, LocationGlobalRelative
 import time
-import math
+
+try:
+    from . import geodesy
+except ImportError:
+    import geodesy
 
 # Bağlantı adresi (MAVProxy tarafından yayınlanan UDP portu)
 connection_string = 'udp:127.0.0.1:14550'
@@ -44,12 +48,8 @@ def get_location_metres(original_location, dNorth, dEast):
     Metre cinsinden verilen kuzey/güney ve doğu/batı offset'leri
     coğrafi koordinatlara çevirir.
     """
-    earth_radius = 6378137.0
-    dLat = dNorth / earth_radius
-    dLon = dEast / (earth_radius * math.cos(math.radians(original_location.lat)))
-    newlat = original_location.lat + math.degrees(dLat)
-    newlon = original_location.lon + math.degrees(dLon)
-    return LocationGlobalRelative(newlat, newlon, original_location.alt)
+    newlat, newlon = geodesy.offset_ned(original_location.lat, original_location.lon, dNorth, dEast)
+    return LocationGlobalRelative(float(newlat), float(newlon), original_location.alt)
 
 
 if __name__ == "__main__":
@@ -78,7 +78,7 @@ if __name__ == "__main__":
             while True:
                 current = vehicle.location.global_relative_frame
                 # Hedefe uzaklık tahmini (metre)
-                dist = math.hypot(point.lat - current.lat, point.lon - current.lon) * 1.113195e5
+                dist = float(geodesy.haversine_distance(point.lat, point.lon, current.lat, current.lon))
                 print(f"   Hedefe uzaklık: {dist:.1f} m")
                 if dist < 1.0:
                     print("   Noktaya ulaşıldı")
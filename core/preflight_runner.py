@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+# core/preflight_runner.py
+"""
+Preflight Runner
+================
+
+Tek oturumlu, eşzamanlı preflight kontrol motoru:
+- Araca bir kez bağlanılır (kontrol başına yeni süreç / handshake yok)
+- Her telemetri akışı için tek abonelik açılır; aynı akışı kullanan
+  kontroller son örneği paylaşır
+- Tüm kontroller aynı anda başlar, her biri bittiği anda sonucu yayınlanır
+- Toplam süre ≈ bağlantı + en yavaş tek kontrol
+- `--watch` modunda abonelikler açık kalır ve her kontrolün durumu sürekli
+  (değiştiğinde hemen, değilse `--refresh` aralığıyla) yayınlanır
+
+Kontrol değerlendirmeleri (`evaluate_*`) saf fonksiyonlardır; aynı eşikler
+sürekli hazırlık izleyicisinde de kullanılabilir.
+
+Kullanım:
+    python3 core/preflight_runner.py --connection udp://:14540 --timeout 10 \\
+        --checks connection,gps,battery
+    python3 core/preflight_runner.py --watch --refresh 1.0
+
+Çıktı (stdout): her satır bir JSON nesnesi
+    {"log": "<mesaj>"}
+    {"item": "gps", "status": "passed", "details": "...", "elapsed_ms": 412.0}
+    {"done": true, "elapsed_ms": 1210.5}
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+
+try:
+    from mavsdk import System
+    MAVSDK_AVAILABLE = True
+except ImportError:
+    MAVSDK_AVAILABLE = False
+
+DEFAULT_CONNECTION_STRING = "udp://:14540"
+DEFAULT_TIMEOUT_S = 10.0
+DEFAULT_REFRESH_S = 1.0       # Watch modunda değişmeyen durumların yayın aralığı
+RECONNECT_DELAY_S = 2.0
+STREAM_RETRY_S = 2.0          # Watch modunda hata veren akışa yeniden abone olma gecikmesi
+
+CHECK_TYPES = ('connection', 'gps', 'battery', 'position', 'armed',
+               'flight_mode', 'velocity', 'attitude')
+
+
+# ========================================
+# DEĞERLENDİRMELER (örnek -> (durum, detay))
+# ========================================
+
+def fix_type_to_int(fix_type):
+    """MAVSDK FixType enum'unu sayıya çevir (0=yok, 2=2D, 3=3D, 4+=DGPS/RTK)"""
+    if fix_type is None:
+        return 0
+    if isinstance(fix_type, int):
+        return fix_type
+    value = getattr(fix_type, 'value', None)
+    if isinstance(value, int):
+        return value
+    name = str(fix_type).upper()
+    if 'RTK' in name or 'DGPS' in name:
+        return 4
+    if 'FIX_3D' in name or '3D' in name:
+        return 3
+    if 'FIX_2D' in name or '2D' in name:
+        return 2
+    return 0
+
+
+def evaluate_gps(gps):
+    satellites = gps.num_satellites
+    fix_type = fix_type_to_int(gps.fix_type)
+
+    if fix_type >= 3 and satellites >= 6:
+        return "passed", f"GPS OK - {satellites} uydu, 3D fix"
+    elif fix_type >= 2:
+        return "warning", f"GPS zayıf - {satellites} uydu, {fix_type}D fix"
+    else:
+        return "failed", f"GPS yok - {satellites} uydu, fix yok"
+
+
+def evaluate_battery(battery):
+    percent = battery.remaining_percent
+    voltage = battery.voltage_v
+
+    if percent >= 60:
+        return "passed", f"Batarya iyi - %{percent:.1f}, {voltage:.1f}V"
+    elif percent >= 30:
+        return "warning", f"Batarya orta - %{percent:.1f}, {voltage:.1f}V"
+    else:
+        return "failed", f"Batarya düşük - %{percent:.1f}, {voltage:.1f}V"
+
+
+def evaluate_position(pos):
+    lat = pos.latitude_deg
+    lon = pos.longitude_deg
+    alt = pos.relative_altitude_m
+
+    if abs(lat) < 0.0001 and abs(lon) < 0.0001:
+        return "failed", "Geçersiz pozisyon (0,0)"
+
+    return "passed", f"Pozisyon OK - {lat:.6f}, {lon:.6f}, {alt:.1f}m"
+
+
+def evaluate_armed(armed):
+    if armed:
+        return "warning", "Motorlar ARM'lı - DİKKAT!"
+    else:
+        return "passed", "Motorlar DISARM - Güvenli"
+
+
+def evaluate_flight_mode(mode):
+    mode_str = str(mode)
+
+    if "MANUAL" in mode_str.upper() or "STABILIZE" in mode_str.upper():
+        return "passed", f"Güvenli mod: {mode_str}"
+    elif "AUTO" in mode_str.upper() or "GUIDED" in mode_str.upper():
+        return "warning", f"Otomatik mod: {mode_str}"
+    else:
+        return "warning", f"Bilinmeyen mod: {mode_str}"
+
+
+def evaluate_velocity(vel):
+    speed = math.sqrt(vel.north_m_s**2 + vel.east_m_s**2)
+    speed_kmh = speed * 3.6
+
+    if speed_kmh > 5:
+        return "warning", f"Yüksek hız: {speed_kmh:.1f} km/h"
+    else:
+        return "passed", f"Hız normal: {speed_kmh:.1f} km/h"
+
+
+def evaluate_attitude(att):
+    roll = abs(att.roll_deg)
+    pitch = abs(att.pitch_deg)
+
+    if roll > 45 or pitch > 45:
+        return "warning", f"Yüksek açı - Roll: {roll:.1f}°, Pitch: {pitch:.1f}°"
+    else:
+        return "passed", f"Açı normal - Roll: {roll:.1f}°, Pitch: {pitch:.1f}°"
+
+
+# check_type -> (telemetri akışı, değerlendirici, veri yoksa durum, veri yok mesajı, hata öneki)
+TELEMETRY_CHECKS = {
+    'gps': ('gps_info', evaluate_gps, "failed", "GPS verisi yok", "GPS kontrolü hatası"),
+    'battery': ('battery', evaluate_battery, "failed", "Batarya verisi yok", "Batarya kontrolü hatası"),
+    'position': ('position', evaluate_position, "failed", "Pozisyon verisi yok", "Pozisyon kontrolü hatası"),
+    'armed': ('armed', evaluate_armed, "failed", "ARM durumu alınamadı", "ARM kontrolü hatası"),
+    'flight_mode': ('flight_mode', evaluate_flight_mode, "failed", "Uçuş modu alınamadı", "Uçuş modu kontrolü hatası"),
+    'velocity': ('velocity_ned', evaluate_velocity, "warning", "Hız verisi yok", "Hız kontrolü hatası"),
+    'attitude': ('attitude_euler', evaluate_attitude, "warning", "Açı verisi yok", "Açı kontrolü hatası"),
+}
+
+
+# ========================================
+# PAYLAŞILAN TELEMETRİ
+# ========================================
+
+class TelemetryCache:
+    """
+    Akış başına tek kalıcı abonelik; son örnek ve ilk örnek bekleme.
+
+    `retry_delay` verilirse (watch modu) hata veren ya da biten akışa bu
+    gecikmeyle yeniden abone olunur; hata sayısı `errors`'ta, akış yeniden
+    örnek verene kadar son hata `down`'da tutulur ve `on_error` çağrılır.
+    Verilmezse (tek seferlik kontrol) akış hatası task'ı bitirir.
+    """
+
+    def __init__(self, telemetry, on_sample=None, on_error=None, retry_delay=None):
+        self.telemetry = telemetry
+        self.on_sample = on_sample
+        self.on_error = on_error
+        self.retry_delay = retry_delay
+        self.latest = {}
+        self.sample_times = {}
+        self.errors = {}          # akış -> hata sayısı
+        self.down = {}            # akış -> son hata (akış yeniden örnek verene kadar)
+        self._ready = {}
+        self._tasks = {}
+
+    def subscribe(self, stream_name):
+        """Aboneliği başlat (zaten açıksa bir şey yapmaz)"""
+        if stream_name in self._tasks:
+            return
+        self._ready[stream_name] = asyncio.Event()
+        self._tasks[stream_name] = asyncio.ensure_future(self._consume(stream_name))
+
+    async def _consume(self, stream_name):
+        while True:
+            try:
+                async for sample in getattr(self.telemetry, stream_name)():
+                    self.down.pop(stream_name, None)
+                    self.latest[stream_name] = sample
+                    self.sample_times[stream_name] = time.monotonic()
+                    self._ready[stream_name].set()
+                    if self.on_sample is not None:
+                        self.on_sample(stream_name, sample)
+                error = "Stream bitti"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.retry_delay is None:
+                    raise
+                error = str(e) or type(e).__name__
+            if self.retry_delay is None:
+                return
+
+            count = self.errors[stream_name] = self.errors.get(stream_name, 0) + 1
+            self.down[stream_name] = error
+            if self.on_error is not None:
+                self.on_error(stream_name, error, count)
+            await asyncio.sleep(self.retry_delay)
+
+    async def first(self, stream_name, timeout):
+        """İlk (veya son) örneği döndür; süre aşılırsa asyncio.TimeoutError"""
+        self.subscribe(stream_name)
+        task = self._tasks[stream_name]
+        ready = asyncio.ensure_future(self._ready[stream_name].wait())
+        try:
+            done, _ = await asyncio.wait({ready, task}, timeout=timeout,
+                                         return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            ready.cancel()
+
+        if stream_name in self.latest:
+            return self.latest[stream_name]
+        if task in done:
+            # Akış örnek vermeden bitti veya hata verdi
+            error = task.exception() if not task.cancelled() else None
+            raise RuntimeError(str(error) if error else "Stream bitti")
+        raise asyncio.TimeoutError()
+
+    async def close(self):
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+
+
+# ========================================
+# OTURUM
+# ========================================
+
+class PreflightSession:
+    """Tek bağlantı üzerinde tüm preflight kontrollerini eşzamanlı çalıştırır"""
+
+    def __init__(self, connection_string=DEFAULT_CONNECTION_STRING, timeout=DEFAULT_TIMEOUT_S):
+        self.connection_string = connection_string
+        self.timeout = timeout
+        self.system = None
+        self.cache = None
+
+    async def connect(self):
+        """MAVSDK bağlantısı - bağlanana kadar bekler"""
+        if not MAVSDK_AVAILABLE:
+            raise Exception("MAVSDK kütüphanesi mevcut değil")
+
+        system = System()
+        await system.connect(system_address=self.connection_string)
+
+        async for state in system.core.connection_state():
+            if state.is_connected:
+                break
+
+        self.system = system
+        self.cache = TelemetryCache(system.telemetry)
+        return system
+
+    async def run_check(self, check_type):
+        """Tek telemetri kontrolü (bağlantı kurulmuş olmalı)"""
+        spec = TELEMETRY_CHECKS.get(check_type)
+        if spec is None:
+            return "failed", f"Bilinmeyen check: {check_type}"
+
+        stream_name, evaluate, missing_status, missing_message, error_prefix = spec
+        try:
+            sample = await self.cache.first(stream_name, self.timeout)
+        except asyncio.TimeoutError:
+            return missing_status, f"{missing_message}: Timeout"
+        except Exception as e:
+            return missing_status, f"{missing_message}: {str(e)}"
+
+        try:
+            return evaluate(sample)
+        except Exception as e:
+            return "failed", f"{error_prefix}: {str(e)}"
+
+    async def run(self, check_types, emit):
+        """
+        Kontrolleri çalıştır, her sonucu bittiği anda `emit` et.
+
+        Bağlantı bir kez kurulur; kurulamazsa tüm kontroller aynı hata ile
+        başarısız sayılır.
+        """
+        started = time.monotonic()
+
+        def elapsed_ms():
+            return round((time.monotonic() - started) * 1000.0, 1)
+
+        def emit_item(check_type, status, details):
+            emit({'item': check_type, 'status': status, 'details': details,
+                  'elapsed_ms': elapsed_ms()})
+
+        emit({'log': f"Bağlanılıyor: {self.connection_string}"})
+        try:
+            await asyncio.wait_for(self.connect(), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            error = f"Bağlantı zaman aşımı: {self.timeout} saniye"
+        except Exception as e:
+            error = f"Bağlantı hatası: {str(e)}"
+        else:
+            error = None
+
+        if error:
+            for check_type in check_types:
+                emit_item(check_type, "failed", error)
+            emit({'done': True, 'elapsed_ms': elapsed_ms()})
+            return
+
+        if 'connection' in check_types:
+            emit_item('connection', "passed", "MAVSDK bağlantısı OK")
+
+        # Tüm abonelikleri önceden aç - kontroller aynı anda veri beklesin
+        telemetry_checks = [c for c in check_types if c != 'connection']
+        for check_type in telemetry_checks:
+            if check_type in TELEMETRY_CHECKS:
+                self.cache.subscribe(TELEMETRY_CHECKS[check_type][0])
+
+        async def run_and_emit(check_type):
+            status, details = await self.run_check(check_type)
+            emit_item(check_type, status, details)
+
+        try:
+            await asyncio.gather(*(run_and_emit(c) for c in telemetry_checks))
+        finally:
+            await self.cache.close()
+
+        emit({'done': True, 'elapsed_ms': elapsed_ms()})
+
+    async def watch(self, check_types, emit, refresh_s=DEFAULT_REFRESH_S):
+        """
+        Sürekli hazırlık izleme: abonelikler açık kalır, her örnekte ilgili
+        kontroller değerlendirilir. Durum değiştiğinde hemen, değişmediyse en
+        fazla `refresh_s` aralıkla yayınlanır. Bağlantı kurulana kadar yeniden denenir.
+        """
+        last_emitted = {}
+
+        def publish(check_type, status, details, force=False):
+            now = time.monotonic()
+            previous = last_emitted.get(check_type)
+            if not force and previous and previous[0] == status and now - previous[1] < refresh_s:
+                return
+            last_emitted[check_type] = (status, now)
+            emit({'item': check_type, 'status': status, 'details': details})
+
+        by_stream = {}
+        for check_type in check_types:
+            if check_type in TELEMETRY_CHECKS:
+                by_stream.setdefault(TELEMETRY_CHECKS[check_type][0], []).append(check_type)
+
+        def on_sample(stream_name, sample):
+            for check_type in by_stream.get(stream_name, ()):
+                evaluate = TELEMETRY_CHECKS[check_type][1]
+                error_prefix = TELEMETRY_CHECKS[check_type][4]
+                try:
+                    status, details = evaluate(sample)
+                except Exception as e:
+                    status, details = "failed", f"{error_prefix}: {str(e)}"
+                publish(check_type, status, details)
+
+        while self.system is None:
+            try:
+                emit({'log': f"Bağlanılıyor: {self.connection_string}"})
+                await self.connect()
+            except Exception as e:
+                if 'connection' in check_types:
+                    publish('connection', "failed", f"Bağlantı hatası: {str(e)}", force=True)
+                await asyncio.sleep(RECONNECT_DELAY_S)
+
+        def publish_stream_down(stream_name, force=False):
+            error = self.cache.down.get(stream_name)
+            if error is None:
+                return
+            count = self.cache.errors.get(stream_name, 0)
+            for check_type in by_stream.get(stream_name, ()):
+                missing_message = TELEMETRY_CHECKS[check_type][3]
+                publish(check_type, "failed",
+                        f"{missing_message}: akış hatası ({error}, {count}. hata)", force=force)
+
+        def on_stream_error(stream_name, error, count):
+            emit({'log': f"Telemetri akışı '{stream_name}' hatası ({count}. hata): {error} - "
+                         f"{STREAM_RETRY_S:g} sn sonra yeniden abone olunuyor"})
+            publish_stream_down(stream_name, force=True)
+
+        # MAVSDK kopan bağlantıyı kendisi yeniden kurar; akışlar açık kalır.
+        # Bağlantı yokken örnek gelmez, bayatlık izleyici tarafında yakalanır.
+        # Hata veren akışa yeniden abone olunur; akış kapalıyken ilgili
+        # kontroller "failed" olarak yayınlanır.
+        self.cache.on_sample = on_sample
+        self.cache.on_error = on_stream_error
+        self.cache.retry_delay = STREAM_RETRY_S
+        for stream_name in by_stream:
+            self.cache.subscribe(stream_name)
+
+        # connection_state yalnızca değişimde örnek verir; son durum periyodik
+        # olarak yeniden yayınlanır ki izleyici tarafında bayatlamasın
+        connected = [True]
+
+        def publish_connection(force=False):
+            if 'connection' not in check_types:
+                return
+            if connected[0]:
+                publish('connection', "passed", "MAVSDK bağlantısı OK", force=force)
+            else:
+                publish('connection', "failed", "Bağlantı yok", force=force)
+
+        async def refresh_states():
+            while True:
+                publish_connection()
+                for stream_name in list(self.cache.down):
+                    publish_stream_down(stream_name)
+                await asyncio.sleep(refresh_s)
+
+        refresher = asyncio.ensure_future(refresh_states())
+        try:
+            while True:
+                try:
+                    async for state in self.system.core.connection_state():
+                        changed = connected[0] != state.is_connected
+                        connected[0] = state.is_connected
+                        publish_connection(force=changed)
+                except Exception as e:
+                    emit({'log': f"Bağlantı durumu akışı hatası: {str(e)}"})
+                await asyncio.sleep(RECONNECT_DELAY_S)
+        finally:
+            refresher.cancel()
+            await self.cache.close()
+
+def emit_json(message):
+    """Tek JSON satırı yaz"""
+    print(json.dumps(message), flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tek oturumlu eşzamanlı preflight kontrolü")
+    parser.add_argument('--connection', default=DEFAULT_CONNECTION_STRING,
+                        help="MAVSDK bağlantı adresi")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT_S,
+                        help="Bağlantı ve kontrol başına süre sınırı (s)")
+    parser.add_argument('--checks', default=','.join(CHECK_TYPES),
+                        help="Virgülle ayrılmış kontrol listesi")
+    parser.add_argument('--watch', action='store_true',
+                        help="Sürekli izleme (hazırlık servisi)")
+    parser.add_argument('--refresh', type=float, default=DEFAULT_REFRESH_S,
+                        help="Watch modunda değişmeyen durumların yayın aralığı (s)")
+    args = parser.parse_args(argv)
+
+    check_types = [c.strip() for c in args.checks.split(',') if c.strip()]
+    session = PreflightSession(args.connection, args.timeout)
+    try:
+        if args.watch:
+            asyncio.run(session.watch(check_types, emit_json, args.refresh))
+        else:
+            asyncio.run(session.run(check_types, emit_json))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        emit_json({'log': f"Runner hatası: {str(e)}"})
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
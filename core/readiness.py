@@ -0,0 +1,341 @@
+# core/readiness.py
+"""
+Sürekli Uçuş Hazırlığı İzleyicisi
+=================================
+
+Kalkış kapısının (takeoff gate) anında cevap verebilmesi için preflight
+öğelerinin canlı durumunu arka planda tutar:
+- `preflight_runner.py --watch` subprocess'i telemetri akışlarını açık tutar
+  ve her öğenin durumunu değiştiğinde / periyodik olarak yayınlar
+- `ReadinessState` öğe başına son durumu, detayı ve zaman damgasını saklar
+- Her öğenin bir yaş sınırı vardır; sınırı aşan sonuç "bayat" sayılır ve
+  kritik öğelerde kalkışı engeller
+- `gate()` sabit sayıda kritik öğeye bakar; kontrol tekrar çalıştırılmaz
+- Runner beklenmedik şekilde biterse artan beklemeyle yeniden başlatılır;
+  bu sırada `is_down()` True döner ve `on_status` ile bildirilir
+
+Usage:
+    service = ReadinessService()
+    service.on_status = lambda alive, message: print(message)
+    service.start("udp://:14540")
+    ready, blocking = service.state.gate()
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from threading import Thread
+
+try:
+    from .logger import get_logger
+    from .mavlink_hub import resolve_endpoint
+except ImportError:
+    from logger import get_logger
+    from mavlink_hub import resolve_endpoint
+
+log = get_logger("readiness")
+
+PREFLIGHT_RUNNER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'preflight_runner.py')
+READINESS_REFRESH_S = 1.0     # Runner'ın değişmeyen durumları yeniden yayın aralığı
+SERVICE_STOP_TIMEOUT_S = 3.0
+RESTART_DELAY_S = 1.0         # Runner bittiğinde ilk yeniden başlatma beklemesi
+RESTART_MAX_DELAY_S = 30.0    # Art arda hatalarda bekleme bu sınıra kadar ikiye katlanır
+STABLE_RUN_S = 30.0           # Bu süreden uzun çalışan runner'dan sonra bekleme başa döner
+
+# check_type -> (görünen ad, kritik mi, yaş sınırı (s))
+READINESS_ITEMS = {
+    'connection': ("Bağlantı", True, 5.0),
+    'gps': ("GPS", True, 5.0),
+    'battery': ("Batarya", True, 10.0),
+    'position': ("Pozisyon", True, 5.0),
+    'armed': ("ARM Durumu", True, 5.0),
+    'flight_mode': ("Uçuş Modu", False, 10.0),
+    'velocity': ("Hız", False, 5.0),
+    'attitude': ("Açı", False, 5.0),
+}
+
+
+class ReadinessState:
+    """Öğe başına son preflight durumu (thread-safe)"""
+
+    def __init__(self, items=READINESS_ITEMS):
+        self.items = dict(items)
+        self.critical_items = tuple(k for k, (_, critical, _) in self.items.items() if critical)
+        self._lock = threading.Lock()
+        self._entries = {}        # check_type -> (status, details, monotonic zaman)
+        self.started_at = None
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self.started_at = time.monotonic()
+
+    def update(self, check_type, status, details, timestamp=None):
+        if check_type not in self.items:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._lock:
+            self._entries[check_type] = (status, details, timestamp)
+
+    def item_state(self, check_type, now=None):
+        """(durum, detay, yaş) - sonuç yoksa durum "pending", yaş sınırı aşıldıysa "stale" """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(check_type)
+        if entry is None:
+            return "pending", "Henüz veri yok", None
+
+        status, details, timestamp = entry
+        age = now - timestamp
+        if age > self.items[check_type][2]:
+            return "stale", f"{details} ({age:.0f} sn önce)", age
+        return status, details, age
+
+    def gate(self, now=None):
+        """
+        Kalkış kapısı: (hazır mı, engelleyen öğeler).
+
+        Kritik öğelerden biri başarısız, bayat veya henüz gelmemişse kalkış
+        engellenir; uyarılar engellemez.
+        """
+        if now is None:
+            now = time.monotonic()
+        blocking = []
+        for check_type in self.critical_items:
+            status, details, _ = self.item_state(check_type, now)
+            if status not in ("passed", "warning"):
+                blocking.append((self.items[check_type][0], status, details))
+        return not blocking, blocking
+
+    def summary(self, now=None):
+        """Öğe bazında durum sözlüğü ve genel hazırlık"""
+        if now is None:
+            now = time.monotonic()
+        items = {}
+        warnings = 0
+        for check_type, (name, critical, _) in self.items.items():
+            status, details, age = self.item_state(check_type, now)
+            if status == "warning":
+                warnings += 1
+            items[check_type] = {
+                'name': name,
+                'critical': critical,
+                'status': status,
+                'details': details,
+                'age_s': age,
+            }
+        ready, blocking = self.gate(now)
+        return {
+            'ready': ready,
+            'blocking': blocking,
+            'warnings': warnings,
+            'items': items,
+        }
+
+
+class ReadinessService:
+    """
+    preflight_runner --watch subprocess'ini yöneten arka plan servisi.
+
+    `on_status(alive, message)` runner düştüğünde ve yeniden başladığında
+    okuyucu / zamanlayıcı thread'inden çağrılır.
+    """
+
+    def __init__(self, refresh_s=READINESS_REFRESH_S):
+        self.state = ReadinessState()
+        self.refresh_s = refresh_s
+        self.running = False
+        self.subprocess_proc = None
+        self.connection_string = "udp://:14540"
+        self.on_status = None
+
+        # Yeniden başlatma durumu
+        self.restart_count = 0
+        self.down_since = None        # Runner düştüğü an (monotonic); çalışıyorsa None
+        self.down_reason = None
+        self.last_stderr = None
+        self._restart_delay = RESTART_DELAY_S
+        self._restart_timer = None
+        self._spawned_at = None
+        self._lock = threading.Lock()
+
+    def is_alive(self):
+        return self.running and self.subprocess_proc is not None and self.subprocess_proc.poll() is None
+
+    def is_down(self):
+        """Servis açık ama runner çalışmıyor: canlı kalkış kapısı devre dışı"""
+        return self.running and not self.is_alive()
+
+    def start(self, connection_string="udp://:14540"):
+        """Hazırlık izleyicisini başlat"""
+        with self._lock:
+            if self.running:
+                return False
+
+            self.connection_string = connection_string
+            self.state.reset()
+            self.restart_count = 0
+            self.down_since = None
+            self.down_reason = None
+            self._restart_delay = RESTART_DELAY_S
+            self.running = True
+
+            try:
+                self._spawn()
+            except Exception as e:
+                self.running = False
+                self.subprocess_proc = None
+                log.error("Hazırlık izleyicisi başlatılamadı: %s", e)
+                return False
+
+        log.info("Hazırlık izleyicisi başlatıldı (%s)", connection_string)
+        return True
+
+    def _spawn(self):
+        """Runner subprocess'ini ve okuyucularını başlat (_lock altında)"""
+        proc = subprocess.Popen([
+            sys.executable, '-u', PREFLIGHT_RUNNER_SCRIPT,
+            '--watch',
+            '--connection', resolve_endpoint('readiness', self.connection_string),
+            '--refresh', str(self.refresh_s),
+            '--checks', ','.join(self.state.items),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+        )
+        self.subprocess_proc = proc
+        self._spawned_at = time.monotonic()
+
+        Thread(target=self._read_output, args=(proc,), daemon=True).start()
+        Thread(target=self._read_stderr, args=(proc,), daemon=True).start()
+
+    def _notify(self, alive, message):
+        if self.on_status is None:
+            return
+        try:
+            self.on_status(alive, message)
+        except Exception as e:
+            log.error("Hazırlık izleyicisi durum callback hatası: %s", e)
+
+    def _runner_exited(self, proc):
+        """Runner beklenmedik şekilde bitti: kapıyı düşmüş say, yeniden başlatmayı planla"""
+        try:
+            return_code = proc.wait(timeout=SERVICE_STOP_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            return_code = None
+        reason = f"çıkış kodu {return_code}"
+        if self.last_stderr:
+            reason += f": {self.last_stderr}"
+        self._schedule_restart(reason)
+
+    def _schedule_restart(self, reason):
+        with self._lock:
+            if not self.running:
+                return
+            # Uzun süre sorunsuz çalıştıysa bekleme başa döner
+            if self._spawned_at is not None and time.monotonic() - self._spawned_at > STABLE_RUN_S:
+                self._restart_delay = RESTART_DELAY_S
+            delay = self._restart_delay
+            self._restart_delay = min(self._restart_delay * 2.0, RESTART_MAX_DELAY_S)
+            if self.down_since is None:
+                self.down_since = time.monotonic()
+            self.down_reason = reason
+
+            self._restart_timer = threading.Timer(delay, self._restart)
+            self._restart_timer.daemon = True
+            self._restart_timer.start()
+
+        log.warning("Hazırlık izleyicisi subprocess'i sonlandı (%s) - %.0f sn sonra yeniden başlatılıyor",
+                    reason, delay)
+        self._notify(False, f"Canlı hazırlık izleyicisi durdu ({reason}) - "
+                            f"{delay:.0f} sn sonra yeniden başlatılıyor")
+
+    def _restart(self):
+        with self._lock:
+            if not self.running:
+                return
+            self.restart_count += 1
+            self.last_stderr = None
+            try:
+                self._spawn()
+            except Exception as e:
+                error = e
+            else:
+                error = None
+                self.down_since = None
+                self.down_reason = None
+
+        if error is not None:
+            log.error("Hazırlık izleyicisi yeniden başlatılamadı: %s", error)
+            self._schedule_restart(f"başlatma hatası: {error}")
+            return
+
+        log.info("Hazırlık izleyicisi yeniden başlatıldı (%d. deneme)", self.restart_count)
+        self._notify(True, f"Canlı hazırlık izleyicisi yeniden başlatıldı ({self.restart_count}. deneme)")
+
+    def _read_output(self, proc):
+        """Runner JSON satırlarını oku ve duruma işle"""
+        try:
+            for line in proc.stdout:
+                if not self.running:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError:
+                    log.debug("Hazırlık izleyicisi: %s", line)
+                    continue
+
+                if 'item' in msg:
+                    self.state.update(msg['item'], msg.get('status', 'failed'), msg.get('details', ''))
+                elif 'log' in msg:
+                    log.debug("Hazırlık izleyicisi: %s", msg['log'])
+        except Exception as e:
+            log.error("Hazırlık izleyicisi okuma hatası: %s", e)
+
+        if self.running and proc is self.subprocess_proc:
+            self._runner_exited(proc)
+
+    def _read_stderr(self, proc):
+        try:
+            for line in proc.stderr:
+                if not self.running:
+                    break
+                line = line.strip()
+                if line:
+                    self.last_stderr = line
+                log.warning("Hazırlık izleyicisi stderr: %s", line)
+        except Exception as e:
+            log.error("STDERR okuma hatası: %s", e)
+
+    def stop(self):
+        """Hazırlık izleyicisini durdur"""
+        with self._lock:
+            self.running = False
+            if self._restart_timer is not None:
+                self._restart_timer.cancel()
+                self._restart_timer = None
+            self.down_since = None
+            self.down_reason = None
+
+        if self.subprocess_proc:
+            try:
+                self.subprocess_proc.terminate()
+                self.subprocess_proc.wait(timeout=SERVICE_STOP_TIMEOUT_S)
+            except Exception:
+                try:
+                    self.subprocess_proc.kill()
+                except Exception:
+                    pass
+            self.subprocess_proc = None
+
+        log.info("Hazırlık izleyicisi durduruldu")
@@ -6,10 +6,9 @@ UUID karmaşıklığı yok - Sadece basit telemetri kontrolleri
 """
 
 import sys
-import time
 import subprocess
 import json
-import tempfile
+import threading
 import os
 import math
 import asyncio
@@ -31,341 +30,15 @@ except ImportError:
     MAVSDK_AVAILABLE = False
     print("⚠️ MAVSDK kütüphanesi bulunamadı!")
 
-# ==================== BASIT SUBPROCESS RUNNER SCRIPT ====================
-
-SIMPLE_SUBPROCESS_RUNNER = '''#!/usr/bin/env python3
-"""
-Basit subprocess runner - Direkt telemetri kontrolleri
-UUID yok, sadece basit MAVSDK telemetri verileri
-"""
-
-import sys
-import json
-import asyncio
-import math
-import traceback
-
 try:
-    from mavsdk import System
-    MAVSDK_AVAILABLE = True
+    from .mavlink_hub import resolve_endpoint
 except ImportError:
-    MAVSDK_AVAILABLE = False
-
-class SimplePreflightChecker:
-    """Basit MAVSDK preflight checker - UUID yok"""
-    
-    def __init__(self, connection_string="udp://:14540", timeout=10):
-        self.connection_string = connection_string
-        self.timeout = timeout
-        self.system = None
-        
-    async def connect_simple(self):
-        """Basit MAVSDK bağlantısı - UUID kontrolü yok"""
-        if not MAVSDK_AVAILABLE:
-            raise Exception("MAVSDK kütüphanesi mevcut değil")
-        
-        self.system = System()
-        print(f"Connecting to {self.connection_string}")
-        await self.system.connect(system_address=self.connection_string)
-        
-        # Basit bağlantı bekleme - UUID yok
-        print("Waiting for connection...")
-        async for state in self.system.core.connection_state():
-            if state.is_connected:
-                print("Connected!")
-                break
-        
-        return self.system
-    
-    async def get_telemetry_simple(self, telemetry_stream, timeout=5.0):
-        """Basit telemetri verisi alma - Python 3.8+ uyumlu"""
-        try:
-            # Timeout ile async iterator kullanımı
-            async def get_first_item():
-                async for data in telemetry_stream:
-                    return data
-                raise StopAsyncIteration("Stream bitti")
-            
-            data = await asyncio.wait_for(get_first_item(), timeout=timeout)
-            return data, None
-            
-        except asyncio.TimeoutError:
-            return None, "Timeout"
-        except StopAsyncIteration:
-            return None, "Stream bitti"  
-        except Exception as e:
-            return None, str(e)
-    
-    async def check_connection(self):
-        """Basit bağlantı kontrolü"""
-        try:
-            if not MAVSDK_AVAILABLE:
-                return "failed", "MAVSDK kütüphanesi yok"
-            
-            system = await self.connect_simple()
-            
-            # Sadece bağlantı durumu - UUID yok
-            state, error = await self.get_telemetry_simple(
-                system.core.connection_state(), timeout=3.0
-            )
-            
-            if error:
-                return "failed", f"Bağlantı durumu alınamadı: {error}"
-            
-            if state and state.is_connected:
-                return "passed", "MAVSDK bağlantısı OK"
-            else:
-                return "failed", "Bağlantı yok"
-                
-        except Exception as e:
-            return "failed", f"Bağlantı hatası: {str(e)}"
-    
-    async def check_gps_simple(self):
-        """Basit GPS kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            gps, error = await self.get_telemetry_simple(
-                self.system.telemetry.gps_info(), timeout=self.timeout
-            )
-            
-            if error:
-                return "failed", f"GPS verisi yok: {error}"
-            
-            satellites = gps.num_satellites
-            fix_type = gps.fix_type
-            
-            if fix_type >= 3 and satellites >= 6:
-                return "passed", f"GPS OK - {satellites} uydu, 3D fix"
-            elif fix_type >= 2:
-                return "warning", f"GPS zayıf - {satellites} uydu, {fix_type}D fix"
-            else:
-                return "failed", f"GPS yok - {satellites} uydu, fix yok"
-            
-        except Exception as e:
-            return "failed", f"GPS kontrolü hatası: {str(e)}"
-    
-    async def check_battery_simple(self):
-        """Basit batarya kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            battery, error = await self.get_telemetry_simple(
-                self.system.telemetry.battery(), timeout=self.timeout
-            )
-            
-            if error:
-                return "failed", f"Batarya verisi yok: {error}"
-            
-            percent = battery.remaining_percent
-            voltage = battery.voltage_v
-            
-            if percent >= 60:
-                return "passed", f"Batarya iyi - %{percent:.1f}, {voltage:.1f}V"
-            elif percent >= 30:
-                return "warning", f"Batarya orta - %{percent:.1f}, {voltage:.1f}V"
-            else:
-                return "failed", f"Batarya düşük - %{percent:.1f}, {voltage:.1f}V"
-            
-        except Exception as e:
-            return "failed", f"Batarya kontrolü hatası: {str(e)}"
-    
-    async def check_position_simple(self):
-        """Basit pozisyon kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            pos, error = await self.get_telemetry_simple(
-                self.system.telemetry.position(), timeout=self.timeout
-            )
-            
-            if error:
-                return "failed", f"Pozisyon verisi yok: {error}"
-            
-            lat = pos.latitude_deg
-            lon = pos.longitude_deg
-            alt = pos.relative_altitude_m
-            
-            if abs(lat) < 0.0001 and abs(lon) < 0.0001:
-                return "failed", "Geçersiz pozisyon (0,0)"
-            
-            return "passed", f"Pozisyon OK - {lat:.6f}, {lon:.6f}, {alt:.1f}m"
-            
-        except Exception as e:
-            return "failed", f"Pozisyon kontrolü hatası: {str(e)}"
-    
-    async def check_armed_simple(self):
-        """Basit ARM durumu kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            armed, error = await self.get_telemetry_simple(
-                self.system.telemetry.armed(), timeout=self.timeout
-            )
-            
-            if error:
-                return "failed", f"ARM durumu alınamadı: {error}"
-            
-            if armed:
-                return "warning", "Motorlar ARM'lı - DİKKAT!"
-            else:
-                return "passed", "Motorlar DISARM - Güvenli"
-            
-        except Exception as e:
-            return "failed", f"ARM kontrolü hatası: {str(e)}"
-    
-    async def check_flight_mode_simple(self):
-        """Basit uçuş modu kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            mode, error = await self.get_telemetry_simple(
-                self.system.telemetry.flight_mode(), timeout=self.timeout
-            )
-            
-            if error:
-                return "failed", f"Uçuş modu alınamadı: {error}"
-            
-            mode_str = str(mode)
-            
-            # Basit mod kontrolü
-            if "MANUAL" in mode_str.upper() or "STABILIZE" in mode_str.upper():
-                return "passed", f"Güvenli mod: {mode_str}"
-            elif "AUTO" in mode_str.upper() or "GUIDED" in mode_str.upper():
-                return "warning", f"Otomatik mod: {mode_str}"
-            else:
-                return "warning", f"Bilinmeyen mod: {mode_str}"
-            
-        except Exception as e:
-            return "failed", f"Uçuş modu kontrolü hatası: {str(e)}"
-    
-    async def check_velocity_simple(self):
-        """Basit hız kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            vel, error = await self.get_telemetry_simple(
-                self.system.telemetry.velocity_ned(), timeout=self.timeout
-            )
-            
-            if error:
-                return "warning", f"Hız verisi yok: {error}"
-            
-            speed = math.sqrt(vel.north_m_s**2 + vel.east_m_s**2)
-            speed_kmh = speed * 3.6
-            
-            if speed_kmh > 5:
-                return "warning", f"Yüksek hız: {speed_kmh:.1f} km/h"
-            else:
-                return "passed", f"Hız normal: {speed_kmh:.1f} km/h"
-            
-        except Exception as e:
-            return "failed", f"Hız kontrolü hatası: {str(e)}"
-    
-    async def check_attitude_simple(self):
-        """Basit açı kontrolü"""
-        try:
-            if not self.system:
-                await self.connect_simple()
-            
-            att, error = await self.get_telemetry_simple(
-                self.system.telemetry.attitude_euler(), timeout=self.timeout
-            )
-            
-            if error:
-                return "warning", f"Açı verisi yok: {error}"
-            
-            roll = abs(att.roll_deg)
-            pitch = abs(att.pitch_deg)
-            
-            if roll > 45 or pitch > 45:
-                return "warning", f"Yüksek açı - Roll: {roll:.1f}°, Pitch: {pitch:.1f}°"
-            else:
-                return "passed", f"Açı normal - Roll: {roll:.1f}°, Pitch: {pitch:.1f}°"
-            
-        except Exception as e:
-            return "failed", f"Açı kontrolü hatası: {str(e)}"
+    from mavlink_hub import resolve_endpoint
 
-async def run_simple_check(params):
-    """Basit preflight check runner"""
-    try:
-        check_type = params.get('check_type')
-        connection_string = params.get('connection_string', 'udp://:14540')
-        timeout = params.get('timeout', 10)
-        
-        checker = SimplePreflightChecker(connection_string, timeout)
-        
-        # Basit check fonksiyonları
-        check_functions = {
-            'connection': checker.check_connection,
-            'gps': checker.check_gps_simple,
-            'battery': checker.check_battery_simple,
-            'position': checker.check_position_simple,
-            'armed': checker.check_armed_simple,
-            'flight_mode': checker.check_flight_mode_simple,
-            'velocity': checker.check_velocity_simple,
-            'attitude': checker.check_attitude_simple
-        }
-        
-        if check_type not in check_functions:
-            return {
-                'status': 'failed',
-                'details': f'Bilinmeyen check: {check_type}'
-            }
-        
-        status, details = await asyncio.wait_for(
-            check_functions[check_type](), 
-            timeout=timeout + 5
-        )
-        
-        return {
-            'status': status,
-            'details': details
-        }
-        
-    except asyncio.TimeoutError:
-        return {
-            'status': 'failed',
-            'details': f'Timeout: {timeout + 5} saniye'
-        }
-    except Exception as e:
-        return {
-            'status': 'failed',
-            'details': f'Hata: {str(e)}'
-        }
+# ==================== PREFLIGHT RUNNER ====================
 
-def main():
-    """Subprocess entry point"""
-    try:
-        if len(sys.argv) != 2:
-            print("Usage: python runner.py <params_file>")
-            sys.exit(1)
-        
-        params_file = sys.argv[1]
-        
-        with open(params_file, 'r') as f:
-            params = json.load(f)
-        
-        result = asyncio.run(run_simple_check(params))
-        print(json.dumps(result))
-        
-    except Exception as e:
-        error_result = {
-            'status': 'failed',
-            'details': f'Runner hatası: {str(e)}'
-        }
-        print(json.dumps(error_result))
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
+# Tek oturumlu, eşzamanlı preflight motoru (core/preflight_runner.py)
+PREFLIGHT_RUNNER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'preflight_runner.py')
 
 # ==================== PREFLIGHT CHECK ITEMS ====================
 
@@ -465,7 +138,7 @@ class AnimatedStatusIcon(QLabel):
 # ==================== WORKER THREAD ====================
 
 class SimplePreflightWorker(QThread):
-    """Basit subprocess worker"""
+    """Preflight runner sürecini çalıştırır, sonuçları bittikçe iletir"""
     item_started = pyqtSignal(int)
     item_completed = pyqtSignal(int, str, str, str)
     all_completed = pyqtSignal()
@@ -477,91 +150,87 @@ class SimplePreflightWorker(QThread):
         self.connection_string = connection_string or "udp://:14540"
         self.timeout = timeout
         self.should_stop = False
+        self.process = None
         
     def run(self):
-        """Ana thread - basit subprocess'ler çalıştır"""
-        for i, item in enumerate(self.check_items):
-            if self.should_stop:
-                break
-                
+        """Tek runner süreci - tüm kontroller aynı bağlantı üzerinde eşzamanlı"""
+        indices = {item.check_type: i for i, item in enumerate(self.check_items)}
+        pending = set(indices)
+        
+        # Tüm kontroller aynı anda başlar
+        for i in range(len(self.check_items)):
             self.item_started.emit(i)
-            
-            try:
-                check_params = {
-                    'check_type': item.check_type,
-                    'connection_string': self.connection_string,
-                    'timeout': self.timeout
-                }
-                
-                self.log_message.emit(f"🔄 {datetime.now().strftime('%H:%M:%S')} - {item.name} kontrol ediliyor...")
-                
-                status, details = self.run_simple_subprocess(check_params)
-                
-            except Exception as e:
-                status = "failed"
-                details = f"Subprocess hatası: {str(e)}"
-                self.log_message.emit(f"❌ Hata: {e}")
-            
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.item_completed.emit(i, status, details, timestamp)
-            
-            time.sleep(0.3)  # Daha hızlı
-            
-        if not self.should_stop:
-            self.all_completed.emit()
-    
-    def run_simple_subprocess(self, params):
-        """Basit subprocess çalıştır"""
+        self.log_message.emit(
+            f"🔄 {datetime.now().strftime('%H:%M:%S')} - {len(self.check_items)} kontrol eşzamanlı başlatıldı"
+        )
+        
+        cmd = [
+            sys.executable, '-u', PREFLIGHT_RUNNER_SCRIPT,
+            '--connection', self.connection_string,
+            '--timeout', str(self.timeout),
+            '--checks', ','.join(item.check_type for item in self.check_items)
+        ]
+        
+        watchdog = None
         try:
-            # Geçici runner dosyası
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as runner_file:
-                runner_file.write(SIMPLE_SUBPROCESS_RUNNER)
-                runner_path = runner_file.name
+            self.process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                cwd=os.path.dirname(os.path.abspath(__file__))
+            )
             
-            # Parametreler dosyası
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as params_file:
-                json.dump(params, params_file, indent=2)
-                params_path = params_file.name
+            # Bağlantı + en yavaş kontrol için üst süre sınırı
+            watchdog = threading.Timer(2 * self.timeout + 5, self.process.kill)
+            watchdog.daemon = True
+            watchdog.start()
             
-            try:
-                # Subprocess çalıştır
-                cmd = [sys.executable, runner_path, params_path]
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout + 5,
-                    cwd=os.path.dirname(os.path.abspath(__file__))
-                )
-                
-                if result.returncode == 0:
-                    try:
-                        output_lines = result.stdout.strip().split('\n')
-                        json_result = output_lines[-1]
-                        data = json.loads(json_result)
-                        return data.get('status', 'failed'), data.get('details', 'Detay yok')
-                    except (json.JSONDecodeError, IndexError):
-                        return "failed", f"Çıktı parse edilemedi: {result.stdout[:100]}"
-                else:
-                    error_detail = result.stderr.strip() if result.stderr else "Bilinmeyen hata"
-                    return "failed", f"Subprocess hatası: {error_detail[:200]}"
-                    
-            finally:
-                # Temizlik
+            for line in iter(self.process.stdout.readline, ''):
+                if self.should_stop:
+                    break
                 try:
-                    os.unlink(runner_path)
-                    os.unlink(params_path)
-                except:
-                    pass
-                    
-        except subprocess.TimeoutExpired:
-            return "failed", f"Timeout: {self.timeout + 5} saniye"
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # mavsdk_server vb. çıktıları yok say
+                
+                if 'item' in data and data['item'] in pending:
+                    pending.discard(data['item'])
+                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    self.item_completed.emit(
+                        indices[data['item']],
+                        data.get('status', 'failed'),
+                        data.get('details', 'Detay yok'),
+                        timestamp
+                    )
+                elif 'log' in data:
+                    self.log_message.emit(f"🔗 {data['log']}")
+                elif data.get('done'):
+                    self.log_message.emit(f"⏱️ Toplam süre: {data.get('elapsed_ms', 0) / 1000.0:.2f} s")
+            
+            self.process.wait()
+            
         except Exception as e:
-            return "failed", f"Subprocess hatası: {str(e)}"
+            self.log_message.emit(f"❌ Hata: {e}")
+        finally:
+            if watchdog:
+                watchdog.cancel()
+        
+        if self.should_stop:
+            return
+        
+        # Sonuç gelmeyen kontroller
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        for check_type in pending:
+            self.item_completed.emit(indices[check_type], "failed", "Sonuç alınamadı (runner hatası / timeout)", timestamp)
+        
+        self.all_completed.emit()
     
     def stop(self):
         self.should_stop = True
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
 
 # ==================== MAIN DIALOG ====================
 
@@ -1064,7 +733,8 @@ class SimplePreflightDialog(QDialog):
         self.safety_recommendation.setText("Basit telemetri kontrolleri yapılıyor...")
         
         # Worker başlat
-        self.worker = SimplePreflightWorker(check_items, connection_string, timeout)
+        # MAVLink hub açıksa runner kendi yerel ucuna bağlanır
+        self.worker = SimplePreflightWorker(check_items, resolve_endpoint('preflight', connection_string), timeout)
         self.worker.item_started.connect(self.on_item_started)
         self.worker.item_completed.connect(self.on_item_completed)
         self.worker.all_completed.connect(self.on_all_completed)
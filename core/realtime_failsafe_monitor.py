@@ -9,11 +9,12 @@ import sys
 import time
 import subprocess
 import json
-import tempfile
 import os
 import math
 import asyncio
+import threading
 import traceback
+from collections import deque
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QProgressBar, QListWidget, QListWidgetItem,
@@ -38,6 +39,18 @@ except ImportError:
 print("✅ MAVSDK kütüphanesi yüklendi")
 
 
+try:
+    from .logger import get_logger
+except ImportError:
+    from logger import get_logger
+
+try:
+    from .mavlink_hub import resolve_endpoint
+except ImportError:
+    from mavlink_hub import resolve_endpoint
+
+log = get_logger("failsafe_monitor")
+
 # pyqtgraph için güvenli import (isteğe bağlı)
 try:
     import pyqtgraph as pg
@@ -46,711 +59,165 @@ except ImportError:
     PYQTGRAPH_AVAILABLE = False
     print("⚠️ pyqtgraph kütüphanesi bulunamadı - grafikler devre dışı")
 
-# ==================== FAILSAFE SUBPROCESS RUNNER ====================
+import numpy as np
 
-FAILSAFE_SUBPROCESS_RUNNER = '''#!/usr/bin/env python3
-"""
-Failsafe subprocess runner - Sürekli telemetri izleme
-Real-time failsafe monitoring ve otomatik müdahaleler
-"""
+try:
+    from .live_chart import create_live_chart, seconds_ago
+    from .timeseries import RingTimeSeries
+except ImportError:
+    from live_chart import create_live_chart, seconds_ago
+    from timeseries import RingTimeSeries
 
-import sys
-import json
-import asyncio
-import math
-import time
-import traceback
-from datetime import datetime
+# Grafik sekmesi ayarları
+CHART_CHANNELS = ('battery_percent', 'battery_voltage', 'gps_satellites', 'gps_fix_type',
+                  'horizontal_speed', 'vertical_speed', 'roll', 'pitch', 'yaw')
+CHART_HISTORY_CAPACITY = 6000   # 10 Hz'de 10 dakika
+CHART_REFRESH_HZ = 10           # Grafik çizim hızı üst sınırı
+CHART_TIME_RANGES = {
+    "30 saniye": 30,
+    "1 dakika": 60,
+    "5 dakika": 300,
+    "10 dakika": 600,
+    "Tümü": 0           # 0 = tüm geçmiş
+}
 
+# ==================== FAILSAFE WORKER ====================
 
-try:
-    from mavsdk import System
-    from mavsdk.action import ActionError
-    from mavsdk.telemetry import FixType
-    MAVSDK_AVAILABLE = True
-except ImportError:
-    MAVSDK_AVAILABLE = False
+# Uzun ömürlü izleme süreci - stdin üzerinden kontrol komutları alır
+FAILSAFE_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'failsafe_worker.py')
+WORKER_SHUTDOWN_TIMEOUT_S = 3.0
+DISPLAY_REFRESH_MS = 100          # Ekran güncelleme aralığı
+MAX_PENDING_EVENTS = 1000         # GUI'ye aktarılmayı bekleyen olay sınırı
 
 
-class FailsafeLevel:
-    """Failsafe seviye sabitleri"""
-    NORMAL = "normal"
-    WARNING = "warning" 
-    CRITICAL = "critical"
-    EMERGENCY = "emergency"
+def snapshot_events(data):
+    """
+    Durum snapshot'ındaki olayları çıkar.
+    Stream motoru sadece seviyesi değişen tipleri olay olarak bildirir.
+    """
+    changed = data.get('changed')
+    events = []
+    for result in data.get('results', []):
+        if result['level'] != 'normal' and (changed is None or result['type'] in changed):
+            events.append((data['timestamp'], result['type'], result['level'], result['message']))
+    return events
 
-class FailsafeMonitor:
-    """Real-time failsafe monitoring engine"""
-    
-    def __init__(self, connection_string="udp://:14540", config=None):
-        self.connection_string = connection_string
-        self.system = None
-        self.config = config or self.get_default_config()
-        self.running = True
-        self.last_alert_times = {}
-        self.failsafe_history = []
-        self.current_state = {
-            'battery_level': FailsafeLevel.NORMAL,
-            'gps_level': FailsafeLevel.NORMAL,
-            'rc_level': FailsafeLevel.NORMAL,
-            'telemetry_level': FailsafeLevel.NORMAL,
-            'speed_level': FailsafeLevel.NORMAL,
-            'attitude_level': FailsafeLevel.NORMAL,
-            'altitude_level': FailsafeLevel.NORMAL,
-            'geofence_level': FailsafeLevel.NORMAL
-        }
-        
-    def get_default_config(self):
-        """Varsayılan failsafe konfigürasyonu"""
-        return {
-            'battery': {
-                'warning_percent': 50,
-                'critical_percent': 30,
-                'emergency_percent': 20,
-                'voltage_critical': 11.1
-            },
-            'gps': {
-                'warning_satellites': 7,
-                'critical_satellites': 5,
-                'emergency_satellites': 3
-            },
-            'rc': {
-                'warning_rssi': -50,
-                'critical_rssi': -70,
-                'timeout_seconds': 5
-            },
-            'speed': {
-                'warning_horizontal': 15,
-                'critical_horizontal': 25,
-                'emergency_horizontal': 35,
-                'warning_vertical': 5,
-                'critical_vertical': 10
-            },
-            'attitude': {
-                'warning_angle': 30,
-                'critical_angle': 45,
-                'emergency_angle': 60
-            },
-            'altitude': {
-                'min_safe': 2,
-                'warning_low': 1,
-                'max_safe': 120,
-                'warning_high': 100
-            },
-            'actions': {
-                'auto_rtl_enabled': True,
-                'auto_land_enabled': True,
-                'emergency_stop_enabled': True
-            }
-        }
-    
-    async def connect_to_system(self):
-        """MAVSDK sistemine bağlan"""
-        if not MAVSDK_AVAILABLE:
-            raise Exception("MAVSDK kütüphanesi mevcut değil")
-        
-        self.system = System()
-        await self.system.connect(system_address=self.connection_string)
-        
-        # Bağlantı bekleme
-        async for state in self.system.core.connection_state():
-            if state.is_connected:
-                break
-        
-        return self.system
-    
-    async def get_telemetry_data(self, telemetry_stream, timeout=2.0):
-        """Güvenli telemetri verisi alma"""
-        try:
-            async def get_first_item():
-                async for data in telemetry_stream:
-                    return data
-                raise StopAsyncIteration("Stream bitti")
-            
-            data = await asyncio.wait_for(get_first_item(), timeout=timeout)
-            return data, None
-            
-        except asyncio.TimeoutError:
-            return None, "Timeout"
-        except Exception as e:
-            return None, str(e)
-    
-    def add_event(self, event_type, level, message, action_taken=None):
-        """Failsafe olayını kaydet"""
-        event = {
-            'timestamp': datetime.now().isoformat(),
-            'type': event_type,
-            'level': level,
-            'message': message,
-            'action_taken': action_taken
-        }
-        self.failsafe_history.append(event)
-        
-        # Son 100 olayı tut
-        if len(self.failsafe_history) > 100:
-            self.failsafe_history.pop(0)
-        
-        return event
+
+class FailsafeOutputReader:
+    """
+    Worker çıktısını ayrı thread'lerde sürekli okur:
+    - Tüm satırlar geldiği anda çözülür, pipe'ta birikme olmaz
+    - Durum snapshot'larından sadece en yenisi tutulur; eskiler atlanır
+    - Atlanan snapshot'lardaki olaylar dahil her olay GUI'ye iletilir
+    - Kuyruk derinliği ve ekran gecikmesi `metrics()` ile okunur
+    """
     
-    def should_alert(self, event_type, level):
-        """Uyarı vermeli mi kontrol et (spam önleme)"""
-        now = time.time()
-        last_alert = self.last_alert_times.get(f"{event_type}_{level}", 0)
-        
-        # Seviyeye göre uyarı sıklığı
-        intervals = {
-            FailsafeLevel.WARNING: 30,    # 30 saniye
-            FailsafeLevel.CRITICAL: 15,   # 15 saniye  
-            FailsafeLevel.EMERGENCY: 5    # 5 saniye
-        }
-        
-        interval = intervals.get(level, 60)
-        
-        if now - last_alert > interval:
-            self.last_alert_times[f"{event_type}_{level}"] = now
-            return True
-        return False
+    def __init__(self, process, max_events=MAX_PENDING_EVENTS):
+        self.process = process
+        self._lock = threading.Lock()
+        self._latest = None
+        self._events = deque(maxlen=max_events)
+        
+        self.lines_read = 0
+        self.snapshots_received = 0
+        self.snapshots_skipped = 0
+        self.events_dropped = 0
+        self.max_queue_depth = 0
+        self.display_lag_ms = None
+        
+        self._threads = [
+            threading.Thread(target=self._read_stdout, name="failsafe-stdout", daemon=True),
+            threading.Thread(target=self._read_stderr, name="failsafe-stderr", daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
     
-    def safe_float(self, value, default=0.0):
-        """Güvenli float dönüşümü"""
-        try:
-            if value is None:
-                return default
-            return float(value)
-        except (ValueError, TypeError):
-            return default
-    
-    def safe_int(self, value, default=0):
-        """Güvenli int dönüşümü"""
-        try:
-            if value is None:
-                return default
-            return int(value)
-        except (ValueError, TypeError):
-            return default
-    
-    def safe_getattr(self, obj, attr_name, default=None):
-        """Güvenli attribute erişimi"""
+    def _read_stdout(self):
         try:
-            return getattr(obj, attr_name, default)
-        except (AttributeError, TypeError):
-            return default
+            for line in iter(self.process.stdout.readline, ''):
+                self._handle_line(line.strip())
+        except (OSError, ValueError):
+            pass  # Pipe kapandı
     
-    async def check_battery_failsafe(self):
-        """Batarya failsafe kontrolü"""
+    def _read_stderr(self):
         try:
-            if not self.system:
-                await self.connect_to_system()
-            
-            battery, error = await self.get_telemetry_data(
-                self.system.telemetry.battery()
-            )
-            
-            if error:
-                return {
-                    'type': 'battery',
-                    'level': FailsafeLevel.WARNING,
-                    'message': f"Batarya verisi alınamadı: {error}",
-                    'data': None
-                }
-            
-            if not battery:
-                return {
-                    'type': 'battery',
-                    'level': FailsafeLevel.WARNING,
-                    'message': "Batarya verisi None",
-                    'data': None
-                }
-            
-            # Güvenli değer alma
-            percent = self.safe_float(self.safe_getattr(battery, 'remaining_percent', 0))
-            voltage = self.safe_float(self.safe_getattr(battery, 'voltage_v', 0))
-            current = self.safe_float(self.safe_getattr(battery, 'current_a', 0))
-            
-            # Seviye belirleme
-            if percent <= self.config['battery']['emergency_percent']:
-                level = FailsafeLevel.EMERGENCY
-                message = f"KRİTİK BATARYA: %{percent:.1f} - OTOMATİK İNİŞ!"
-                action = "emergency_land"
-            elif percent <= self.config['battery']['critical_percent']:
-                level = FailsafeLevel.CRITICAL  
-                message = f"DÜŞÜK BATARYA: %{percent:.1f} - DERHAL DÖNÜN!"
-                action = "rtl_recommended"
-            elif percent <= self.config['battery']['warning_percent']:
-                level = FailsafeLevel.WARNING
-                message = f"Batarya azalıyor: %{percent:.1f}"
-                action = None
-            else:
-                level = FailsafeLevel.NORMAL
-                message = f"Batarya normal: %{percent:.1f}"
-                action = None
-            
-            # Voltaj kontrolü
-            if voltage < self.config['battery']['voltage_critical'] and level == FailsafeLevel.NORMAL:
-                level = FailsafeLevel.CRITICAL
-                message = f"DÜŞÜK VOLTAJ: {voltage:.1f}V - Kritik!"
-                action = "voltage_critical"
-            
-            self.current_state['battery_level'] = level
-            
-            return {
-                'type': 'battery',
-                'level': level,
-                'message': message,
-                'action': action,
-                'data': {
-                    'percent': percent,
-                    'voltage': voltage,
-                    'current': current
-                }
-            }
-            
-        except Exception as e:
-            return {
-                'type': 'battery',
-                'level': FailsafeLevel.WARNING,
-                'message': f"Batarya kontrolü hatası: {str(e)}",
-                'data': None
-            }
-    
-    def gps_fix_type_to_int(self, fix_type):
-        """GPS fix type enum'unu int'e çevir"""
-        try:
-            if fix_type is None:
-                return 0
-            
-            # MAVSDK fix type enum değerleri
-            if hasattr(fix_type, 'value'):
-                return fix_type.value
-            elif isinstance(fix_type, int):
-                return fix_type
-            else:
-                # String karşılaştırma
-                fix_str = str(fix_type).lower()
-                if 'no_fix' in fix_str or 'none' in fix_str:
-                    return 0
-                elif '2d' in fix_str:
-                    return 2
-                elif '3d' in fix_str:
-                    return 3
-                elif 'dgps' in fix_str or 'rtk' in fix_str:
-                    return 4
-                else:
-                    return 0
-        except:
-            return 0
+            for line in iter(self.process.stderr.readline, ''):
+                log.warning("Failsafe worker stderr: %s", line.rstrip())
+        except (OSError, ValueError):
+            pass
     
-    async def check_gps_failsafe(self):
-        """GPS failsafe kontrolü - DÜZELTİLMİŞ VERSİYON"""
+    def _handle_line(self, line):
+        if not line:
+            return
         try:
-            if not self.system:
-                await self.connect_to_system()
-            
-            # GPS info alma
-            gps, error = await self.get_telemetry_data(
-                self.system.telemetry.gps_info()
-            )
-            
-            if error:
-                return {
-                    'type': 'gps',
-                    'level': FailsafeLevel.CRITICAL,
-                    'message': f"GPS verisi alınamadı: {error}",
-                    'action': 'gps_loss',
-                    'data': None
-                }
-            
-            if not gps:
-                return {
-                    'type': 'gps',
-                    'level': FailsafeLevel.CRITICAL,
-                    'message': "GPS verisi None",
-                    'action': 'gps_loss',
-                    'data': None
-                }
-            
-            # Güvenli GPS verisi alma
-            try:
-                satellites = self.safe_int(self.safe_getattr(gps, 'num_satellites', 0))
-                fix_type_raw = self.safe_getattr(gps, 'fix_type', None)
-                fix_type = self.gps_fix_type_to_int(fix_type_raw)
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return  # JSON olmayan satırları yok say
+        
+        if 'results' in data:
+            events = snapshot_events(data)
+            with self._lock:
+                self.lines_read += 1
+                self.snapshots_received += 1
+                if self._latest is not None:
+                    self.snapshots_skipped += 1
+                self._latest = data
+                self._push_events(events)
                 
-            except Exception as e:
-                return {
-                    'type': 'gps',
-                    'level': FailsafeLevel.CRITICAL,
-                    'message': f"GPS attribute hatası: {str(e)}",
-                    'action': 'gps_loss',
-                    'data': None
-                }
-            
-            # Fix type kontrolü - DÜZELTİLMİŞ
-            if fix_type < 2:  # No fix veya invalid
-                level = FailsafeLevel.EMERGENCY
-                message = f"GPS FIX YOK - {satellites} uydu - ACİL İNİŞ!"
-                action = "emergency_land"
-            elif satellites <= self.config['gps']['emergency_satellites']:
-                level = FailsafeLevel.EMERGENCY
-                message = f"KRİTİK GPS: {satellites} uydu - Pozisyon güvenilmez!"
-                action = "stabilize_mode"
-            elif satellites <= self.config['gps']['critical_satellites']:
-                level = FailsafeLevel.CRITICAL
-                message = f"DÜŞÜK GPS: {satellites} uydu - Dikkat!"
-                action = "gps_degraded"
-            elif satellites <= self.config['gps']['warning_satellites']:
-                level = FailsafeLevel.WARNING
-                message = f"GPS zayıfladı: {satellites} uydu"
-                action = None
-            else:
-                level = FailsafeLevel.NORMAL
-                message = f"GPS normal: {satellites} uydu, {fix_type}D fix"
-                action = None
-            
-            self.current_state['gps_level'] = level
-            
-            return {
-                'type': 'gps',
-                'level': level,
-                'message': message,
-                'action': action,
-                'data': {
-                    'satellites': satellites,
-                    'fix_type': fix_type
-                }
-            }
-            
-        except Exception as e:
-            return {
-                'type': 'gps',
-                'level': FailsafeLevel.CRITICAL,
-                'message': f"GPS kontrolü hatası: {str(e)}",
-                'data': None
-            }
-    
-    async def check_speed_failsafe(self):
-        """Hız failsafe kontrolü - DÜZELTİLMİŞ VERSİYON"""
+        elif 'control' in data:
+            with self._lock:
+                self.lines_read += 1
+            if data.get('status') != 'ok':
+                log.warning("Failsafe worker komut hatası: %s", data)
+            
+        elif data.get('status') == 'error':
+            with self._lock:
+                self.lines_read += 1
+                self._push_events([(datetime.now().isoformat(), 'system', 'critical', data.get('message', 'Worker hatası'))])
+    
+    def _push_events(self, events):
+        """Kilit altında çağrılır"""
+        overflow = len(self._events) + len(events) - self._events.maxlen
+        if overflow > 0:
+            self.events_dropped += overflow
+        self._events.extend(events)
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth())
+    
+    def queue_depth(self):
+        """GUI'ye aktarılmayı bekleyen öğe sayısı"""
+        return len(self._events) + (1 if self._latest is not None else 0)
+    
+    def take(self):
+        """Bekleyen olayları ve en yeni snapshot'ı al (GUI thread)"""
+        with self._lock:
+            snapshot, self._latest = self._latest, None
+            events = list(self._events)
+            self._events.clear()
+        return snapshot, events
+    
+    def mark_displayed(self, snapshot):
+        """Gösterilen snapshot'ın üretiminden bu yana geçen süreyi kaydet"""
         try:
-            if not self.system:
-                await self.connect_to_system()
-            
-            # Velocity verisi alma
-            velocity, error = await self.get_telemetry_data(
-                self.system.telemetry.velocity_ned()
-            )
-            
-            if error:
-                return {
-                    'type': 'speed',
-                    'level': FailsafeLevel.WARNING,
-                    'message': f"Hız verisi alınamadı: {error}",
-                    'data': None
-                }
-            
-            if not velocity:
-                return {
-                    'type': 'speed',
-                    'level': FailsafeLevel.WARNING,
-                    'message': "Hız verisi None",
-                    'data': None
-                }
-            
-            # Güvenli velocity hesaplama - DÜZELTİLMİŞ
-            try:
-                north = self.safe_float(self.safe_getattr(velocity, 'north_m_s', 0.0))
-                east = self.safe_float(self.safe_getattr(velocity, 'east_m_s', 0.0))
-                down = self.safe_float(self.safe_getattr(velocity, 'down_m_s', 0.0))
-                
-                horizontal_speed = math.sqrt(north**2 + east**2)
-                vertical_speed = abs(down)
-                
-            except Exception as e:
-                return {
-                    'type': 'speed',
-                    'level': FailsafeLevel.WARNING,
-                    'message': f"Hız hesaplama hatası: {str(e)}",
-                    'data': None
-                }
-            
-            # Yatay hız kontrolü
-            if horizontal_speed > self.config['speed']['emergency_horizontal']:
-                level = FailsafeLevel.EMERGENCY
-                message = f"AŞIRI HIZ: {horizontal_speed:.1f} m/s - FREN!"
-                action = "emergency_brake"
-            elif horizontal_speed > self.config['speed']['critical_horizontal']:
-                level = FailsafeLevel.CRITICAL
-                message = f"TEHLİKELİ HIZ: {horizontal_speed:.1f} m/s"
-                action = "speed_limit"
-            elif horizontal_speed > self.config['speed']['warning_horizontal']:
-                level = FailsafeLevel.WARNING
-                message = f"Yüksek hız: {horizontal_speed:.1f} m/s"
-                action = None
-            else:
-                level = FailsafeLevel.NORMAL
-                message = f"Hız normal: {horizontal_speed:.1f} m/s"
-                action = None
-            
-            # Dikey hız kontrolü - DÜZELTİLMİŞ
-            if vertical_speed > self.config['speed'].get('critical_vertical', 10):
-                if level == FailsafeLevel.NORMAL:
-                    level = FailsafeLevel.CRITICAL
-                message += f" | Dikey: {vertical_speed:.1f} m/s TEHLİKELİ!"
-                action = "vertical_speed_limit"
-            elif vertical_speed > self.config['speed'].get('warning_vertical', 5):
-                if level == FailsafeLevel.NORMAL:
-                    level = FailsafeLevel.WARNING
-                message += f" | Dikey hız yüksek: {vertical_speed:.1f} m/s"
-            
-            self.current_state['speed_level'] = level
-            
-            return {
-                'type': 'speed',
-                'level': level,
-                'message': message,
-                'action': action,
-                'data': {
-                    'horizontal_speed': horizontal_speed,
-                    'vertical_speed': vertical_speed,
-                    'north': north,
-                    'east': east,
-                    'down': down
-                }
-            }
-            
-        except Exception as e:
-            return {
-                'type': 'speed',
-                'level': FailsafeLevel.WARNING,
-                'message': f"Hız kontrolü hatası: {str(e)}",
-                'data': None
-            }
+            produced = datetime.fromisoformat(snapshot['timestamp'])
+            self.display_lag_ms = (datetime.now() - produced).total_seconds() * 1000.0
+        except (KeyError, ValueError):
+            pass
     
-    async def check_attitude_failsafe(self):
-        """Açı failsafe kontrolü - DÜZELTİLMİŞ VERSİYON"""
-        try:
-            if not self.system:
-                await self.connect_to_system()
-            
-            attitude, error = await self.get_telemetry_data(
-                self.system.telemetry.attitude_euler()
-            )
-            
-            if error:
-                return {
-                    'type': 'attitude',
-                    'level': FailsafeLevel.WARNING,
-                    'message': f"Açı verisi alınamadı: {error}",
-                    'data': None
-                }
-            
-            if not attitude:
-                return {
-                    'type': 'attitude',
-                    'level': FailsafeLevel.WARNING,
-                    'message': "Açı verisi None",
-                    'data': None
-                }
-            
-            # Güvenli attitude hesaplama - DÜZELTİLMİŞ
-            try:
-                roll_deg = self.safe_float(self.safe_getattr(attitude, 'roll_deg', 0.0))
-                pitch_deg = self.safe_float(self.safe_getattr(attitude, 'pitch_deg', 0.0))
-                yaw_deg = self.safe_float(self.safe_getattr(attitude, 'yaw_deg', 0.0))
-                
-                roll = abs(roll_deg)
-                pitch = abs(pitch_deg)
-                yaw = yaw_deg
-                
-                max_angle = max(roll, pitch)
-                
-            except Exception as e:
-                return {
-                    'type': 'attitude',
-                    'level': FailsafeLevel.WARNING,
-                    'message': f"Açı hesaplama hatası: {str(e)}",
-                    'data': None
-                }
-            
-            if max_angle > self.config['attitude']['emergency_angle']:
-                level = FailsafeLevel.EMERGENCY
-                message = f"KONTROL KAYBI: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
-                action = "stabilize_emergency"
-            elif max_angle > self.config['attitude']['critical_angle']:
-                level = FailsafeLevel.CRITICAL
-                message = f"TEHLİKELİ EĞİM: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
-                action = "attitude_correction"
-            elif max_angle > self.config['attitude']['warning_angle']:
-                level = FailsafeLevel.WARNING
-                message = f"Yüksek eğim: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
-                action = None
-            else:
-                level = FailsafeLevel.NORMAL
-                message = f"Açı normal: Roll {roll:.1f}°, Pitch {pitch:.1f}°"
-                action = None
-            
-            self.current_state['attitude_level'] = level
-            
-            return {
-                'type': 'attitude',
-                'level': level,
-                'message': message,
-                'action': action,
-                'data': {
-                    'roll': roll,
-                    'pitch': pitch,
-                    'yaw': yaw
-                }
-            }
-            
-        except Exception as e:
+    def is_alive(self):
+        return self._threads[0].is_alive()
+    
+    def metrics(self):
+        """Okuyucu metrikleri"""
+        with self._lock:
             return {
-                'type': 'attitude',
-                'level': FailsafeLevel.WARNING,
-                'message': f"Açı kontrolü hatası: {str(e)}",
-                'data': None
+                'queue_depth': self.queue_depth(),
+                'max_queue_depth': self.max_queue_depth,
+                'display_lag_ms': self.display_lag_ms,
+                'lines_read': self.lines_read,
+                'snapshots_received': self.snapshots_received,
+                'snapshots_skipped': self.snapshots_skipped,
+                'events_dropped': self.events_dropped
             }
-    
-    async def execute_failsafe_action(self, action, level, event_type):
-        """Failsafe aksiyonunu gerçekleştir"""
-        if not self.config['actions'].get('auto_rtl_enabled', True):
-            return f"Otomatik aksiyon devre dışı: {action}"
-        
-        try:
-            if action == "emergency_land" and self.config['actions'].get('auto_land_enabled', True):
-                await self.system.action.land()
-                return "Acil iniş komutu gönderildi"
-                
-            elif action == "rtl_recommended":
-                # Sadece öneri, otomatik eylem yok
-                return "RTL önerildi (manuel)"
-                
-            elif action == "emergency_brake":
-                # Hız sınırlama modu
-                try:
-                    await self.system.action.set_maximum_speed(5.0)
-                    return "Acil fren - Hız sınırlandı"
-                except Exception:
-                    return "Acil fren komutu - Hız sınırlama desteklenmiyor"
-                
-            elif action == "stabilize_emergency":
-                # Stabilize moda geçiş
-                return "Stabilize moduna geçiş önerildi"
-                
-            elif action == "gps_loss":
-                # GPS kaybında stabilize mod
-                return "GPS kaybı - Stabilize mod önerildi"
-                
-            else:
-                return f"Bilinmeyen aksiyon: {action}"
-                
-        except Exception as e:
-            return f"Aksiyon hatası: {str(e)}"
-    
-    async def run_monitoring_cycle(self):
-        """Tek bir monitoring döngüsü"""
-        results = []
-        
-        # Tüm kontrolleri sırayla yap
-        checks = [
-            self.check_battery_failsafe(),
-            self.check_gps_failsafe(),
-            self.check_speed_failsafe(),
-            self.check_attitude_failsafe()
-        ]
-        
-        for check_coro in checks:
-            try:
-                result = await asyncio.wait_for(check_coro, timeout=3.0)
-                results.append(result)
-                
-                # Aksiyon gerekiyorsa çalıştır
-                if result.get('action') and result['level'] in [FailsafeLevel.CRITICAL, FailsafeLevel.EMERGENCY]:
-                    if self.should_alert(result['type'], result['level']):
-                        action_result = await self.execute_failsafe_action(
-                            result['action'], result['level'], result['type']
-                        )
-                        result['action_result'] = action_result
-                        
-                        # Event log'a ekle
-                        self.add_event(
-                            result['type'],
-                            result['level'], 
-                            result['message'],
-                            action_result
-                        )
-                
-            except asyncio.TimeoutError:
-                results.append({
-                    'type': 'system',
-                    'level': FailsafeLevel.WARNING,
-                    'message': 'Kontrol timeout',
-                    'data': None
-                })
-            except Exception as e:
-                results.append({
-                    'type': 'system',
-                    'level': FailsafeLevel.WARNING,
-                    'message': f'Kontrol hatası: {str(e)}',
-                    'data': None
-                })
-        
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'results': results,
-            'state': self.current_state.copy(),
-            'recent_events': self.failsafe_history[-5:]  # Son 5 olay
-        }
-
-async def run_failsafe_monitoring(params):
-    """Ana failsafe monitoring fonksiyonu"""
-    try:
-        connection_string = params.get('connection_string', 'udp://:14540')
-        config = params.get('config', {})
-        duration = params.get('duration', 60)  # Kaç saniye çalışacak
-        
-        monitor = FailsafeMonitor(connection_string, config)
-        
-        start_time = time.time()
-        
-        while time.time() - start_time < duration:
-            cycle_result = await monitor.run_monitoring_cycle()
-            
-            # Sonucu gönder
-            print(json.dumps(cycle_result))
-            sys.stdout.flush()
-            
-            # 1 saniye bekle
-            await asyncio.sleep(1.0)
-        
-        return {"status": "completed", "message": "Monitoring tamamlandı"}
-        
-    except Exception as e:
-        return {"status": "error", "message": str(e)}
-
-def main():
-    """Subprocess entry point"""
-    try:
-        if len(sys.argv) != 2:
-            print("Usage: python runner.py <params_file>")
-            sys.exit(1)
-        
-        params_file = sys.argv[1]
-        
-        with open(params_file, 'r') as f:
-            params = json.load(f)
-        
-        result = asyncio.run(run_failsafe_monitoring(params))
-        
-    except Exception as e:
-        error_result = {
-            'status': 'error',
-            'message': f'Failsafe runner hatası: {str(e)}'
-        }
-        print(json.dumps(error_result))
-        sys.exit(1)
-
-if __name__ == "__main__":
-    main()
-'''
 
 # ==================== UI COMPONENTS ====================
 # (UI komponenleri aynı kalacak, sadece failsafe runner'da değişiklik yaptık)
@@ -877,19 +344,21 @@ class FailsafeMonitorDialog(QDialog):
     
     def __init__(self, parent=None, connection_manager=None):
         super().__init__(parent)
-        print("[DEBUG] FailsafeMonitorDialog init başladı")
+        log.debug("FailsafeMonitorDialog init başladı")
         
         self.connection_manager = connection_manager
         self.monitoring_active = False
         self.worker_process = None
+        self.output_reader = None
+        self.worker_paused = False
         self.update_timer = QTimer()
         self.failsafe_config = self.get_default_config()
         
-        print("[DEBUG] UI setup başlıyor...")
+        log.debug("UI setup başlıyor...")
         self.setup_ui()
         self.setup_styles()
         self.setup_update_timer()
-        print("[DEBUG] FailsafeMonitorDialog init tamamlandı")
+        log.debug("FailsafeMonitorDialog init tamamlandı")
         
     def get_connection_string(self):
         """Bağlantı string'ini al"""
@@ -935,7 +404,7 @@ class FailsafeMonitorDialog(QDialog):
     
     def setup_ui(self):
         """UI kurulumu"""
-        print("[DEBUG] UI setup başladı")
+        log.debug("UI setup başladı")
         self.setWindowTitle("🛡️ REAL-TIME FAİLSAFE MONİTOR")
         self.setFixedSize(1100, 750)
         self.setModal(False)  # Non-modal - arka planda çalışabilir
@@ -946,19 +415,19 @@ class FailsafeMonitorDialog(QDialog):
         main_layout.setContentsMargins(15, 15, 15, 15)
         
         # Header
-        print("[DEBUG] Header oluşturuluyor")
+        log.debug("Header oluşturuluyor")
         self.create_header(main_layout)
         
         # Ana içerik tabları
-        print("[DEBUG] Tablar oluşturuluyor")
+        log.debug("Tablar oluşturuluyor")
         self.create_main_tabs(main_layout)
         
         # Footer
-        print("[DEBUG] Footer oluşturuluyor")
+        log.debug("Footer oluşturuluyor")
         self.create_footer(main_layout)
         
         self.setLayout(main_layout)
-        print("[DEBUG] UI setup tamamlandı")
+        log.debug("UI setup tamamlandı")
     
     def create_header(self, layout):
         """Header bölümü"""
@@ -1021,19 +490,19 @@ class FailsafeMonitorDialog(QDialog):
         self.tabs = QTabWidget()
         
         # Dashboard tab
-        print("[DEBUG] Dashboard tab oluşturuluyor")
+        log.debug("Dashboard tab oluşturuluyor")
         self.create_dashboard_tab()
         
         # Grafikler tab
-        print("[DEBUG] Grafikler tab oluşturuluyor")
+        log.debug("Grafikler tab oluşturuluyor")
         self.create_charts_tab()
         
         # Settings tab  
-        print("[DEBUG] Settings tab oluşturuluyor")
+        log.debug("Settings tab oluşturuluyor")
         self.create_settings_tab()
         
         # Events tab
-        print("[DEBUG] Events tab oluşturuluyor")
+        log.debug("Events tab oluşturuluyor")
         self.create_events_tab()
         
         layout.addWidget(self.tabs)
@@ -1179,26 +648,18 @@ class FailsafeMonitorDialog(QDialog):
         """Grafikler tab'ı - Detaylı failsafe grafikleri"""
         charts_widget = QWidget()
         charts_layout = QVBoxLayout(charts_widget)
+        self.charts_widget = charts_widget
         
         # Scroll area
         scroll = QScrollArea()
         scroll_content = QWidget()
         scroll_layout = QVBoxLayout(scroll_content)
         
-        # Telemetri verisi saklama (grafik için)
-        if not hasattr(self, 'telemetry_data'):
-            self.telemetry_data = {
-                'timestamps': [],
-                'battery_percent': [],
-                'battery_voltage': [],
-                'gps_satellites': [],
-                'gps_fix_type': [],
-                'horizontal_speed': [],
-                'vertical_speed': [],
-                'roll': [],
-                'pitch': [],
-                'yaw': []
-            }
+        # Telemetri geçmişi (grafik için) - önceden ayrılmış halka tampon
+        if not hasattr(self, 'chart_history'):
+            self.chart_history = RingTimeSeries(CHART_CHANNELS, capacity=CHART_HISTORY_CAPACITY)
+            self._chart_x = np.empty(CHART_HISTORY_CAPACITY)
+        self.chart_window_s = CHART_TIME_RANGES["1 dakika"]
         
         # Batarya grafikleri
         battery_group = QGroupBox("🔋 BATARYA TELEMETRİ GRAFİKLERİ")
@@ -1211,7 +672,8 @@ class FailsafeMonitorDialog(QDialog):
             "Yüzde (%)",
             [(self.failsafe_config['battery']['warning_percent'], "Uyarı", "#f1c40f"),
              (self.failsafe_config['battery']['critical_percent'], "Kritik", "#e74c3c"),
-             (self.failsafe_config['battery']['emergency_percent'], "Acil", "#9b59b6")]
+             (self.failsafe_config['battery']['emergency_percent'], "Acil", "#9b59b6")],
+            series=[('battery_percent', '#27ae60', "Batarya")]
         )
         battery_layout.addWidget(self.battery_percent_canvas)
         
@@ -1220,7 +682,8 @@ class FailsafeMonitorDialog(QDialog):
             "Batarya Voltajı (V)",
             "Zaman",
             "Voltaj (V)",
-            [(self.failsafe_config['battery']['voltage_critical'], "Kritik Voltaj", "#e74c3c")]
+            [(self.failsafe_config['battery']['voltage_critical'], "Kritik Voltaj", "#e74c3c")],
+            series=[('battery_voltage', '#3498db', "Voltaj")]
         )
         battery_layout.addWidget(self.battery_voltage_canvas)
         
@@ -1238,7 +701,8 @@ class FailsafeMonitorDialog(QDialog):
             "Uydu Sayısı",
             [(self.failsafe_config['gps']['warning_satellites'], "Uyarı", "#f1c40f"),
              (self.failsafe_config['gps']['critical_satellites'], "Kritik", "#e74c3c"),
-             (self.failsafe_config['gps']['emergency_satellites'], "Acil", "#9b59b6")]
+             (self.failsafe_config['gps']['emergency_satellites'], "Acil", "#9b59b6")],
+            series=[('gps_satellites', '#f39c12', "Uydu")]
         )
         gps_layout.addWidget(self.gps_satellites_canvas)
         
@@ -1247,7 +711,8 @@ class FailsafeMonitorDialog(QDialog):
             "GPS Fix Type",
             "Zaman",
             "Fix Type (0=No Fix, 2=2D, 3=3D, 4=DGPS)",
-            [(2, "Minimum Fix", "#f39c12")]
+            [(2, "Minimum Fix", "#f39c12")],
+            series=[('gps_fix_type', '#3498db', "Fix")]
         )
         gps_layout.addWidget(self.gps_fix_canvas)
         
@@ -1265,7 +730,8 @@ class FailsafeMonitorDialog(QDialog):
             "Hız (m/s)",
             [(self.failsafe_config['speed']['warning_horizontal'], "Uyarı", "#f1c40f"),
              (self.failsafe_config['speed']['critical_horizontal'], "Kritik", "#e74c3c"),
-             (self.failsafe_config['speed']['emergency_horizontal'], "Acil", "#9b59b6")]
+             (self.failsafe_config['speed']['emergency_horizontal'], "Acil", "#9b59b6")],
+            series=[('horizontal_speed', '#e74c3c', "Yatay")]
         )
         speed_layout.addWidget(self.horizontal_speed_canvas)
         
@@ -1275,7 +741,8 @@ class FailsafeMonitorDialog(QDialog):
             "Zaman",
             "Hız (m/s)",
             [(self.failsafe_config['speed']['warning_vertical'], "Uyarı", "#f1c40f"),
-             (self.failsafe_config['speed']['critical_vertical'], "Kritik", "#e74c3c")]
+             (self.failsafe_config['speed']['critical_vertical'], "Kritik", "#e74c3c")],
+            series=[('vertical_speed', '#e74c3c', "Dikey")]
         )
         speed_layout.addWidget(self.vertical_speed_canvas)
         
@@ -1293,7 +760,9 @@ class FailsafeMonitorDialog(QDialog):
             "Açı (°)",
             [(self.failsafe_config['attitude']['warning_angle'], "Uyarı", "#f1c40f"),
              (self.failsafe_config['attitude']['critical_angle'], "Kritik", "#e74c3c"),
-             (self.failsafe_config['attitude']['emergency_angle'], "Acil", "#9b59b6")]
+             (self.failsafe_config['attitude']['emergency_angle'], "Acil", "#9b59b6")],
+            series=[('roll', '#e74c3c', "Roll"), ('pitch', '#3498db', "Pitch")],
+            mirror_thresholds=True
         )
         attitude_layout.addWidget(self.attitude_canvas)
         
@@ -1302,7 +771,8 @@ class FailsafeMonitorDialog(QDialog):
             "Yaw Açısı (°)",
             "Zaman",
             "Açı (°)",
-            []
+            [],
+            series=[('yaw', '#9b59b6', "Yaw")]
         )
         attitude_layout.addWidget(self.yaw_canvas)
         
@@ -1375,246 +845,143 @@ class FailsafeMonitorDialog(QDialog):
         
         charts_layout.addWidget(scroll)
         
-        # Grafik güncelleme için timer
+        # Grafik güncelleme durumu
         self.charts_paused = False
-        self.max_data_points = 100  # Maksimum veri noktası
+        self.live_charts = [
+            self.battery_percent_canvas,
+            self.battery_voltage_canvas,
+            self.gps_satellites_canvas,
+            self.gps_fix_canvas,
+            self.horizontal_speed_canvas,
+            self.vertical_speed_canvas,
+            self.attitude_canvas,
+            self.yaw_canvas
+        ]
+        
+        # Veri gelişinden bağımsız, kare hızı sınırlı çizim
+        self.charts_dirty = False
+        self.chart_refresh_timer = QTimer(self)
+        self.chart_refresh_timer.timeout.connect(self.refresh_charts)
+        self.chart_refresh_timer.start(int(1000 / CHART_REFRESH_HZ))
         
         self.tabs.addTab(charts_widget, "📈 Grafikler")
     
-    def create_chart_widget(self, title, xlabel, ylabel, threshold_lines=None):
-        """Grafik widget'ı oluştur"""
-        try:
-            import matplotlib.pyplot as plt
-            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-            from matplotlib.figure import Figure
-            
-            # Matplotlib figure oluştur
-            fig = Figure(figsize=(10, 4), dpi=80)
-            fig.patch.set_facecolor('white')
-            
-            ax = fig.add_subplot(111)
-            ax.set_title(title, fontsize=12, fontweight='bold')
-            ax.set_xlabel(xlabel)
-            ax.set_ylabel(ylabel)
-            ax.grid(True, alpha=0.3)
-            
-            # Eşik çizgileri ekle
-            if threshold_lines:
-                for value, label, color in threshold_lines:
-                    ax.axhline(y=value, color=color, linestyle='--', alpha=0.7, label=f"{label}: {value}")
-                ax.legend(loc='upper right', fontsize=8)
-            
-            # Canvas oluştur
-            canvas = FigureCanvas(fig)
-            canvas.setMinimumHeight(250)
-            
-            # Grafik verilerini sakla
-            canvas.ax = ax
-            canvas.fig = fig
-            canvas.data_x = []
-            canvas.data_y = []
-            canvas.line = None
-            
-            return canvas
-            
-        except ImportError:
-            # Matplotlib yoksa basit widget
-            placeholder = QLabel(f"📊 {title}\n\nMatplotlib gerekli!\npip install matplotlib")
-            placeholder.setAlignment(Qt.AlignCenter)
-            placeholder.setStyleSheet("""
-                QLabel {
-                    border: 2px solid #bdc3c7;
-                    border-radius: 8px;
-                    background-color: #ecf0f1;
-                    color: #7f8c8d;
-                    font-size: 14px;
-                    padding: 20px;
-                }
-            """)
-            placeholder.setMinimumHeight(250)
-            return placeholder
+    def create_chart_widget(self, title, xlabel, ylabel, threshold_lines=None,
+                            series=None, mirror_thresholds=False):
+        """Grafik widget'ı oluştur (çizgiler bir kez oluşturulur, veriler yerinde güncellenir)"""
+        chart = create_live_chart(title, xlabel, ylabel, threshold_lines=threshold_lines,
+                                  series=series, mirror_thresholds=mirror_thresholds,
+                                  window_s=self.chart_window_s)
+        if chart is not None:
+            return chart
+        
+        # Grafik backend'i yoksa basit widget
+        placeholder = QLabel(f"📊 {title}\n\nMatplotlib veya pyqtgraph gerekli!\npip install pyqtgraph")
+        placeholder.setAlignment(Qt.AlignCenter)
+        placeholder.setStyleSheet("""
+            QLabel {
+                border: 2px solid #bdc3c7;
+                border-radius: 8px;
+                background-color: #ecf0f1;
+                color: #7f8c8d;
+                font-size: 14px;
+                padding: 20px;
+            }
+        """)
+        placeholder.setMinimumHeight(250)
+        return placeholder
     
     def update_charts(self, telemetry_data):
-        """Grafikleri güncelle"""
+        """Grafik geçmişine örnek ekle (çizim refresh_charts ile kare hızında yapılır)"""
         if self.charts_paused:
             return
             
         try:
-            import matplotlib.pyplot as plt
-            from datetime import datetime
-            
-            # Zaman damgası
-            current_time = datetime.now()
-            
-            # Veri ekle
-            self.telemetry_data['timestamps'].append(current_time)
-            
-            # Veri sınırla
-            if len(self.telemetry_data['timestamps']) > self.max_data_points:
-                for key in self.telemetry_data:
-                    self.telemetry_data[key].pop(0)
-            
-            # Grafikleri güncelle
-            charts = [
-                (self.battery_percent_canvas, 'battery_percent', telemetry_data.get('battery_percent', 0)),
-                (self.battery_voltage_canvas, 'battery_voltage', telemetry_data.get('battery_voltage', 0)),
-                (self.gps_satellites_canvas, 'gps_satellites', telemetry_data.get('gps_satellites', 0)),
-                (self.gps_fix_canvas, 'gps_fix_type', telemetry_data.get('gps_fix_type', 0)),
-                (self.horizontal_speed_canvas, 'horizontal_speed', telemetry_data.get('horizontal_speed', 0)),
-                (self.vertical_speed_canvas, 'vertical_speed', telemetry_data.get('vertical_speed', 0)),
-                (self.attitude_canvas, 'roll', telemetry_data.get('roll', 0)),
-                (self.yaw_canvas, 'yaw', telemetry_data.get('yaw', 0))
-            ]
-            
-            for canvas, data_key, value in charts:
-                if hasattr(canvas, 'ax'):
-                    self.telemetry_data[data_key].append(value)
-                    self.update_single_chart(canvas, data_key)
-            
-            # Pitch için attitude grafiğine ikinci çizgi ekle
-            if hasattr(self.attitude_canvas, 'ax'):
-                self.telemetry_data['pitch'].append(telemetry_data.get('pitch', 0))
-                self.update_attitude_chart()
-            
-            # İstatistikleri güncelle
-            self.update_statistics()
+            self.chart_history.append(
+                time.time(),
+                tuple(telemetry_data.get(key, 0) for key in CHART_CHANNELS)
+            )
+            self.charts_dirty = True
             
         except Exception as e:
-            print(f"[DEBUG] Grafik güncelleme hatası: {e}")
+            log.error("Grafik güncelleme hatası: %s", e)
     
-    def update_single_chart(self, canvas, data_key):
-        """Tek grafik güncelle"""
-        try:
-            if not hasattr(canvas, 'ax'):
-                return
-                
-            ax = canvas.ax
-            
-            # Eski çizgiyi temizle
-            if canvas.line:
-                canvas.line.remove()
-            
-            # Yeni çizgi çiz
-            x_data = list(range(len(self.telemetry_data[data_key])))
-            y_data = self.telemetry_data[data_key]
-            
-            color = '#3498db'
-            if data_key == 'battery_percent':
-                color = '#27ae60'
-            elif data_key == 'gps_satellites':
-                color = '#f39c12'
-            elif data_key in ['horizontal_speed', 'vertical_speed']:
-                color = '#e74c3c'
-            elif data_key in ['roll', 'pitch']:
-                color = '#9b59b6'
-            
-            canvas.line, = ax.plot(x_data, y_data, color=color, linewidth=2)
-            
-            # Y ekseni sınırlarını ayarla
-            if len(y_data) > 0:
-                y_min, y_max = min(y_data), max(y_data)
-                margin = (y_max - y_min) * 0.1 if y_max != y_min else 1
-                ax.set_ylim(y_min - margin, y_max + margin)
-            
-            # X ekseni sınırlarını ayarla
-            if len(x_data) > 0:
-                ax.set_xlim(0, max(x_data) + 1)
-            
-            canvas.draw()
-            
-        except Exception as e:
-            print(f"[DEBUG] Tek grafik güncelleme hatası: {e}")
+    def _chart_window_slice(self):
+        """Seçili zaman aralığındaki örneklerin başlangıç indeksi"""
+        times = self.chart_history.times()
+        if not self.chart_window_s or not len(times):
+            return 0
+        return int(np.searchsorted(times, times[-1] - self.chart_window_s))
     
-    def update_attitude_chart(self):
-        """Attitude grafiğini güncelle (Roll + Pitch)"""
+    def refresh_charts(self):
+        """Değişen grafik verilerini çizgi nesnelerine yerinde aktar"""
+        if not self.charts_dirty or self.charts_paused:
+            return
+        if self.tabs.currentWidget() is not self.charts_widget:
+            return  # Sekme görünmüyorken çizim yapma; veri birikmeye devam eder
+        
         try:
-            canvas = self.attitude_canvas
-            if not hasattr(canvas, 'ax'):
-                return
-                
-            ax = canvas.ax
-            
-            # Eski çizgileri temizle
-            ax.clear()
-            
-            # Başlık ve etiketleri yeniden ekle
-            ax.set_title("Roll ve Pitch Açıları (°)", fontsize=12, fontweight='bold')
-            ax.set_xlabel("Zaman")
-            ax.set_ylabel("Açı (°)")
-            ax.grid(True, alpha=0.3)
-            
-            # Eşik çizgilerini yeniden ekle
-            thresholds = [
-                (self.failsafe_config['attitude']['warning_angle'], "Uyarı", "#f1c40f"),
-                (self.failsafe_config['attitude']['critical_angle'], "Kritik", "#e74c3c"),
-                (self.failsafe_config['attitude']['emergency_angle'], "Acil", "#9b59b6")
-            ]
-            
-            for value, label, color in thresholds:
-                ax.axhline(y=value, color=color, linestyle='--', alpha=0.7, label=f"{label}: {value}")
-                ax.axhline(y=-value, color=color, linestyle='--', alpha=0.7)
-            
-            # Veri çizgilerini çiz
-            x_data = list(range(len(self.telemetry_data['roll'])))
-            
-            if len(x_data) > 0:
-                ax.plot(x_data, self.telemetry_data['roll'], color='#e74c3c', linewidth=2, label='Roll')
-                ax.plot(x_data, self.telemetry_data['pitch'], color='#3498db', linewidth=2, label='Pitch')
-                
-                # Y ekseni sınırlarını ayarla
-                all_angles = self.telemetry_data['roll'] + self.telemetry_data['pitch']
-                if all_angles:
-                    y_min, y_max = min(all_angles), max(all_angles)
-                    margin = max(5, (y_max - y_min) * 0.1)
-                    ax.set_ylim(y_min - margin, y_max + margin)
-                
-                # X ekseni sınırlarını ayarla
-                ax.set_xlim(0, max(x_data) + 1)
+            start = self._chart_window_slice()
+            x_data = seconds_ago(self.chart_history.times()[start:], self._chart_x)
+            
+            for chart in self.live_charts:
+                if not hasattr(chart, 'update_series'):
+                    continue
+                chart.update_series(x_data, {
+                    key: self.chart_history.channel(key)[start:]
+                    for key in chart.series_keys
+                })
             
-            ax.legend(loc='upper right', fontsize=8)
-            canvas.draw()
+            self.update_statistics(start)
+            self.charts_dirty = False
             
         except Exception as e:
-            print(f"[DEBUG] Attitude grafik güncelleme hatası: {e}")
+            log.error("Grafik çizim hatası: %s", e)
     
-    def update_statistics(self):
+    def update_statistics(self, start=0):
         """İstatistikleri güncelle"""
         try:
-            if not self.telemetry_data['timestamps']:
+            if not len(self.chart_history):
                 return
             
+            history = self.chart_history
+            
             # Batarya istatistikleri
-            battery_data = [x for x in self.telemetry_data['battery_percent'] if x > 0]
-            if battery_data:
-                self.stats_labels['avg_battery'].setText(f"{sum(battery_data)/len(battery_data):.1f}%")
-                self.stats_labels['min_battery'].setText(f"{min(battery_data):.1f}%")
+            battery_data = history.channel('battery_percent')[start:]
+            battery_data = battery_data[battery_data > 0]
+            if battery_data.size:
+                self.stats_labels['avg_battery'].setText(f"{battery_data.mean():.1f}%")
+                self.stats_labels['min_battery'].setText(f"{battery_data.min():.1f}%")
             
             # GPS istatistikleri
-            gps_data = [x for x in self.telemetry_data['gps_satellites'] if x > 0]
-            if gps_data:
-                self.stats_labels['avg_gps'].setText(f"{sum(gps_data)/len(gps_data):.1f}")
-                self.stats_labels['min_gps'].setText(f"{min(gps_data)}")
+            gps_data = history.channel('gps_satellites')[start:]
+            gps_data = gps_data[gps_data > 0]
+            if gps_data.size:
+                self.stats_labels['avg_gps'].setText(f"{gps_data.mean():.1f}")
+                self.stats_labels['min_gps'].setText(f"{int(gps_data.min())}")
             
             # Hız istatistikleri
-            h_speed_data = [x for x in self.telemetry_data['horizontal_speed'] if x >= 0]
-            if h_speed_data:
-                self.stats_labels['max_h_speed'].setText(f"{max(h_speed_data):.1f} m/s")
+            h_speed_data = history.channel('horizontal_speed')[start:]
+            h_speed_data = h_speed_data[h_speed_data >= 0]
+            if h_speed_data.size:
+                self.stats_labels['max_h_speed'].setText(f"{h_speed_data.max():.1f} m/s")
             
-            v_speed_data = [x for x in self.telemetry_data['vertical_speed'] if x >= 0]
-            if v_speed_data:
-                self.stats_labels['max_v_speed'].setText(f"{max(v_speed_data):.1f} m/s")
+            v_speed_data = history.channel('vertical_speed')[start:]
+            v_speed_data = v_speed_data[v_speed_data >= 0]
+            if v_speed_data.size:
+                self.stats_labels['max_v_speed'].setText(f"{v_speed_data.max():.1f} m/s")
             
             # Açı istatistikleri
-            roll_data = [abs(x) for x in self.telemetry_data['roll']]
-            if roll_data:
-                self.stats_labels['max_roll'].setText(f"{max(roll_data):.1f}°")
+            roll_data = history.channel('roll')[start:]
+            if roll_data.size:
+                self.stats_labels['max_roll'].setText(f"{np.abs(roll_data).max():.1f}°")
             
-            pitch_data = [abs(x) for x in self.telemetry_data['pitch']]
-            if pitch_data:
-                self.stats_labels['max_pitch'].setText(f"{max(pitch_data):.1f}°")
+            pitch_data = history.channel('pitch')[start:]
+            if pitch_data.size:
+                self.stats_labels['max_pitch'].setText(f"{np.abs(pitch_data).max():.1f}°")
                 
         except Exception as e:
-            print(f"[DEBUG] İstatistik güncelleme hatası: {e}")
+            log.error("İstatistik güncelleme hatası: %s", e)
     
     def clear_charts(self):
         """Grafikleri temizle"""
@@ -1627,33 +994,21 @@ class FailsafeMonitorDialog(QDialog):
         
         if reply == QMessageBox.Yes:
             # Veri temizle
-            for key in self.telemetry_data:
-                self.telemetry_data[key].clear()
+            self.chart_history.clear()
+            self.charts_dirty = False
             
             # İstatistikleri sıfırla
             for label in self.stats_labels.values():
                 label.setText("--")
             
-            # Grafikleri yeniden çiz
+            # Çizgileri boşalt
             try:
-                charts = [
-                    self.battery_percent_canvas,
-                    self.battery_voltage_canvas,
-                    self.gps_satellites_canvas,
-                    self.gps_fix_canvas,
-                    self.horizontal_speed_canvas,
-                    self.vertical_speed_canvas,
-                    self.attitude_canvas,
-                    self.yaw_canvas
-                ]
-                
-                for canvas in charts:
-                    if hasattr(canvas, 'ax'):
-                        canvas.ax.clear()
-                        canvas.draw()
+                for chart in self.live_charts:
+                    if hasattr(chart, 'reset'):
+                        chart.reset()
                         
             except Exception as e:
-                print(f"[DEBUG] Grafik temizleme hatası: {e}")
+                log.error("Grafik temizleme hatası: %s", e)
     
     def export_charts(self):
         """Grafikleri dışa aktar"""
@@ -1684,12 +1039,12 @@ class FailsafeMonitorDialog(QDialog):
                     ("Pitch Açısı (°)", 'pitch', axes[3, 1])
                 ]
                 
+                x_data = self.chart_history.times()
                 for title, data_key, ax in charts_data:
-                    if self.telemetry_data[data_key]:
-                        x_data = list(range(len(self.telemetry_data[data_key])))
-                        y_data = self.telemetry_data[data_key]
-                        ax.plot(x_data, y_data, linewidth=2)
+                    if len(x_data):
+                        ax.plot(x_data, self.chart_history.channel(data_key), linewidth=2)
                         ax.set_title(title, fontsize=12)
+                        ax.set_xlabel("Zaman (s)")
                         ax.grid(True, alpha=0.3)
                 
                 plt.tight_layout()
@@ -1716,15 +1071,14 @@ class FailsafeMonitorDialog(QDialog):
     
     def update_time_range(self, range_text):
         """Zaman aralığını güncelle"""
-        range_mapping = {
-            "30 saniye": 30,
-            "1 dakika": 60,
-            "5 dakika": 300,
-            "10 dakika": 600,
-            "Tümü": 1000
-        }
+        self.chart_window_s = CHART_TIME_RANGES.get(range_text, 60)
         
-        self.max_data_points = range_mapping.get(range_text, 60)
+        for chart in self.live_charts:
+            if hasattr(chart, 'set_window'):
+                chart.set_window(self.chart_window_s)
+        
+        self.charts_dirty = True
+        self.refresh_charts()
     
     def create_settings_tab(self):
         """Ayarlar tab'ı"""
@@ -1907,6 +1261,11 @@ class FailsafeMonitorDialog(QDialog):
         self.status_label.setStyleSheet("color: #7f8c8d; font-style: italic;")
         footer_layout.addWidget(self.status_label)
         
+        # Çıktı okuyucu metrikleri
+        self.reader_metrics_label = QLabel("")
+        self.reader_metrics_label.setStyleSheet("color: #95a5a6; font-size: 10px;")
+        footer_layout.addWidget(self.reader_metrics_label)
+        
         footer_layout.addStretch()
         
         # Sağ taraf - kontrol butonları
@@ -1943,6 +1302,23 @@ class FailsafeMonitorDialog(QDialog):
             QPushButton:disabled { background-color: #95a5a6; }
         """)
         
+        self.pause_monitoring_button = QPushButton("⏸️ DURAKLAT")
+        self.pause_monitoring_button.clicked.connect(self.toggle_monitoring_pause)
+        self.pause_monitoring_button.setEnabled(False)
+        self.pause_monitoring_button.setStyleSheet("""
+            QPushButton {
+                background-color: #f39c12;
+                color: white;
+                border: none;
+                padding: 12px 20px;
+                border-radius: 6px;
+                font-size: 12px;
+                font-weight: bold;
+            }
+            QPushButton:hover { background-color: #d68910; }
+            QPushButton:disabled { background-color: #95a5a6; }
+        """)
+        
         self.close_button = QPushButton("❌ KAPAT")
         self.close_button.clicked.connect(self.close)
         self.close_button.setStyleSheet("""
@@ -1959,6 +1335,7 @@ class FailsafeMonitorDialog(QDialog):
         """)
         
         footer_layout.addWidget(self.start_button)
+        footer_layout.addWidget(self.pause_monitoring_button)
         footer_layout.addWidget(self.stop_monitoring_button)
         footer_layout.addWidget(self.close_button)
         
@@ -2008,27 +1385,28 @@ class FailsafeMonitorDialog(QDialog):
         
     def start_monitoring(self):
         """Failsafe monitoring başlat"""
-        print("[DEBUG] start_monitoring çağrıldı")
+        log.debug("start_monitoring çağrıldı")
         
         if self.monitoring_active:
-            print("[DEBUG] Monitoring zaten aktif")
+            log.debug("Monitoring zaten aktif")
             return
         
 
         
         try:
-            print("[DEBUG] Ayarları güncelleniyor")
+            log.debug("Ayarları güncelleniyor")
             # Ayarları güncelle
             self.update_config_from_ui()
             
-            # Subprocess parametreleri
+            # Worker parametreleri
             params = {
-                'connection_string': self.get_connection_string(),
+                'connection_string': resolve_endpoint('failsafe', self.get_connection_string()),
                 'config': self.failsafe_config,
-                'duration': 3600  # 1 saat
+                'engine': 'stream',  # Sürekli abonelik + debounce
+                'publish_interval_s': DISPLAY_REFRESH_MS / 1000.0
             }
             
-            print(f"[DEBUG] Subprocess parametreleri: {params}")
+            log.debug("Subprocess parametreleri: %s", params)
             
             # Subprocess başlat
             self.start_monitoring_subprocess(params)
@@ -2037,6 +1415,7 @@ class FailsafeMonitorDialog(QDialog):
             self.monitoring_active = True
             self.start_button.setEnabled(False)
             self.stop_monitoring_button.setEnabled(True)
+            self.pause_monitoring_button.setEnabled(True)
             
             self.monitoring_status_label.setText("🔄 İzleme Aktif")
             self.monitoring_status_label.setStyleSheet("""
@@ -2052,7 +1431,7 @@ class FailsafeMonitorDialog(QDialog):
             self.status_label.setText("🔄 Real-time failsafe monitoring aktif...")
             
             # Update timer başlat
-            self.update_timer.start(1000)  # Her saniye güncelle
+            self.update_timer.start(DISPLAY_REFRESH_MS)
             
             # Event ekle
             self.events_list.add_event(
@@ -2062,10 +1441,10 @@ class FailsafeMonitorDialog(QDialog):
                 "Failsafe monitoring başlatıldı"
             )
             
-            print("[DEBUG] Monitoring başarıyla başlatıldı")
+            log.debug("Monitoring başarıyla başlatıldı")
             
         except Exception as e:
-            print(f"[DEBUG] Monitoring başlatma hatası: {e}")
+            log.error("Monitoring başlatma hatası: %s", e)
             QMessageBox.critical(self, "Monitoring Hatası", 
                                f"Failsafe monitoring başlatılamadı:\n\n{str(e)}")
     
@@ -2075,10 +1454,13 @@ class FailsafeMonitorDialog(QDialog):
             return
         
         try:
-            # Subprocess'i durdur
-            if self.worker_process:
-                self.worker_process.terminate()
-                self.worker_process = None
+            # Worker'ı kapat, kalan olayları log'a aktar
+            self.shutdown_worker()
+            if self.output_reader:
+                _, events = self.output_reader.take()
+                for event in events:
+                    self.events_list.add_event(*event)
+                self.output_reader = None
             
             # Timer'ı durdur
             self.update_timer.stop()
@@ -2087,6 +1469,8 @@ class FailsafeMonitorDialog(QDialog):
             self.monitoring_active = False
             self.start_button.setEnabled(True)
             self.stop_monitoring_button.setEnabled(False)
+            self.pause_monitoring_button.setEnabled(False)
+            self.pause_monitoring_button.setText("⏸️ DURAKLAT")
             
             self.monitoring_status_label.setText("⏸️ İzleme Durduruldu")
             self.monitoring_status_label.setStyleSheet("""
@@ -2114,135 +1498,168 @@ class FailsafeMonitorDialog(QDialog):
                               f"Monitoring durdurulurken hata:\n\n{str(e)}")
     
     def start_monitoring_subprocess(self, params):
-        """Monitoring subprocess'ini başlat"""
+        """Failsafe worker sürecini başlat"""
         try:
-            print("[DEBUG] Subprocess başlatılıyor")
-            
-            # Geçici runner dosyası
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as runner_file:
-                runner_file.write(FAILSAFE_SUBPROCESS_RUNNER)
-                runner_path = runner_file.name
-            
-            # Parametreler dosyası
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as params_file:
-                json.dump(params, params_file, indent=2)
-                params_path = params_file.name
-            
-            # Subprocess başlat
-            cmd = [sys.executable, runner_path, params_path]
-            print(f"[DEBUG] Subprocess komutu: {cmd}")
+            log.debug("Failsafe worker başlatılıyor")
+            
+            cmd = [
+                sys.executable, '-u', FAILSAFE_WORKER_SCRIPT,
+                '--connection', params['connection_string'],
+                '--engine', params.get('engine', 'stream'),
+                '--config', json.dumps(params.get('config', {})),
+                '--publish-interval', str(params.get('publish_interval_s', 1.0))
+            ]
+            log.debug("Worker komutu: %s", cmd)
             
             self.worker_process = subprocess.Popen(
                 cmd,
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                bufsize=1,
                 cwd=os.path.dirname(os.path.abspath(__file__))
             )
+            self.output_reader = FailsafeOutputReader(self.worker_process)
+            self.worker_paused = False
             
-            print(f"[DEBUG] Subprocess başlatıldı, PID: {self.worker_process.pid}")
+            log.debug("Worker başlatıldı, PID: %s", self.worker_process.pid)
             
         except Exception as e:
-            print(f"[DEBUG] Subprocess başlatma hatası: {e}")
-            raise Exception(f"Subprocess başlatma hatası: {str(e)}")
+            log.error("Worker başlatma hatası: %s", e)
+            raise Exception(f"Worker başlatma hatası: {str(e)}")
+    
+    def send_worker_command(self, cmd, **payload):
+        """Worker kontrol kanalına komut gönder"""
+        if not self.worker_process or self.worker_process.poll() is not None:
+            return False
+        
+        try:
+            payload['cmd'] = cmd
+            self.worker_process.stdin.write(json.dumps(payload) + "\n")
+            self.worker_process.stdin.flush()
+            return True
+        except (BrokenPipeError, OSError, ValueError) as e:
+            log.error("Worker komut hatası (%s): %s", cmd, e)
+            return False
+    
+    def push_worker_config(self):
+        """Güncel eşikleri çalışan worker'a uygula (yeniden bağlanmadan)"""
+        if self.monitoring_active:
+            self.send_worker_command('config', config=self.failsafe_config)
+    
+    def shutdown_worker(self):
+        """Worker'ı kontrol kanalıyla kapat, cevap vermezse sonlandır"""
+        process = self.worker_process
+        if not process:
+            return
+        
+        self.send_worker_command('shutdown')
+        self.worker_process = None
+        
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        
+        try:
+            process.wait(timeout=WORKER_SHUTDOWN_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            process.terminate()
+    
+    def toggle_monitoring_pause(self):
+        """Worker değerlendirmesini duraklat/devam ettir (bağlantı açık kalır)"""
+        if not self.monitoring_active:
+            return
+        
+        self.worker_paused = not self.worker_paused
+        self.send_worker_command('pause' if self.worker_paused else 'resume')
+        
+        if self.worker_paused:
+            self.pause_monitoring_button.setText("▶️ DEVAM")
+            self.status_label.setText("⏸️ Failsafe değerlendirmesi duraklatıldı (bağlantı açık)")
+        else:
+            self.pause_monitoring_button.setText("⏸️ DURAKLAT")
+            self.status_label.setText("🔄 Real-time failsafe monitoring aktif...")
+        
+        self.events_list.add_event(
+            datetime.now().isoformat(),
+            "system",
+            "warning" if self.worker_paused else "normal",
+            "Failsafe izleme duraklatıldı" if self.worker_paused else "Failsafe izleme devam ediyor"
+        )
     
     def update_display(self):
-        """Display'i güncelle"""
-        if not self.monitoring_active or not self.worker_process:
+        """Okuyucudaki bekleyen olayları ve en yeni durumu ekrana aktar"""
+        if not self.monitoring_active or not self.worker_process or not self.output_reader:
             return
         
         try:
-            # Subprocess çıktısını oku
-            if self.worker_process.poll() is None:  # Hala çalışıyor
-                # Non-blocking okuma - Unix/Linux için
-                try:
-                    import select
-                    if select.select([self.worker_process.stdout], [], [], 0.1)[0]:
-                        line = self.worker_process.stdout.readline()
-                        if line:
-                            self.process_monitoring_data(line.strip())
-                except ImportError:
-                    # Windows için alternatif
-                    import threading
-                    import queue
-                    
-                    if not hasattr(self, 'output_queue'):
-                        self.output_queue = queue.Queue()
-                        self.output_thread = threading.Thread(
-                            target=self._read_output, 
-                            args=(self.worker_process.stdout, self.output_queue)
-                        )
-                        self.output_thread.daemon = True
-                        self.output_thread.start()
-                    
-                    try:
-                        line = self.output_queue.get_nowait()
-                        self.process_monitoring_data(line.strip())
-                    except queue.Empty:
-                        pass
-            else:
-                # Subprocess bitti
-                self.stop_monitoring()
+            snapshot, events = self.output_reader.take()
+            
+            # Her olay log'a gider - atlanan snapshot'lardakiler dahil
+            for event in events:
+                self.events_list.add_event(*event)
+            
+            # Sadece en yeni durum gösterilir
+            if snapshot is not None:
+                self.apply_monitoring_snapshot(snapshot)
+                self.output_reader.mark_displayed(snapshot)
+            
+            self.update_reader_metrics()
+            
+            # Worker bitti ve tüm çıktı işlendi
+            if self.worker_process.poll() is not None and not self.output_reader.is_alive():
+                if not self.output_reader.queue_depth():
+                    self.stop_monitoring()
                 
         except Exception as e:
-            print(f"[DEBUG] Display update hatası: {e}")
-    
-    def _read_output(self, stdout, queue):
-        """Windows için output okuma thread'i"""
-        try:
-            for line in iter(stdout.readline, ''):
-                queue.put(line)
-        except:
-            pass
+            log.error("Display update hatası: %s", e)
+    
+    def update_reader_metrics(self):
+        """Kuyruk derinliği ve ekran gecikmesi göstergesi"""
+        metrics = self.output_reader.metrics()
+        lag = metrics['display_lag_ms']
+        lag_text = f"{lag:.0f} ms" if lag is not None else "--"
+        self.reader_metrics_label.setText(
+            f"Kuyruk: {metrics['queue_depth']} (max {metrics['max_queue_depth']}) | "
+            f"Gecikme: {lag_text} | Atlanan: {metrics['snapshots_skipped']}"
+        )
     
-    def process_monitoring_data(self, json_line):
-       """Monitoring verilerini işle"""
+    def apply_monitoring_snapshot(self, data):
+       """Durum snapshot'ını widget'lara ve grafiklere uygula"""
        try:
-           data = json.loads(json_line)
+           # Telemetri verisini topla
+           chart_data = {}
            
-           if 'results' in data:
-               # Telemetri verisini topla
-               chart_data = {}
-               
-               # Failsafe sonuçlarını işle
-               for result in data['results']:
-                   self.update_status_widget(result)
-                   
-                   # Grafik verisini topla
-                   if result['type'] == 'battery' and result.get('data'):
-                       chart_data['battery_percent'] = result['data']['percent']
-                       chart_data['battery_voltage'] = result['data']['voltage']
-                   elif result['type'] == 'gps' and result.get('data'):
-                       chart_data['gps_satellites'] = result['data']['satellites']
-                       chart_data['gps_fix_type'] = result['data']['fix_type']
-                   elif result['type'] == 'speed' and result.get('data'):
-                       chart_data['horizontal_speed'] = result['data']['horizontal_speed']
-                       chart_data['vertical_speed'] = result['data']['vertical_speed']
-                   elif result['type'] == 'attitude' and result.get('data'):
-                       chart_data['roll'] = result['data']['roll']
-                       chart_data['pitch'] = result['data']['pitch']
-                       chart_data['yaw'] = result['data']['yaw']
-                   
-                   # Event ekle
-                   if result['level'] != 'normal':
-                       self.events_list.add_event(
-                           data['timestamp'],
-                           result['type'],
-                           result['level'],
-                           result['message']
-                       )
-               
-               # Grafikleri güncelle
-               if hasattr(self, 'update_charts'):
-                   self.update_charts(chart_data)
+           # Failsafe sonuçlarını işle
+           for result in data['results']:
+               self.update_status_widget(result)
                
-               # Genel durumu güncelle
-               self.update_overall_status(data['results'])
-               
-       except json.JSONDecodeError:
-           pass  # JSON olmayan satırları yok say
+               # Grafik verisini topla
+               if result['type'] == 'battery' and result.get('data'):
+                   chart_data['battery_percent'] = result['data']['percent']
+                   chart_data['battery_voltage'] = result['data']['voltage']
+               elif result['type'] == 'gps' and result.get('data'):
+                   chart_data['gps_satellites'] = result['data']['satellites']
+                   chart_data['gps_fix_type'] = result['data']['fix_type']
+               elif result['type'] == 'speed' and result.get('data'):
+                   chart_data['horizontal_speed'] = result['data']['horizontal_speed']
+                   chart_data['vertical_speed'] = result['data']['vertical_speed']
+               elif result['type'] == 'attitude' and result.get('data'):
+                   chart_data['roll'] = result['data']['roll']
+                   chart_data['pitch'] = result['data']['pitch']
+                   chart_data['yaw'] = result['data']['yaw']
+           
+           # Grafikleri güncelle
+           if hasattr(self, 'update_charts'):
+               self.update_charts(chart_data)
+           
+           # Genel durumu güncelle
+           self.update_overall_status(data['results'])
+           
        except Exception as e:
-           print(f"[DEBUG] Data processing hatası: {e}")
+           log.error("Data processing hatası: %s", e)
     
     def update_status_widget(self, result):
         """Status widget'ını güncelle"""
@@ -2328,6 +1745,9 @@ class FailsafeMonitorDialog(QDialog):
             with open(config_file, 'w') as f:
                 json.dump(self.failsafe_config, f, indent=2)
             
+            # Çalışan worker'a yeniden başlatmadan uygula
+            self.push_worker_config()
+            
             QMessageBox.information(self, "Ayarlar", 
                                   f"Failsafe ayarları kaydedildi!\n\n{config_file}")
             
@@ -2441,6 +1861,7 @@ class FailsafeMonitorDialog(QDialog):
                 # 5 dakika override
                 self.failsafe_config['actions']['auto_rtl_enabled'] = False
                 self.failsafe_config['actions']['auto_land_enabled'] = False
+                self.push_worker_config()
                 
                 # 5 dakika sonra tekrar aç
                 QTimer.singleShot(300000, self.restore_failsafe)  # 5 dakika = 300000 ms
@@ -2465,6 +1886,7 @@ class FailsafeMonitorDialog(QDialog):
         """Failsafe'i geri yükle"""
         self.failsafe_config['actions']['auto_rtl_enabled'] = True
         self.failsafe_config['actions']['auto_land_enabled'] = True
+        self.push_worker_config()
         
         self.events_list.add_event(
             datetime.now().isoformat(),
@@ -2551,9 +1973,9 @@ def open_failsafe_monitor(connection_manager=None):
     Ana arayüzden çağrılacak failsafe monitor fonksiyonu
     """
     try:
-        print("[DEBUG] open_failsafe_monitor çağrıldı")
+        log.debug("open_failsafe_monitor çağrıldı")
         
-        print("[DEBUG] Dialog oluşturuluyor")
+        log.debug("Dialog oluşturuluyor")
         dialog = FailsafeMonitorDialog(
             parent=None, 
             connection_manager=connection_manager
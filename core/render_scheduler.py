@@ -0,0 +1,136 @@
+# core/render_scheduler.py
+"""
+UI Render Scheduler
+===================
+
+Telemetri örneklerini birleştirip (coalesce) ekrana kare hızı sınırıyla
+yansıtan zamanlayıcı:
+- Gelen değerler bir "dirty" kümesinde birikir, her örnekte widget'a dokunulmaz
+- En fazla bir kare süresinde (ör. 30 FPS) bir kez flush edilir
+- Sadece ekranda görünen (formatlanmış) değeri değişen widget'lar güncellenir
+- Telemetri hızı artsa da GUI iş yükü kare hızıyla sınırlı kalır
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QObject, QTimer
+
+DEFAULT_RENDER_FPS = 30
+
+
+class RenderBinding:
+    """Tek bir değeri bir widget setter'ına bağlar"""
+
+    __slots__ = ('setter', 'formatter', 'displayed')
+
+    _UNSET = object()
+
+    def __init__(self, setter: Callable[[Any], None],
+                 formatter: Optional[Callable[[Any], Any]] = None):
+        self.setter = setter
+        self.formatter = formatter
+        self.displayed = RenderBinding._UNSET
+
+    def apply(self, value) -> bool:
+        """Görünen değer değiştiyse widget'ı güncelle"""
+        shown = self.formatter(value) if self.formatter else value
+        if shown == self.displayed:
+            return False
+        self.setter(shown)
+        self.displayed = shown
+        return True
+
+
+class UIRenderScheduler(QObject):
+    """
+    Kare hızı sınırlı, birleştirici UI güncelleme zamanlayıcısı.
+
+    Usage:
+        scheduler = UIRenderScheduler(fps=30, parent=self)
+        scheduler.bind('speed', self.speed_value.setText, lambda v: f"{v:.1f} km/h")
+        scheduler.add_flush_hook(self.redraw_graphs)
+        scheduler.submit({'speed': 42.3})   # telemetri geldikçe
+    """
+
+    def __init__(self, fps: float = DEFAULT_RENDER_FPS, parent=None):
+        super().__init__(parent)
+        self.bindings: Dict[str, List[RenderBinding]] = {}
+        self.flush_hooks: List[Callable[[], None]] = []
+
+        self._pending: Dict[str, Any] = {}
+        self._last_flush = 0.0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self.set_fps(fps)
+
+        # İstatistikler
+        self.samples_submitted = 0
+        self.frames_rendered = 0
+        self.widget_updates = 0
+        self.widget_skips = 0
+
+    def set_fps(self, fps: float):
+        """Maksimum kare hızını ayarla"""
+        self.fps = max(1.0, float(fps))
+        self.frame_interval = 1.0 / self.fps
+
+    def bind(self, key: str, setter: Callable[[Any], None],
+             formatter: Optional[Callable[[Any], Any]] = None):
+        """Bir telemetri anahtarını widget setter'ına bağla"""
+        self.bindings.setdefault(key, []).append(RenderBinding(setter, formatter))
+
+    def add_flush_hook(self, hook: Callable[[], None]):
+        """Her kare sonunda (değişiklik varsa) bir kez çağrılacak fonksiyon ekle"""
+        self.flush_hooks.append(hook)
+
+    def submit(self, values: Dict[str, Any]):
+        """Yeni değerleri dirty kümesine ekle ve bir sonraki kareyi planla"""
+        self._pending.update(values)
+        self.samples_submitted += 1
+
+        if self._timer.isActive():
+            return
+
+        wait = self._last_flush + self.frame_interval - time.monotonic()
+        self._timer.start(max(0, int(wait * 1000)))
+
+    def flush(self):
+        """Bekleyen değerleri widget'lara uygula"""
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        changed = False
+
+        for key, value in pending.items():
+            for binding in self.bindings.get(key, ()):
+                try:
+                    if binding.apply(value):
+                        self.widget_updates += 1
+                        changed = True
+                    else:
+                        self.widget_skips += 1
+                except Exception as e:
+                    print(f"❌ Render binding hatası ({key}): {e}")
+
+        for hook in self.flush_hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"❌ Render hook hatası: {e}")
+
+        if changed:
+            self.frames_rendered += 1
+
+    def get_statistics(self) -> dict:
+        """Zamanlayıcı istatistikleri"""
+        return {
+            'fps_cap': self.fps,
+            'samples_submitted': self.samples_submitted,
+            'frames_rendered': self.frames_rendered,
+            'widget_updates': self.widget_updates,
+            'widget_skips': self.widget_skips,
+        }
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# core/runner_benchmark.py
+"""
+Task Runner Başlatma Benchmark'ı
+================================
+
+Task subprocess'ini başlatmanın iki yolunu karşılaştırır:
+- `-c` kaynak: task programının tamamı komut satırında kaynak olarak gider
+  ve her başlatmada yeniden derlenir (eski f-string üretilen script yolu)
+- runner modülü: `mavsdk_runner.py` ince giriş noktası `mavsdk_tasks`'ı
+  import eder; bytecode `__pycache__`'ten yüklenir
+
+Her iki yol da `--dry-run` ile çalışır: argümanlar çözülür, task modülü
+yüklenir, araca bağlanılmadan çıkılır. mavsdk import maliyeti iki yolda da
+aynıdır; ölçülen fark derleme ve argüman/kaynak hazırlığıdır.
+
+Kullanım:
+    python3 core/runner_benchmark.py --runs 20
+"""
+
+import argparse
+import importlib.util
+import json
+import marshal
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+CORE_DIR = os.path.dirname(os.path.abspath(__file__))
+TASKS_MODULE = os.path.join(CORE_DIR, 'mavsdk_tasks.py')
+RUNNER_SCRIPT = os.path.join(CORE_DIR, 'mavsdk_runner.py')
+
+BENCH_PARAMS = {'altitude': 15.0, 'connection_string': 'udp://:14540'}
+
+
+def legacy_command(task_type, params):
+    """Task programının tamamı -c kaynağı olarak (her seferinde derlenir)"""
+    with open(TASKS_MODULE, encoding='utf-8') as f:
+        source = f.read()
+    source = f"__file__ = {TASKS_MODULE!r}\n" + source + "\nmain()\n"
+    return [sys.executable, '-u', '-c', source,
+            '--task', task_type, '--params', json.dumps(params), '--dry-run']
+
+
+def runner_command(task_type, params):
+    return [sys.executable, '-u', RUNNER_SCRIPT,
+            '--task', task_type, '--params', json.dumps(params), '--dry-run']
+
+
+def time_spawn(command, runs):
+    """Başlatmadan çıkışa kadar geçen süreler (ms)"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                cwd=os.path.dirname(CORE_DIR))
+        samples.append((time.perf_counter() - started) * 1000.0)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip())
+    return samples
+
+
+def time_compile(runs):
+    """Süreç içi: kaynaktan derleme ve önbellekten yükleme (ms)"""
+    with open(TASKS_MODULE, encoding='utf-8') as f:
+        source = f.read()
+
+    compile_samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        compile(source, TASKS_MODULE, 'exec')
+        compile_samples.append((time.perf_counter() - started) * 1000.0)
+
+    # py_compile ile aynı biçimde: 16 baytlık başlık + marshal edilmiş kod
+    cache_path = importlib.util.cache_from_source(TASKS_MODULE)
+    load_samples = []
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        for _ in range(runs):
+            started = time.perf_counter()
+            marshal.loads(data[16:])
+            load_samples.append((time.perf_counter() - started) * 1000.0)
+    return compile_samples, load_samples
+
+
+def describe(samples):
+    if not samples:
+        return "ölçülmedi"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return f"medyan {statistics.median(ordered):7.2f} ms  p95 {p95:7.2f} ms  (n={len(ordered)})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Task runner başlatma benchmark'ı")
+    parser.add_argument('--runs', type=int, default=20, help="Yol başına başlatma sayısı")
+    parser.add_argument('--task', default='TAKEOFF', help="Ölçülecek task tipi")
+    args = parser.parse_args(argv)
+
+    # Önbelleği ısıt (ilk import .pyc yazar)
+    time_spawn(runner_command(args.task, BENCH_PARAMS), 1)
+    time_spawn(legacy_command(args.task, BENCH_PARAMS), 1)
+
+    legacy = time_spawn(legacy_command(args.task, BENCH_PARAMS), args.runs)
+    runner = time_spawn(runner_command(args.task, BENCH_PARAMS), args.runs)
+    compile_samples, load_samples = time_compile(args.runs * 10)
+
+    print(f"Task runner başlatma ({args.task}, --dry-run, {sys.version.split()[0]})")
+    print(f"  -c kaynak (eski yol)  : {describe(legacy)}")
+    print(f"  runner modülü         : {describe(runner)}")
+    print(f"  fark (medyan)         : {statistics.median(legacy) - statistics.median(runner):7.2f} ms")
+    print("Süreç içi (mavsdk_tasks.py)")
+    print(f"  kaynaktan derleme     : {describe(compile_samples)}")
+    print(f"  .pyc yükleme          : {describe(load_samples)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# core/task_engine_check.py
+"""
+Task Motoru Durdurma / Kesme Kontrolü
+=====================================
+
+`MAVSDKSubprocessManager` için soğuk task durdurma yolları, seçilen motorda
+(varsayılan asyncio) gerçek child process'lerle:
+- stop_task: çıktı üreten çalışan soğuk task durdurulur; çağrı hemen döner,
+  task STOPPED olur ve process sonlanır
+- preempt: çıktı üreten çalışan MISSION, `emergency_land()` ile kesilir;
+  MISSION STOPPED, acil durum task'ı COMPLETED olur
+- stop_all: çalışan birden fazla task kapanışta bloklanmadan durdurulur
+
+Araç gerekmez: task komut satırı, runner yerine sürekli çıktı basan küçük
+bir Python process'i ile değiştirilir (acil durum task'ı hemen başarıyla
+biter). Bir kontrol süre sınırını aşarsa çıkış kodu 1'dir.
+
+Kullanım:
+    python3 core/task_engine_check.py --engine asyncio
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.mavsdk_subprocess import MAVSDKSubprocessManager, TaskStatus, TaskType
+
+# Çalışan task: sürekli çıktı (task_lock'u alan çıktı yolunu besler)
+CHATTY_SCRIPT = (
+    "import time\n"
+    "for i in range(100000):\n"
+    "    print(f'STATUS:tick {i}', flush=True)\n"
+    "    time.sleep(0.01)\n"
+)
+EMERGENCY_SCRIPT = "print('SUCCESS:emergency', flush=True)\n"
+
+
+def check_command(task_info):
+    script = EMERGENCY_SCRIPT if task_info.task_type == TaskType.EMERGENCY else CHATTY_SCRIPT
+    return [sys.executable, '-u', '-c', script]
+
+
+def wait_for(predicate, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return bool(predicate())
+
+
+def status_of(manager, task_id):
+    info = manager.get_task_status(task_id)
+    return info.status if info else None
+
+
+def running_with_output(manager, task_id):
+    info = manager.get_task_status(task_id)
+    return bool(info and info.status == TaskStatus.RUNNING and info.process and info.output)
+
+
+def call_with_timeout(func, timeout):
+    """Çağrıyı ayrı thread'de çalıştır; `timeout` içinde dönmezse None"""
+    result = {}
+    thread = threading.Thread(target=lambda: result.setdefault('value', func()), daemon=True)
+    started = time.perf_counter()
+    thread.start()
+    thread.join(timeout)
+    elapsed = time.perf_counter() - started
+    return ('value' in result), result.get('value'), elapsed
+
+
+def report(name, ok, detail, results):
+    results.append(ok)
+    print(f"  {'OK  ' if ok else 'HATA'} {name:<34} {detail}")
+
+
+def check_stop_task(manager, timeout, results):
+    task_id = "check_stop_cold"
+    manager.execute_script(task_id, CHATTY_SCRIPT)
+    if not wait_for(lambda: running_with_output(manager, task_id), timeout):
+        report("stop_task (soğuk task)", False, "task çalışmaya başlamadı", results)
+        return
+    process = manager.get_task_status(task_id).process
+
+    returned, stopped, elapsed = call_with_timeout(lambda: manager.stop_task(task_id), timeout)
+    exited = returned and wait_for(lambda: process.poll() is not None, timeout)
+    ok = returned and stopped and status_of(manager, task_id) == TaskStatus.STOPPED and exited
+    report("stop_task (soğuk task)", ok,
+           f"{elapsed * 1000.0:.0f} ms, durum {status_of(manager, task_id)}, process "
+           f"{'bitti' if exited else 'çalışıyor'}", results)
+
+
+def check_preempt_mission(manager, timeout, results):
+    before = set(manager.tasks)
+    manager.start_mission({'type': 'check'})
+    mission_id = next(task_id for task_id in manager.tasks if task_id not in before)
+    if not wait_for(lambda: running_with_output(manager, mission_id), timeout):
+        report("emergency_land -> MISSION kesme", False, "MISSION çalışmaya başlamadı", results)
+        return
+
+    before = set(manager.tasks)
+    started = time.perf_counter()
+    returned, _ok, _elapsed = call_with_timeout(manager.emergency_land, timeout)
+    emergency_id = next((task_id for task_id in manager.tasks if task_id not in before), None)
+    done = returned and emergency_id is not None and wait_for(
+        lambda: (status_of(manager, mission_id) == TaskStatus.STOPPED
+                 and status_of(manager, emergency_id) == TaskStatus.COMPLETED), timeout)
+    elapsed = time.perf_counter() - started
+    report("emergency_land -> MISSION kesme", done,
+           f"{elapsed * 1000.0:.0f} ms, MISSION {status_of(manager, mission_id)}, "
+           f"acil {status_of(manager, emergency_id) if emergency_id else None}", results)
+
+
+def check_stop_all(manager, timeout, results):
+    task_ids = [f"check_stop_all_{i}" for i in range(3)]
+    for task_id in task_ids:
+        manager.execute_script(task_id, CHATTY_SCRIPT)
+    if not wait_for(lambda: all(running_with_output(manager, t) for t in task_ids), timeout):
+        report("stop_all", False, "task'lar çalışmaya başlamadı", results)
+        return
+
+    returned, _value, elapsed = call_with_timeout(manager.stop_all, timeout)
+    ok = returned and all(status_of(manager, t) == TaskStatus.STOPPED for t in task_ids)
+    report("stop_all", ok, f"{elapsed * 1000.0:.0f} ms, {len(task_ids)} task", results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Task motoru durdurma / kesme kontrolü")
+    parser.add_argument('--engine', choices=['asyncio', 'thread'], default='asyncio')
+    parser.add_argument('--timeout', type=float, default=5.0, help="Kontrol başına süre sınırı (s)")
+    args = parser.parse_args(argv)
+
+    manager = MAVSDKSubprocessManager(max_concurrent=4, enable_logging=False, pool_size=0,
+                                      history_dir=None, engine=args.engine)
+    manager._build_command = check_command
+
+    print(f"Motor: {args.engine}")
+    results = []
+    try:
+        check_stop_task(manager, args.timeout, results)
+        check_preempt_mission(manager, args.timeout, results)
+        check_stop_all(manager, args.timeout, results)
+    finally:
+        call_with_timeout(manager.shutdown, args.timeout)
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+# core/task_history.py
+"""
+Task Geçmişi ve Çıktı Arşivi
+============================
+
+MAVSDK task çıktılarının bellek dışı saklanması:
+- Her task'ın tam çıktısı kendi log dosyasına akar; dosya `max_bytes`
+  boyutunu aşınca döndürülür (`<task>.log`, `<task>.log.1`, ...)
+- Bellekte yalnızca son satırlar tutulur (bkz. TaskInfo.output)
+- Biten task'lar SQLite indeksine yazılır; bellekten atılan task'lar da
+  tip / durum / zaman aralığına göre sorgulanabilir kalır
+
+Usage:
+    history = TaskHistory()
+    history.append(task_id, 'OUT', "STATUS:Takeoff başlatılıyor...")
+    history.record(task_info)
+    history.query(task_type='TAKEOFF', status='FAILED', limit=20)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .logger import get_logger
+
+log = get_logger("task_history")
+
+DEFAULT_HISTORY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'task_logs')
+TASK_LOG_MAX_BYTES = 1024 * 1024
+TASK_LOG_BACKUP_COUNT = 3
+INDEX_FILENAME = 'index.sqlite3'
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    task_type TEXT,
+    priority TEXT,
+    status TEXT,
+    start_time REAL,
+    end_time REAL,
+    timeout REAL,
+    params TEXT,
+    log_path TEXT,
+    output_lines INTEGER,
+    queue_wait_ms REAL,
+    first_command_latency_ms REAL,
+    pooled INTEGER
+);
+CREATE INDEX IF NOT EXISTS tasks_start_time ON tasks (start_time);
+CREATE INDEX IF NOT EXISTS tasks_type_status ON tasks (task_type, status);
+"""
+
+
+class RotatingTaskLog:
+    """
+    Tek task'ın boyut sınırlı, döndürülen log dosyası.
+
+    Satır tamponlu açılır: çalışan task'ın log'u okunurken son satırlar
+    eksik kalmaz, süreç çökerse yazılmış satırlar kaybolmaz.
+    """
+
+    def __init__(self, path: str, max_bytes: int = TASK_LOG_MAX_BYTES,
+                 backup_count: int = TASK_LOG_BACKUP_COUNT):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8', buffering=1)
+        self._size = os.path.getsize(path)
+
+    def write(self, stream: str, line: str):
+        stamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
+        entry = f"{stamp} {stream} {line}\n"
+        size = len(entry.encode('utf-8'))
+        with self.lock:
+            if self._file is None:
+                return
+            if self._size + size > self.max_bytes and self._size > 0:
+                self._rotate()
+            self._file.write(entry)
+            self._size += size
+
+    def _rotate(self):
+        self._file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=1)
+        self._size = 0
+
+    def close(self):
+        with self.lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class TaskHistory:
+    """Task log dosyaları ve sorgulanabilir SQLite indeksi"""
+
+    def __init__(self, root_dir: str = DEFAULT_HISTORY_DIR,
+                 max_log_bytes: int = TASK_LOG_MAX_BYTES,
+                 backup_count: int = TASK_LOG_BACKUP_COUNT):
+        self.root_dir = root_dir
+        self.max_log_bytes = max_log_bytes
+        self.backup_count = backup_count
+        self.logs: Dict[str, RotatingTaskLog] = {}
+        self.lock = threading.Lock()
+
+        os.makedirs(root_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(root_dir, INDEX_FILENAME), check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(INDEX_SCHEMA)
+        self.db.commit()
+
+    def log_path(self, task_id: str) -> str:
+        safe_id = "".join(c if c.isalnum() or c in '-_.' else '_' for c in task_id)
+        return os.path.join(self.root_dir, f"{safe_id}.log")
+
+    def _get_log(self, task_id: str) -> RotatingTaskLog:
+        with self.lock:
+            task_log = self.logs.get(task_id)
+            if task_log is None:
+                task_log = RotatingTaskLog(self.log_path(task_id), self.max_log_bytes, self.backup_count)
+                self.logs[task_id] = task_log
+            return task_log
+
+    def append(self, task_id: str, stream: str, line: str):
+        """Satırı task log dosyasına ekle (stream: 'OUT' / 'ERR')"""
+        try:
+            self._get_log(task_id).write(stream, line)
+        except OSError as e:
+            log.warning("Task log yazılamadı [%s]: %s", task_id, e)
+
+    def record(self, task_info):
+        """Biten task'ı indekse yaz ve log dosyasını kapat"""
+        with self.lock:
+            task_log = self.logs.pop(task_info.task_id, None)
+        if task_log is not None:
+            task_log.close()
+
+        log_path = self.log_path(task_info.task_id)
+        row = (
+            task_info.task_id,
+            task_info.task_type.value,
+            task_info.priority.name if task_info.priority else None,
+            task_info.status.value,
+            task_info.start_time,
+            task_info.end_time,
+            task_info.timeout,
+            json.dumps(task_info.params or {}, default=str),
+            log_path if os.path.exists(log_path) else None,
+            task_info.output_line_count,
+            task_info.queue_wait_ms,
+            task_info.first_command_latency_ms,
+            int(task_info.pooled),
+        )
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self.db.commit()
+
+    def _row_to_dict(self, row) -> dict:
+        record = dict(row)
+        try:
+            record['params'] = json.loads(record['params']) if record['params'] else {}
+        except ValueError:
+            record['params'] = {}
+        record['pooled'] = bool(record['pooled'])
+        return record
+
+    def get(self, task_id: str) -> Optional[dict]:
+        with self.lock:
+            row = self.db.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def query(self, task_type: Optional[str] = None, status: Optional[str] = None,
+              since: Optional[float] = None, until: Optional[float] = None,
+              limit: int = 100) -> List[dict]:
+        """İndeksten task kayıtları (en yeni önce)"""
+        clauses, args = [], []
+        if task_type:
+            clauses.append("task_type = ?")
+            args.append(task_type)
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        if since is not None:
+            clauses.append("start_time >= ?")
+            args.append(since)
+        if until is not None:
+            clauses.append("start_time <= ?")
+            args.append(until)
+
+        sql = "SELECT * FROM tasks"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY start_time DESC LIMIT ?"
+        args.append(limit)
+
+        with self.lock:
+            rows = self.db.execute(sql, args).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def read_log(self, task_id: str, max_lines: Optional[int] = None) -> List[str]:
+        """Task'ın tam çıktısı (döndürülmüş parçalar dahil, eskiden yeniye)"""
+        path = self.log_path(task_id)
+        parts = [f"{path}.{index}" for index in range(self.backup_count, 0, -1)] + [path]
+
+        lines = []
+        for part in parts:
+            if os.path.exists(part):
+                with open(part, encoding='utf-8', errors='replace') as f:
+                    lines.extend(line.rstrip('\n') for line in f)
+        if max_lines is not None:
+            lines = lines[-max_lines:]
+        return lines
+
+    def close(self):
+        with self.lock:
+            logs = list(self.logs.values())
+            self.logs.clear()
+        for task_log in logs:
+            task_log.close()
+        with self.lock:
+            self.db.close()
@@ -0,0 +1,159 @@
+# core/task_stats.py
+"""
+Artımlı Task İstatistikleri
+===========================
+
+MAVSDK task yöneticisinin sayaçları her durum geçişinde güncellenir:
+- Durum / tip dağılımları ve aktif sayılar O(1) tutulur; özet almak için
+  task listesi taranmaz
+- Task tipi başına süre histogramları: kuyruk bekleme, process başlatma
+  (spawn) ve çalışma süresi
+- Kendi küçük kilidi vardır; GUI'nin periyodik okuması task kilidini
+  (stdout okuyucuları / zamanlayıcı) bekletmez
+
+Sayaçlar yönetici açıldığından beri tüm task'ları kapsar; bellekten atılan
+(evict) task'lar da dahildir.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, Optional, Tuple
+
+# Kova üst sınırları (ms) - son kova bunun üstü
+DURATION_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500,
+    1000, 2000, 5000, 10000, 30000, 60000, 120000, 300000, 600000, 1800000
+)
+TERMINAL_STATUSES = ('COMPLETED', 'FAILED', 'STOPPED', 'TIMEOUT')
+DURATION_KINDS = ('queue_wait', 'spawn', 'run')
+
+
+class DurationHistogram:
+    """Sabit kovalı süre histogramı (ms)"""
+
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'min', 'max', 'last')
+
+    def __init__(self, bounds: Tuple[float, ...] = DURATION_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.last: Optional[float] = None
+
+    def add(self, value_ms: float):
+        value_ms = max(0.0, value_ms)
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.last = value_ms
+        if self.min is None or value_ms < self.min:
+            self.min = value_ms
+        if self.max is None or value_ms > self.max:
+            self.max = value_ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Yaklaşık yüzdelik: değerin düştüğü kovanın üst sınırı"""
+        if not self.count:
+            return None
+        target = q / 100.0 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index < len(self.bounds):
+                    return min(float(self.bounds[index]), self.max)
+                return self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        buckets = {}
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count:
+                label = f"<={self.bounds[index]:g}" if index < len(self.bounds) else f">{self.bounds[-1]:g}"
+                buckets[label] = bucket_count
+        return {
+            'count': self.count,
+            'avg_ms': self.total / self.count if self.count else 0.0,
+            'min_ms': self.min,
+            'max_ms': self.max,
+            'last_ms': self.last,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'buckets': buckets,
+        }
+
+
+class TaskStatistics:
+    """Durum geçişlerinde güncellenen sayaçlar ve süre histogramları"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.total = 0
+        self.status_counts: Dict[str, int] = {}
+        self.type_counts: Dict[str, int] = {}
+        self.live_by_type: Dict[str, int] = {}      # PENDING + RUNNING
+        self.durations: Dict[str, Dict[str, DurationHistogram]] = {}
+        self.queue_wait_by_priority: Dict[str, DurationHistogram] = {}
+
+    def _move(self, old_status: Optional[str], new_status: str):
+        if old_status:
+            self.status_counts[old_status] = self.status_counts.get(old_status, 0) - 1
+        self.status_counts[new_status] = self.status_counts.get(new_status, 0) + 1
+
+    def _histogram(self, task_type: str, kind: str) -> DurationHistogram:
+        per_type = self.durations.get(task_type)
+        if per_type is None:
+            per_type = self.durations[task_type] = {k: DurationHistogram() for k in DURATION_KINDS}
+        return per_type[kind]
+
+    def task_submitted(self, task_type: str, status: str):
+        with self.lock:
+            self.total += 1
+            self.type_counts[task_type] = self.type_counts.get(task_type, 0) + 1
+            self.live_by_type[task_type] = self.live_by_type.get(task_type, 0) + 1
+            self._move(None, status)
+
+    def task_started(self, task_type: str, priority: str, old_status: str, new_status: str,
+                     queue_wait_ms: Optional[float]):
+        with self.lock:
+            self._move(old_status, new_status)
+            if queue_wait_ms is not None:
+                self._histogram(task_type, 'queue_wait').add(queue_wait_ms)
+                histogram = self.queue_wait_by_priority.get(priority)
+                if histogram is None:
+                    histogram = self.queue_wait_by_priority[priority] = DurationHistogram()
+                histogram.add(queue_wait_ms)
+
+    def task_spawned(self, task_type: str, spawn_ms: float):
+        with self.lock:
+            self._histogram(task_type, 'spawn').add(spawn_ms)
+
+    def task_finished(self, task_type: str, old_status: str, new_status: str,
+                      run_ms: Optional[float]):
+        with self.lock:
+            self._move(old_status, new_status)
+            if old_status not in TERMINAL_STATUSES:
+                self.live_by_type[task_type] = self.live_by_type.get(task_type, 0) - 1
+            if run_ms is not None:
+                self._histogram(task_type, 'run').add(run_ms)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            status_counts = {k: v for k, v in self.status_counts.items() if v}
+            return {
+                'total_tasks': self.total,
+                'active_tasks': status_counts.get('RUNNING', 0),
+                'completed_tasks': sum(status_counts.get(s, 0) for s in TERMINAL_STATUSES),
+                'status_distribution': status_counts,
+                'type_distribution': dict(self.type_counts),
+                'live_by_type': {k: v for k, v in self.live_by_type.items() if v},
+                'durations_by_type': {
+                    task_type: {kind: h.snapshot() for kind, h in per_type.items()}
+                    for task_type, per_type in self.durations.items()
+                },
+                'queue_wait_by_priority': {
+                    priority: h.snapshot() for priority, h in self.queue_wait_by_priority.items()
+                },
+            }
@@ -0,0 +1,299 @@
+# core/telemetry_protocol.py
+"""
+Telemetri IPC Protokolü
+=======================
+
+Telemetri servisi (subprocess) ile GUI arasındaki ikili (binary), uzunluk
+önekli çerçeve protokolü. `TELEMETRY:{json}` metin satırlarının yerini alır.
+
+Çerçeve yapısı (little-endian):
+
+    +-------+------+--------+-----------------+
+    | magic | type | length | payload         |
+    | u8    | u8   | u16    | length bayt     |
+    +-------+------+--------+-----------------+
+
+Mesaj tipleri:
+    MSG_TELEMETRY  - sabit düzenli telemetri snapshot'ı (TELEMETRY_STRUCT)
+    MSG_STATUS     - UTF-8 durum metni
+    MSG_ERROR      - UTF-8 hata metni
+    MSG_CONNECTED  - boş payload
+
+Okuyucu tarafta `FrameDecoder` tek bir sabit bytearray tamponuna doğrudan
+`readinto` ile okur ve çerçeveleri kopyalamadan `memoryview` olarak verir;
+telemetri alanları `struct.unpack_from` ile yerinde çözülür.
+
+Benchmark:
+    python3 core/telemetry_protocol.py
+"""
+
+import json
+import struct
+import time
+
+FRAME_MAGIC = 0xA5
+
+MSG_TELEMETRY = 1
+MSG_STATUS = 2
+MSG_ERROR = 3
+MSG_CONNECTED = 4
+
+HEADER_STRUCT = struct.Struct('<BBH')
+HEADER_SIZE = HEADER_STRUCT.size
+MAX_PAYLOAD_SIZE = 0xFFFF
+
+# seq, timestamp, alan maskesi, lat, lon, alt, battery, speed, heading, armed, flight_mode
+TELEMETRY_STRUCT = struct.Struct('<IdBddffffBB')
+
+# Alan maskesi bitleri - snapshot'ta bulunmayan alanlar sözlüğe konmaz
+FIELD_POSITION = 0x01
+FIELD_BATTERY = 0x02
+FIELD_SPEED = 0x04
+FIELD_HEADING = 0x08
+FIELD_ARMED = 0x10
+FIELD_FLIGHT_MODE = 0x20
+
+# MAVSDK FlightMode isimleri - indeks protokoldeki koddur, sıra değişmemeli
+FLIGHT_MODES = (
+    'UNKNOWN', 'READY', 'TAKEOFF', 'HOLD', 'MISSION', 'RETURN_TO_LAUNCH',
+    'LAND', 'OFFBOARD', 'FOLLOW_ME', 'MANUAL', 'ALTCTL', 'POSCTL',
+    'ACRO', 'STABILIZED', 'RATTITUDE',
+)
+FLIGHT_MODE_CODES = {name: code for code, name in enumerate(FLIGHT_MODES)}
+
+
+# ========================================
+# ENCODER (servis tarafı)
+# ========================================
+
+def encode_frame(msg_type: int, payload: bytes = b"") -> bytes:
+    """Tek bir çerçeve oluştur"""
+    if len(payload) > MAX_PAYLOAD_SIZE:
+        payload = payload[:MAX_PAYLOAD_SIZE]
+    return HEADER_STRUCT.pack(FRAME_MAGIC, msg_type, len(payload)) + payload
+
+
+def encode_text(msg_type: int, message: str) -> bytes:
+    """STATUS / ERROR çerçevesi oluştur"""
+    return encode_frame(msg_type, message.encode('utf-8', 'replace'))
+
+
+def encode_telemetry(snapshot: dict) -> bytes:
+    """Telemetri snapshot sözlüğünü sabit düzenli çerçeveye çevir"""
+    mask = 0
+    lat = lon = 0.0
+    alt = battery = speed = heading = 0.0
+    armed = 0
+    flight_mode = 0
+
+    position = snapshot.get('position')
+    if position:
+        mask |= FIELD_POSITION
+        lat = position['lat']
+        lon = position['lon']
+        alt = position['alt']
+    if 'battery' in snapshot:
+        mask |= FIELD_BATTERY
+        battery = snapshot['battery']
+    if 'speed' in snapshot:
+        mask |= FIELD_SPEED
+        speed = snapshot['speed']
+    if 'heading' in snapshot:
+        mask |= FIELD_HEADING
+        heading = snapshot['heading']
+    if 'armed' in snapshot:
+        mask |= FIELD_ARMED
+        armed = 1 if snapshot['armed'] else 0
+    if 'flight_mode' in snapshot:
+        mask |= FIELD_FLIGHT_MODE
+        flight_mode = FLIGHT_MODE_CODES.get(snapshot['flight_mode'], 0)
+
+    payload = TELEMETRY_STRUCT.pack(
+        snapshot.get('seq', 0) & 0xFFFFFFFF,
+        snapshot.get('timestamp', 0.0),
+        mask, lat, lon, alt, battery, speed, heading, armed, flight_mode
+    )
+    return HEADER_STRUCT.pack(FRAME_MAGIC, MSG_TELEMETRY, len(payload)) + payload
+
+
+# ========================================
+# DECODER (GUI tarafı)
+# ========================================
+
+def decode_telemetry(buffer, offset: int = 0) -> dict:
+    """Telemetri payload'ını yerinde çözerek UI sözlüğüne çevir"""
+    (seq, timestamp, mask, lat, lon, alt, battery, speed,
+     heading, armed, flight_mode) = TELEMETRY_STRUCT.unpack_from(buffer, offset)
+
+    telemetry = {'seq': seq, 'timestamp': timestamp}
+    if mask & FIELD_POSITION:
+        telemetry['position'] = {'lat': lat, 'lon': lon, 'alt': alt}
+    if mask & FIELD_BATTERY:
+        telemetry['battery'] = battery
+    if mask & FIELD_SPEED:
+        telemetry['speed'] = speed
+    if mask & FIELD_HEADING:
+        telemetry['heading'] = heading
+    if mask & FIELD_ARMED:
+        telemetry['armed'] = bool(armed)
+    if mask & FIELD_FLIGHT_MODE:
+        telemetry['flight_mode'] = (FLIGHT_MODES[flight_mode]
+                                    if flight_mode < len(FLIGHT_MODES) else 'UNKNOWN')
+    return telemetry
+
+
+def decode_text(payload) -> str:
+    """STATUS / ERROR payload'ını metne çevir"""
+    return str(payload, 'utf-8', 'replace')
+
+
+class FrameDecoder:
+    """
+    Akış tabanlı çerçeve çözücü.
+
+    Veri doğrudan iç tampona okunur (`feed_from`) ya da eklenir (`feed`);
+    `frames()` tamamlanmış çerçeveleri (tip, memoryview) olarak döndürür.
+    Verilen memoryview'lar bir sonraki `feed` çağrısına kadar geçerlidir.
+    Bozuk veri görülürse bir sonraki magic bayta kadar atlanır.
+    """
+
+    def __init__(self, capacity: int = 65536):
+        self._buf = bytearray(max(capacity, HEADER_SIZE + MAX_PAYLOAD_SIZE))
+        self._start = 0
+        self._end = 0
+        self.frames_decoded = 0
+        self.bytes_skipped = 0
+
+    def _compact(self):
+        """Okunmamış veriyi tamponun başına taşı"""
+        if self._start == 0:
+            return
+        pending = self._end - self._start
+        if pending:
+            self._buf[0:pending] = self._buf[self._start:self._end]
+        self._start = 0
+        self._end = pending
+
+    def feed_from(self, stream) -> int:
+        """Stream'den doğrudan iç tampona oku; okunan bayt sayısını döner (0 = EOF)"""
+        if self._end == len(self._buf):
+            self._compact()
+        with memoryview(self._buf) as view:
+            count = stream.readinto(view[self._end:])
+        if count:
+            self._end += count
+        return count or 0
+
+    def feed(self, data):
+        """Hazır bayt dizisini tampona ekle"""
+        size = len(data)
+        if self._end + size > len(self._buf):
+            self._compact()
+            if self._end + size > len(self._buf):
+                grown = bytearray(max(len(self._buf) * 2, self._end + size))
+                grown[:self._end] = self._buf[:self._end]
+                self._buf = grown
+        self._buf[self._end:self._end + size] = data
+        self._end += size
+
+    def frames(self):
+        """Tamamlanmış çerçeveleri (msg_type, payload memoryview) olarak üret"""
+        buf = self._buf
+        view = memoryview(buf)
+        try:
+            while self._end - self._start >= HEADER_SIZE:
+                start = self._start
+                if buf[start] != FRAME_MAGIC:
+                    next_magic = buf.find(FRAME_MAGIC, start + 1, self._end)
+                    if next_magic < 0:
+                        next_magic = self._end
+                    self.bytes_skipped += next_magic - start
+                    self._start = next_magic
+                    continue
+
+                _, msg_type, length = HEADER_STRUCT.unpack_from(buf, start)
+                frame_end = start + HEADER_SIZE + length
+                if frame_end > self._end:
+                    break
+
+                self._start = frame_end
+                self.frames_decoded += 1
+                yield msg_type, view[start + HEADER_SIZE:frame_end]
+        finally:
+            view.release()
+
+        if self._start == self._end:
+            self._start = self._end = 0
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def _sample_snapshot(seq: int) -> dict:
+    return {
+        'position': {'lat': -35.363262 + seq * 1e-7, 'lon': 149.1652371, 'alt': 10.0 + seq * 0.01},
+        'battery': 87.5,
+        'speed': 42.3,
+        'heading': 271.4,
+        'armed': True,
+        'flight_mode': 'MISSION',
+        'seq': seq,
+        'timestamp': 1700000000.0 + seq * 0.05,
+    }
+
+
+def benchmark_encodings(count: int = 100000) -> dict:
+    """JSON metin satırı ile ikili çerçeve kodlamasını karşılaştır"""
+    snapshots = [_sample_snapshot(i) for i in range(count)]
+    results = {}
+
+    # JSON satırları
+    t0 = time.perf_counter()
+    json_stream = b"".join(
+        ("TELEMETRY:" + json.dumps(s) + "\n").encode('utf-8') for s in snapshots
+    )
+    t1 = time.perf_counter()
+    decoded = 0
+    for line in json_stream.decode('utf-8').splitlines():
+        if line.startswith("TELEMETRY:"):
+            json.loads(line[10:])
+            decoded += 1
+    t2 = time.perf_counter()
+    results['json'] = {
+        'encode_us': (t1 - t0) / count * 1e6,
+        'decode_us': (t2 - t1) / count * 1e6,
+        'bytes_per_msg': len(json_stream) / count,
+        'decoded': decoded,
+    }
+
+    # İkili çerçeveler
+    t0 = time.perf_counter()
+    binary_stream = b"".join(encode_telemetry(s) for s in snapshots)
+    t1 = time.perf_counter()
+    decoder = FrameDecoder()
+    decoded = 0
+    chunk = 65536
+    for offset in range(0, len(binary_stream), chunk):
+        decoder.feed(binary_stream[offset:offset + chunk])
+        for msg_type, payload in decoder.frames():
+            if msg_type == MSG_TELEMETRY:
+                decode_telemetry(payload)
+                decoded += 1
+    t2 = time.perf_counter()
+    results['binary'] = {
+        'encode_us': (t1 - t0) / count * 1e6,
+        'decode_us': (t2 - t1) / count * 1e6,
+        'bytes_per_msg': len(binary_stream) / count,
+        'decoded': decoded,
+    }
+    return results
+
+
+if __name__ == "__main__":
+    print("🧪 Telemetri kodlama benchmark'ı (JSON satır vs ikili çerçeve)")
+    print("=" * 60)
+    for name, stats in benchmark_encodings().items():
+        print(f"{name:>7}: encode {stats['encode_us']:.2f} µs/msg | "
+              f"decode {stats['decode_us']:.2f} µs/msg | "
+              f"{stats['bytes_per_msg']:.0f} bayt/msg | {stats['decoded']} mesaj")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# core/telemetry_service.py
+"""
+Sürekli Telemetri Servisi
+=========================
+
+UI telemetrisi için uzun ömürlü MAVSDK servisi. Her telemetri akışı için
+tek bir kalıcı abonelik açılır, tüm abonelikler aynı anda çalışır ve gelen
+örnekler tek bir "son durum" snapshot'ında birleştirilir. Snapshot, UI'ya
+ayarlanabilir bir hızda (varsayılan 20 Hz) tek bir kanal (stdout) üzerinden
+yayınlanır.
+
+Kullanım:
+    python3 core/telemetry_service.py --connection udp://:14540 --rate 20
+
+Varsayılan çıktı formatı `telemetry_protocol` ikili çerçeveleridir. Hata
+ayıklama için `--format text` eski satır formatını verir:
+    STATUS:<mesaj>
+    ERROR:<mesaj>
+    CONNECTED
+    TELEMETRY:<json snapshot>
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+
+try:
+    from .telemetry_protocol import (MSG_CONNECTED, MSG_ERROR, MSG_STATUS,
+                                     encode_frame, encode_telemetry, encode_text)
+except ImportError:
+    # Script olarak çalıştırıldığında (python3 core/telemetry_service.py)
+    from telemetry_protocol import (MSG_CONNECTED, MSG_ERROR, MSG_STATUS,
+                                    encode_frame, encode_telemetry, encode_text)
+
+DEFAULT_CONNECTION_STRING = "udp://:14540"
+DEFAULT_PUBLISH_RATE_HZ = 20.0
+MIN_PUBLISH_RATE_HZ = 1.0
+MAX_PUBLISH_RATE_HZ = 50.0
+
+OUTPUT_FORMATS = ('binary', 'text')
+
+CONNECTION_TIMEOUT_S = 30.0
+RESUBSCRIBE_DELAY_S = 1.0
+
+
+def clamp_publish_rate(rate_hz) -> float:
+    """Yayın hızını desteklenen aralığa sıkıştır"""
+    try:
+        rate_hz = float(rate_hz)
+    except (TypeError, ValueError):
+        return DEFAULT_PUBLISH_RATE_HZ
+    return max(MIN_PUBLISH_RATE_HZ, min(MAX_PUBLISH_RATE_HZ, rate_hz))
+
+
+class TelemetrySnapshot:
+    """
+    Tüm akışların son değerlerini tutan birleşik durum.
+
+    Her akış kendi alanını günceller; `seq` her güncellemede artar, böylece
+    yayıncı yalnızca yeni veri geldiğinde snapshot gönderir.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.seq = 0
+        self.last_update = 0.0
+
+    def update(self, key, value):
+        """Tek bir alanı güncelle"""
+        self.data[key] = value
+        self.seq += 1
+        self.last_update = time.time()
+
+    def to_dict(self) -> dict:
+        """Yayınlanacak snapshot sözlüğü"""
+        snapshot = dict(self.data)
+        snapshot['seq'] = self.seq
+        snapshot['timestamp'] = self.last_update
+        return snapshot
+
+
+class TelemetryService:
+    """
+    Kalıcı abonelikli telemetri servisi.
+
+    Features:
+    - Akış başına tek bir sürekli abonelik (position, battery, velocity,
+      attitude, armed, flight mode)
+    - Tüm abonelikler eşzamanlı asyncio task'ları olarak çalışır
+    - Kopan akışlar otomatik olarak yeniden abone edilir
+    - Birleşik snapshot sabit hızda ve sadece değiştiğinde yayınlanır
+    """
+
+    def __init__(self, connection_string: str = DEFAULT_CONNECTION_STRING,
+                 rate_hz: float = DEFAULT_PUBLISH_RATE_HZ, output=None,
+                 output_format: str = 'binary'):
+        self.connection_string = connection_string
+        self.rate_hz = clamp_publish_rate(rate_hz)
+        self.binary = output_format == 'binary'
+        if output is None:
+            output = sys.stdout.buffer if self.binary else sys.stdout
+        self.output = output
+        self.snapshot = TelemetrySnapshot()
+        self.drone = None
+        self._published_seq = 0
+
+    # ========================================
+    # OUTPUT CHANNEL
+    # ========================================
+
+    def _write(self, data):
+        """Tek kanala yaz"""
+        self.output.write(data)
+        self.output.flush()
+
+    def emit_status(self, message: str):
+        if self.binary:
+            self._write(encode_text(MSG_STATUS, message))
+        else:
+            self._write(f"STATUS:{message}\n")
+
+    def emit_error(self, message: str):
+        if self.binary:
+            self._write(encode_text(MSG_ERROR, message))
+        else:
+            self._write(f"ERROR:{message}\n")
+
+    def emit_connected(self):
+        if self.binary:
+            self._write(encode_frame(MSG_CONNECTED))
+        else:
+            self._write("CONNECTED\n")
+
+    def publish_snapshot(self):
+        """Snapshot'ı yayınla"""
+        snapshot = self.snapshot.to_dict()
+        if self.binary:
+            self._write(encode_telemetry(snapshot))
+        else:
+            self._write("TELEMETRY:" + json.dumps(snapshot) + "\n")
+
+    # ========================================
+    # STREAM HANDLERS
+    # ========================================
+
+    def _on_position(self, position):
+        self.snapshot.update('position', {
+            'lat': position.latitude_deg,
+            'lon': position.longitude_deg,
+            'alt': position.relative_altitude_m
+        })
+
+    def _on_battery(self, battery):
+        self.snapshot.update('battery', battery.remaining_percent)
+
+    def _on_velocity(self, velocity):
+        speed_ms = math.sqrt(
+            velocity.north_m_s ** 2 +
+            velocity.east_m_s ** 2 +
+            velocity.down_m_s ** 2
+        )
+        self.snapshot.update('speed', speed_ms * 3.6)
+
+    def _on_attitude(self, attitude):
+        heading = attitude.yaw_deg
+        if heading < 0:
+            heading += 360
+        self.snapshot.update('heading', heading)
+
+    def _on_armed(self, armed):
+        self.snapshot.update('armed', armed)
+
+    def _on_flight_mode(self, flight_mode):
+        self.snapshot.update('flight_mode', str(flight_mode))
+
+    def _stream_table(self):
+        """(isim, akış fabrikası, handler) listesi"""
+        telemetry = self.drone.telemetry
+        return [
+            ('position', telemetry.position, self._on_position),
+            ('battery', telemetry.battery, self._on_battery),
+            ('velocity', telemetry.velocity_ned, self._on_velocity),
+            ('attitude', telemetry.attitude_euler, self._on_attitude),
+            ('armed', telemetry.armed, self._on_armed),
+            ('flight_mode', telemetry.flight_mode, self._on_flight_mode),
+        ]
+
+    # ========================================
+    # MAIN LOOPS
+    # ========================================
+
+    async def _connect(self) -> bool:
+        """Drone'a bağlan ve bağlantıyı bekle"""
+        from mavsdk import System
+
+        self.emit_status("Telemetri başlıyor...")
+        self.drone = System()
+        await self.drone.connect(self.connection_string)
+        self.emit_status("Telemetri bağlantısı kuruluyor...")
+
+        async def wait_connected():
+            async for state in self.drone.core.connection_state():
+                if state.is_connected:
+                    return True
+            return False
+
+        try:
+            connected = await asyncio.wait_for(wait_connected(), CONNECTION_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            connected = False
+
+        if not connected:
+            self.emit_error("Bağlantı timeout")
+            return False
+
+        self.emit_connected()
+        return True
+
+    async def _request_stream_rates(self):
+        """Otopilottan yayın hızı kadar örnek iste (desteklenmiyorsa atla)"""
+        telemetry = self.drone.telemetry
+        for setter_name in ('set_rate_position', 'set_rate_battery',
+                            'set_rate_velocity_ned', 'set_rate_attitude_euler'):
+            setter = getattr(telemetry, setter_name, None)
+            if setter is None:
+                continue
+            try:
+                await setter(self.rate_hz)
+            except Exception as rate_err:
+                self.emit_status(f"{setter_name} atlandı: {rate_err}")
+
+    async def _subscribe(self, name, stream_factory, handler):
+        """Tek bir akışa sürekli abone ol, koparsa yeniden bağlan"""
+        while True:
+            try:
+                async for item in stream_factory():
+                    handler(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as stream_err:
+                self.emit_error(f"{name}: {stream_err}")
+            await asyncio.sleep(RESUBSCRIBE_DELAY_S)
+
+    async def _publish_loop(self):
+        """Snapshot'ı sabit hızda, sadece değiştiğinde yayınla"""
+        period = 1.0 / self.rate_hz
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+
+        while True:
+            if self.snapshot.seq != self._published_seq:
+                self._published_seq = self.snapshot.seq
+                self.publish_snapshot()
+
+            next_tick += period
+            delay = next_tick - loop.time()
+            if delay < 0:
+                # Geride kaldıysak biriktirme, bir sonraki periyoda hizalan
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    async def run(self):
+        """Servisi çalıştır"""
+        try:
+            if not await self._connect():
+                return
+
+            await self._request_stream_rates()
+            self.emit_status(f"Telemetri akışları başlıyor ({self.rate_hz:.0f} Hz)...")
+
+            tasks = [
+                asyncio.ensure_future(self._subscribe(name, factory, handler))
+                for name, factory, handler in self._stream_table()
+            ]
+            tasks.append(asyncio.ensure_future(self._publish_loop()))
+
+            await asyncio.gather(*tasks)
+
+        except asyncio.CancelledError:
+            pass
+        except BrokenPipeError:
+            # UI tarafı kapandı - sessizce çık
+            pass
+        except Exception as main_err:
+            self.emit_error(str(main_err))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sürekli MAVSDK telemetri servisi")
+    parser.add_argument('--connection', default=DEFAULT_CONNECTION_STRING,
+                        help="MAVSDK bağlantı adresi")
+    parser.add_argument('--rate', type=float, default=DEFAULT_PUBLISH_RATE_HZ,
+                        help="UI yayın hızı (Hz)")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='binary',
+                        help="Çıktı formatı")
+    args = parser.parse_args(argv)
+
+    output = None
+    if args.format == 'binary':
+        # İkili kanalı stdout'tan ayır; kütüphanelerin print'leri stderr'e gitsin
+        output = os.fdopen(os.dup(sys.stdout.fileno()), 'wb', buffering=0)
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        sys.stdout = sys.stderr
+
+    service = TelemetryService(args.connection, args.rate, output, args.format)
+    try:
+        asyncio.run(service.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# core/timeseries.py
+"""
+Ring Buffer Zaman Serisi
+========================
+
+Grafikler için sabit kapasiteli NumPy halka tamponu:
+- Kanal başına bir satır, gerçek zaman damgaları
+- Ekleme O(1): her örnek iki kez yazılır (i ve i + kapasite), böylece son
+  N örnek her zaman tek parça (contiguous) bir dilimdir
+- `times()` / `channel()` kopyasız view döndürür; pyqtgraph'a doğrudan verilir
+- Sözlükle eklenen örnekte eksik kanallar bir önceki örneğin değerini taşır
+  (ilk örnekte önceki değer yoksa NaN; pyqtgraph NaN noktayı çizmez)
+- 10k+ nokta geçmişinde bile örnek başına O(n) kopya veya liste kırpma yoktur
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Union
+
+import numpy as np
+
+DEFAULT_HISTORY_LENGTH = 6000
+
+
+class RingTimeSeries:
+    """
+    Çok kanallı, sabit kapasiteli zaman serisi.
+
+    Zaman ekseni ilk örneğe göre saniye cinsinden saklanır (`origin` mutlak
+    başlangıç zamanıdır); böylece eksen etiketi "Zaman (s)" doğrudan
+    kullanılabilir ve view almak için ek çıkarma/kopya gerekmez.
+
+    Usage:
+        history = RingTimeSeries(('altitude', 'speed'), capacity=10000)
+        history.append(time.time(), (12.5, 41.0))
+        curve.setData(history.times(), history.channel('altitude'))
+    """
+
+    def __init__(self, channels: Sequence[str], capacity: int = DEFAULT_HISTORY_LENGTH,
+                 dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity en az 1 olmalı")
+        self.channels = tuple(channels)
+        self.index: Dict[str, int] = {name: i + 1 for i, name in enumerate(self.channels)}
+        self.dtype = dtype
+        self.capacity = int(capacity)
+        self.origin: Optional[float] = None
+
+        # Satır 0: zaman, satır 1..n: kanallar; her satır 2 * kapasite uzunlukta
+        self._data = np.zeros((len(self.channels) + 1, 2 * self.capacity), dtype=dtype)
+        self._pos = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _window(self):
+        end = self._pos + self.capacity
+        return end - self._count, end
+
+    def append(self, timestamp: float, values: Union[Sequence[float], Dict[str, float]]):
+        """
+        Tek örnek ekle (değerler kanal sırasıyla veya isim sözlüğü olarak).
+
+        Sözlükte olmayan kanallar önceki örneğin değerini taşır; önceki örnek
+        yoksa NaN yazılır. Slotta kalan eski değer (0 veya `capacity` örnek
+        önceki değer) hiçbir zaman görünmez.
+        """
+        if self.origin is None:
+            self.origin = timestamp
+
+        column = self._data[:, self._pos]
+        column[0] = timestamp - self.origin
+        if isinstance(values, dict):
+            if self._count:
+                column[1:] = self._data[1:, self._pos + self.capacity - 1]
+            else:
+                column[1:] = np.nan
+            for name, value in values.items():
+                column[self.index[name]] = value
+        else:
+            column[1:] = values
+
+        # Aynı örneği ikinci yarıya da yaz - pencere her zaman tek parça kalır
+        self._data[:, self._pos + self.capacity] = column
+
+        self._pos = (self._pos + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def extend(self, timestamps: Iterable[float], rows: Iterable[Sequence[float]]):
+        """Birden fazla örnek ekle"""
+        for timestamp, values in zip(timestamps, rows):
+            self.append(timestamp, values)
+
+    def times(self) -> np.ndarray:
+        """Zaman ekseni view'ı (ilk örnekten itibaren saniye)"""
+        start, end = self._window()
+        return self._data[0, start:end]
+
+    def channel(self, name: str) -> np.ndarray:
+        """Kanal verisi view'ı"""
+        start, end = self._window()
+        return self._data[self.index[name], start:end]
+
+    def latest(self, name: str, default: float = 0.0) -> float:
+        """Kanalın son değeri"""
+        if not self._count:
+            return default
+        return float(self._data[self.index[name], self._pos + self.capacity - 1])
+
+    def clear(self):
+        """Geçmişi temizle"""
+        self._pos = 0
+        self._count = 0
+        self.origin = None
+
+    def resize(self, capacity: int):
+        """Kapasiteyi değiştir, son örnekleri koru"""
+        capacity = int(capacity)
+        if capacity < 1:
+            raise ValueError("capacity en az 1 olmalı")
+        if capacity == self.capacity:
+            return
+
+        start, end = self._window()
+        keep = min(self._count, capacity)
+        recent = self._data[:, end - keep:end]
+
+        data = np.zeros((self._data.shape[0], 2 * capacity), dtype=self.dtype)
+        data[:, :keep] = recent
+        data[:, capacity:capacity + keep] = recent
+
+        self._data = data
+        self.capacity = capacity
+        self._count = keep
+        self._pos = keep % capacity
@@ -7,21 +7,22 @@ Yardımcı konum ve matematik fonksiyonları.
 import math
 from dronekit import LocationGlobalRelative
 
+try:
+    from . import geodesy
+except ImportError:
+    import geodesy
+
 
 def get_location_metres(original_location, dNorth, dEast):
     """
     Verilen GPS noktasından metre cinsinden kuzey/doğu offset ile yeni LocationGlobalRelative döner.
     """
-    earth_radius = 6378137.0  # metre
-    dLat = dNorth / earth_radius
-    dLon = dEast / (earth_radius * math.cos(math.radians(original_location.lat)))
-    newlat = original_location.lat + math.degrees(dLat)
-    newlon = original_location.lon + math.degrees(dLon)
+    newlat, newlon = geodesy.offset_ned(original_location.lat, original_location.lon, dNorth, dEast)
     
     # Altitude'yi original_location'dan al
     alt = original_location.alt if original_location.alt is not None else 10.0
 
-    return LocationGlobalRelative(newlat, newlon, alt)
+    return LocationGlobalRelative(float(newlat), float(newlon), alt)
 
 
 def offset_location(original_location, dNorth, dEast, altitude=None):
@@ -49,43 +50,28 @@ def offset_location(original_location, dNorth, dEast, altitude=None):
 
 def distance_meters(a: LocationGlobalRelative, b: LocationGlobalRelative) -> float:
     """
-    İki GPS noktası arasındaki mesafeyi metre cinsinden hesaplar.
+    İki GPS noktası arasındaki mesafeyi metre cinsinden hesaplar (haversine).
     """
-    dlat = (b.lat - a.lat) * 1.113195e5
-    dlon = (b.lon - a.lon) * 1.113195e5
-    return math.hypot(dlat, dlon)
+    return float(geodesy.haversine_distance(a.lat, a.lon, b.lat, b.lon))
 
 
 def calculate_bearing(a: LocationGlobalRelative, b: LocationGlobalRelative) -> float:
     """
     A noktasından B noktasına doğru pusula yönü (derece) hesaplar.
     """
-    lat1 = math.radians(a.lat)
-    lat2 = math.radians(b.lat)
-    dLon = math.radians(b.lon - a.lon)
-    y = math.sin(dLon) * math.cos(lat2)
-    x = math.cos(lat1)*math.sin(lat2) - math.sin(lat1)*math.cos(lat2)*math.cos(dLon)
-    bearing = math.degrees(math.atan2(y, x))
-    return (bearing + 360) % 360
+    return float(geodesy.initial_bearing(a.lat, a.lon, b.lat, b.lon))
 
 
 def destination_point(start: LocationGlobalRelative, bearing_deg: float, distance_m: float) -> LocationGlobalRelative:
     """
     Başlangıç noktasından belirli bir mesafe ve yöne göre yeni GPS koordinatı hesaplar.
     """
-    R = 6378137.0  # Dünya yarıçapı (m)
-    lat1 = math.radians(start.lat)
-    lon1 = math.radians(start.lon)
-    bearing = math.radians(bearing_deg)
-    d_div_R = distance_m / R
-    lat2 = math.asin(math.sin(lat1) * math.cos(d_div_R) + math.cos(lat1) * math.sin(d_div_R) * math.cos(bearing))
-    lon2 = lon1 + math.atan2(math.sin(bearing) * math.sin(d_div_R) * math.cos(lat1),
-                               math.cos(d_div_R) - math.sin(lat1) * math.sin(lat2))
+    lat2, lon2 = geodesy.destination(start.lat, start.lon, bearing_deg, distance_m)
     
     # Altitude güvenli kontrol
     alt = start.alt if start.alt is not None else 10.0
 
-    return LocationGlobalRelative(math.degrees(lat2), math.degrees(lon2), alt)
+    return LocationGlobalRelative(float(lat2), float(lon2), alt)
 
 
 def generate_circle_waypoints(center: LocationGlobalRelative, radius: float = 10, count: int = 8, altitude: float = None) -> list:
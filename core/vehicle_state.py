@@ -0,0 +1,199 @@
+# core/vehicle_state.py
+"""
+Canlı Araç Durumu Önbelleği
+===========================
+
+Navigation'ın telemetri okumaları için sürekli güncellenen önbellek:
+- Her telemetri akışına (position, heading, battery, velocity_ned,
+  vtol_state, armed) tek bir uzun ömürlü abonelik açılır; her örnek
+  önbelleği ve alan başına örnek zamanını günceller
+- Status okuması aboneliği beklemez: son değerler alan başına örnek yaşı
+  (sample_age, saniye) ile hemen döner; hiç örnek gelmemiş alan None'dır
+- Monitör döngüleri (kalkış, iniş, RTL, goto) her 0.5-2 s'de yeniden
+  abone olmak yerine `wait_until()` ile önbellek değişimini bekler
+
+Abonelik görevleri ilk kullanımda, çağıranın event loop'unda (navigation
+loop) başlatılır; MAVSDK akışı hata verirse kısa bir beklemeden sonra
+yeniden açılır.
+
+Usage:
+    state = get_vehicle_state(drone)
+    await state.ensure_started()
+    snapshot = state.snapshot()              # {'values': {...}, 'sample_age': {...}}
+    landed = await state.wait_until(lambda s: s.get('armed') is False, timeout=120)
+"""
+
+import asyncio
+import math
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Optional
+
+try:
+    from .logger import get_logger
+except ImportError:
+    from logger import get_logger
+
+log = get_logger("vehicle_state")
+
+STREAM_RETRY_S = 2.0
+
+
+def _position_fields(position) -> dict:
+    return {
+        'latitude': position.latitude_deg,
+        'longitude': position.longitude_deg,
+        'altitude': position.relative_altitude_m,
+    }
+
+
+def _velocity_fields(velocity) -> dict:
+    return {
+        'ground_speed': math.hypot(velocity.north_m_s, velocity.east_m_s),
+        'vertical_speed': velocity.down_m_s,
+    }
+
+
+# Telemetri akışı -> örnekten alan değerleri
+STREAM_FIELDS: Dict[str, Callable[[object], dict]] = {
+    'position': _position_fields,
+    'heading': lambda heading: {'heading': heading.heading_deg},
+    'battery': lambda battery: {'battery_voltage': battery.voltage_v,
+                                'battery_remaining': battery.remaining_percent},
+    'velocity_ned': _velocity_fields,
+    'vtol_state': lambda vtol_state: {'vtol_state': str(vtol_state)},
+    'armed': lambda armed: {'armed': bool(armed)},
+}
+
+STATE_FIELDS = ('latitude', 'longitude', 'altitude', 'heading', 'battery_voltage',
+                'battery_remaining', 'ground_speed', 'vertical_speed', 'vtol_state', 'armed')
+
+
+class VehicleStateCache:
+    """Telemetri akışlarından beslenen araç durumu"""
+
+    def __init__(self, drone):
+        self.drone = drone
+        self._values: Dict[str, object] = {}
+        self._stamps: Dict[str, float] = {}          # alan -> son örnek (monotonic)
+        self._updates: Dict[str, int] = {stream: 0 for stream in STREAM_FIELDS}
+        self._errors: Dict[str, int] = {stream: 0 for stream in STREAM_FIELDS}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._changed: Optional[asyncio.Event] = None
+
+    # ----------------------------------------
+    # ABONELİKLER
+    # ----------------------------------------
+
+    def is_running(self) -> bool:
+        return bool(self._tasks) and not all(task.done() for task in self._tasks.values())
+
+    async def ensure_started(self):
+        """Abonelikleri çağıranın loop'unda başlat (zaten açıksa bir şey yapmaz)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self.is_running():
+            return
+        self._loop = loop
+        self._changed = asyncio.Event()
+        self._tasks = {stream: loop.create_task(self._follow(stream, convert))
+                       for stream, convert in STREAM_FIELDS.items()}
+        log.info("Araç durumu abonelikleri başlatıldı (%d akış)", len(self._tasks))
+
+    async def _follow(self, stream: str, convert: Callable[[object], dict]):
+        while True:
+            try:
+                async for sample in getattr(self.drone.telemetry, stream)():
+                    self._update(stream, convert(sample))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._errors[stream] += 1
+                if self._errors[stream] == 1:
+                    log.warning("Telemetri akışı '%s' hatası: %s", stream, e)
+            await asyncio.sleep(STREAM_RETRY_S)
+
+    def _update(self, stream: str, fields: dict):
+        now = time.monotonic()
+        self._values.update(fields)
+        for field in fields:
+            self._stamps[field] = now
+        self._updates[stream] += 1
+
+        # Bekleyenleri uyandır; sonraki değişim için yeni event
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def stop(self):
+        """Abonelikleri iptal et (herhangi bir thread'den)"""
+        tasks, self._tasks = list(self._tasks.values()), {}
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        for task in tasks:
+            loop.call_soon_threadsafe(task.cancel)
+
+    # ----------------------------------------
+    # OKUMA
+    # ----------------------------------------
+
+    def get(self, field: str, default=None):
+        return self._values.get(field, default)
+
+    def has(self, field: str) -> bool:
+        return field in self._values
+
+    def age(self, field: str) -> Optional[float]:
+        """Alanın son örneğinden bu yana geçen süre (s); örnek yoksa None"""
+        stamp = self._stamps.get(field)
+        return None if stamp is None else time.monotonic() - stamp
+
+    def snapshot(self) -> dict:
+        """Anlık değerler ve alan başına örnek yaşı (s)"""
+        now = time.monotonic()
+        values = {field: self._values.get(field) for field in STATE_FIELDS}
+        sample_age = {field: (round(now - self._stamps[field], 3) if field in self._stamps else None)
+                      for field in STATE_FIELDS}
+        return {'values': values, 'sample_age': sample_age}
+
+    async def wait_until(self, predicate: Callable[['VehicleStateCache'], bool], timeout: float) -> bool:
+        """Her önbellek değişiminde `predicate(self)`'i dene; süre dolarsa False"""
+        await self.ensure_started()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            changed = self._changed
+            if predicate(self):
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return bool(predicate(self))
+
+    def get_statistics(self) -> dict:
+        return {
+            'running': self.is_running(),
+            'updates': dict(self._updates),
+            'errors': dict(self._errors),
+        }
+
+
+# ========================================
+# ARAÇ BAŞINA ÖNBELLEK
+# ========================================
+
+_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_vehicle_state(vehicle) -> VehicleStateCache:
+    """Araç nesnesinin (MAVSDK System) durum önbelleği; yoksa oluşturulur"""
+    with _caches_lock:
+        cache = _caches.get(vehicle)
+        if cache is None:
+            cache = _caches[vehicle] = VehicleStateCache(vehicle)
+        return cache
@@ -11,6 +11,15 @@ from PyQt5.QtWebEngineWidgets import QWebEngineView
 from PyQt5.QtWebChannel import QWebChannel
 from PyQt5.QtCore import QTimer, pyqtSlot, QMetaObject, Q_ARG
 from core.mavsdk_subprocess import MAVSDKSubprocessManager
+from core.render_scheduler import UIRenderScheduler, DEFAULT_RENDER_FPS
+from core.logger import get_logger
+from core.timeseries import RingTimeSeries, DEFAULT_HISTORY_LENGTH
+from core.readiness import ReadinessService
+from core.mavlink_hub import start_hub, stop_hub, resolve_endpoint
+from core.geodesy import circle_points
+from core.coverage_planner import plan_coverage_lla
+from core.telemetry_protocol import (FrameDecoder, decode_telemetry, decode_text,
+                                     MSG_TELEMETRY, MSG_STATUS, MSG_ERROR, MSG_CONNECTED)
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtGui import QPainter, QBrush, QColor, QFont, QPen, QPainterPath, QRadialGradient, QLinearGradient, QConicalGradient
 from PyQt5.QtCore import Qt, QPointF, QTimer, QPropertyAnimation, QEasingCurve, pyqtProperty
@@ -43,6 +52,7 @@ import math
 import sys
 import subprocess
 import json
+import os
 from motor_status import MotorStatusWidget
 from core.weather_ai_module import create_weather_ai_dialog
 from core.realtime_failsafe_monitor import open_failsafe_monitor
@@ -57,6 +67,11 @@ from PyQt5.QtGui import QFont, QIcon
 # Thread-safe lock
 vehicle_lock = threading.Lock()
 
+log = get_logger("iha_arayuz")
+
+# Ana pencere grafik kanalları (RingTimeSeries sütun sırası)
+GRAPH_CHANNELS = ('altitude', 'speed', 'battery', 'power')
+
 UI_SCALE = 1
 
 class AdvancedSpeedometerWidget(QWidget):
@@ -1390,151 +1405,53 @@ class MAVSDKActionManager:
             return False
         
 class UISubprocessTelemetry:
-    """UI dosyasında çalışan telemetri - ESKİ ÇALIŞAN YÖNTEMİ"""
+    """UI telemetri servisi - kalıcı abonelikli telemetry_service subprocess'i"""
+    
+    SERVICE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'core', 'telemetry_service.py')
     
-    def __init__(self, main_app):
+    def __init__(self, main_app, rate_hz=20.0):
         self.main_app = main_app
         self.running = False
         self.subprocess_proc = None
         self.reader_thread = None
         self.connection_string = "udp://:14540"
+        self.rate_hz = rate_hz
         
-    def start(self, connection_string="udp://:14540"):
+    def start(self, connection_string="udp://:14540", rate_hz=None):
         """UI telemetri subprocess başlat"""
         if self.running:
             return False
             
         self.connection_string = connection_string
+        if rate_hz is not None:
+            self.rate_hz = rate_hz
         self.running = True
         
-        # UISubprocessTelemetry'de telemetry_script'i bu şekilde değiştirin:
-        telemetry_connection = "udp://:14540"
-        telemetry_script = telemetry_script = f'''import asyncio
-import json
-import sys
-from mavsdk import System
-
-async def get_telemetry():
-    try:
-        print("STATUS:Telemetri başlıyor...", flush=True)
-        
-        drone = System()
-        await drone.connect("{telemetry_connection}")
-        
-        print("STATUS:Telemetri bağlantısı kuruluyor...", flush=True)
-        
-        connection_timeout = 0
-        async for state in drone.core.connection_state():
-            print(f"STATUS:Bağlantı durumu: {{state.is_connected}}", flush=True)
-            if state.is_connected:
-                print("CONNECTED", flush=True)
-                break
-            
-            connection_timeout += 1
-            if connection_timeout > 30:
-                print("ERROR:Bağlantı timeout", flush=True)
-                return
-        
-        print("STATUS:Telemetri döngüsü başlıyor...", flush=True)
-        
-        loop_count = 0
-        while True:
-            try:
-                loop_count += 1
-                if loop_count % 10 == 0:
-                    print(f"STATUS:Telemetri döngü {{loop_count}}", flush=True)
-                
-                telemetry_data = {{}}
-                
-                try:
-                    async for position in drone.telemetry.position():
-                        telemetry_data['position'] = {{
-                            'lat': position.latitude_deg,
-                            'lon': position.longitude_deg,
-                            'alt': position.relative_altitude_m
-                        }}
-                        break
-                except Exception as pos_err:
-                    print(f"ERROR:Position: {{pos_err}}", flush=True)
-                
-                try:
-                    async for battery in drone.telemetry.battery():
-                        telemetry_data['battery'] = battery.remaining_percent
-                        break
-                except Exception as bat_err:
-                    print(f"ERROR:Battery: {{bat_err}}", flush=True)
-                
-                try:
-                    async for velocity in drone.telemetry.velocity_ned():
-                        import math
-                        speed_ms = math.sqrt(
-                            velocity.north_m_s**2 + 
-                            velocity.east_m_s**2 + 
-                            velocity.down_m_s**2
-                        )
-                        telemetry_data['speed'] = speed_ms * 3.6
-                        break
-                except Exception as vel_err:
-                    print(f"ERROR:Velocity: {{vel_err}}", flush=True)
-                
-                try:
-                    async for attitude in drone.telemetry.attitude_euler():
-                        heading = attitude.yaw_deg
-                        if heading < 0:
-                            heading += 360
-                        telemetry_data['heading'] = heading
-                        break
-                except Exception as att_err:
-                    print(f"ERROR:Attitude: {{att_err}}", flush=True)
-                
-                try:
-                    async for armed in drone.telemetry.armed():
-                        telemetry_data['armed'] = armed
-                        break
-                except Exception as arm_err:
-                    print(f"ERROR:Armed: {{arm_err}}", flush=True)
-                
-                try:
-                    async for flight_mode in drone.telemetry.flight_mode():
-                        telemetry_data['flight_mode'] = str(flight_mode)
-                        break
-                except Exception as fm_err:
-                    print(f"ERROR:Flight mode: {{fm_err}}", flush=True)
-                
-                if telemetry_data:
-                    json_output = json.dumps(telemetry_data)
-                    print(f"TELEMETRY:{{json_output}}", flush=True)
-                
-                await asyncio.sleep(2.0)
-                
-            except Exception as loop_err:
-                print(f"ERROR:Telemetry loop: {{loop_err}}", flush=True)
-                await asyncio.sleep(1.0)
-                
-    except Exception as main_err:
-        print(f"ERROR:{{main_err}}", flush=True)
-
-asyncio.run(get_telemetry())'''
+        # MAVLink hub açıksa telemetri kendi yerel ucundan dinlenir
+        telemetry_connection = resolve_endpoint('telemetry', connection_string)
         
         try:
             self.subprocess_proc = subprocess.Popen([
-                'python3', '-c', telemetry_script
+                sys.executable, self.SERVICE_SCRIPT,
+                '--connection', telemetry_connection,
+                '--rate', str(self.rate_hz),
+                '--format', 'binary'
             ], 
             stdout=subprocess.PIPE, 
             stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1
+            bufsize=0
             )
             
-            Thread(target=self._read_stderr, daemon=True).start()  # ← BU SATIRI EKLEYİN
+            Thread(target=self._read_stderr, daemon=True).start()
             
             self.reader_thread = Thread(target=self._read_output, daemon=True)
             self.reader_thread.start()
             
-            print("✅ UI Telemetri başlatıldı")
+            print(f"✅ UI Telemetri başlatıldı ({self.rate_hz} Hz)")
             return True
             
         except Exception as e:
+            self.running = False
             print(f"❌ UI Telemetri hatası: {e}")
             return False
     
@@ -1545,9 +1462,9 @@ asyncio.run(get_telemetry())'''
                 line = self.subprocess_proc.stderr.readline()
                 if not line:
                     break
-                print(f"🚨 SUBPROCESS STDERR: {line.strip()}")
+                log.warning("Telemetri subprocess stderr: %s", line.decode('utf-8', 'replace').strip())
         except Exception as e:
-            print(f"STDERR okuma hatası: {e}")
+            log.error("STDERR okuma hatası: %s", e)
         
     def stop(self):
         """UI telemetri durdur"""
@@ -1567,63 +1484,40 @@ asyncio.run(get_telemetry())'''
         print("✅ UI Telemetri durduruldu")
     
     def _read_output(self):
-       """Subprocess çıktısını oku - GÜNCELLEME"""
-       try:
-           print(f"🚨 DEBUG: _read_output BAŞLADI!")
-           print(f"🚨 DEBUG: subprocess_proc = {self.subprocess_proc}")
-           print(f"🚨 DEBUG: running = {self.running}")
-           
-           while self.running and self.subprocess_proc:
-               print(f"🚨 DEBUG: readline() bekleniyor...")
-               line = self.subprocess_proc.stdout.readline()
-               
-               if not line:
-                   print(f"🚨 DEBUG: line BOŞ - subprocess bitti")
-                   break
-                   
-               line = line.strip()
-               print(f"🚨 DEBUG: SUBPROCESS ÇIKTISI: '{line}'")
-               
-               if line.startswith("TELEMETRY:"):
-                   print(f"🚨 DEBUG: TELEMETRY verisi bulundu!")
-                   try:
-                       json_data = line[10:]
-                       print(f"🚨 DEBUG: JSON data: {json_data[:100]}...")
-                       telemetry = json.loads(json_data)
-                       print(f"🚨 DEBUG: JSON parse başarılı: {list(telemetry.keys())}")
-                       
-                       # ✅ YENİ: QMetaObject.invokeMethod ile gönder
-                       from PyQt5.QtCore import QMetaObject, Q_ARG
-                       QMetaObject.invokeMethod(
-                           self.main_app,
-                           "_update_ui_telemetry", 
-                           Q_ARG("PyQt_PyObject", telemetry)
-                       )
-                       print(f"🚨 DEBUG: QMetaObject.invokeMethod çağrıldı")
-                       
-                   except Exception as json_error:
-                       print(f"🚨 DEBUG: JSON parse hatası: {json_error}")
-                       print(f"🚨 DEBUG: Hatalı JSON: {json_data}")
-                       
-               elif line == "CONNECTED":
-                   print("✅ UI Telemetri MAVSDK bağlandı (Port 14540)")
-                   
-               elif line.startswith("STATUS:"):
-                   print(f"📊 Subprocess STATUS: {line[7:]}")
-                   
-               elif line.startswith("ERROR:"):
-                   print(f"❌ Subprocess ERROR: {line[6:]}")
-                   
-               elif line.strip():  # Boş olmayan diğer satırlar
-                   print(f"🔍 Subprocess diğer çıktı: {line}")
-                   
-           print(f"🚨 DEBUG: _read_output LOOP BİTTİ")
-           print(f"🚨 DEBUG: Final - running={self.running}, subprocess_proc={self.subprocess_proc}")
+        """Subprocess ikili çerçeve çıktısını oku"""
+        decoder = FrameDecoder()
+        stdout = self.subprocess_proc.stdout
+        try:
+            while self.running and self.subprocess_proc:
+                if not decoder.feed_from(stdout):
+                    log.info("Telemetri kanalı kapandı - subprocess bitti")
+                    break
+                
+                for msg_type, payload in decoder.frames():
+                    if msg_type == MSG_TELEMETRY:
+                        telemetry = decode_telemetry(payload)
+                        if __debug__:
+                            log.debug("Telemetri: %s", telemetry)
+                        QMetaObject.invokeMethod(
+                            self.main_app,
+                            "_update_ui_telemetry", 
+                            Q_ARG("PyQt_PyObject", telemetry)
+                        )
+                        
+                    elif msg_type == MSG_CONNECTED:
+                        log.info("UI Telemetri MAVSDK bağlandı (Port 14540)")
+                        
+                    elif msg_type == MSG_STATUS:
+                        log.info("Telemetri subprocess: %s", decode_text(payload))
+                        
+                    elif msg_type == MSG_ERROR:
+                        log.error("Telemetri subprocess: %s", decode_text(payload))
+                    
+            if decoder.bytes_skipped:
+                log.warning("Telemetri kanalında %d bayt bozuk veri atlandı", decoder.bytes_skipped)
                
-       except Exception as e:
-           print(f"🚨 DEBUG: _read_output HATASI: {e}")
-           import traceback
-           traceback.print_exc()
+        except Exception:
+            log.exception("_read_output hatası")
     
     def _send_to_ui(self, telemetry):
         """UI'ya telemetri gönder - DÜZELTME"""
@@ -1658,6 +1552,8 @@ class FlightControlStation(QWidget):
     SITL_ALT = 584.0
     SITL_HOME_ALT = 10.0
     
+    GRAPH_HISTORY_LENGTH = DEFAULT_HISTORY_LENGTH  # Grafik geçmişi (örnek sayısı)
+    
     def __init__(self):
         super().__init__()
         # Uçuş durumuna ilişkin değişkenler
@@ -1680,6 +1576,9 @@ class FlightControlStation(QWidget):
         self.start_point = None    # Başlangıç noktası
         self.end_point = None      # Bitiş noktası
         self.home_point = None     # Ev konumu
+        self.map_waypoint_coords = []  # Haritadan eklenen (lat, lon) noktaları
+        self.coverage_area = None  # Kapsama alanı köşeleri (lat, lon)
+        self.coverage_plan = None  # Son kapsama planı (harita yeniden planlar)
         self.saved_missions = {}  # Kaydedilen görevleri tutacak sözlük
         
           # OpenWeatherMap API anahtarınızı buraya ekleyin
@@ -1710,13 +1609,8 @@ class FlightControlStation(QWidget):
         self.gps_spoof_page = GPSSpoofingPage(self)
         self.ew_page = ElectronicWarfarePage(self)
 
-        # Grafik sayfası için gerekli değişkenler
-        self.t = 0
-        self.time_list = []
-        self.altitude_list = []
-        self.speed_list = []
-        self.battery_list = []
-        self.power_list = []
+        # Grafik sayfası için zaman serisi geçmişi (halka tampon)
+        self.graph_history = RingTimeSeries(GRAPH_CHANNELS, capacity=self.GRAPH_HISTORY_LENGTH)
         
         self.last_map_update = 0  # Son harita güncellemesi
         self.map_update_interval = 1.0  # 1 saniyede bir güncelle
@@ -1728,6 +1622,7 @@ class FlightControlStation(QWidget):
 
         # UI'ı başlat
         self.initUI()
+        self.setup_render_bindings()
         
         # MAVSDK sistemini hazırla
         self.setup_connection_controls()
@@ -1984,6 +1879,62 @@ class FlightControlStation(QWidget):
     def check_preflight_before_takeoff(self):
         """Kalkıştan önce basit MAVSDK preflight kontrolü yap"""
         try:
+            # Hazırlık izleyicisi çalışıyorsa canlı durum kullanılır - kontrol tekrar koşulmaz
+            readiness = getattr(self, 'readiness_service', None)
+            if readiness and readiness.is_down():
+                # Canlı kapı düştü: eski manuel kontrol yoluna sessizce geçilmez
+                reply = QMessageBox.question(
+                    self,
+                    '🛡️ Canlı Kalkış Kapısı Devre Dışı',
+                    f'''Canlı hazırlık izleyicisi çalışmıyor:
+    {readiness.down_reason or 'bilinmeyen hata'}
+
+Yeniden başlatma deneniyor ({readiness.restart_count} deneme yapıldı).
+Kritik öğeler şu an canlı olarak doğrulanamıyor.
+
+Manuel preflight check yapmak istiyor musunuz?
+(Hayır: yine de kalk, İptal: kalkışı iptal et)''',
+                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+                    QMessageBox.Cancel
+                )
+                
+                if reply == QMessageBox.Yes:
+                    self.show_preflight_check()
+                    return False
+                elif reply == QMessageBox.Cancel:
+                    return False
+                self.safe_log("⚠️ Canlı kalkış kapısı devre dışıyken kalkış operatör tarafından onaylandı")
+                return True
+            
+            if readiness and readiness.is_alive():
+                ready, blocking = readiness.state.gate()
+                if ready:
+                    return True
+                
+                blocking_lines = "\n".join(
+                    f"    ❌ {name}: {details}" for name, status, details in blocking
+                )
+                reply = QMessageBox.question(
+                    self,
+                    '🛡️ Uçuşa Hazır Değil',
+                    f'''Canlı hazırlık izleyicisi kritik sorunlar bildiriyor:
+
+{blocking_lines}
+
+Manuel preflight check yapmak istiyor musunuz?
+(Hayır: yine de kalk, İptal: kalkışı iptal et)''',
+                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel,
+                    QMessageBox.Cancel
+                )
+                
+                if reply == QMessageBox.Yes:
+                    self.show_preflight_check()
+                    return False
+                elif reply == QMessageBox.Cancel:
+                    return False
+                self.safe_log("⚠️ Hazırlık kapısı operatör tarafından geçildi")
+                return True
+            
             # Son preflight kontrolünün ne zaman yapıldığını kontrol et
             import time
             current_time = time.time()
@@ -2039,6 +1990,34 @@ class FlightControlStation(QWidget):
     def get_preflight_status_summary(self):
         """Preflight durum özetini al"""
         try:
+            readiness = getattr(self, 'readiness_service', None)
+            if readiness and readiness.is_down():
+                return {
+                    'status': 'live_down',
+                    'message': f"Canlı hazırlık izleyicisi çalışmıyor ({readiness.down_reason or 'bilinmeyen hata'}) - yeniden başlatılıyor",
+                    'time_ago': None,
+                    'safe_to_fly': False,
+                    'restart_count': readiness.restart_count
+                }
+            
+            if readiness and readiness.is_alive():
+                live = readiness.state.summary()
+                if live['ready']:
+                    message = 'Canlı hazırlık: uçuşa hazır'
+                    if live['warnings']:
+                        message += f" ({live['warnings']} uyarı)"
+                else:
+                    message = 'Canlı hazırlık: ' + ', '.join(
+                        f"{name} ({status})" for name, status, _ in live['blocking']
+                    )
+                return {
+                    'status': 'live',
+                    'message': message,
+                    'time_ago': 'canlı',
+                    'safe_to_fly': live['ready'],
+                    'items': live['items']
+                }
+            
             if not hasattr(self, 'last_preflight_time') or not self.last_preflight_time:
                 return {
                     'status': 'not_done',
@@ -2105,6 +2084,19 @@ class FlightControlStation(QWidget):
                 icon = "✅"
                 title = "Preflight Check Güncel"
                 message = f"Son kontrol {summary['time_ago']} yapıldı.\n\nSistem kontrolleri güncel."
+            elif summary['status'] == 'live':
+                icon = "✅" if summary['safe_to_fly'] else "❌"
+                title = "Canlı Hazırlık Durumu"
+                item_lines = []
+                for item in summary['items'].values():
+                    age = f"{item['age_s']:.0f} sn" if item['age_s'] is not None else "-"
+                    item_lines.append(f"{item['name']}: {item['status']} ({age}) - {item['details']}")
+                message = summary['message'] + "\n\n" + "\n".join(item_lines)
+            elif summary['status'] == 'live_down':
+                icon = "❌"
+                title = "Canlı Kalkış Kapısı Devre Dışı"
+                message = (f"{summary['message']}\n\nYeniden başlatma denemesi: {summary['restart_count']}\n"
+                           "Kalkışta kritik öğeler canlı doğrulanamaz; manuel preflight check önerilir.")
             else:
                 icon = "❌"
                 title = "Preflight Check Hatası"
@@ -2123,6 +2115,13 @@ class FlightControlStation(QWidget):
         """MAVSDK Subprocess Manager'ı kur"""
         try:
             connection_string = "udp://:14540"
+            
+            # Araç portunu router sahiplenir; pool worker'ları dahil herkes kendi ucuna bağlanır
+            if start_hub(connection_string):
+                self.safe_log("🔀 MAVLink hub başlatıldı")
+            else:
+                self.safe_log("⚠ MAVLink hub başlatılamadı - doğrudan bağlantı kullanılacak")
+            
             self.mavsdk_manager = MAVSDKSubprocessManager(
                 connection_string=connection_string,
                 max_concurrent=3
@@ -2233,7 +2232,8 @@ class FlightControlStation(QWidget):
         try:
             # 🚁✈️ EW MISSION ÖZEL FİLTRE - YENİ EKLEME
             if task_id.startswith('ew_'):
-                print(f"📡 EW MISSION [{task_id}]: {output}")
+                if __debug__:
+                    log.debug("EW MISSION [%s]: %s", task_id, output)
                 
                 if output.startswith("STATUS:"):
                     status = output[7:]
@@ -2288,14 +2288,43 @@ class FlightControlStation(QWidget):
     def setup_ui_telemetry(self):
         """UI telemetri kur"""
         self.ui_telemetry = UISubprocessTelemetry(self)
+        self.render_scheduler = UIRenderScheduler(fps=DEFAULT_RENDER_FPS, parent=self)
+    
+    def setup_render_bindings(self):
+        """Telemetri anahtarlarını widget'lara bağla - sadece değişen değerler çizilir"""
+        scheduler = self.render_scheduler
+        
+        if hasattr(self, 'altitude_value'):
+            scheduler.bind('altitude', self.altitude_value.setText, lambda v: f"{v} m")
+        if hasattr(self, 'speed_value'):
+            scheduler.bind('speed', self.speed_value.setText, lambda v: f"{v:.1f} km/h")
+        if hasattr(self, 'heading_value'):
+            scheduler.bind('heading', self.heading_value.setText, lambda v: f"{v:.0f}°")
+        if hasattr(self, 'battery_value'):
+            scheduler.bind('battery', self.battery_value.setText, lambda v: f"{v:.1f}%")
+        if hasattr(self, 'gps_value'):
+            scheduler.bind('gps', self.gps_value.setText)
+        if hasattr(self, 'flight_mode_value'):
+            scheduler.bind('flight_mode', self.flight_mode_value.setText)
+        if hasattr(self, 'arm_status_value'):
+            scheduler.bind('armed', self.arm_status_value.setText,
+                           lambda v: "Armed" if v else "Disarmed")
+        
+        # Göstergeler - animasyon tetiklememek için ekran çözünürlüğüne yuvarla
+        if hasattr(self, 'speedometer'):
+            scheduler.bind('speed', self.speedometer.setSpeed, lambda v: round(v, 1))
+        if hasattr(self, 'fuel_gauge'):
+            set_level = getattr(self.fuel_gauge, 'setBatteryLevel', None) or self.fuel_gauge.setFuelLevel
+            scheduler.bind('battery', set_level, lambda v: round(v, 1))
+        if hasattr(self, 'compass'):
+            scheduler.bind('heading', self.compass.setHeading, lambda v: round(v))
+        
+        scheduler.add_flush_hook(self._redraw_graphs)
     
     @pyqtSlot(object)
     def _update_ui_telemetry(self, telemetry):
-        """UI telemetri ile güncelle - ENHANCED DEBUG"""
+        """UI telemetri ile güncelle - değerler render scheduler'da birleştirilir"""
         try:
-            print(f"🎯 UI Telemetri güncelleme çağrıldı!")
-            print(f"🔍 Gelen telemetri: {telemetry}")
-            
             position = telemetry.get('position')
             battery = telemetry.get('battery', 100.0)
             speed = telemetry.get('speed', 0.0)
@@ -2303,203 +2332,67 @@ class FlightControlStation(QWidget):
             armed = telemetry.get('armed', False)
             flight_mode = telemetry.get('flight_mode', 'UNKNOWN')
             
-            print(f"🔍 Parse edilen veriler:")
-            print(f"   Position: {position}")
-            print(f"   Battery: {battery}")
-            print(f"   Speed: {speed}")
-            print(f"   Heading: {heading}")
-            print(f"   Armed: {armed}")
-            print(f"   Flight Mode: {flight_mode}")
-            
             # Position güncelle
             if position:
-                old_alt = getattr(self, 'altitude', 0)
                 self.altitude = round(position['alt'], 2)
                 self.gps = f"{position['lat']:.6f}, {position['lon']:.6f}"
-                print(f"🔍 Altitude güncellendi: {old_alt} -> {self.altitude}")
                 
                 # Haritaya gönder
                 current_time = time.time()
                 if current_time - getattr(self, 'last_map_update', 0) > 2.0:
                     self.send_position_to_map(position['lat'], position['lon'], position['alt'], heading)
                     self.last_map_update = current_time
-                    print(f"🔍 Haritaya pozisyon gönderildi")
             
             # Diğer veriler
             self.battery = battery
             self.speed = speed
             self.heading = heading
             
-            # UI elementleri güncelle - HER BİRİNİ KONTROL ET
-            ui_updates = 0
-            
-            # ALTITUDE
-            if hasattr(self, 'altitude_value'):
-                try:
-                    self.altitude_value.setText(f"{self.altitude} m")
-                    ui_updates += 1
-                    print(f"✅ altitude_value güncellendi: {self.altitude} m")
-                except Exception as e:
-                    print(f"❌ altitude_value hatası: {e}")
-            else:
-                print(f"❌ altitude_value bulunamadı!")
-                
-            # SPEED  
-            if hasattr(self, 'speed_value'):
-                try:
-                    self.speed_value.setText(f"{self.speed:.1f} km/h")
-                    ui_updates += 1
-                    print(f"✅ speed_value güncellendi: {self.speed:.1f} km/h")
-                except Exception as e:
-                    print(f"❌ speed_value hatası: {e}")
-            else:
-                print(f"❌ speed_value bulunamadı!")
-                
-            # HEADING
-            if hasattr(self, 'heading_value'):
-                try:
-                    self.heading_value.setText(f"{self.heading:.0f}°")
-                    ui_updates += 1
-                    print(f"✅ heading_value güncellendi: {self.heading:.0f}°")
-                except Exception as e:
-                    print(f"❌ heading_value hatası: {e}")
-            else:
-                print(f"❌ heading_value bulunamadı!")
-                
-            # BATTERY
-            if hasattr(self, 'battery_value'):
-                try:
-                    self.battery_value.setText(f"{self.battery:.1f}%")
-                    ui_updates += 1
-                    print(f"✅ battery_value güncellendi: {self.battery:.1f}%")
-                except Exception as e:
-                    print(f"❌ battery_value hatası: {e}")
-            else:
-                print(f"❌ battery_value bulunamadı!")
-                
-            # GPS
-            if hasattr(self, 'gps_value'):
-                try:
-                    self.gps_value.setText(self.gps)
-                    ui_updates += 1
-                    print(f"✅ gps_value güncellendi: {self.gps}")
-                except Exception as e:
-                    print(f"❌ gps_value hatası: {e}")
-            else:
-                print(f"❌ gps_value bulunamadı!")
-                
-            # FLIGHT MODE
-            if hasattr(self, 'flight_mode_value'):
-                try:
-                    self.flight_mode_value.setText(flight_mode)
-                    ui_updates += 1
-                    print(f"✅ flight_mode_value güncellendi: {flight_mode}")
-                except Exception as e:
-                    print(f"❌ flight_mode_value hatası: {e}")
-            else:
-                print(f"❌ flight_mode_value bulunamadı!")
-                
-            # ARM STATUS
-            if hasattr(self, 'arm_status_value'):
-                try:
-                    arm_text = "Armed" if armed else "Disarmed"
-                    self.arm_status_value.setText(arm_text)
-                    ui_updates += 1
-                    print(f"✅ arm_status_value güncellendi: {arm_text}")
-                except Exception as e:
-                    print(f"❌ arm_status_value hatası: {e}")
-            else:
-                print(f"❌ arm_status_value bulunamadı!")
-            
-            print(f"🔍 Toplam {ui_updates} UI elementi güncellendi")
-            
-            # Göstergeler
-            gauge_updates = 0
-            
-            if hasattr(self, 'speedometer'):
-                try:
-                    self.speedometer.setSpeed(self.speed)
-                    gauge_updates += 1
-                    print(f"✅ speedometer güncellendi: {self.speed}")
-                except Exception as e:
-                    print(f"❌ speedometer hatası: {e}")
-            else:
-                print(f"❌ speedometer bulunamadı!")
-                
-            if hasattr(self, 'fuel_gauge'):
-                try:
-                    self.fuel_gauge.setFuelLevel(self.battery)
-                    gauge_updates += 1
-                    print(f"✅ fuel_gauge güncellendi: {self.battery}")
-                except Exception as e:
-                    print(f"❌ fuel_gauge hatası: {e}")
-            else:
-                print(f"❌ fuel_gauge bulunamadı!")
-                
-            if hasattr(self, 'compass'):
-                try:
-                    self.compass.setHeading(self.heading)
-                    gauge_updates += 1
-                    print(f"✅ compass güncellendi: {self.heading}")
-                except Exception as e:
-                    print(f"❌ compass hatası: {e}")
-            else:
-                print(f"❌ compass bulunamadı!")
-            
-            print(f"🔍 Toplam {gauge_updates} gösterge güncellendi")
-            
-            # Grafik güncelle
-            try:
-                self._update_graph_data_simple()
-                print(f"✅ Grafik güncellendi")
-            except Exception as graph_error:
-                print(f"❌ Grafik güncelleme hatası: {graph_error}")
-            
-            # FORCE REPAINT
-            try:
-                self.update()  # Widget'ı yeniden çiz
-                QApplication.processEvents()  # Event loop'u zorla çalıştır
-                print(f"✅ UI repaint zorlandı")
-            except Exception as repaint_error:
-                print(f"❌ UI repaint hatası: {repaint_error}")
+            # Grafik verisi her örnekte eklenir, çizim kare başına bir kez yapılır
+            self._update_graph_data_simple(telemetry.get('timestamp'))
             
-            print(f"🎯 UI Telemetri güncelleme tamamlandı!")
+            self.render_scheduler.submit({
+                'altitude': self.altitude,
+                'speed': self.speed,
+                'heading': self.heading,
+                'battery': self.battery,
+                'gps': self.gps,
+                'flight_mode': flight_mode,
+                'armed': armed,
+            })
             
-        except Exception as e:
-            print(f"❌ UI telemetri güncelleme hatası: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("UI telemetri güncelleme hatası")
             
-    def _update_graph_data_simple(self):
+    def _update_graph_data_simple(self, timestamp=None):
         """Grafik verilerini güncelle"""
         try:
-            self.t += 1
-            self.time_list.append(self.t)
-            self.altitude_list.append(self.altitude)
-            self.speed_list.append(self.speed)
-            self.battery_list.append(self.battery)
-            self.power_list.append(self.power_consumption)
-    
-            # Listleri 100 noktaya sınırla
-            if len(self.time_list) > 100:
-                self.time_list = self.time_list[-100:]
-                self.altitude_list = self.altitude_list[-100:]
-                self.speed_list = self.speed_list[-100:]
-                self.battery_list = self.battery_list[-100:]
-                self.power_list = self.power_list[-100:]
+            self.graph_history.append(timestamp or time.time(), (
+                self.altitude,
+                self.speed,
+                self.battery,
+                self.power_consumption
+            ))
+                
+        except Exception as e:
+            print(f"Grafik güncelleme hatası: {e}")
     
-            # Grafikleri güncelle
+    def _redraw_graphs(self):
+        """Grafik eğrilerini çiz - render scheduler tarafından kare başına bir kez çağrılır"""
+        try:
+            history = self.graph_history
+            times = history.times()
             if hasattr(self, 'altitude_curve'):
-                self.altitude_curve.setData(self.time_list, self.altitude_list)
+                self.altitude_curve.setData(times, history.channel('altitude'))
             if hasattr(self, 'speed_curve'):
-                self.speed_curve.setData(self.time_list, self.speed_list)
+                self.speed_curve.setData(times, history.channel('speed'))
             if hasattr(self, 'battery_curve'):
-                self.battery_curve.setData(self.time_list, self.battery_list)
+                self.battery_curve.setData(times, history.channel('battery'))
             if hasattr(self, 'power_curve'):
-                self.power_curve.setData(self.time_list, self.power_list)
+                self.power_curve.setData(times, history.channel('power'))
                 
         except Exception as e:
-            print(f"Grafik güncelleme hatası: {e}")
+            print(f"Grafik çizim hatası: {e}")
             
     def add_waypoint(self):
         waypoint = self.waypoint_input.text()
@@ -3198,10 +3091,25 @@ class FlightControlStation(QWidget):
         self.load_mission_button = QPushButton("Görevi Yükle")
         self.start_mission_map_button = QPushButton("Görevi Başlat")
         
+        # Kapsama rotası: waypoint'ler alan köşeleri olarak kullanılır
+        coverage_row = QHBoxLayout()
+        self.coverage_swath_input = QSpinBox()
+        self.coverage_swath_input.setRange(10, 1000)
+        self.coverage_swath_input.setValue(120)
+        self.coverage_swath_input.setPrefix("Tarama: ")
+        self.coverage_swath_input.setSuffix(" m")
+        self.coverage_turn_radius_input = QSpinBox()
+        self.coverage_turn_radius_input.setRange(0, 500)
+        self.coverage_turn_radius_input.setValue(60)
+        self.coverage_turn_radius_input.setPrefix("Dönüş R: ")
+        self.coverage_turn_radius_input.setSuffix(" m")
+        self.plan_coverage_button = QPushButton("Kapsama Rotası Planla")
+        
         for button in [self.add_start_point_button, self.add_end_point_button, 
                       self.add_home_point_button, self.add_waypoint_map_button,
                       self.clear_waypoints_button, self.save_mission_button,
-                      self.load_mission_button, self.start_mission_map_button]:
+                      self.load_mission_button, self.start_mission_map_button,
+                      self.plan_coverage_button]:
             button.setStyleSheet("""
                 QPushButton {
                     background-color: #e74c3c;
@@ -3226,8 +3134,13 @@ class FlightControlStation(QWidget):
         bottom_buttons.addWidget(self.load_mission_button)
         bottom_buttons.addWidget(self.start_mission_map_button)
         
+        coverage_row.addWidget(self.coverage_swath_input)
+        coverage_row.addWidget(self.coverage_turn_radius_input)
+        coverage_row.addWidget(self.plan_coverage_button)
+        
         waypoint_layout.addLayout(top_buttons)
         waypoint_layout.addLayout(bottom_buttons)
+        waypoint_layout.addLayout(coverage_row)
         waypoint_group.setLayout(waypoint_layout)
         
         # Buton bağlantıları
@@ -3241,6 +3154,9 @@ class FlightControlStation(QWidget):
         self.save_mission_button.clicked.connect(self.save_current_mission)
         self.load_mission_button.clicked.connect(self.load_selected_mission)
         self.start_mission_map_button.clicked.connect(self.on_start_mission)
+        self.plan_coverage_button.clicked.connect(self.plan_map_coverage)
+        self.coverage_swath_input.valueChanged.connect(self.replan_map_coverage)
+        self.coverage_turn_radius_input.valueChanged.connect(self.replan_map_coverage)
         
         # Ana layout'a panelleri ekle
         top_panel.addWidget(waypoint_group)
@@ -3932,6 +3848,8 @@ class FlightControlStation(QWidget):
                 // Global değişkenler
                 var markers = [];
                 var flightPath = null;
+                var coverageArea = null;
+                var coveragePath = null;
                 var startMarker = null;
                 var endMarker = null;
                 var dataReceived = false;
@@ -4163,12 +4081,33 @@ class FlightControlStation(QWidget):
                     homeMarker.setLatLng([lat, lon]);
                 }
                 
+                // Kapsama alanı ve planlanan tarama rotası
+                function showCoverage(area, path) {
+                    clearCoverage();
+                    coverageArea = L.polygon(area, {
+                        color: '#f1c40f',
+                        weight: 2,
+                        fillOpacity: 0.1
+                    }).addTo(map);
+                    coveragePath = L.polyline(path, {
+                        color: '#2ecc71',
+                        weight: 2,
+                        opacity: 0.9
+                    }).addTo(map);
+                }
+                
+                function clearCoverage() {
+                    if (coverageArea) { map.removeLayer(coverageArea); coverageArea = null; }
+                    if (coveragePath) { map.removeLayer(coveragePath); coveragePath = null; }
+                }
+                
                 function clearWaypoints() {
                     markers.forEach(m => map.removeLayer(m));
                     markers = [];
                     if (startMarker) { map.removeLayer(startMarker); startMarker = null; }
                     if (endMarker) { map.removeLayer(endMarker); endMarker = null; }
                     if (flightPath) { map.removeLayer(flightPath); flightPath = null; }
+                    clearCoverage();
                 }
                 
                 console.log("🎉 MAVSDK Gelişmiş Harita hazır!");
@@ -4454,10 +4393,16 @@ class FlightControlStation(QWidget):
                 'duration': mission_data.get('duration', 60),
                 'scan_interval': mission_data.get('scan_interval', 8),
                 'pattern_size': mission_data.get('pattern_size', 400),
+                'sensor_swath': mission_data.get('sensor_swath', self.coverage_swath_input.value()),
+                'turn_radius': mission_data.get('turn_radius', self.coverage_turn_radius_input.value()),
+                'patrol_speed': mission_data.get('patrol_speed', 15),
                 'transition_attempts': mission_data.get('transition_attempts', 10),
                 'landing_timeout': mission_data.get('landing_timeout', 25),
                 'connection_string': connection_string
             }
+            # Haritada kapsama alanı çizildiyse devriye o alanı tarar
+            if self.coverage_area:
+                ew_params['patrol_area_lla'] = self.coverage_area
             
             print(f"🔥 DEBUG: EW params: {ew_params}")
             
@@ -4740,11 +4685,11 @@ class FlightControlStation(QWidget):
                 self.send_position_to_map(lat, lon, self.altitude, self.heading)
                 self.last_map_update = current_time
                 
-            # Debug
-            print(f"🛰️ MAVSDK Telemetri: Lat={lat:.6f}, Lon={lon:.6f}, Alt={alt}m")
+            if __debug__:
+                log.debug("MAVSDK Telemetri: Lat=%.6f, Lon=%.6f, Alt=%sm", lat, lon, alt)
             
         except Exception as e:
-            print(f"Position data güncelleme hatası: {e}")
+            log.error("Position data güncelleme hatası: %s", e)
 
     def update_flight_mode(self, mode_str):
         """Flight mode güncelle"""
@@ -4755,25 +4700,21 @@ class FlightControlStation(QWidget):
             print(f"Flight mode güncelleme hatası: {e}")
 
     def send_position_to_map(self, lat, lon, alt, heading):
-        """MAVSDK pozisyonunu haritaya gönder - DEBUG"""
+        """MAVSDK pozisyonunu haritaya gönder"""
         try:
-            print(f"🔍 DEBUG: send_position_to_map çağrıldı - lat:{lat}, lon:{lon}, alt:{alt}, heading:{heading}")
-            
             if hasattr(self, 'map_view') and self.map_view:
                 # JavaScript fonksiyonunu çağır
                 js_command = f"updateDronePosition({lat}, {lon}, {alt}, {heading});"
-                print(f"🔍 DEBUG: JavaScript komutu: {js_command}")
+                if __debug__:
+                    log.debug("Harita JS: %s", js_command)
                 
                 self.map_view.page().runJavaScript(js_command)
-                print("🔍 DEBUG: JavaScript komutu gönderildi")
                 
-            else:
-                print("🔍 DEBUG: map_view bulunamadı veya None!")
+            elif __debug__:
+                log.debug("map_view bulunamadı veya None")
                     
-        except Exception as map_error:
-            print(f"❌ Harita güncelleme hatası: {map_error}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("Harita güncelleme hatası")
 
 # 5. TELEMETRİ BAŞLATMA KONTROLÜ:
     
@@ -4797,30 +4738,8 @@ class FlightControlStation(QWidget):
                 self.gps_coord_value.setText(self.gps)
     
             # Grafik verilerini güncelle
-            self.t += 1
-            self.time_list.append(self.t)
-            self.altitude_list.append(self.altitude)
-            self.speed_list.append(self.speed)
-            self.battery_list.append(self.battery)
-            self.power_list.append(self.power_consumption)
-    
-            # Listleri 100 noktaya sınırla
-            if len(self.time_list) > 100:
-                self.time_list = self.time_list[-100:]
-                self.altitude_list = self.altitude_list[-100:]
-                self.speed_list = self.speed_list[-100:]
-                self.battery_list = self.battery_list[-100:]
-                self.power_list = self.power_list[-100:]
-    
-            # Grafikleri güncelle
-            if hasattr(self, 'altitude_curve'):
-                self.altitude_curve.setData(self.time_list, self.altitude_list)
-            if hasattr(self, 'speed_curve'):
-                self.speed_curve.setData(self.time_list, self.speed_list)
-            if hasattr(self, 'battery_curve'):
-                self.battery_curve.setData(self.time_list, self.battery_list)
-            if hasattr(self, 'power_curve'):
-                self.power_curve.setData(self.time_list, self.power_list)
+            self._update_graph_data_simple()
+            self._redraw_graphs()
     
             # Göstergeleri güncelle
             if hasattr(self, 'speedometer'):
@@ -5290,8 +5209,39 @@ class FlightControlStation(QWidget):
         self.waypoint_counter += 1
         waypoint = f"Waypoint {self.waypoint_counter}: {lat:.6f}, {lon:.6f}"
         self.waypoints.append(waypoint)
+        self.map_waypoint_coords.append((lat, lon))
         self.map_waypoint_list.addItem(waypoint)
         self.safe_log(f"Haritadan waypoint eklendi: {waypoint}")
+        self.replan_map_coverage()
+
+    def plan_map_coverage(self):
+        """Harita waypoint'lerini alan köşeleri alarak kapsama rotası planla ve çiz"""
+        if len(self.map_waypoint_coords) < 3:
+            self.safe_log("Kapsama rotası için haritada en az 3 alan köşesi seçin")
+            return
+        lats, lons = zip(*self.map_waypoint_coords)
+        try:
+            plan = plan_coverage_lla(lats, lons, self.coverage_swath_input.value(),
+                                     self.coverage_turn_radius_input.value())
+        except ValueError as e:
+            self.safe_log(f"Kapsama rotası planlanamadı: {e}")
+            return
+
+        path_lats, path_lons = plan.to_lla()
+        area = [[lat, lon] for lat, lon in self.map_waypoint_coords]
+        path = [[float(lat), float(lon)] for lat, lon in zip(path_lats, path_lons)]
+        self.map_view.page().runJavaScript(f"showCoverage({json.dumps(area)}, {json.dumps(path)});")
+
+        self.coverage_area = area
+        self.coverage_plan = plan
+        self.safe_log(f"Kapsama rotası: {plan.pattern}, {plan.area / 1e6:.2f} km², "
+                      f"{plan.total_length / 1000.0:.2f} km, {plan.lanes} şerit, {plan.turns} dönüş "
+                      f"({plan.planning_ms:.1f} ms)")
+
+    def replan_map_coverage(self, *_args):
+        """Kapsama rotası açıksa alan / parametre değişiminde yeniden planla"""
+        if self.coverage_plan is not None:
+            self.plan_map_coverage()
 
     def add_start_point(self):
         try:
@@ -5321,8 +5271,11 @@ class FlightControlStation(QWidget):
 
     def clear_map_waypoints(self):
         self.waypoints.clear()
+        self.map_waypoint_coords.clear()
         self.map_waypoint_list.clear()
         self.waypoint_counter = 0
+        self.coverage_area = None
+        self.coverage_plan = None
         self.start_point = None
         self.end_point = None
         self.map_view.page().runJavaScript("clearWaypoints();")
@@ -5427,6 +5380,9 @@ class FlightControlStation(QWidget):
             try:
                 self.safe_log("🔌 Core MAVSDK Connection Manager ile bağlantı başlatılıyor...")
                 
+                # Port değiştiyse hub yeni araç portuyla yeniden açılır
+                start_hub(port)
+                
                 # Core connection manager oluştur
                 self.connection_manager = CoreMAVSDKConnectionManager(
                     connection_string=port,
@@ -5631,6 +5587,9 @@ class FlightControlStation(QWidget):
             self.safe_log("🚁 Zaten uçuşta!")
             return
         
+        if not self.check_preflight_before_takeoff():
+            return
+        
         # İrtifa seçim dialogunu aç
         altitude_dialog = TakeoffAltitudeDialog(self)
         if altitude_dialog.exec_() == QDialog.Accepted:
@@ -5733,14 +5692,10 @@ class FlightControlStation(QWidget):
                                 
                             elif mission_name == "Dairesel Devriye":
                                 self.safe_log("🔄 Dairesel devriye waypoint'leri oluşturuluyor...")
-                                import math
                                 
-                                radius_deg = 0.0001  # ~11 metre yarıçap
-                                for i in range(8):
-                                    angle = (i * 2 * math.pi) / 8
-                                    wp_lat = lat + radius_deg * math.cos(angle)
-                                    wp_lon = lon + radius_deg * math.sin(angle)
-                                    waypoints.append((wp_lat, wp_lon, 10.0))
+                                wp_lats, wp_lons = circle_points(lat, lon, 11.0, 8)  # 11 metre yarıçap
+                                for wp_lat, wp_lon in zip(wp_lats, wp_lons):
+                                    waypoints.append((float(wp_lat), float(wp_lon), 10.0))
                             
                             self.safe_log(f"✅ {len(waypoints)} waypoint oluşturuldu")
                             
@@ -5869,37 +5824,43 @@ class FlightControlStation(QWidget):
             self.safe_log(f"⚠ MAVSDK connection failed callback hatası: {e}")
 
     def start_mavsdk_telemetry(self):
-        """UI telemetri başlat - DEBUG"""
+        """UI telemetri başlat"""
         try:
-            print("🚨 DEBUG: start_mavsdk_telemetry ÇAĞRILDI!")
-            
             if not hasattr(self, 'ui_telemetry'):
-                print("🚨 DEBUG: ui_telemetry yok, setup_ui_telemetry çağrılıyor")
                 self.setup_ui_telemetry()
             
             main_connection_string = self.port_input.text().strip() or "udp://:14540"
-            print(f"🚨 DEBUG: main_connection_string = {main_connection_string}")
+            log.debug("start_mavsdk_telemetry: connection=%s", main_connection_string)
             
             success = self.ui_telemetry.start(main_connection_string)
-            print(f"🚨 DEBUG: ui_telemetry.start sonucu = {success}")
             
             if success:
                 self.safe_log("⏰ UI Telemetri başlatıldı (Port: 14540)")
             else:
                 self.safe_log("❌ UI Telemetri başlatılamadı")
             
+            if not hasattr(self, 'readiness_service'):
+                self.readiness_service = ReadinessService()
+                self.readiness_service.on_status = self.on_readiness_status
+            if self.readiness_service.start(main_connection_string):
+                self.safe_log("🛡️ Canlı hazırlık izleyicisi başlatıldı")
+            
         except Exception as e:
-            print(f"🚨 DEBUG: HATA = {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("start_mavsdk_telemetry hatası")
             self.safe_log(f"⚠ UI Telemetri hatası: {e}")
     
+    def on_readiness_status(self, alive, message):
+        """Hazırlık izleyicisi düştü / yeniden başladı (izleyici thread'inden)"""
+        self.safe_log(f"🛡️ {message}" if alive else f"⚠️ Canlı kalkış kapısı devre dışı: {message}")
+    
     def stop_mavsdk_telemetry(self):
         """UI telemetri durdur"""
         try:
             if hasattr(self, 'ui_telemetry'):
                 self.ui_telemetry.stop()
                 self.safe_log("⏰ UI Telemetri durduruldu")
+            if hasattr(self, 'readiness_service'):
+                self.readiness_service.stop()
         except Exception as e:
             self.safe_log(f"⚠ UI Telemetri durdurma hatası: {e}")
 
@@ -6019,6 +5980,7 @@ class FlightControlStation(QWidget):
         except Exception as e:
             print(f"MAVSDK kapatma hatası: {e}")
         
+        stop_hub()
         event.accept()
     
     def check_restart_status(self):
@@ -10,6 +10,7 @@ try:
         get_available_ew_missions,
         EW_VTOL_MISSIONS,
         generate_ew_vtol_mission_script,
+        run_ew_vtol_mission,
         EWVTOLElectronicPatrolMission
     )
     
@@ -33,6 +34,9 @@ except ImportError as e:
     def generate_ew_vtol_mission_script(mission_type, params, connection_string):
         return ""
     
+    async def run_ew_vtol_mission(mission_type, params, connection_string):
+        return False
+    
     class EWVTOLElectronicPatrolMission:
         def __init__(self, connection_string="udp://:14540"):
             pass
@@ -41,6 +45,7 @@ __all__ = [
     'get_available_ew_missions',
     'EW_VTOL_MISSIONS', 
     'generate_ew_vtol_mission_script',
+    'run_ew_vtol_mission',
     'EWVTOLElectronicPatrolMission',
     'EW_MISSIONS_AVAILABLE',
     'AVAILABLE_MISSIONS'
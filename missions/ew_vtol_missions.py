@@ -8,6 +8,8 @@ Parametreleri ayarlanabilir + güvenli iniş
 """
 
 import asyncio
+import math
+import os
 import random
 import time
 from mavsdk import System
@@ -16,6 +18,15 @@ try:
     from mavsdk.offboard import VelocityNedYaw
 except ImportError:
     VelocityNedYaw = None
+try:
+    # Runner alt sürecinde core/ dizini sys.path'tedir
+    from coverage_planner import plan_coverage, rectangle
+    from geodesy import lla_to_ned
+except ImportError:
+    from core.coverage_planner import plan_coverage, rectangle
+    from core.geodesy import lla_to_ned
+
+HOME_POSITION_TIMEOUT_S = 5.0
 
 
 class EWVTOLElectronicPatrolMission:
@@ -35,6 +46,9 @@ class EWVTOLElectronicPatrolMission:
             'duration': 60,             # Görev süresi (saniye)
             'scan_interval': 8,         # Tarama aralığı (saniye)
             'pattern_size': 400,        # Devriye alanı boyutu (m)
+            'sensor_swath': 120,        # Sensör tarama genişliği (m)
+            'turn_radius': 60,          # FW dönüş yarıçapı (m)
+            'patrol_speed': 15,         # Devriye hızı (m/s)
             'transition_attempts': 10,  # Transition deneme sayısı
             'landing_timeout': 25       # İniş timeout (saniye)
         }
@@ -49,6 +63,7 @@ class EWVTOLElectronicPatrolMission:
             print(f"   ⏰ Görev süresi: {self.params['duration']} saniye")
             print(f"   📡 Tarama aralığı: {self.params['scan_interval']} saniye")
             print(f"   📍 Devriye alanı: {self.params['pattern_size']}m")
+            print(f"   🗺️ Tarama genişliği: {self.params['sensor_swath']}m, dönüş yarıçapı: {self.params['turn_radius']}m")
             print(f"   🔄 Transition denemeleri: {self.params['transition_attempts']}")
             print(f"   🛬 İniş timeout: {self.params['landing_timeout']} saniye")
             
@@ -168,48 +183,84 @@ class EWVTOLElectronicPatrolMission:
         print("✅ Manuel transition süresi doldu - FW modunda devam!")
         return True
     
+    async def _home_position(self):
+        """Ev konumu (lat, lon); telemetri gelmezse None"""
+        async def first_home():
+            async for home in self.drone.telemetry.home():
+                return home.latitude_deg, home.longitude_deg
+        try:
+            return await asyncio.wait_for(first_home(), HOME_POSITION_TIMEOUT_S)
+        except Exception:
+            return None
+    
+    async def plan_patrol_route(self):
+        """
+        Devriye alanı için kapsama rotası (NED, ev konumuna göre).
+        
+        Alan sırasıyla: `patrol_area` (kuzey/doğu m köşeleri), `patrol_area_lla`
+        (harita köşeleri, ev konumuna göre çevrilir) ya da `pattern_size`
+        kenarlı varsayılan alan (kuzeye 2x, doğu-batı 1x).
+        """
+        area = self.params.get('patrol_area')
+        if area is None and self.params.get('patrol_area_lla'):
+            home = await self._home_position()
+            if home is None:
+                print("⚠️ Ev konumu alınamadı - varsayılan devriye alanı kullanılıyor")
+            else:
+                lats, lons = zip(*self.params['patrol_area_lla'])
+                north, east, _down = lla_to_ned(lats, lons, 0.0, home[0], home[1], 0.0)
+                area = list(zip(north, east))
+        if area is None:
+            size = float(self.params['pattern_size'])
+            area = rectangle(0.0, -size, 2.0 * size, size)
+        
+        return plan_coverage(area, float(self.params['sensor_swath']), float(self.params['turn_radius']),
+                             pattern=self.params.get('coverage_pattern', 'auto'))
+    
     async def patrol_search_pattern(self):
-        """Arama devriye rotası - parametreli"""
+        """Arama devriye rotası - kapsama planlayıcı ile"""
         print("🎯 ELEKTRONİK ARAMA DEVRİYESİ BAŞLATILIYOR!")
         print("=" * 60)
         
-        pattern_size = self.params['pattern_size']
         scan_interval = self.params['scan_interval']
         max_mission_time = self.params['duration']
+        patrol_speed = max(1.0, float(self.params['patrol_speed']))
         altitude = -self.params['altitude']  # NED koordinat sistemi için negatif
         
-        # Parametreli arama rotası
-        search_pattern = [
-            {"waypoint": (pattern_size * 0.5, 0, altitude), "duration": 25, "description": "📡 Kuzey sektör tarama"},
-            {"waypoint": (pattern_size, pattern_size * 0.5, altitude - 10), "duration": 30, "description": "📡 Kuzeydoğu sektör tarama"},
-            {"waypoint": (pattern_size * 1.5, pattern_size, altitude - 20), "duration": 35, "description": "📡 Doğu sektör tarama"},
-            {"waypoint": (pattern_size * 2, pattern_size * 0.5, altitude - 15), "duration": 30, "description": "📡 Güneydoğu sektör tarama"},
-            {"waypoint": (pattern_size * 1.5, 0, altitude - 10), "duration": 25, "description": "📡 Güney sektör tarama"},
-            {"waypoint": (pattern_size, -pattern_size * 0.5, altitude - 5), "duration": 30, "description": "📡 Güneybatı sektör tarama"},
-            {"waypoint": (pattern_size * 0.5, -pattern_size, altitude), "duration": 35, "description": "📡 Batı sektör tarama"},
-            {"waypoint": (0, -pattern_size * 0.5, altitude + 5), "duration": 25, "description": "📡 Kuzeybatı sektör tarama"}
-        ]
+        # Alan kapsama rotası
+        try:
+            plan = await self.plan_patrol_route()
+        except ValueError as e:
+            print(f"❌ Devriye rotası planlanamadı: {e}")
+            return False
         
-        for i, sector in enumerate(search_pattern, 1):
+        print(f"🗺️ Kapsama rotası: {plan.pattern}, {len(plan.waypoints)} waypoint, "
+              f"{plan.total_length:.0f} m, {plan.turns} dönüş ({plan.planning_ms:.1f} ms)")
+        search_pattern = plan.ned_waypoints(altitude)
+        previous = (0.0, 0.0)
+        
+        for i, waypoint in enumerate(search_pattern, 1):
             # Süre kontrolü
             elapsed_time = time.time() - self.mission_start_time
             if elapsed_time >= max_mission_time:
                 print(f"⏰ {max_mission_time} SANİYE TAMAMLANDI - Görev süresi doldu!")
                 break
                 
-            waypoint = sector["waypoint"]
-            duration = sector["duration"]
-            description = sector["description"]
+            north, east, down = waypoint
+            leg = math.hypot(north - previous[0], east - previous[1])
+            yaw = math.degrees(math.atan2(east - previous[1], north - previous[0])) if leg > 0 else 0.0
+            duration = leg / patrol_speed
+            description = f"📡 Tarama ayağı {leg:.0f} m"
+            previous = (north, east)
             
             remaining_time = max_mission_time - elapsed_time
-            print(f"\n📍 SEKTÖR {i}/{len(search_pattern)}: {description}")
+            print(f"\n📍 WAYPOINT {i}/{len(search_pattern)}: {description}")
             print(f"⏰ Kalan görev süresi: {remaining_time:.0f} saniye")
             
             # Waypoint'e git
-            north, east, down = waypoint
-            await self.drone.offboard.set_position_ned(PositionNedYaw(north, east, down, 0.0))
+            await self.drone.offboard.set_position_ned(PositionNedYaw(north, east, down, yaw))
             
-            # Bu sektörde elektronik tarama yap
+            # Ayak boyunca elektronik tarama yap
             sector_scan_time = min(duration, remaining_time)
             scan_intervals = max(1, int(sector_scan_time // scan_interval))
             
@@ -374,6 +425,7 @@ class EWVTOLElectronicPatrolMission:
         print(f"   ⏰ Planlanan süre: {self.params['duration']}s")
         print(f"   📡 Tarama aralığı: {self.params['scan_interval']}s")
         print(f"   📍 Devriye alanı: {self.params['pattern_size']}m")
+        print(f"   🗺️ Tarama genişliği: {self.params['sensor_swath']}m")
         
         if self.target_detected:
             print(f"\n📊 Elektronik imza: VERİTABANINA KAYDEDİLDİ")
@@ -461,6 +513,9 @@ EW_VTOL_MISSIONS = {
             'duration': 60,             # Görev süresi (saniye)
             'scan_interval': 8,         # Tarama aralığı (saniye)
             'pattern_size': 400,        # Devriye alanı boyutu (m)
+            'sensor_swath': 120,        # Sensör tarama genişliği (m)
+            'turn_radius': 60,          # FW dönüş yarıçapı (m)
+            'patrol_speed': 15,         # Devriye hızı (m/s)
             'transition_attempts': 10,  # Transition deneme sayısı
             'landing_timeout': 25       # İniş timeout (saniye)
         }
@@ -480,64 +535,61 @@ def get_available_ew_missions():
     }
 
 
-def generate_ew_vtol_mission_script(mission_type: str, params: dict, connection_string: str) -> str:
-    """EW VTOL mission script'i üret - FIXED VERSION"""
-    
+async def run_ew_vtol_mission(mission_type: str, params: dict, connection_string: str) -> bool:
+    """EW VTOL mission'ı çalıştır (task runner giriş noktası)"""
     mission_info = EW_VTOL_MISSIONS.get(mission_type)
     if not mission_info:
-        return ""
+        print(f"ERROR:Bilinmeyen EW mission: {mission_type}")
+        return False
     
     # Parametreleri birleştir
     final_params = mission_info['default_params'].copy()
     final_params.update(params)
     
-    script_template = f'''import asyncio
-import sys
-import os
-
-# EW VTOL mission modülünü import et - FIXED PATH
-script_dir = os.getcwd()
-missions_path = os.path.join(script_dir, 'missions')
-if missions_path not in sys.path:
-    sys.path.append(missions_path)
-
-# Fallback paths
-sys.path.append('missions')
-sys.path.append('.')
-
-from ew_vtol_missions import EWVTOLElectronicPatrolMission
-
-async def execute_ew_mission():
     try:
         print("STATUS:🚁✈️ EW VTOL Elektronik Devriye başlatılıyor...")
         
         # Mission instance oluştur
-        mission = EWVTOLElectronicPatrolMission("{connection_string}")
-        
-        # Mission parametreleri
-        params = {final_params}
+        mission = mission_info['class'](connection_string)
         
         print("STATUS:📊 Mission parametreleri:")
-        for key, value in params.items():
-            print(f"STATUS:   {{key}}: {{value}}")
+        for key, value in final_params.items():
+            print(f"STATUS:   {key}: {value}")
         
         # Mission'ı çalıştır
-        success = await mission.execute_mission(params)
+        success = await mission.execute_mission(final_params)
         
         if success:
             print("SUCCESS:EW VTOL mission completed successfully")
         else:
             print("ERROR:EW VTOL mission failed")
-            
+        return bool(success)
+        
     except Exception as e:
-        print(f"ERROR:EW mission error: {{e}}")
+        print(f"ERROR:EW mission error: {e}")
         import traceback
         traceback.print_exc()
+        return False
 
-asyncio.run(execute_ew_mission())
-'''
+
+def generate_ew_vtol_mission_script(mission_type: str, params: dict, connection_string: str) -> str:
+    """
+    EW VTOL mission script'i üret (geriye uyumluluk).
+    
+    Görev gövdesi run_ew_vtol_mission içindedir; üretilen script yalnızca
+    onu çağırır. Yönetici bu script yerine core/mavsdk_runner.py kullanır.
+    """
+    if mission_type not in EW_VTOL_MISSIONS:
+        return ""
     
-    return script_template
+    missions_path = os.path.dirname(os.path.abspath(__file__))
+    return (
+        "import asyncio, sys\n"
+        f"sys.path.append({missions_path!r})\n"
+        "from ew_vtol_missions import run_ew_vtol_mission\n"
+        f"ok = asyncio.run(run_ew_vtol_mission({mission_type!r}, {dict(params)!r}, {connection_string!r}))\n"
+        "sys.exit(0 if ok else 1)\n"
+    )
 
 
 # Test fonksiyonu